@@ -0,0 +1,13 @@
+import argparse
+from pathlib import Path
+
+import path_util  # noqa: F401
+
+from hummingbot.client.settings import CONNECTOR_MANIFEST_PATH, AllConnectorSettings
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Generate the manifest of the connector settings loaded at startup")
+    parser.add_argument("--output", type=Path, default=CONNECTOR_MANIFEST_PATH, help="Path of the manifest file.")
+    args = parser.parse_args()
+    manifest = AllConnectorSettings.generate_connector_manifest(args.output)
+    print(f"Saved the settings of {len(manifest['connectors'])} connectors to {args.output}")
@@ -8,7 +8,7 @@ import path_util  # noqa: F401
 
 from hummingbot import chdir_to_data_directory, init_logging
 from hummingbot.client.config.client_config_map import ClientConfigMap
-from hummingbot.client.config.config_crypt import ETHKeyFileSecretManger
+from hummingbot.client.config.config_crypt import CachedETHKeyFileSecretManager
 from hummingbot.client.config.config_helpers import (
     ClientConfigAdapter,
     create_yml_files_legacy,
@@ -17,11 +17,12 @@ from hummingbot.client.config.config_helpers import (
 )
 from hummingbot.client.config.security import Security
 from hummingbot.client.hummingbot_application import HummingbotApplication
-from hummingbot.client.settings import AllConnectorSettings
+from hummingbot.client.settings import DEFAULT_LOG_FILE_PATH, AllConnectorSettings
 from hummingbot.client.ui import login_prompt
 from hummingbot.client.ui.style import load_style
 from hummingbot.core.event.event_listener import EventListener
 from hummingbot.core.event.events import HummingbotUIEvent
+from hummingbot.core.management.startup_profiler import StartupProfiler, get_startup_profiler
 from hummingbot.core.utils import detect_available_port
 from hummingbot.core.utils.async_utils import safe_gather
 
@@ -51,6 +52,22 @@ class UIStartListener(EventListener):
                      script=hb.strategy_name if self._is_script else None,
                      conf=self._script_config,
                      is_quickstart=self._is_quickstart)
+        startup_profiler = get_startup_profiler()
+        if startup_profiler is not None and startup_profiler.is_running:
+            await self._report_startup_profile(hb, startup_profiler)
+
+    @staticmethod
+    async def _report_startup_profile(hb: HummingbotApplication, startup_profiler: StartupProfiler):
+        # Let the start check scheduled by `start()` begin, then wait for the strategy to be started so that the
+        # imports of the strategy are part of the profile
+        await asyncio.sleep(0)
+        while hb._in_start_check:
+            await asyncio.sleep(0.1)
+        startup_profiler.stop()
+        report_path = DEFAULT_LOG_FILE_PATH / "startup_profile.txt"
+        report_path.parent.mkdir(parents=True, exist_ok=True)
+        report_path.write_text(startup_profiler.report())
+        hb.notify(f"\n{startup_profiler.summary()} The startup profile was written to {report_path}.")
 
 
 async def main_async(client_config_map: ClientConfigAdapter):
@@ -83,7 +100,7 @@ async def main_async(client_config_map: ClientConfigAdapter):
 
 def main():
     chdir_to_data_directory()
-    secrets_manager_cls = ETHKeyFileSecretManger
+    secrets_manager_cls = CachedETHKeyFileSecretManager
 
     try:
         ev_loop: asyncio.AbstractEventLoop = asyncio.get_event_loop()
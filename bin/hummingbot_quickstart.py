@@ -14,7 +14,7 @@ import path_util  # noqa: F401
 
 from bin.hummingbot import UIStartListener, detect_available_port
 from hummingbot import init_logging
-from hummingbot.client.config.config_crypt import BaseSecretsManager, ETHKeyFileSecretManger
+from hummingbot.client.config.config_crypt import BaseSecretsManager, CachedETHKeyFileSecretManager
 from hummingbot.client.config.config_helpers import (
     ClientConfigAdapter,
     all_configs_complete,
@@ -53,6 +53,11 @@ class CmdlineParser(argparse.ArgumentParser):
                           required=False,
                           help="Try to automatically set config / logs / data dir permissions, "
                                "useful for Docker containers.")
+        # Handled in `path_util`, before the client modules are imported
+        self.add_argument("--profile-startup",
+                          action="store_true",
+                          help="Profile the import time of the modules until the strategy is started, and write the "
+                               "report to `logs/startup_profile.txt`.")
 
 
 def autofix_permissions(user_group_spec: str):
@@ -150,7 +155,7 @@ def main():
         args.config_password = os.environ["CONFIG_PASSWORD"]
 
     # If no password is given from the command line, prompt for one.
-    secrets_manager_cls = ETHKeyFileSecretManger
+    secrets_manager_cls = CachedETHKeyFileSecretManager
     client_config_map = load_client_config_map_from_file()
     if args.config_password is None:
         secrets_manager = login_prompt(secrets_manager_cls, style=load_style(client_config_map))
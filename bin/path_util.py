@@ -14,3 +14,8 @@ else:
     from os.path import join, realpath
     import sys
     sys.path.insert(0, realpath(join(__file__, "../../")))
+
+if "--profile-startup" in sys.argv:
+    # Installed before the client modules are imported, so that their import time is profiled
+    from hummingbot.core.management.startup_profiler import start_startup_profiler_if_requested
+    start_startup_profiler_if_requested()
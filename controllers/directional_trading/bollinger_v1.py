@@ -1,12 +1,14 @@
 from typing import List
 
+import numpy as np
 import pandas as pd
-import pandas_ta as ta  # noqa: F401
 from pydantic import Field, validator
 
 from hummingbot.client.config.config_data_types import ClientFieldData
 from hummingbot.client.ui.interface_utils import format_df_for_printout
 from hummingbot.data_feed.candles_feed.candles_factory import CandlesConfig
+from hummingbot.data_feed.candles_feed.feature_pipeline import CandlesFeaturePipeline
+from hummingbot.data_feed.candles_feed.incremental_indicators import BollingerBands
 from hummingbot.smart_components.controllers.directional_trading_controller_base import (
     DirectionalTradingControllerBase,
     DirectionalTradingControllerConfigBase,
@@ -81,25 +83,29 @@ class BollingerV1Controller(DirectionalTradingControllerBase):
             )]
         super().__init__(config, *args, **kwargs)
 
-    def get_signal(self) -> int:
-        return self.get_processed_data()["signal"].iloc[-1]
+    def get_feature_pipeline(self) -> CandlesFeaturePipeline:
+        return self.market_data_provider.get_candles_feature_pipeline(
+            connector_name=self.config.candles_connector,
+            trading_pair=self.config.candles_trading_pair,
+            interval=self.config.interval,
+            max_records=self.max_records,
+            indicators=[BollingerBands(length=self.config.bb_length, std=self.config.bb_std)])
 
-    def get_processed_data(self) -> pd.DataFrame:
-        df = self.market_data_provider.get_candles_df(connector_name=self.config.candles_connector,
-                                                      trading_pair=self.config.candles_trading_pair,
-                                                      interval=self.config.interval,
-                                                      max_records=self.max_records)
-        # Add indicators
-        df.ta.bbands(length=self.config.bb_length, std=self.config.bb_std, append=True)
+    def get_signal(self) -> int:
+        return int(self.compute_signal(self.get_feature_pipeline().features))
 
-        # Generate signal
-        long_condition = df[f"BBP_{self.config.bb_length}_{self.config.bb_std}"] < self.config.bb_long_threshold
-        short_condition = df[f"BBP_{self.config.bb_length}_{self.config.bb_std}"] > self.config.bb_short_threshold
+    def compute_signal(self, features):
+        """
+        Computes the signal from the features of a candle (dict of values) or of the candles (DataFrame).
+        """
+        bbp = features[f"BBP_{self.config.bb_length}_{self.config.bb_std}"]
+        long_condition = bbp < self.config.bb_long_threshold
+        short_condition = bbp > self.config.bb_short_threshold
+        return np.where(long_condition, 1, np.where(short_condition, -1, 0))
 
-        # Generate signal
-        df["signal"] = 0
-        df.loc[long_condition, "signal"] = 1
-        df.loc[short_condition, "signal"] = -1
+    def get_processed_data(self) -> pd.DataFrame:
+        df = self.get_feature_pipeline().features_df
+        df["signal"] = self.compute_signal(df)
         return df
 
     def to_format_status(self) -> List[str]:
@@ -2,13 +2,15 @@ import time
 from decimal import Decimal
 from typing import List, Optional, Tuple
 
+import numpy as np
 import pandas as pd
-import pandas_ta as ta  # noqa: F401
 from pydantic import Field, validator
 
 from hummingbot.client.config.config_data_types import ClientFieldData
 from hummingbot.core.data_type.common import TradeType
 from hummingbot.data_feed.candles_feed.candles_factory import CandlesConfig
+from hummingbot.data_feed.candles_feed.feature_pipeline import CandlesFeaturePipeline
+from hummingbot.data_feed.candles_feed.incremental_indicators import BollingerBands
 from hummingbot.smart_components.controllers.directional_trading_controller_base import (
     DirectionalTradingControllerBase,
     DirectionalTradingControllerConfigBase,
@@ -164,31 +166,35 @@ class DManV3Controller(DirectionalTradingControllerBase):
             )]
         super().__init__(config, *args, **kwargs)
 
+    def get_feature_pipeline(self) -> CandlesFeaturePipeline:
+        return self.market_data_provider.get_candles_feature_pipeline(
+            connector_name=self.config.candles_connector,
+            trading_pair=self.config.candles_trading_pair,
+            interval=self.config.interval,
+            max_records=self.max_records,
+            indicators=[BollingerBands(length=self.config.bb_length, std=self.config.bb_std)])
+
     def get_signal(self) -> int:
-        return self.get_processed_data()["signal"].iloc[-1]
+        return int(self.compute_signal(self.get_feature_pipeline().features))
+
+    def compute_signal(self, features):
+        """
+        Computes the signal from the features of a candle (dict of values) or of the candles (DataFrame).
+        """
+        bbp = features[f"BBP_{self.config.bb_length}_{self.config.bb_std}"]
+        long_condition = bbp < self.config.bb_long_threshold
+        short_condition = bbp > self.config.bb_short_threshold
+        return np.where(long_condition, 1, np.where(short_condition, -1, 0))
 
     def get_processed_data(self) -> pd.DataFrame:
-        df = self.market_data_provider.get_candles_df(connector_name=self.config.candles_connector,
-                                                      trading_pair=self.config.candles_trading_pair,
-                                                      interval=self.config.interval,
-                                                      max_records=self.max_records)
-        # Add indicators
-        df.ta.bbands(length=self.config.bb_length, std=self.config.bb_std, append=True)
-
-        # Generate signal
-        long_condition = df[f"BBP_{self.config.bb_length}_{self.config.bb_std}"] < self.config.bb_long_threshold
-        short_condition = df[f"BBP_{self.config.bb_length}_{self.config.bb_std}"] > self.config.bb_short_threshold
-
-        # Generate signal
-        df["signal"] = 0
-        df.loc[long_condition, "signal"] = 1
-        df.loc[short_condition, "signal"] = -1
+        df = self.get_feature_pipeline().features_df
+        df["signal"] = self.compute_signal(df)
         return df
 
     def get_spread_multiplier(self) -> Decimal:
         if self.config.dynamic_order_spread:
-            df = self.get_processed_data()
-            bb_width = df[f"BBB_{self.config.bb_length}_{self.config.bb_std}"].iloc[-1]
+            features = self.get_feature_pipeline().features
+            bb_width = features[f"BBB_{self.config.bb_length}_{self.config.bb_std}"]
             return Decimal(bb_width / 200)
         else:
             return Decimal("1.0")
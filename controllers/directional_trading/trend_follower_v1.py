@@ -1,11 +1,14 @@
 from typing import List
 
+import numpy as np
 import pandas as pd
 from pydantic import Field, validator
 
 from hummingbot.client.config.config_data_types import ClientFieldData
 from hummingbot.client.ui.interface_utils import format_df_for_printout
 from hummingbot.data_feed.candles_feed.candles_factory import CandlesConfig
+from hummingbot.data_feed.candles_feed.feature_pipeline import CandlesFeaturePipeline
+from hummingbot.data_feed.candles_feed.incremental_indicators import SMA, BollingerBands
 from hummingbot.smart_components.controllers.directional_trading_controller_base import (
     DirectionalTradingControllerBase,
     DirectionalTradingControllerConfigBase,
@@ -85,32 +88,35 @@ class TrendFollowerV1(DirectionalTradingControllerBase):
             )]
         super().__init__(config, *args, **kwargs)
 
-    def get_signal(self) -> int:
-        return self.get_processed_data()["signal"].iloc[-1]
-
-    def get_processed_data(self) -> pd.DataFrame:
-        df = self.market_data_provider.get_candles_df(connector_name=self.config.candles_connector,
-                                                      trading_pair=self.config.candles_trading_pair,
-                                                      interval=self.config.interval,
-                                                      max_records=self.max_records)
-        # Add indicators
-        df.ta.sma(close='close', length=self.config.sma_fast, append=True)
-        df.ta.sma(close='close', length=self.config.sma_slow, append=True)
-        df.ta.bbands(length=self.config.bb_length, std=self.config.bb_std, append=True)
+    def get_feature_pipeline(self) -> CandlesFeaturePipeline:
+        return self.market_data_provider.get_candles_feature_pipeline(
+            connector_name=self.config.candles_connector,
+            trading_pair=self.config.candles_trading_pair,
+            interval=self.config.interval,
+            max_records=self.max_records,
+            indicators=[SMA(length=self.config.sma_fast),
+                        SMA(length=self.config.sma_slow),
+                        BollingerBands(length=self.config.bb_length, std=self.config.bb_std)])
 
-        sma_fast = df[f"SMA_{self.config.sma_fast}"]
-        sma_slow = df[f"SMA_{self.config.sma_slow}"]
-        bb_upper = df[f"BBU_{self.config.bb_length}_{self.config.bb_std}"]
-        bb_lower = df[f"BBL_{self.config.bb_length}_{self.config.bb_std}"]
+    def get_signal(self) -> int:
+        return int(self.compute_signal(self.get_feature_pipeline().features))
 
-        # Generate signal
-        long_condition = (sma_fast > sma_slow) & (df['close'] < bb_lower + self.config.bb_threshold * (bb_upper - bb_lower))
-        short_condition = (sma_fast < sma_slow) & (df['close'] > bb_upper - self.config.bb_threshold * (bb_upper - bb_lower))
+    def compute_signal(self, features):
+        """
+        Computes the signal from the features of a candle (dict of values) or of the candles (DataFrame).
+        """
+        sma_fast = features[f"SMA_{self.config.sma_fast}"]
+        sma_slow = features[f"SMA_{self.config.sma_slow}"]
+        bb_upper = features[f"BBU_{self.config.bb_length}_{self.config.bb_std}"]
+        bb_lower = features[f"BBL_{self.config.bb_length}_{self.config.bb_std}"]
 
-        df["signal"] = 0
-        df.loc[long_condition, "signal"] = 1
-        df.loc[short_condition, "signal"] = -1
+        long_condition = (sma_fast > sma_slow) & (features['close'] < bb_lower + self.config.bb_threshold * (bb_upper - bb_lower))
+        short_condition = (sma_fast < sma_slow) & (features['close'] > bb_upper - self.config.bb_threshold * (bb_upper - bb_lower))
+        return np.where(long_condition, 1, np.where(short_condition, -1, 0))
 
+    def get_processed_data(self) -> pd.DataFrame:
+        df = self.get_feature_pipeline().features_df
+        df["signal"] = self.compute_signal(df)
         return df
 
     def to_format_status(self) -> List[str]:
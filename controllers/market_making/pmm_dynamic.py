@@ -1,6 +1,6 @@
 import time
 from decimal import Decimal
-from typing import List
+from typing import Any, Dict, List
 
 import pandas_ta as ta  # noqa: F401
 from pydantic import Field, validator
@@ -89,7 +89,7 @@ class PMMDynamicController(MarketMakingControllerBase):
     """
     def __init__(self, config: PMMDynamicControllerConfig, *args, **kwargs):
         self.config = config
-        self.max_records = max(config.macd_slow, config.macd_fast, config.macd_signal, config.natr_length) + 10
+        self.max_records = self.get_max_records(config)
         if len(self.config.candles_config) == 0:
             self.config.candles_config = [CandlesConfig(
                 connector=config.candles_connector,
@@ -99,24 +99,31 @@ class PMMDynamicController(MarketMakingControllerBase):
             )]
         super().__init__(config, *args, **kwargs)
 
+    @staticmethod
+    def get_max_records(config: PMMDynamicControllerConfig) -> int:
+        return max(config.macd_slow, config.macd_fast, config.macd_signal, config.natr_length) + 10
+
     async def update_processed_data(self):
-        candles = self.market_data_provider.get_candles_df(connector_name=self.config.candles_connector,
-                                                           trading_pair=self.config.candles_trading_pair,
-                                                           interval=self.config.interval,
-                                                           max_records=self.max_records)
-        natr = ta.natr(candles["high"], candles["low"], candles["close"], length=self.config.natr_length) / 100
-        macd_output = ta.macd(candles["close"], fast=self.config.macd_fast, slow=self.config.macd_slow, signal=self.config.macd_signal)
-        macd = macd_output[f"MACD_{self.config.macd_fast}_{self.config.macd_slow}_{self.config.macd_signal}"]
+        self.processed_data = self.compute_processed_data(self.config, self.market_data_provider)
+
+    @classmethod
+    def compute_processed_data(cls, config: PMMDynamicControllerConfig, market_data) -> Dict[str, Any]:
+        candles = market_data.get_candles_df(connector_name=config.candles_connector,
+                                             trading_pair=config.candles_trading_pair,
+                                             interval=config.interval,
+                                             max_records=cls.get_max_records(config))
+        natr = ta.natr(candles["high"], candles["low"], candles["close"], length=config.natr_length) / 100
+        macd_output = ta.macd(candles["close"], fast=config.macd_fast, slow=config.macd_slow, signal=config.macd_signal)
+        macd = macd_output[f"MACD_{config.macd_fast}_{config.macd_slow}_{config.macd_signal}"]
         macd_signal = - (macd - macd.mean()) / macd.std()
-        macdh = macd_output[f"MACDh_{self.config.macd_fast}_{self.config.macd_slow}_{self.config.macd_signal}"]
+        macdh = macd_output[f"MACDh_{config.macd_fast}_{config.macd_slow}_{config.macd_signal}"]
         macdh_signal = macdh.apply(lambda x: 1 if x > 0 else -1)
         max_price_shift = natr / 2
         price_multiplier = Decimal(((0.5 * macd_signal + 0.5 * macdh_signal) * max_price_shift).iloc[-1])
         spread_multiplier = Decimal(natr.iloc[-1])
-        mid_price = self.market_data_provider.get_price_by_type(self.config.connector_name, self.config.trading_pair,
-                                                                PriceType.MidPrice)
+        mid_price = market_data.get_price_by_type(config.connector_name, config.trading_pair, PriceType.MidPrice)
         reference_price = mid_price * (1 + price_multiplier)
-        self.processed_data = {"reference_price": reference_price, "spread_multiplier": spread_multiplier}
+        return {"reference_price": reference_price, "spread_multiplier": spread_multiplier}
 
     def get_executor_config(self, level_id: str, price: Decimal, amount: Decimal):
         trade_type = self.get_trade_type_from_level_id(level_id)
@@ -138,6 +138,7 @@ def init_logging(conf_filename: str,
     import pandas as pd
     from ruamel.yaml import YAML
 
+    from hummingbot.logger.log_queue import start_log_queue, stop_log_queue
     from hummingbot.logger.struct_logger import StructLogger, StructLogRecord
     global STRUCT_LOGGER_SET
     if not STRUCT_LOGGER_SET:
@@ -161,7 +162,12 @@ def init_logging(conf_filename: str,
             for logger in config_dict["loggers"]:
                 if logger in client_config_map.logger_override_whitelist:
                     config_dict["loggers"][logger]["level"] = override_log_level
+        # The queued records are passed to the current handlers before they are replaced
+        stop_log_queue()
         logging.config.dictConfig(config_dict)
+        queue_config = config_dict.get("queue")
+        if queue_config is not None and queue_config.get("enabled", False):
+            start_log_queue(queue_config, config_dict.get("loggers", {}).keys())
 
 
 def get_strategy_list() -> List[str]:
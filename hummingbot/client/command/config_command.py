@@ -23,8 +23,6 @@ from hummingbot.connector.utils import split_hb_trading_pair
 from hummingbot.core.utils import map_df_to_str
 from hummingbot.core.utils.async_utils import safe_ensure_future
 from hummingbot.model.inventory_cost import InventoryCost
-from hummingbot.strategy.perpetual_market_making import PerpetualMarketMakingStrategy
-from hummingbot.strategy.pure_market_making import PureMarketMakingStrategy
 from hummingbot.user.user_balances import UserBalances
 
 if TYPE_CHECKING:
@@ -73,6 +71,7 @@ client_configs_to_display = ["autofill_import",
                              "gateway",
                              "gateway_api_host",
                              "gateway_api_port",
+                             "gateway_quote_cache_ttl",
                              "rate_oracle_source",
                              "extra_tokens",
                              "fetch_pairs_from_all_exchanges",
@@ -89,6 +88,9 @@ client_configs_to_display = ["autofill_import",
                              "market_data_collection_enabled",
                              "market_data_collection_interval",
                              "market_data_collection_depth",
+                             "event_journal",
+                             "event_journal_enabled",
+                             "event_journal_max_file_size",
                              ]
 color_settings_to_display = ["top_pane",
                              "bottom_pane",
@@ -319,6 +321,9 @@ class ConfigCommand:
         self.app.app.style = load_style(self.client_config_map)
         for config in missings:
             self.notify(f"{config.key}: {str(config.value)}")
+        from hummingbot.strategy.perpetual_market_making import PerpetualMarketMakingStrategy
+        from hummingbot.strategy.pure_market_making import PureMarketMakingStrategy
+
         if (
                 isinstance(self.strategy, PureMarketMakingStrategy) or
                 isinstance(self.strategy, PerpetualMarketMakingStrategy)
@@ -33,12 +33,6 @@ from hummingbot.client.settings import SCRIPT_STRATEGY_CONF_DIR_PATH, STRATEGIES
 from hummingbot.client.ui.completer import load_completer
 from hummingbot.core.utils.async_utils import safe_ensure_future
 from hummingbot.exceptions import InvalidController, InvalidScriptModule
-from hummingbot.smart_components.controllers.controller_base import ControllerConfigBase
-from hummingbot.smart_components.controllers.directional_trading_controller_base import (
-    DirectionalTradingControllerConfigBase,
-)
-from hummingbot.smart_components.controllers.market_making_controller_base import MarketMakingControllerConfigBase
-from hummingbot.strategy.strategy_v2_base import StrategyV2ConfigBase
 
 if TYPE_CHECKING:
     from hummingbot.client.hummingbot_application import HummingbotApplication  # noqa: F401
@@ -68,6 +62,14 @@ class CreateCommand:
 
     async def prompt_for_controller_config(self,  # type: HummingbotApplication
                                            controller_name: str):
+        from hummingbot.smart_components.controllers.controller_base import ControllerConfigBase
+        from hummingbot.smart_components.controllers.directional_trading_controller_base import (
+            DirectionalTradingControllerConfigBase,
+        )
+        from hummingbot.smart_components.controllers.market_making_controller_base import (
+            MarketMakingControllerConfigBase,
+        )
+
         try:
 
             # Attempt to find and load the correct module
@@ -112,9 +114,16 @@ class CreateCommand:
 
     async def prompt_for_configuration_v2(self,  # type: HummingbotApplication
                                           script_to_config: str):
+        from hummingbot.strategy.strategy_v2_base import StrategyV2ConfigBase
+
         try:
+            # The script is not imported yet if the completer has not listed the scripts with a config
             module = sys.modules.get(f"{settings.SCRIPT_STRATEGIES_MODULE}.{script_to_config}")
-            script_module = importlib.reload(module)
+            if module is not None:
+                script_module = importlib.reload(module)
+            else:
+                script_module = importlib.import_module(f".{script_to_config}",
+                                                        package=settings.SCRIPT_STRATEGIES_MODULE)
             config_class = next((member for member_name, member in inspect.getmembers(script_module)
                                  if
                                  inspect.isclass(member) and member not in [BaseClientModel, StrategyV2ConfigBase] and
@@ -1,18 +1,27 @@
 import asyncio
+import hashlib
 import threading
 import time
+from collections import defaultdict
 from datetime import datetime
 from decimal import Decimal
-from typing import TYPE_CHECKING, List, Optional, Set, Tuple
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple
 
 import pandas as pd
 
 from hummingbot.client.command.gateway_command import GatewayCommand
 from hummingbot.client.performance import PerformanceMetrics
-from hummingbot.client.settings import MAXIMUM_TRADE_FILLS_DISPLAY_OUTPUT, AllConnectorSettings
+from hummingbot.client.performance_checkpoints import PerformanceCheckpoints
+from hummingbot.client.settings import (
+    MAXIMUM_TRADE_FILLS_DISPLAY_OUTPUT,
+    SCRIPT_STRATEGY_CONF_DIR_PATH,
+    STRATEGIES_CONF_DIR_PATH,
+    AllConnectorSettings,
+)
 from hummingbot.client.ui.interface_utils import format_df_for_printout
 from hummingbot.core.utils.async_utils import safe_ensure_future
 from hummingbot.model.trade_fill import TradeFill
+from hummingbot.model.trade_fill_aggregates import TradeFillAggregates
 from hummingbot.user.user_balances import UserBalances
 
 s_float_0 = float(0)
@@ -42,16 +51,13 @@ class HistoryCommand:
             return
         start_time = get_timestamp(days) if days > 0 else self.init_time
         with self.trade_fill_db.get_new_session() as session:
-            trades: List[TradeFill] = self._get_trades_from_session(
-                int(start_time * 1e3),
-                session=session,
-                config_file_path=self.strategy_file_name)
-            if not trades:
+            aggregates = TradeFillAggregates(session, int(start_time * 1e3), config_file_path=self.strategy_file_name)
+            if not aggregates.has_trades():
                 self.notify("\n  No past trades to report.")
                 return
-            if verbose:
-                self.list_trades(start_time)
-            safe_ensure_future(self.history_report(start_time, trades, precision))
+        if verbose:
+            self.list_trades(start_time)
+        safe_ensure_future(self.history_report(start_time, precision=precision))
 
     def get_history_trades_json(self,  # type: HummingbotApplication
                                 days: float = 0):
@@ -67,32 +73,65 @@ class HistoryCommand:
 
     async def history_report(self,  # type: HummingbotApplication
                              start_time: float,
-                             trades: List[TradeFill],
+                             trades: Optional[List[TradeFill]] = None,
                              precision: Optional[int] = None,
                              display_report: bool = True) -> Decimal:
-        market_info: Set[Tuple[str, str]] = set((t.market, t.symbol) for t in trades)
+        """
+        Reports the performance of each market. Without `trades`, the fills of the current strategy config since
+        `start_time` are aggregated by the database, incrementally from the performance checkpoint of the config.
+        """
         if display_report:
             self.report_header(start_time)
         return_pcts = []
-        for market, symbol in market_info:
-            cur_trades = [t for t in trades if t.market == market and t.symbol == symbol]
-            network_timeout = float(self.client_config_map.commands_timeout.other_commands_timeout)
-            try:
-                cur_balances = await asyncio.wait_for(self.get_current_balances(market), network_timeout)
-            except asyncio.TimeoutError:
-                self.notify(
-                    "\nA network error prevented the balances retrieval to complete. See logs for more details."
-                )
-                raise
-            perf = await PerformanceMetrics.create(symbol, cur_trades, cur_balances)
-            if display_report:
-                self.report_performance_by_market(market, symbol, perf, precision)
-            return_pcts.append(perf.return_pct)
+        if trades is not None:
+            trades_by_market: Dict[Tuple[str, str], List[TradeFill]] = defaultdict(list)
+            for trade in trades:
+                trades_by_market[(trade.market, trade.symbol)].append(trade)
+            for (market, symbol), cur_trades in trades_by_market.items():
+                cur_balances = await self._get_current_balances_for_report(market)
+                perf = await PerformanceMetrics.create(symbol, cur_trades, cur_balances)
+                if display_report:
+                    self.report_performance_by_market(market, symbol, perf, precision)
+                return_pcts.append(perf.return_pct)
+        else:
+            with self.trade_fill_db.get_new_session() as session:
+                checkpoints = PerformanceCheckpoints(
+                    session, int(start_time * 1e3), self.strategy_file_name, self._strategy_config_fingerprint())
+                market_performances = checkpoints.market_performances()
+            for summary, derivative_pairing in market_performances:
+                cur_balances = await self._get_current_balances_for_report(summary.market)
+                perf = await PerformanceMetrics.create_from_summary(
+                    summary.symbol, summary, cur_balances, derivative_pairing=derivative_pairing)
+                if display_report:
+                    self.report_performance_by_market(summary.market, summary.symbol, perf, precision)
+                return_pcts.append(perf.return_pct)
         avg_return = sum(return_pcts) / len(return_pcts) if len(return_pcts) > 0 else s_decimal_0
         if display_report and len(return_pcts) > 1:
             self.notify(f"\nAveraged Return = {avg_return:.2%}")
         return avg_return
 
+    def _strategy_config_fingerprint(self,  # type: HummingbotApplication
+                                     ) -> str:
+        """
+        Identifies the content of the strategy config, the performance checkpoint is discarded when it changes.
+        """
+        for conf_dir_path in (STRATEGIES_CONF_DIR_PATH, SCRIPT_STRATEGY_CONF_DIR_PATH):
+            config_path = conf_dir_path / self.strategy_file_name
+            if config_path.is_file():
+                return hashlib.sha256(config_path.read_bytes()).hexdigest()
+        return hashlib.sha256(self.strategy_file_name.encode()).hexdigest()
+
+    async def _get_current_balances_for_report(self,  # type: HummingbotApplication
+                                               market: str) -> Dict[str, Decimal]:
+        network_timeout = float(self.client_config_map.commands_timeout.other_commands_timeout)
+        try:
+            return await asyncio.wait_for(self.get_current_balances(market), network_timeout)
+        except asyncio.TimeoutError:
+            self.notify(
+                "\nA network error prevented the balances retrieval to complete. See logs for more details."
+            )
+            raise
+
     async def get_current_balances(self,  # type: HummingbotApplication
                                    market: str):
         if market in self.markets and self.markets[market].ready:
@@ -208,12 +247,7 @@ class HistoryCommand:
 
         start_time = self.init_time
 
-        with self.trade_fill_db.get_new_session() as session:
-            trades: List[TradeFill] = self._get_trades_from_session(
-                int(start_time * 1e3),
-                session=session,
-                config_file_path=self.strategy_file_name)
-            avg_return = await self.history_report(start_time, trades, display_report=False)
+        avg_return = await self.history_report(start_time, display_report=False)
         return avg_return
 
     def list_trades(self,  # type: HummingbotApplication
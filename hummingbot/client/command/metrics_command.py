@@ -0,0 +1,54 @@
+import threading
+from typing import TYPE_CHECKING, Optional
+
+import pandas as pd
+
+from hummingbot.client.ui.interface_utils import format_df_for_printout
+from hummingbot.core.utils.latency_metrics import LatencyMetricsRegistry
+
+if TYPE_CHECKING:
+    from hummingbot.client.hummingbot_application import HummingbotApplication  # noqa: F401
+
+
+SUBCOMMANDS = ["enable", "disable", "reset"]
+
+
+class MetricsCommand:
+    def metrics(self,  # type: HummingbotApplication
+                option: Optional[str] = None,
+                metric: Optional[str] = None):
+        if threading.current_thread() != threading.main_thread():
+            self.ev_loop.call_soon_threadsafe(self.metrics, option, metric)
+            return
+        registry = LatencyMetricsRegistry.get_instance()
+        if option == "enable":
+            registry.enable()
+            self.notify("Latency metrics collection enabled.")
+        elif option == "disable":
+            registry.disable()
+            self.notify("Latency metrics collection disabled.")
+        elif option == "reset":
+            registry.reset()
+            self.notify("Latency metrics have been reset.")
+        else:
+            self.notify(self.latency_metrics_report(metric))
+
+    def latency_metrics_report(self,  # type: HummingbotApplication
+                               metric: Optional[str] = None) -> str:
+        registry = LatencyMetricsRegistry.get_instance()
+        status = "enabled" if registry.enabled else "disabled (use 'metrics enable' to start collecting)"
+        rows = [row for row in registry.snapshot() if metric is None or row["metric"] == metric]
+        if len(rows) == 0:
+            return f"\n  Latency metrics collection is {status}.\n  No metrics recorded."
+        df = pd.DataFrame(rows).rename(columns={
+            "metric": "Metric",
+            "key": "Key",
+            "count": "Count",
+            "mean_ms": "Mean (ms)",
+            "p50_ms": "p50 (ms)",
+            "p99_ms": "p99 (ms)",
+            "max_ms": "Max (ms)",
+        })
+        df_str = format_df_for_printout(df.round(3), table_format=self.client_config_map.tables_format)
+        lines = ["    " + line for line in df_str.split("\n")]
+        return f"\n  Latency metrics collection is {status}.\n" + "\n".join(lines)
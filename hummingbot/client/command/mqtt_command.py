@@ -4,7 +4,6 @@ import time
 from typing import TYPE_CHECKING
 
 from hummingbot.core.utils.async_utils import safe_ensure_future
-from hummingbot.remote_iface.mqtt import MQTTGateway
 
 if TYPE_CHECKING:
     from hummingbot.client.hummingbot_application import HummingbotApplication  # noqa: F401
@@ -47,6 +46,8 @@ class MQTTCommand:
                                timeout: float = 30.0
                                ):
         if self._mqtt is None:
+            from hummingbot.remote_iface.mqtt import MQTTGateway
+
             while True:
                 try:
                     start_t = time.time()
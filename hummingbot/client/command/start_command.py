@@ -23,9 +23,6 @@ from hummingbot.core.clock import Clock, ClockMode
 from hummingbot.core.rate_oracle.rate_oracle import RateOracle
 from hummingbot.core.utils.async_utils import safe_ensure_future
 from hummingbot.exceptions import InvalidScriptModule, OracleRateUnavailable
-from hummingbot.strategy.directional_strategy_base import DirectionalStrategyBase
-from hummingbot.strategy.script_strategy_base import ScriptStrategyBase
-from hummingbot.strategy.strategy_v2_base import StrategyV2Base, StrategyV2ConfigBase
 
 if TYPE_CHECKING:
     from hummingbot.client.hummingbot_application import HummingbotApplication  # noqa: F401
@@ -204,6 +201,11 @@ class StartCommand(GatewayChainApiManager):
 
         :param script_name: name of the module where the script class is defined
         """
+        # The script strategy bases are only imported when a script is started, they are heavy to import
+        from hummingbot.strategy.directional_strategy_base import DirectionalStrategyBase
+        from hummingbot.strategy.script_strategy_base import ScriptStrategyBase
+        from hummingbot.strategy.strategy_v2_base import StrategyV2Base, StrategyV2ConfigBase
+
         script_name = self.strategy_name
         config = None
         module = sys.modules.get(f"{settings.SCRIPT_STRATEGIES_MODULE}.{script_name}")
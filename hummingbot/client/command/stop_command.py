@@ -5,7 +5,6 @@ from typing import TYPE_CHECKING
 
 from hummingbot.core.rate_oracle.rate_oracle import RateOracle
 from hummingbot.core.utils.async_utils import safe_ensure_future
-from hummingbot.strategy.script_strategy_base import ScriptStrategyBase
 
 if TYPE_CHECKING:
     from hummingbot.client.hummingbot_application import HummingbotApplication  # noqa: F401
@@ -32,6 +31,8 @@ class StopCommand:
         if self._pmm_script_iterator is not None:
             self._pmm_script_iterator.stop(self.clock)
 
+        from hummingbot.strategy.script_strategy_base import ScriptStrategyBase
+
         if isinstance(self.strategy, ScriptStrategyBase):
             self.strategy.on_stop()
 
@@ -57,6 +58,9 @@ class StopCommand:
         if self.markets_recorder is not None:
             self.markets_recorder.stop()
 
+        if self.event_journal is not None:
+            self.event_journal.stop()
+
         if self.kill_switch is not None:
             self.kill_switch.stop()
 
@@ -65,4 +69,5 @@ class StopCommand:
         self.market_pair = None
         self.clock = None
         self.markets_recorder = None
+        self.event_journal = None
         self.market_trading_pairs_map.clear()
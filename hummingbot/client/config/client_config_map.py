@@ -6,9 +6,10 @@ from abc import ABC, abstractmethod
 from decimal import Decimal
 from os.path import dirname
 from pathlib import Path
-from typing import TYPE_CHECKING, Callable, Dict, List, Optional, Union
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Union
 
 from pydantic import BaseModel, Field, SecretStr, root_validator, validator
+from sqlalchemy.pool import QueuePool
 from tabulate import tabulate_formats
 
 from hummingbot.client.config.config_data_types import BaseClientModel, ClientConfigEnum, ClientFieldData
@@ -35,12 +36,12 @@ from hummingbot.connector.exchange_base import ExchangeBase
 from hummingbot.core.rate_oracle.rate_oracle import RATE_ORACLE_SOURCES, RateOracle
 from hummingbot.core.rate_oracle.sources.rate_source_base import RateSourceBase
 from hummingbot.core.utils.kill_switch import ActiveKillSwitch, KillSwitch, PassThroughKillSwitch
-from hummingbot.notifier.telegram_notifier import TelegramNotifier
 from hummingbot.pmm_script.pmm_script_iterator import PMMScriptIterator
 from hummingbot.strategy.strategy_base import StrategyBase
 
 if TYPE_CHECKING:
     from hummingbot.client.hummingbot_application import HummingbotApplication
+    from hummingbot.notifier.telegram_notifier import TelegramNotifier
 
 PMM_SCRIPT_ENABLED_KEY = "pmm_script_enabled"
 PMM_SCRIPT_FILE_PATH_KEY = "pmm_script_file_path"
@@ -184,6 +185,29 @@ class MarketDataCollectionConfigMap(BaseClientModel):
         title = "market_data_collection"
 
 
+class EventJournalConfigMap(BaseClientModel):
+    event_journal_enabled: bool = Field(
+        default=False,
+        client_data=ClientFieldData(
+            prompt=lambda cm: (
+                "Enable/Disable the binary journal of the order events (in data/event_journal)"
+            ),
+        ),
+    )
+    event_journal_max_file_size: int = Field(
+        default=64,
+        ge=1,
+        client_data=ClientFieldData(
+            prompt=lambda cm: (
+                "Set the size in MB at which a new event journal file is started (Default=64)"
+            ),
+        ),
+    )
+
+    class Config:
+        title = "event_journal"
+
+
 class ColorConfigMap(BaseClientModel):
     top_pane: str = Field(
         default="#000000",
@@ -392,7 +416,7 @@ class AutofillImportEnum(str, ClientConfigEnum):
 
 class TelegramMode(BaseClientModel, ABC):
     @abstractmethod
-    def get_notifiers(self, hb: "HummingbotApplication") -> List[TelegramNotifier]:
+    def get_notifiers(self, hb: "HummingbotApplication") -> List["TelegramNotifier"]:
         ...
 
 
@@ -409,7 +433,9 @@ class TelegramEnabledMode(TelegramMode):
     class Config:
         title = "telegram_enabled"
 
-    def get_notifiers(self, hb: "HummingbotApplication") -> List[TelegramNotifier]:
+    def get_notifiers(self, hb: "HummingbotApplication") -> List["TelegramNotifier"]:
+        from hummingbot.notifier.telegram_notifier import TelegramNotifier
+
         notifiers = [
             TelegramNotifier(token=self.telegram_token, chat_id=self.telegram_chat_id, hb=hb)
         ]
@@ -420,7 +446,7 @@ class TelegramDisabledMode(TelegramMode):
     class Config:
         title = "telegram_disabled"
 
-    def get_notifiers(self, hb: "HummingbotApplication") -> List[TelegramNotifier]:
+    def get_notifiers(self, hb: "HummingbotApplication") -> List["TelegramNotifier"]:
         return []
 
 
@@ -435,6 +461,12 @@ class DBMode(BaseClientModel, ABC):
     def get_url(self, db_path: str) -> str:
         ...
 
+    def get_engine_kwargs(self, db_path: str) -> Dict[str, Any]:
+        return {}
+
+    def get_connection_pragmas(self) -> Dict[str, Any]:
+        return {}
+
 
 class DBSqliteMode(DBMode):
     db_engine: str = Field(
@@ -506,9 +538,65 @@ class DBOtherMode(DBMode):
         return v
 
 
+class DBSqlitePerformanceMode(DBSqliteMode):
+    sqlite_journal_mode: str = Field(
+        default="WAL",
+        client_data=ClientFieldData(
+            prompt=lambda cm: "Enter the SQLite journal mode (WAL/DELETE/TRUNCATE/PERSIST/MEMORY/OFF)",
+        ),
+    )
+    sqlite_synchronous: str = Field(
+        default="NORMAL",
+        client_data=ClientFieldData(
+            prompt=lambda cm: "Enter the SQLite synchronous setting (OFF/NORMAL/FULL/EXTRA)",
+        ),
+    )
+    sqlite_cache_size: int = Field(
+        default=-64000,
+        client_data=ClientFieldData(
+            prompt=lambda cm: "Enter the SQLite cache size (in pages, or in KiB if negative)",
+        ),
+    )
+    sqlite_mmap_size: int = Field(
+        default=268435456,
+        client_data=ClientFieldData(
+            prompt=lambda cm: "Enter the SQLite memory-mapped I/O size (in bytes)",
+        ),
+    )
+
+    class Config:
+        title = "sqlite_performance_db_engine"
+
+    def get_engine_kwargs(self, db_path: str) -> Dict[str, Any]:
+        if db_path in ("", ":memory:"):
+            # Each connection to an in-memory database opens a different database
+            return {}
+        # Keep the connections open instead of opening the database file for every session
+        return {"poolclass": QueuePool, "connect_args": {"check_same_thread": False}}
+
+    def get_connection_pragmas(self) -> Dict[str, Any]:
+        return {
+            "journal_mode": self.sqlite_journal_mode,
+            "synchronous": self.sqlite_synchronous,
+            "cache_size": self.sqlite_cache_size,
+            "mmap_size": self.sqlite_mmap_size,
+        }
+
+    @validator("sqlite_journal_mode", "sqlite_synchronous", pre=True)
+    def validate_pragma_value(cls, v: str, field: Field):
+        valid_values = {
+            "sqlite_journal_mode": ["WAL", "DELETE", "TRUNCATE", "PERSIST", "MEMORY", "OFF"],
+            "sqlite_synchronous": ["OFF", "NORMAL", "FULL", "EXTRA"],
+        }[field.name]
+        if str(v).upper() not in valid_values:
+            raise ValueError(f"Invalid value, please choose a value from {valid_values}.")
+        return str(v).upper()
+
+
 DB_MODES = {
     DBSqliteMode.Config.title: DBSqliteMode,
     DBOtherMode.Config.title: DBOtherMode,
+    DBSqlitePerformanceMode.Config.title: DBSqlitePerformanceMode,
 }
 
 
@@ -595,6 +683,16 @@ class GatewayConfigMap(BaseClientModel):
             prompt=lambda cm: "Please enter your Gateway API port",
         ),
     )
+    gateway_quote_cache_ttl: Decimal = Field(
+        default=Decimal("2"),
+        ge=Decimal("0"),
+        client_data=ClientFieldData(
+            prompt=lambda cm: (
+                "How long (in seconds) should AMM price quotes from Gateway be reused? Quotes are always discarded"
+                " when a new block is mined (0 to disable)"
+            ),
+        ),
+    )
 
     class Config:
         title = "gateway"
@@ -1030,6 +1128,9 @@ class ClientConfigMap(BaseClientModel):
         description=("Advanced database options, currently supports SQLAlchemy's included dialects"
                      "\nReference: https://docs.sqlalchemy.org/en/13/dialects/"
                      "\nTo use an instance of SQLite DB the required configuration is \n  db_engine: sqlite"
+                     "\nTo use an instance of SQLite DB tuned for write throughput (WAL journal, reused connections)"
+                     " the configuration is\n  db_engine: sqlite\n  sqlite_journal_mode: WAL"
+                     "\n  sqlite_synchronous: NORMAL\n  sqlite_cache_size: -64000\n  sqlite_mmap_size: 268435456"
                      "\nTo use a DBMS the required configuration is"
                      "\n  db_host: 127.0.0.1\n  db_port: 3306\n  db_username: username\n  db_password: password"
                      "\n  db_name: dbname"),
@@ -1155,6 +1256,7 @@ class ClientConfigMap(BaseClientModel):
         ),
     )
     market_data_collection: MarketDataCollectionConfigMap = Field(default=MarketDataCollectionConfigMap())
+    event_journal: EventJournalConfigMap = Field(default=EventJournalConfigMap())
 
     class Config:
         title = "client_config_map"
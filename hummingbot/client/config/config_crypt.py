@@ -1,6 +1,9 @@
 import binascii
+import hmac
 import json
+import threading
 from abc import ABC, abstractmethod
+from typing import Any, Dict, Optional, Tuple
 
 from eth_account import Account
 from eth_keyfile.keyfile import (
@@ -8,9 +11,13 @@ from eth_keyfile.keyfile import (
     SCRYPT_P,
     SCRYPT_R,
     Random,
+    _derive_pbkdf_key,
+    _derive_scrypt_key,
     _pbkdf2_hash,
     _scrypt_hash,
     big_endian_to_int,
+    decode_hex,
+    decrypt_aes_ctr,
     encode_hex_no_prefix,
     encrypt_aes_ctr,
     get_default_work_factor_for_kdf,
@@ -41,6 +48,12 @@ class BaseSecretsManager(ABC):
     def decrypt_secret_value(self, attr: str, value: str) -> str:
         pass
 
+    def needs_reencryption(self, value: str) -> bool:
+        """
+        Whether the encrypted value should be encrypted again to be decrypted faster by this secrets manager.
+        """
+        return False
+
 
 class ETHKeyFileSecretManger(BaseSecretsManager):
     def encrypt_secret_value(self, attr: str, value: str):
@@ -61,6 +74,107 @@ class ETHKeyFileSecretManger(BaseSecretsManager):
         return decrypted_value
 
 
+class CachedETHKeyFileSecretManager(ETHKeyFileSecretManger):
+    """
+    Reads and writes the same keyfiles as `ETHKeyFileSecretManger`, but keeps the keys derived from the password in
+    memory for the session, so the key derivation function runs once per salt instead of once per secret.
+
+    All the values it encrypts share the salt of the first key it derives (the one of the password verification file
+    when logging in), so that the secrets can be decrypted with a single key derivation. The values encrypted with
+    another salt (by `ETHKeyFileSecretManger`) are still decrypted, and `needs_reencryption` tells which ones to
+    encrypt again. The keyfiles stay valid for `ETHKeyFileSecretManger`.
+    """
+
+    def __init__(self, password: str):
+        super().__init__(password)
+        self._derived_keys: Dict[Tuple[str, str], bytes] = {}
+        self._derivation_locks: Dict[Tuple[str, str], threading.Lock] = {}
+        self._session_key: Optional[Tuple[str, Dict[str, Any], bytes]] = None
+        self._lock = threading.Lock()
+
+    def encrypt_secret_value(self, attr: str, value: str):
+        if self._password is None:
+            raise ValueError(f"Could not encrypt secret attribute {attr} because no password was provided.")
+        kdf, kdfparams, derived_key = self._get_session_key()
+        keyfile_json = _encrypt_with_derived_key(value.encode(), derived_key, kdf, kdfparams)
+        json_str = json.dumps(keyfile_json)
+        encrypted_value = binascii.hexlify(json_str.encode()).decode()
+        return encrypted_value
+
+    def decrypt_secret_value(self, attr: str, value: str) -> str:
+        if self._password is None:
+            raise ValueError(f"Could not decrypt secret attribute {attr} because no password was provided.")
+        crypto = self._crypto_from_encrypted_value(value)
+        derived_key = self._get_derived_key(crypto)
+
+        ciphertext = decode_hex(crypto["ciphertext"])
+        mac = keccak(derived_key[16:32] + ciphertext)
+        if not hmac.compare_digest(mac, decode_hex(crypto["mac"])):
+            raise ValueError("MAC mismatch")
+        with self._lock:
+            if self._session_key is None:
+                self._session_key = (crypto["kdf"], crypto["kdfparams"], derived_key)
+
+        iv = big_endian_to_int(decode_hex(crypto["cipherparams"]["iv"]))
+        decrypted_value = decrypt_aes_ctr(ciphertext, derived_key[:16], iv).decode()
+        return decrypted_value
+
+    def needs_reencryption(self, value: str) -> bool:
+        if self._session_key is None:
+            return False
+        kdf, kdfparams, _ = self._session_key
+        return self._key_id(self._crypto_from_encrypted_value(value)) != self._key_id({"kdf": kdf,
+                                                                                       "kdfparams": kdfparams})
+
+    @staticmethod
+    def _crypto_from_encrypted_value(value: str) -> Dict[str, Any]:
+        keyfile_json = json.loads(binascii.unhexlify(value))
+        if keyfile_json.get("version") != 3:
+            raise ValueError(f"Unsupported keyfile version {keyfile_json.get('version')}.")
+        return keyfile_json["crypto"]
+
+    @staticmethod
+    def _key_id(crypto: Dict[str, Any]) -> Tuple[str, str]:
+        return crypto["kdf"], json.dumps(crypto["kdfparams"], sort_keys=True)
+
+    def _get_derived_key(self, crypto: Dict[str, Any]) -> bytes:
+        key_id = self._key_id(crypto)
+        derived_key = self._derived_keys.get(key_id)
+        if derived_key is None:
+            with self._lock:
+                derivation_lock = self._derivation_locks.setdefault(key_id, threading.Lock())
+            # The files decrypted in parallel wait for the derivation of a shared key instead of repeating it
+            with derivation_lock:
+                derived_key = self._derived_keys.get(key_id)
+                if derived_key is None:
+                    derived_key = _derive_key(crypto, self._password.encode())
+                    self._derived_keys[key_id] = derived_key
+        return derived_key
+
+    def _get_session_key(self) -> Tuple[str, Dict[str, Any], bytes]:
+        with self._lock:
+            if self._session_key is None:
+                kdf = "pbkdf2"
+                salt = Random.get_random_bytes(16)
+                work_factor = get_default_work_factor_for_kdf(kdf)
+                derived_key = _pbkdf2_hash(
+                    self._password.encode(),
+                    hash_name='sha256',
+                    salt=salt,
+                    iterations=work_factor,
+                    dklen=DKLEN,
+                )
+                kdfparams = {
+                    'c': work_factor,
+                    'dklen': DKLEN,
+                    'prf': 'hmac-sha256',
+                    'salt': encode_hex_no_prefix(salt),
+                }
+                self._session_key = (kdf, kdfparams, derived_key)
+                self._derived_keys[self._key_id({"kdf": kdf, "kdfparams": kdfparams})] = derived_key
+            return self._session_key
+
+
 def store_password_verification(secrets_manager: BaseSecretsManager):
     encrypted_word = secrets_manager.encrypt_secret_value(PASSWORD_VERIFICATION_WORD, PASSWORD_VERIFICATION_WORD)
     with open(PASSWORD_VERIFICATION_PATH, "w") as f:
@@ -123,6 +237,10 @@ def _create_v3_keyfile_json(message_to_encrypt, password, kdf="pbkdf2", work_fac
     else:
         raise NotImplementedError("KDF not implemented: {0}".format(kdf))
 
+    return _encrypt_with_derived_key(message_to_encrypt, derived_key, kdf, kdfparams)
+
+
+def _encrypt_with_derived_key(message_to_encrypt, derived_key, kdf, kdfparams):
     iv = big_endian_to_int(Random.get_random_bytes(16))
     encrypt_key = derived_key[:16]
     ciphertext = encrypt_aes_ctr(message_to_encrypt, encrypt_key, iv)
@@ -142,3 +260,13 @@ def _create_v3_keyfile_json(message_to_encrypt, password, kdf="pbkdf2", work_fac
         'version': 3,
         'alias': '',  # Add this line to include the 'alias' field with an empty string value
     }
+
+
+def _derive_key(crypto, password):
+    kdf = crypto['kdf']
+    if kdf == 'pbkdf2':
+        return _derive_pbkdf_key(crypto, password)
+    elif kdf == 'scrypt':
+        return _derive_scrypt_key(crypto, password)
+    else:
+        raise TypeError("Unsupported key derivation function: {0}".format(kdf))
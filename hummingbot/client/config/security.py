@@ -1,7 +1,10 @@
 import asyncio
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, Optional
+from typing import Any, Dict, Optional
+
+from pydantic import SecretStr
 
 from hummingbot.client.config.config_crypt import PASSWORD_VERIFICATION_PATH, BaseSecretsManager, validate_password
 from hummingbot.client.config.config_helpers import (
@@ -11,6 +14,7 @@ from hummingbot.client.config.config_helpers import (
     get_connector_config_yml_path,
     list_connector_configs,
     load_connector_config_map_from_file,
+    read_yml_file,
     reset_connector_hb_config,
     save_to_yml,
     update_connector_hb_config,
@@ -25,6 +29,7 @@ class Security:
     secrets_manager: Optional[BaseSecretsManager] = None
     _secure_configs = {}
     _decryption_done = asyncio.Event()
+    decryption_workers = 8
 
     _logger: Optional[HummingbotLogger] = None
 
@@ -61,14 +66,34 @@ class Security:
         cls._secure_configs.clear()
         cls._decryption_done.clear()
         encrypted_files = list_connector_configs()
-        for file in encrypted_files:
-            cls.decrypt_connector_config(file)
+        if len(encrypted_files) > 0:
+            # The key derivation functions release the GIL, so the files are decrypted in parallel by threads
+            with ThreadPoolExecutor(max_workers=min(len(encrypted_files), cls.decryption_workers),
+                                    thread_name_prefix="ConfigDecryption") as executor:
+                list(executor.map(cls.decrypt_connector_config, encrypted_files))
         cls._decryption_done.set()
 
     @classmethod
     def decrypt_connector_config(cls, file_path: Path):
         connector_name = connector_name_from_file(file_path)
-        cls._secure_configs[connector_name] = load_connector_config_map_from_file(file_path)
+        config_map = load_connector_config_map_from_file(file_path)
+        cls._secure_configs[connector_name] = config_map
+        if cls._needs_reencryption(file_path, config_map):
+            save_to_yml(file_path, config_map)
+            cls.logger().info(f"The secrets of {connector_name} were encrypted again with the session key.")
+
+    @classmethod
+    def _needs_reencryption(cls, file_path: Path, config_map: ClientConfigAdapter) -> bool:
+        encrypted_data: Dict[str, Any] = read_yml_file(file_path)
+        for traversal_item in config_map.traverse():
+            if traversal_item.type_ != SecretStr:
+                continue
+            value = encrypted_data
+            for attr in traversal_item.config_path.split("."):
+                value = value.get(attr) if isinstance(value, dict) else None
+            if isinstance(value, str) and value != "" and cls.secrets_manager.needs_reencryption(value):
+                return True
+        return False
 
     @classmethod
     def update_secure_config(cls, connector_config: ClientConfigAdapter):
@@ -2,10 +2,12 @@
 
 import asyncio
 import logging
+import os
 import time
 from collections import deque
-from typing import Deque, Dict, List, Optional, Tuple, Union
+from typing import TYPE_CHECKING, Deque, Dict, List, Optional, Tuple, Union
 
+from hummingbot import data_path
 from hummingbot.client.command import __all__ as commands
 from hummingbot.client.config.client_config_map import ClientConfigMap
 from hummingbot.client.config.config_helpers import (
@@ -27,6 +29,7 @@ from hummingbot.client.ui.completer import load_completer
 from hummingbot.client.ui.hummingbot_cli import HummingbotCLI
 from hummingbot.client.ui.keybindings import load_key_bindings
 from hummingbot.client.ui.parser import ThrowingArgumentParser, load_parser
+from hummingbot.connector.event_journal import EventJournal
 from hummingbot.connector.exchange.paper_trade import create_paper_trade_market
 from hummingbot.connector.exchange_base import ExchangeBase
 from hummingbot.connector.markets_recorder import MarketsRecorder
@@ -40,11 +43,13 @@ from hummingbot.logger import HummingbotLogger
 from hummingbot.logger.application_warning import ApplicationWarning
 from hummingbot.model.sql_connection_manager import SQLConnectionManager
 from hummingbot.notifier.notifier_base import NotifierBase
-from hummingbot.remote_iface.mqtt import MQTTGateway
 from hummingbot.strategy.maker_taker_market_pair import MakerTakerMarketPair
 from hummingbot.strategy.market_trading_pair_tuple import MarketTradingPairTuple
 from hummingbot.strategy.strategy_base import StrategyBase
 
+if TYPE_CHECKING:
+    from hummingbot.remote_iface.mqtt import MQTTGateway
+
 s_logger = None
 
 
@@ -104,10 +109,11 @@ class HummingbotApplication(*commands):
 
         self.trade_fill_db: Optional[SQLConnectionManager] = None
         self.markets_recorder: Optional[MarketsRecorder] = None
+        self.event_journal: Optional[EventJournal] = None
         self._pmm_script_iterator = None
         self._binance_connector = None
         self._shared_client = None
-        self._mqtt: MQTTGateway = None
+        self._mqtt: Optional["MQTTGateway"] = None
 
         # gateway variables and monitor
         self._gateway_monitor = GatewayStatusMonitor(self)
@@ -328,6 +334,15 @@ class HummingbotApplication(*commands):
             self.client_config_map.market_data_collection,
         )
         self.markets_recorder.start()
+        event_journal_config = self.client_config_map.event_journal
+        if event_journal_config.event_journal_enabled:
+            self.event_journal = EventJournal(
+                list(self.markets.values()),
+                journal_dir=os.path.join(data_path(), "event_journal"),
+                journal_name=os.path.splitext(self.strategy_file_name)[0],
+                max_file_size=event_journal_config.event_journal_max_file_size * 1024 * 1024,
+            )
+            self.event_journal.start()
         if self._mqtt is not None:
             self._mqtt.start_market_events_fw()
 
@@ -1,8 +1,8 @@
 import logging
-from collections import defaultdict
+from collections import defaultdict, deque
 from dataclasses import dataclass
 from decimal import Decimal
-from typing import Any, Dict, List, Optional, Tuple
+from typing import TYPE_CHECKING, Any, Callable, Deque, Dict, Iterable, List, Optional, Tuple
 
 from hummingbot.connector.utils import combine_to_hb_trading_pair, split_hb_trading_pair
 from hummingbot.core.data_type.common import PositionAction, TradeType
@@ -11,10 +11,180 @@ from hummingbot.core.rate_oracle.rate_oracle import RateOracle
 from hummingbot.logger import HummingbotLogger
 from hummingbot.model.trade_fill import TradeFill
 
+if TYPE_CHECKING:
+    from hummingbot.model.trade_fill_aggregates import MarketTradesSummary
+
 s_decimal_0 = Decimal("0")
 s_decimal_nan = Decimal("NaN")
 
 
+class AggregatedOrder:
+    """
+    The fills of one order, aggregated without modifying the fills. The price is the average of the fill prices and
+    the amount is the sum of the fill amounts.
+    """
+
+    __slots__ = ("order_id", "trade_type", "position", "amount", "_price_sum", "_fills_count")
+
+    def __init__(self, fill: Any):
+        self.order_id = fill.order_id
+        self.trade_type = fill.trade_type
+        self.position = fill.position
+        self.amount = 0
+        self._price_sum = 0
+        self._fills_count = 0
+        self.add_fill(fill)
+
+    @property
+    def price(self):
+        return self._price_sum / self._fills_count
+
+    def add_fill(self, fill: Any):
+        self._price_sum += fill.price
+        self.amount += fill.amount
+        self._fills_count += 1
+
+    def to_json(self) -> List[Any]:
+        return [self.order_id, self.trade_type, self.position, str(self.amount), str(self._price_sum),
+                self._fills_count]
+
+    @classmethod
+    def from_json(cls, data: List[Any]) -> "AggregatedOrder":
+        order = cls.__new__(cls)
+        order.order_id, order.trade_type, order.position = data[0], data[1], data[2]
+        order.amount, order._price_sum = Decimal(data[3]), Decimal(data[4])
+        order._fills_count = data[5]
+        return order
+
+
+class PositionPair:
+    """
+    An open position order paired with the order that closed it, and the PnL of the closed position.
+    """
+
+    __slots__ = ("open_order", "close_order", "is_long", "pnl")
+
+    def __init__(self, open_order: AggregatedOrder, close_order: AggregatedOrder, is_long: bool):
+        self.open_order = open_order
+        self.close_order = close_order
+        self.is_long = is_long
+        self.pnl = self.current_pnl()
+
+    def current_pnl(self):
+        # It is assumed that the amount and leverage for both open and close orders are the same.
+        if self.is_long:
+            return (self.close_order.price - self.open_order.price) * self.close_order.amount
+        return (self.open_order.price - self.close_order.price) * self.close_order.amount
+
+
+class DerivativePositionPairing:
+    """
+    Pairs the open and close position orders of derivative fills in FIFO order, in a single pass over the fills.
+
+    The fills of each order are aggregated, and each order is queued by the side and position of its first fill. The
+    first buy that opened a position is paired with the first sell that closed one (long positions), and the first
+    sell that opened a position with the first buy that closed one (short positions). Fills can come from any
+    iterable, including a cursor streaming `TradeFill` rows from the database.
+
+    The PnL of the closed positions is updated with each fill. With `max_unsettled_pairs`, only the most recent pairs
+    are kept to account for the later fills of their orders. The older pairs are settled: their PnL is kept and their
+    orders are forgotten, so the state of a pairing that keeps receiving fills stays bounded.
+    """
+
+    def __init__(self, max_unsettled_pairs: Optional[int] = None):
+        self._max_unsettled_pairs = max_unsettled_pairs
+        self._orders: Dict[Tuple[str, bool], AggregatedOrder] = {}
+        self._long_opens: Deque[AggregatedOrder] = deque()
+        self._long_closes: Deque[AggregatedOrder] = deque()
+        self._short_opens: Deque[AggregatedOrder] = deque()
+        self._short_closes: Deque[AggregatedOrder] = deque()
+        self._pairs: Deque[PositionPair] = deque()
+        self._order_pairs: Dict[Tuple[str, bool], PositionPair] = {}
+        self._pnl = 0
+
+    def add_fills(self, fills: Iterable[Any]):
+        for fill in fills:
+            self.add_fill(fill)
+
+    def add_fill(self, fill: Any):
+        key = (fill.order_id, fill.trade_type.upper() == TradeType.BUY.name)
+        order = self._orders.get(key)
+        if order is not None:
+            order.add_fill(fill)
+            pair = self._order_pairs.get(key)
+            if pair is not None:
+                previous_pnl, pair.pnl = pair.pnl, pair.current_pnl()
+                self._pnl += pair.pnl - previous_pnl
+            return
+        order = AggregatedOrder(fill)
+        if order.position == PositionAction.OPEN.value:
+            (self._long_opens if key[1] else self._short_opens).append(order)
+        elif order.position == PositionAction.CLOSE.value:
+            (self._short_closes if key[1] else self._long_closes).append(order)
+        else:
+            return
+        self._orders[key] = order
+        while self._long_opens and self._long_closes:
+            self._add_pair(PositionPair(self._long_opens.popleft(), self._long_closes.popleft(), is_long=True))
+        while self._short_opens and self._short_closes:
+            self._add_pair(PositionPair(self._short_opens.popleft(), self._short_closes.popleft(), is_long=False))
+
+    def pnl(self) -> Decimal:
+        return Decimal(str(self._pnl))
+
+    def to_json(self) -> Dict[str, Any]:
+        """
+        Serializes the pairing state, so that it can be restored to pair the fills received later.
+        """
+        orders = list(self._orders.values())
+        index = {id(order): i for i, order in enumerate(orders)}
+        return {
+            "orders": [order.to_json() for order in orders],
+            "long_opens": [index[id(order)] for order in self._long_opens],
+            "long_closes": [index[id(order)] for order in self._long_closes],
+            "short_opens": [index[id(order)] for order in self._short_opens],
+            "short_closes": [index[id(order)] for order in self._short_closes],
+            "pairs": [[index[id(pair.open_order)], index[id(pair.close_order)], pair.is_long] for pair in self._pairs],
+            "pnl": str(self._pnl),
+        }
+
+    @classmethod
+    def from_json(cls,
+                  data: Dict[str, Any],
+                  max_unsettled_pairs: Optional[int] = None) -> "DerivativePositionPairing":
+        pairing = cls(max_unsettled_pairs=max_unsettled_pairs)
+        orders = [AggregatedOrder.from_json(order) for order in data["orders"]]
+        for order in orders:
+            pairing._orders[pairing._order_key(order)] = order
+        pairing._long_opens.extend(orders[i] for i in data["long_opens"])
+        pairing._long_closes.extend(orders[i] for i in data["long_closes"])
+        pairing._short_opens.extend(orders[i] for i in data["short_opens"])
+        pairing._short_closes.extend(orders[i] for i in data["short_closes"])
+        for i, j, is_long in data["pairs"]:
+            pair = PositionPair(orders[i], orders[j], is_long)
+            pairing._pairs.append(pair)
+            pairing._order_pairs[pairing._order_key(pair.open_order)] = pair
+            pairing._order_pairs[pairing._order_key(pair.close_order)] = pair
+        pairing._pnl = Decimal(data["pnl"])
+        return pairing
+
+    @staticmethod
+    def _order_key(order: AggregatedOrder) -> Tuple[str, bool]:
+        return order.order_id, order.trade_type.upper() == TradeType.BUY.name
+
+    def _add_pair(self, pair: PositionPair):
+        self._pnl += pair.pnl
+        self._pairs.append(pair)
+        self._order_pairs[self._order_key(pair.open_order)] = pair
+        self._order_pairs[self._order_key(pair.close_order)] = pair
+        while self._max_unsettled_pairs is not None and len(self._pairs) > self._max_unsettled_pairs:
+            settled_pair = self._pairs.popleft()
+            for settled_order in (settled_pair.open_order, settled_pair.close_order):
+                key = self._order_key(settled_order)
+                del self._orders[key]
+                del self._order_pairs[key]
+
+
 @dataclass
 class PerformanceMetrics:
     _logger = None
@@ -71,6 +241,24 @@ class PerformanceMetrics:
         await performance._initialize_metrics(trading_pair, trades, current_balances)
         return performance
 
+    @classmethod
+    async def create_from_summary(cls,
+                                  trading_pair: str,
+                                  summary: "MarketTradesSummary",
+                                  current_balances: Dict[str, Decimal],
+                                  derivative_fills: Optional[Callable[[], Iterable[Any]]] = None,
+                                  derivative_pairing: Optional[DerivativePositionPairing] = None,
+                                  ) -> 'PerformanceMetrics':
+        """
+        Same as `create`, from the totals of the fills computed by the database instead of the list of fills
+        :param derivative_fills: returns the fills in chronological order, only called to pair derivative positions
+        :param derivative_pairing: the pairing of the fills preceding `derivative_fills`, updated with them
+        """
+        performance = PerformanceMetrics()
+        await performance._initialize_metrics_from_summary(
+            trading_pair, summary, current_balances, derivative_fills, derivative_pairing)
+        return performance
+
     @staticmethod
     def position_order(open: list, close: list) -> Tuple[Any, Any]:
         """
@@ -94,22 +282,22 @@ class PerformanceMetrics:
 
     @staticmethod
     def aggregate_orders(orders: list) -> list:
-        grouped_orders = {}
+        """
+        Aggregates the fills of each order. Orders with a single fill are returned as they are, the fills of orders
+        with several fills are aggregated in an `AggregatedOrder` (the fills are not modified).
+        """
+        grouped_orders: Dict[Any, list] = {}
         for order in orders:
-            group = grouped_orders.get(order.order_id, [])
-            group.append(order)
-            grouped_orders[order.order_id] = group
+            grouped_orders.setdefault(order.order_id, []).append(order)
 
         aggregated_orders = []
         for group in grouped_orders.values():
-            aggregated_prices = 0
-            aggregated_amounts = 0
-            for order in group:
-                aggregated_prices += order.price
-                aggregated_amounts += order.amount
-            aggregated = group[0]
-            aggregated.price = aggregated_prices / len(group)
-            aggregated.amount = aggregated_amounts
+            if len(group) == 1:
+                aggregated_orders.append(group[0])
+                continue
+            aggregated = AggregatedOrder(group[0])
+            for order in group[1:]:
+                aggregated.add_fill(order)
             aggregated_orders.append(aggregated)
 
         return aggregated_orders
@@ -196,6 +384,11 @@ class PerformanceMetrics:
 
             self.s_vol_quote += self._process_deducted_fees_impact_in_quote_vol(trade)
 
+        self._calculate_volume_totals()
+
+        return buys, sells
+
+    def _calculate_volume_totals(self):
         self.tot_vol_base = self.b_vol_base + self.s_vol_base
         self.tot_vol_quote = self.b_vol_quote + self.s_vol_quote
 
@@ -206,8 +399,6 @@ class PerformanceMetrics:
         self.avg_b_price = abs(self.avg_b_price)
         self.avg_s_price = abs(self.avg_s_price)
 
-        return buys, sells
-
     def _process_deducted_fees_impact_in_quote_vol(self, trade):
         fee_percent = None
         fee_type = ""
@@ -248,6 +439,9 @@ class PerformanceMetrics:
             for flat_fee in flat_fees:
                 self.fees[flat_fee.token] += flat_fee.amount
 
+        await self._calculate_fee_in_quote(quote)
+
+    async def _calculate_fee_in_quote(self, quote: str):
         for fee_token, fee_amount in self.fees.items():
             if fee_token == quote:
                 self.fee_in_quote += fee_amount
@@ -262,27 +456,27 @@ class PerformanceMetrics:
                         f"using {RateOracle.get_instance()}. PNL value will be inconsistent."
                     )
 
+    @staticmethod
+    def derivative_trade_pnl(fills: Iterable[Any]) -> Decimal:
+        """
+        Calculates the PnL of the closed derivative positions
+        :param fills: the fills (TradeFill rows) in chronological order, either a list or a streaming cursor
+        :return: the sum of the PnL of the closed positions
+        """
+        pairing = DerivativePositionPairing()
+        pairing.add_fills(fills)
+        return pairing.pnl()
+
     def _calculate_trade_pnl(self, buys: list, sells: list):
         self.trade_pnl = self.cur_value - self.hold_value
 
         # Handle trade_pnl differently for derivatives
         if self._are_derivatives(buys) or self._are_derivatives(sells):
-            buys_copy, sells_copy = self.aggregate_position_order(buys.copy(), sells.copy())
-            long = []
-            short = []
-
-            while True:
-                lng = self.position_order(buys_copy, sells_copy)
-                if lng is not None:
-                    long.append(lng)
-
-                sht = self.position_order(sells_copy, buys_copy)
-                if sht is not None:
-                    short.append(sht)
-                if lng is None and sht is None:
-                    break
-
-            self.trade_pnl = Decimal(str(sum(self.derivative_pnl(long, short))))
+            # Positions are paired within each side, so the buys and sells do not need to be merged back
+            pairing = DerivativePositionPairing()
+            pairing.add_fills(buys)
+            pairing.add_fills(sells)
+            self.trade_pnl = pairing.pnl()
 
     async def _initialize_metrics(self,
                                   trading_pair: str,
@@ -302,15 +496,69 @@ class PerformanceMetrics:
         self.num_sells = len(sells)
         self.num_trades = self.num_buys + self.num_sells
 
+        await self._calculate_balances_and_values(
+            trading_pair, Decimal(str(trades[0].price)), Decimal(str(trades[-1].price)), current_balances)
+        self._calculate_trade_pnl(buys, sells)
+
+        await self._calculate_fees(quote, trades)
+
+        self.total_pnl = self.trade_pnl - self.fee_in_quote
+        self.return_pct = self.divide(self.total_pnl, self.hold_value)
+
+    async def _initialize_metrics_from_summary(self,
+                                               trading_pair: str,
+                                               summary: "MarketTradesSummary",
+                                               current_balances: Dict[str, Decimal],
+                                               derivative_fills: Optional[Callable[[], Iterable[Any]]],
+                                               derivative_pairing: Optional[DerivativePositionPairing]):
+        base, quote = split_hb_trading_pair(trading_pair)
+
+        self.num_buys = summary.buys.count
+        self.num_sells = summary.sells.count
+        self.num_trades = summary.num_trades
+
+        self.b_vol_base = summary.buys.base_volume
+        self.b_vol_quote = summary.buys.quote_volume * Decimal("-1")
+        self.s_vol_base = summary.sells.base_volume * Decimal("-1")
+        self.s_vol_quote = (summary.sells.quote_volume
+                            - summary.buys.deducted_fee_volume
+                            - summary.sells.deducted_fee_volume)
+        self._calculate_volume_totals()
+
+        await self._calculate_balances_and_values(
+            trading_pair, summary.first_price, summary.last_price, current_balances)
+        self.trade_pnl = self.cur_value - self.hold_value
+        if summary.are_derivatives and (derivative_fills is not None or derivative_pairing is not None):
+            pairing = derivative_pairing if derivative_pairing is not None else DerivativePositionPairing()
+            if derivative_fills is not None:
+                pairing.add_fills(derivative_fills())
+            self.trade_pnl = pairing.pnl()
+
+        if summary.buys.percent_fee_count + summary.sells.percent_fee_count > 0:
+            self.fees[quote] += summary.buys.percent_fee_volume + summary.sells.percent_fee_volume
+        for fee_token, fee_amount in summary.flat_fees.items():
+            self.fees[fee_token] += fee_amount
+        await self._calculate_fee_in_quote(quote)
+
+        self.total_pnl = self.trade_pnl - self.fee_in_quote
+        self.return_pct = self.divide(self.total_pnl, self.hold_value)
+
+    async def _calculate_balances_and_values(self,
+                                             trading_pair: str,
+                                             start_price: Decimal,
+                                             last_price: Decimal,
+                                             current_balances: Dict[str, Decimal]):
+        base, quote = split_hb_trading_pair(trading_pair)
+
         self.cur_base_bal = current_balances.get(base, s_decimal_0)
         self.cur_quote_bal = current_balances.get(quote, s_decimal_0)
         self.start_base_bal = self.cur_base_bal - self.tot_vol_base
         self.start_quote_bal = self.cur_quote_bal - self.tot_vol_quote
 
-        self.start_price = Decimal(str(trades[0].price))
+        self.start_price = start_price
         self.cur_price = await RateOracle.get_instance().stored_or_live_rate(trading_pair)
         if self.cur_price is None:
-            self.cur_price = Decimal(str(trades[-1].price))
+            self.cur_price = last_price
         self.start_base_ratio_pct = self.divide(self.start_base_bal * self.start_price,
                                                 (self.start_base_bal * self.start_price) + self.start_quote_bal)
         self.cur_base_ratio_pct = self.divide(self.cur_base_bal * self.cur_price,
@@ -318,9 +566,3 @@ class PerformanceMetrics:
 
         self.hold_value = (self.start_base_bal * self.cur_price) + self.start_quote_bal
         self.cur_value = (self.cur_base_bal * self.cur_price) + self.cur_quote_bal
-        self._calculate_trade_pnl(buys, sells)
-
-        await self._calculate_fees(quote, trades)
-
-        self.total_pnl = self.trade_pnl - self.fee_in_quote
-        self.return_pct = self.divide(self.total_pnl, self.hold_value)
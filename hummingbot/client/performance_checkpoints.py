@@ -0,0 +1,187 @@
+from typing import Dict, List, Optional, Tuple
+
+from sqlalchemy.orm import Session
+
+from hummingbot.client.performance import DerivativePositionPairing
+from hummingbot.model.performance_checkpoint import PerformanceCheckpoint
+from hummingbot.model.trade_fill_aggregates import MarketTradesSummary, TradeFillAggregates
+
+CHECKPOINT_STATE_VERSION = 2
+# The fills of the orders of older derivative position pairs are not expected anymore
+MAX_UNSETTLED_POSITION_PAIRS = 1000
+
+MarketKey = Tuple[str, str]
+MarketPerformanceState = Tuple[MarketTradesSummary, Optional[DerivativePositionPairing]]
+
+
+class PerformanceCheckpoints:
+    """
+    Keeps the performance totals of the fills of a strategy config in the database, so that each history report only
+    aggregates the fills recorded since the previous report instead of all the fills since the start time.
+
+    The checkpoint holds, for each market, the `MarketTradesSummary` of the fills and the state of the pairing of
+    derivative positions, and the id of the last processed fill. When the start time moves forward (`history --days`),
+    the totals of the fills that are now before it are subtracted, and only the pairing of the derivative positions
+    is computed again. The checkpoint is discarded and rebuilt from all the fills when the start time moves backward
+    or the config fingerprint (the content of the config file) changes.
+
+    The fill ids are SQLite rowids, with other database engines the fills are aggregated in full for each report.
+    """
+
+    def __init__(self,
+                 sql_session: Session,
+                 start_timestamp: int,
+                 config_file_path: str,
+                 config_fingerprint: str,
+                 batch_size: int = 1000):
+        self._session = sql_session
+        self._start_timestamp = start_timestamp
+        self._config_file_path = config_file_path
+        self._config_fingerprint = config_fingerprint
+        self._batch_size = batch_size
+
+    def market_performances(self) -> List[MarketPerformanceState]:
+        """
+        Returns the summary of the fills of each market (and the pairing of its derivative positions), updated with
+        the fills recorded since the checkpoint, and stores the updated checkpoint.
+        """
+        summaries: Dict[MarketKey, MarketTradesSummary] = {}
+        pairings: Dict[MarketKey, DerivativePositionPairing] = {}
+        if self._session.get_bind().dialect.name != "sqlite":
+            self._add_fills(summaries, pairings, self._aggregates())
+            return [(summary, pairings.get(key)) for key, summary in summaries.items()]
+
+        checkpoint: Optional[PerformanceCheckpoint] = self._session.get(PerformanceCheckpoint, self._config_file_path)
+        after_fill_id: Optional[int] = None
+        is_up_to_date = False
+        if checkpoint is not None and self._is_valid(checkpoint):
+            summaries, pairings = self._restore_state(checkpoint.state)
+            after_fill_id = checkpoint.last_fill_id
+            is_up_to_date = checkpoint.start_timestamp == self._start_timestamp
+            if not is_up_to_date and not self._remove_fills_before_start(summaries, pairings, checkpoint):
+                return self._rebuild(checkpoint)
+
+        until_fill_id = self._aggregates(after_fill_id=after_fill_id).last_fill_id()
+        if until_fill_id is not None:
+            new_fills = self._aggregates(after_fill_id=after_fill_id, until_fill_id=until_fill_id)
+            if not self._add_fills(summaries, pairings, new_fills):
+                # The previous fills of a market that now has derivative positions were not paired
+                return self._rebuild(checkpoint)
+        if not is_up_to_date or until_fill_id is not None:
+            self._store(checkpoint, summaries, pairings, until_fill_id or after_fill_id or 0)
+
+        return [(summary, pairings.get(key)) for key, summary in summaries.items()]
+
+    def _aggregates(self, **kwargs) -> TradeFillAggregates:
+        return TradeFillAggregates(
+            self._session, self._start_timestamp, self._config_file_path, self._batch_size, **kwargs)
+
+    def _is_valid(self, checkpoint: PerformanceCheckpoint) -> bool:
+        return (checkpoint.start_timestamp <= self._start_timestamp
+                and checkpoint.config_fingerprint == self._config_fingerprint
+                and checkpoint.state.get("version") == CHECKPOINT_STATE_VERSION)
+
+    @staticmethod
+    def _add_fills(summaries: Dict[MarketKey, MarketTradesSummary],
+                   pairings: Dict[MarketKey, DerivativePositionPairing],
+                   new_fills: TradeFillAggregates) -> bool:
+        """
+        Merges the totals of `new_fills` and pairs their derivative positions. Returns `False` if the previous fills of
+        a market were not paired.
+        """
+        for new_summary in new_fills.market_summaries():
+            key = (new_summary.market, new_summary.symbol)
+            summary = summaries.get(key)
+            if summary is None:
+                summary = new_summary
+                summaries[key] = summary
+            else:
+                summary.merge(new_summary)
+            if summary.are_derivatives:
+                pairing = pairings.get(key)
+                if pairing is None:
+                    if summary is not new_summary:
+                        return False
+                    pairing = DerivativePositionPairing(max_unsettled_pairs=MAX_UNSETTLED_POSITION_PAIRS)
+                    pairings[key] = pairing
+                pairing.add_fills(new_fills.stream_trades(new_summary.market, new_summary.symbol))
+            else:
+                pairings.pop(key, None)
+        return True
+
+    def _remove_fills_before_start(self,
+                                   summaries: Dict[MarketKey, MarketTradesSummary],
+                                   pairings: Dict[MarketKey, DerivativePositionPairing],
+                                   checkpoint: PerformanceCheckpoint) -> bool:
+        """
+        Subtracts the totals of the fills of the checkpoint that are before the start time. Returns `False` if they
+        are not consistent with the checkpoint.
+        """
+        expired_fills = TradeFillAggregates(self._session,
+                                            checkpoint.start_timestamp,
+                                            self._config_file_path,
+                                            self._batch_size,
+                                            end_timestamp=self._start_timestamp,
+                                            until_fill_id=checkpoint.last_fill_id)
+        remaining_fills = self._aggregates(until_fill_id=checkpoint.last_fill_id)
+        for expired_summary in expired_fills.market_summaries():
+            key = (expired_summary.market, expired_summary.symbol)
+            summary = summaries.get(key)
+            if summary is None:
+                return False
+            summary.subtract(expired_summary)
+            if summary.num_trades == 0:
+                del summaries[key]
+                pairings.pop(key, None)
+                continue
+            summary.first_timestamp, summary.first_price = remaining_fills.edge_fill(
+                summary.market, summary.symbol, first=True)
+            if key in pairings:
+                # The positions are paired from the first fill after the start time
+                pairing = DerivativePositionPairing(max_unsettled_pairs=MAX_UNSETTLED_POSITION_PAIRS)
+                pairing.add_fills(remaining_fills.stream_trades(summary.market, summary.symbol))
+                pairings[key] = pairing
+        return True
+
+    def _rebuild(self, checkpoint: Optional[PerformanceCheckpoint]) -> List[MarketPerformanceState]:
+        if checkpoint is not None:
+            self._session.delete(checkpoint)
+            self._session.commit()
+        return self.market_performances()
+
+    @staticmethod
+    def _restore_state(state: dict) -> Tuple[Dict[MarketKey, MarketTradesSummary],
+                                             Dict[MarketKey, DerivativePositionPairing]]:
+        summaries = {}
+        pairings = {}
+        for market_state in state["markets"]:
+            summary = MarketTradesSummary.from_json(market_state["summary"])
+            key = (summary.market, summary.symbol)
+            summaries[key] = summary
+            if market_state.get("pairing") is not None:
+                pairings[key] = DerivativePositionPairing.from_json(
+                    market_state["pairing"], max_unsettled_pairs=MAX_UNSETTLED_POSITION_PAIRS)
+        return summaries, pairings
+
+    def _store(self,
+               checkpoint: Optional[PerformanceCheckpoint],
+               summaries: Dict[MarketKey, MarketTradesSummary],
+               pairings: Dict[MarketKey, DerivativePositionPairing],
+               last_fill_id: int):
+        if checkpoint is None:
+            checkpoint = PerformanceCheckpoint(config_file_path=self._config_file_path)
+            self._session.add(checkpoint)
+        checkpoint.config_fingerprint = self._config_fingerprint
+        checkpoint.start_timestamp = self._start_timestamp
+        checkpoint.last_fill_id = last_fill_id
+        checkpoint.state = {
+            "version": CHECKPOINT_STATE_VERSION,
+            "markets": [
+                {
+                    "summary": summary.to_json(),
+                    "pairing": pairings[key].to_json() if key in pairings else None,
+                }
+                for key, summary in summaries.items()
+            ],
+        }
+        self._session.commit()
@@ -1,11 +1,14 @@
+import hashlib
 import importlib
 import json
+import logging
 from decimal import Decimal
 from enum import Enum
 from os import DirEntry, scandir
 from os.path import exists, join, realpath
+from pathlib import Path
 from types import ModuleType
-from typing import TYPE_CHECKING, Any, Dict, List, NamedTuple, Optional, Set, Union, cast
+from typing import TYPE_CHECKING, Any, Dict, Iterator, List, NamedTuple, Optional, Set, Tuple, Union, cast
 
 from pydantic import SecretStr
 
@@ -58,6 +61,9 @@ GATEAWAY_CLIENT_CERT_PATH = DEFAULT_GATEWAY_CERTS_PATH / "client_cert.pem"
 GATEAWAY_CLIENT_KEY_PATH = DEFAULT_GATEWAY_CERTS_PATH / "client_key.pem"
 
 CONNECTOR_SUBMODULES_THAT_ARE_NOT_CEX_TYPES = ["test_support", "utilities", "gateway"]
+# Precomputed connector settings, generated with `python bin/generate_connector_manifest.py` (run by `./compile`)
+CONNECTOR_MANIFEST_PATH = root_path() / "hummingbot" / "connector" / "connector_manifest.json"
+CONNECTOR_MANIFEST_VERSION = 1
 
 
 class ConnectorType(Enum):
@@ -167,22 +173,48 @@ class GatewayConnectionSetting:
         GatewayConnectionSetting.save(connectors_conf)
 
 
-class ConnectorSetting(NamedTuple):
+class ConnectorConfigKeysReference(NamedTuple):
+    """
+    Locates the config keys of a connector in its utils module, so that the module is only imported when the keys
+    are used.
+    """
+    util_module_path: str
+    domain: Optional[str] = None
+
+    def load(self) -> Optional["BaseConnectorConfigMap"]:
+        util_module = importlib.import_module(self.util_module_path)
+        if self.domain is None:
+            return getattr(util_module, "KEYS", None)
+        return getattr(util_module, "OTHER_DOMAINS_KEYS")[self.domain]
+
+
+class _ConnectorSettingFields(NamedTuple):
     name: str
     type: ConnectorType
     example_pair: str
     centralised: bool
     use_ethereum_wallet: bool
     trade_fee_schema: TradeFeeSchema
-    config_keys: Optional["BaseConnectorConfigMap"]
+    config_keys: Union[Optional["BaseConnectorConfigMap"], ConnectorConfigKeysReference]
     is_sub_domain: bool
     parent_name: Optional[str]
     domain_parameter: Optional[str]
     use_eth_gas_lookup: bool
+
+
+class ConnectorSetting(_ConnectorSettingFields):
     """
     This class has metadata data about Exchange connections. The name of the connection and the file path location of
     the connector file.
     """
+    __slots__ = ()
+
+    @property
+    def config_keys(self) -> Optional["BaseConnectorConfigMap"]:
+        config_keys = super().config_keys
+        if isinstance(config_keys, ConnectorConfigKeysReference):
+            config_keys = config_keys.load()
+        return config_keys
 
     def uses_gateway_generic_connector(self) -> bool:
         non_gateway_connectors_types = [ConnectorType.Exchange, ConnectorType.Derivative, ConnectorType.Connector]
@@ -367,68 +399,12 @@ class AllConnectorSettings:
     def create_connector_settings(cls):
         """
         Iterate over files in specific Python directories to create a dictionary of exchange names to ConnectorSetting.
+        The settings are read from the connector manifest when it is up to date, which avoids importing the utils
+        module of every connector.
         """
-        cls.all_connector_settings = {}  # reset
-        connector_exceptions = ["mock_paper_exchange", "mock_pure_python_paper_exchange", "paper_trade"]
-
-        type_dirs: List[DirEntry] = [
-            cast(DirEntry, f) for f in scandir(f"{root_path() / 'hummingbot' / 'connector'}")
-            if f.is_dir() and f.name not in CONNECTOR_SUBMODULES_THAT_ARE_NOT_CEX_TYPES
-        ]
-        for type_dir in type_dirs:
-            if type_dir.name == 'gateway':
-                continue
-            connector_dirs: List[DirEntry] = [
-                cast(DirEntry, f) for f in scandir(type_dir.path)
-                if f.is_dir() and exists(join(f.path, "__init__.py"))
-            ]
-            for connector_dir in connector_dirs:
-                if connector_dir.name.startswith("_") or connector_dir.name in connector_exceptions:
-                    continue
-                if connector_dir.name in cls.all_connector_settings:
-                    raise Exception(f"Multiple connectors with the same {connector_dir.name} name.")
-                try:
-                    util_module_path: str = f"hummingbot.connector.{type_dir.name}." \
-                                            f"{connector_dir.name}.{connector_dir.name}_utils"
-                    util_module = importlib.import_module(util_module_path)
-                except ModuleNotFoundError:
-                    continue
-                trade_fee_settings: List[float] = getattr(util_module, "DEFAULT_FEES", None)
-                trade_fee_schema: TradeFeeSchema = cls._validate_trade_fee_schema(
-                    connector_dir.name, trade_fee_settings
-                )
-                cls.all_connector_settings[connector_dir.name] = ConnectorSetting(
-                    name=connector_dir.name,
-                    type=ConnectorType[type_dir.name.capitalize()],
-                    centralised=getattr(util_module, "CENTRALIZED", True),
-                    example_pair=getattr(util_module, "EXAMPLE_PAIR", ""),
-                    use_ethereum_wallet=getattr(util_module, "USE_ETHEREUM_WALLET", False),
-                    trade_fee_schema=trade_fee_schema,
-                    config_keys=getattr(util_module, "KEYS", None),
-                    is_sub_domain=False,
-                    parent_name=None,
-                    domain_parameter=None,
-                    use_eth_gas_lookup=getattr(util_module, "USE_ETH_GAS_LOOKUP", False),
-                )
-                # Adds other domains of connector
-                other_domains = getattr(util_module, "OTHER_DOMAINS", [])
-                for domain in other_domains:
-                    trade_fee_settings = getattr(util_module, "OTHER_DOMAINS_DEFAULT_FEES")[domain]
-                    trade_fee_schema = cls._validate_trade_fee_schema(domain, trade_fee_settings)
-                    parent = cls.all_connector_settings[connector_dir.name]
-                    cls.all_connector_settings[domain] = ConnectorSetting(
-                        name=domain,
-                        type=parent.type,
-                        centralised=parent.centralised,
-                        example_pair=getattr(util_module, "OTHER_DOMAINS_EXAMPLE_PAIR")[domain],
-                        use_ethereum_wallet=parent.use_ethereum_wallet,
-                        trade_fee_schema=trade_fee_schema,
-                        config_keys=getattr(util_module, "OTHER_DOMAINS_KEYS")[domain],
-                        is_sub_domain=True,
-                        parent_name=parent.name,
-                        domain_parameter=getattr(util_module, "OTHER_DOMAINS_PARAMETER")[domain],
-                        use_eth_gas_lookup=parent.use_eth_gas_lookup,
-                    )
+        cls.all_connector_settings = cls._load_connector_manifest()
+        if cls.all_connector_settings is None:
+            cls.all_connector_settings = cls._scan_connector_settings()
 
         # add gateway connectors
         gateway_connections_conf: List[Dict[str, str]] = GatewayConnectionSetting.load()
@@ -453,6 +429,167 @@ class AllConnectorSettings:
 
         return cls.all_connector_settings
 
+    @classmethod
+    def generate_connector_manifest(cls, manifest_path: Optional[Path] = None) -> Dict[str, Any]:
+        """
+        Imports the utils module of every connector and saves their settings, to be loaded at startup instead.
+        """
+        manifest_path = manifest_path or CONNECTOR_MANIFEST_PATH
+        manifest = {
+            "version": CONNECTOR_MANIFEST_VERSION,
+            "fingerprint": cls._connector_utils_fingerprint(),
+            "connectors": [
+                {
+                    "name": setting.name,
+                    "type": setting.type.name,
+                    "example_pair": setting.example_pair,
+                    "centralised": setting.centralised,
+                    "use_ethereum_wallet": setting.use_ethereum_wallet,
+                    "trade_fee_schema": setting.trade_fee_schema.to_json(),
+                    "config_keys": (
+                        None if setting.config_keys is None
+                        else cls._config_keys_reference(setting)._asdict()
+                    ),
+                    "is_sub_domain": setting.is_sub_domain,
+                    "parent_name": setting.parent_name,
+                    "domain_parameter": setting.domain_parameter,
+                    "use_eth_gas_lookup": setting.use_eth_gas_lookup,
+                }
+                for setting in cls._scan_connector_settings().values()
+            ],
+        }
+        with open(manifest_path, "w") as fd:
+            json.dump(manifest, fd, indent=2)
+        return manifest
+
+    @classmethod
+    def _load_connector_manifest(cls, manifest_path: Optional[Path] = None) -> Optional[Dict[str, ConnectorSetting]]:
+        manifest_path = manifest_path or CONNECTOR_MANIFEST_PATH
+        if not exists(manifest_path):
+            return None
+        try:
+            with open(manifest_path) as fd:
+                manifest = json.load(fd)
+            if (manifest["version"] != CONNECTOR_MANIFEST_VERSION
+                    or manifest["fingerprint"] != cls._connector_utils_fingerprint()):
+                logging.getLogger(__name__).info("The connector manifest is outdated, scanning the connectors.")
+                return None
+            connector_settings = {}
+            for connector in manifest["connectors"]:
+                config_keys = connector["config_keys"]
+                connector_settings[connector["name"]] = ConnectorSetting(
+                    name=connector["name"],
+                    type=ConnectorType[connector["type"]],
+                    centralised=connector["centralised"],
+                    example_pair=connector["example_pair"],
+                    use_ethereum_wallet=connector["use_ethereum_wallet"],
+                    trade_fee_schema=TradeFeeSchema.from_json(connector["trade_fee_schema"]),
+                    config_keys=None if config_keys is None else ConnectorConfigKeysReference(**config_keys),
+                    is_sub_domain=connector["is_sub_domain"],
+                    parent_name=connector["parent_name"],
+                    domain_parameter=connector["domain_parameter"],
+                    use_eth_gas_lookup=connector["use_eth_gas_lookup"],
+                )
+            return connector_settings
+        except Exception:
+            logging.getLogger(__name__).warning("Error reading the connector manifest, scanning the connectors.",
+                                                exc_info=True)
+            return None
+
+    @staticmethod
+    def _connector_dirs() -> Iterator[Tuple[str, str, str]]:
+        """
+        Yields the connector type, name and directory of each connector package (gateway connectors excluded).
+        """
+        connector_exceptions = ["mock_paper_exchange", "mock_pure_python_paper_exchange", "paper_trade"]
+
+        type_dirs: List[DirEntry] = [
+            cast(DirEntry, f) for f in sorted(scandir(f"{root_path() / 'hummingbot' / 'connector'}"),
+                                              key=lambda f: f.name)
+            if f.is_dir() and f.name not in CONNECTOR_SUBMODULES_THAT_ARE_NOT_CEX_TYPES
+        ]
+        for type_dir in type_dirs:
+            connector_dirs: List[DirEntry] = [
+                cast(DirEntry, f) for f in sorted(scandir(type_dir.path), key=lambda f: f.name)
+                if f.is_dir() and exists(join(f.path, "__init__.py"))
+            ]
+            for connector_dir in connector_dirs:
+                if connector_dir.name.startswith("_") or connector_dir.name in connector_exceptions:
+                    continue
+                yield type_dir.name, connector_dir.name, connector_dir.path
+
+    @classmethod
+    def _connector_utils_fingerprint(cls) -> str:
+        """
+        Hash of the modules of the connector packages, the manifest is only used when they did not change. The
+        settings are read from the utils modules, which import their values from other modules of the package (e.g.
+        the constants), so all the modules of the package are hashed.
+        """
+        fingerprint = hashlib.sha256()
+        for type_name, connector_name, connector_path in cls._connector_dirs():
+            for module_path in sorted(Path(connector_path).rglob("*.py")):
+                fingerprint.update(f"{type_name}/{connector_name}/{module_path.relative_to(connector_path)}".encode())
+                fingerprint.update(module_path.read_bytes())
+        return fingerprint.hexdigest()
+
+    @classmethod
+    def _scan_connector_settings(cls) -> Dict[str, ConnectorSetting]:
+        connector_settings: Dict[str, ConnectorSetting] = {}
+        for type_name, connector_name, _ in cls._connector_dirs():
+            if connector_name in connector_settings:
+                raise Exception(f"Multiple connectors with the same {connector_name} name.")
+            try:
+                util_module_path: str = f"hummingbot.connector.{type_name}.{connector_name}.{connector_name}_utils"
+                util_module = importlib.import_module(util_module_path)
+            except ModuleNotFoundError:
+                continue
+            trade_fee_settings: List[float] = getattr(util_module, "DEFAULT_FEES", None)
+            trade_fee_schema: TradeFeeSchema = cls._validate_trade_fee_schema(
+                connector_name, trade_fee_settings
+            )
+            connector_settings[connector_name] = ConnectorSetting(
+                name=connector_name,
+                type=ConnectorType[type_name.capitalize()],
+                centralised=getattr(util_module, "CENTRALIZED", True),
+                example_pair=getattr(util_module, "EXAMPLE_PAIR", ""),
+                use_ethereum_wallet=getattr(util_module, "USE_ETHEREUM_WALLET", False),
+                trade_fee_schema=trade_fee_schema,
+                config_keys=getattr(util_module, "KEYS", None),
+                is_sub_domain=False,
+                parent_name=None,
+                domain_parameter=None,
+                use_eth_gas_lookup=getattr(util_module, "USE_ETH_GAS_LOOKUP", False),
+            )
+            # Adds other domains of connector
+            other_domains = getattr(util_module, "OTHER_DOMAINS", [])
+            for domain in other_domains:
+                trade_fee_settings = getattr(util_module, "OTHER_DOMAINS_DEFAULT_FEES")[domain]
+                trade_fee_schema = cls._validate_trade_fee_schema(domain, trade_fee_settings)
+                parent = connector_settings[connector_name]
+                connector_settings[domain] = ConnectorSetting(
+                    name=domain,
+                    type=parent.type,
+                    centralised=parent.centralised,
+                    example_pair=getattr(util_module, "OTHER_DOMAINS_EXAMPLE_PAIR")[domain],
+                    use_ethereum_wallet=parent.use_ethereum_wallet,
+                    trade_fee_schema=trade_fee_schema,
+                    config_keys=getattr(util_module, "OTHER_DOMAINS_KEYS")[domain],
+                    is_sub_domain=True,
+                    parent_name=parent.name,
+                    domain_parameter=getattr(util_module, "OTHER_DOMAINS_PARAMETER")[domain],
+                    use_eth_gas_lookup=parent.use_eth_gas_lookup,
+                )
+        return connector_settings
+
+    @staticmethod
+    def _config_keys_reference(setting: ConnectorSetting) -> ConnectorConfigKeysReference:
+        base_setting_name = setting.parent_name if setting.is_sub_domain else setting.name
+        return ConnectorConfigKeysReference(
+            util_module_path=(f"hummingbot.connector.{setting.type.name.lower()}.{base_setting_name}."
+                              f"{base_setting_name}_utils"),
+            domain=setting.name if setting.is_sub_domain else None,
+        )
+
     @classmethod
     def initialize_paper_trade_settings(cls, paper_trade_exchanges: List[str]):
         cls.paper_trade_connectors_names = paper_trade_exchanges
@@ -466,7 +603,8 @@ class AllConnectorSettings:
                     example_pair=base_connector_settings.example_pair,
                     use_ethereum_wallet=base_connector_settings.use_ethereum_wallet,
                     trade_fee_schema=base_connector_settings.trade_fee_schema,
-                    config_keys=base_connector_settings.config_keys,
+                    # The raw field, to not import the utils module of the connector when its keys are not loaded yet
+                    config_keys=base_connector_settings._asdict()["config_keys"],
                     is_sub_domain=False,
                     parent_name=base_connector_settings.name,
                     domain_parameter=None,
@@ -7,7 +7,6 @@ from prompt_toolkit.shortcuts import input_dialog, message_dialog
 from prompt_toolkit.styles import Style
 
 from hummingbot import root_path
-from hummingbot.client.config.conf_migration import migrate_configs, migrate_non_secure_configs_only
 from hummingbot.client.config.config_crypt import BaseSecretsManager, store_password_verification
 from hummingbot.client.config.security import Security
 from hummingbot.client.settings import CONF_DIR_PATH
@@ -106,6 +105,9 @@ def migrate_configs_prompt(secrets_manager_cls: Type[BaseSecretsManager], style:
         style=style).run()
     if password is None:
         raise ValueError("Wrong password.")
+    # The migration imports the legacy strategy config maps, only needed when legacy configs exist
+    from hummingbot.client.config.conf_migration import migrate_configs
+
     secrets_manager = secrets_manager_cls(password)
     errors = migrate_configs(secrets_manager)
     if len(errors) != 0:
@@ -138,6 +140,8 @@ def migrate_non_secure_only_prompt(style: Style):
 
                     """,
         style=style).run()
+    from hummingbot.client.config.conf_migration import migrate_non_secure_configs_only
+
     errors = migrate_non_secure_configs_only()
     if len(errors) != 0:
         _migration_errors_dialog(errors, style)
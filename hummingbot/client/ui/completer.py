@@ -5,13 +5,14 @@ import re
 import sys
 from os import listdir
 from os.path import exists, isfile, join
-from typing import List
+from typing import List, Optional
 
 from prompt_toolkit.completion import CompleteEvent, Completer, WordCompleter
 from prompt_toolkit.document import Document
 
 from hummingbot.client import settings
 from hummingbot.client.command.connect_command import OPTIONS as CONNECT_OPTIONS
+from hummingbot.client.command.metrics_command import SUBCOMMANDS as METRICS_SUBCOMMANDS
 from hummingbot.client.config.config_data_types import BaseClientModel
 from hummingbot.client.settings import (
     GATEWAY_CONNECTORS,
@@ -26,7 +27,6 @@ from hummingbot.client.ui.parser import ThrowingArgumentParser
 from hummingbot.core.rate_oracle.rate_oracle import RATE_ORACLE_SOURCES
 from hummingbot.core.utils.gateway_config_utils import list_gateway_wallets
 from hummingbot.core.utils.trading_pair_fetcher import TradingPairFetcher
-from hummingbot.strategy.strategy_v2_base import StrategyV2ConfigBase
 
 
 def file_name_list(path, file_extension):
@@ -96,15 +96,19 @@ class HummingbotCompleter(Completer):
         self._py_file_completer = WordCompleter(file_name_list(str(PMM_SCRIPTS_PATH), "py"))
         self._script_strategy_completer = WordCompleter(file_name_list(str(SCRIPT_STRATEGIES_PATH), "py"))
         self._scripts_config_completer = WordCompleter(file_name_list(str(SCRIPT_STRATEGY_CONF_DIR_PATH), "yml"))
-        self._strategy_v2_create_config_completer = self.get_strategies_v2_with_config()
+        # Built on first use, since it imports every script strategy
+        self._strategy_v2_with_config_completer: Optional[WordCompleter] = None
         self._controller_completer = self.get_available_controllers()
         self._rate_oracle_completer = WordCompleter(list(RATE_ORACLE_SOURCES.keys()), ignore_case=True)
         self._mqtt_completer = WordCompleter(["start", "stop", "restart"], ignore_case=True)
+        self._metrics_completer = WordCompleter(METRICS_SUBCOMMANDS, ignore_case=True)
         self._gateway_chains = []
         self._gateway_networks = []
         self._list_gateway_wallets_parameters = {"wallets": [], "chain": ""}
 
     def get_strategies_v2_with_config(self):
+        from hummingbot.strategy.strategy_v2_base import StrategyV2ConfigBase
+
         file_names = file_name_list(str(SCRIPT_STRATEGIES_PATH), "py")
         strategies_with_config = []
 
@@ -172,6 +176,12 @@ class HummingbotCompleter(Completer):
         trading_pairs = trading_pair_fetcher.trading_pairs.get(market, []) if trading_pair_fetcher.ready and market else []
         return WordCompleter(trading_pairs, ignore_case=True, sentence=True)
 
+    @property
+    def _strategy_v2_create_config_completer(self) -> WordCompleter:
+        if self._strategy_v2_with_config_completer is None:
+            self._strategy_v2_with_config_completer = self.get_strategies_v2_with_config()
+        return self._strategy_v2_with_config_completer
+
     @property
     def _gateway_chain_completer(self):
         return WordCompleter(self._gateway_chains, ignore_case=True)
@@ -329,6 +339,10 @@ class HummingbotCompleter(Completer):
         text_before_cursor: str = document.text_before_cursor
         return text_before_cursor.startswith("mqtt ")
 
+    def _complete_metrics_arguments(self, document: Document) -> bool:
+        text_before_cursor: str = document.text_before_cursor
+        return text_before_cursor.startswith("metrics ")
+
     def get_completions(self, document: Document, complete_event: CompleteEvent):
         """
         Get completions for the current scope. This is the defining function for the completer
@@ -489,6 +503,10 @@ class HummingbotCompleter(Completer):
             for c in self._mqtt_completer.get_completions(document, complete_event):
                 yield c
 
+        elif self._complete_metrics_arguments(document):
+            for c in self._metrics_completer.get_completions(document, complete_event):
+                yield c
+
         else:
             text_before_cursor: str = document.text_before_cursor
             try:
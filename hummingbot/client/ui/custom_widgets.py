@@ -1,8 +1,10 @@
 from __future__ import unicode_literals
 
+import asyncio
 import re
+import threading
 from collections import deque
-from typing import Callable, Deque, Dict, List, Tuple
+from typing import Callable, Deque, Dict, List, Optional, Tuple
 
 import six
 from prompt_toolkit.auto_suggest import DynamicAutoSuggest
@@ -104,7 +106,8 @@ class CustomTextArea:
                  dont_extend_height=False, dont_extend_width=False,
                  line_numbers=False, get_line_prefix=None, scrollbar=False,
                  style='', search_field=None, preview_search=True, prompt='',
-                 input_processors=None, max_line_count=1000, initial_text="", align=WindowAlign.LEFT):
+                 input_processors=None, max_line_count=1000, initial_text="", align=WindowAlign.LEFT,
+                 render_interval=0.05):
         assert isinstance(text, six.text_type)
         assert search_field is None or isinstance(search_field, SearchToolbar)
 
@@ -182,7 +185,14 @@ class CustomTextArea:
             get_line_prefix=get_line_prefix,
             align=align)
 
-        self.log_lines: Deque[str] = deque()
+        # The logged lines are kept in a ring buffer, and the document of the buffer is built from them at most once
+        # every render_interval seconds, instead of once per logged text
+        self.render_interval = render_interval
+        self.log_lines: Deque[str] = deque(maxlen=max_line_count)
+        self._log_lock = threading.Lock()
+        self._unsaved_lines: Optional[List[str]] = None
+        self._render_scheduled = False
+        self._ev_loop = asyncio.get_event_loop()
         self.log(initial_text)
 
     @property
@@ -243,12 +253,33 @@ class CustomTextArea:
                 line = line[max_width:]
             new_lines.append(line)
 
-        if save_log:
-            self.log_lines.extend(new_lines)
-            while len(self.log_lines) > self.max_line_count:
-                self.log_lines.popleft()
-            new_text: str = "\n".join(self.log_lines)
-        else:
-            new_text: str = "\n".join(new_lines)
+        with self._log_lock:
+            if save_log:
+                self.log_lines.extend(new_lines)
+                if not silent:
+                    self._unsaved_lines = None
+            elif not silent:
+                self._unsaved_lines = new_lines
         if not silent:
-            self.buffer.document = Document(text=new_text, cursor_position=len(new_text))
+            self._schedule_render()
+
+    def _schedule_render(self):
+        # log can be called from other threads (the stdout redirection), the document is only set on the event loop
+        with self._log_lock:
+            if self._render_scheduled:
+                return
+            self._render_scheduled = True
+        if self._ev_loop.is_running():
+            self._ev_loop.call_soon_threadsafe(self._ev_loop.call_later, self.render_interval, self.render)
+        else:
+            self.render()
+
+    def render(self):
+        """
+        Sets the logged lines (or the last lines logged without saving them) as the document of the buffer.
+        """
+        with self._log_lock:
+            self._render_scheduled = False
+            lines = self._unsaved_lines if self._unsaved_lines is not None else list(self.log_lines)
+        new_text: str = "\n".join(lines)
+        self.buffer.document = Document(text=new_text, cursor_position=len(new_text))
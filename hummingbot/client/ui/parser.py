@@ -2,6 +2,7 @@ import argparse
 from typing import TYPE_CHECKING, Any, List
 
 from hummingbot.client.command.connect_command import OPTIONS as CONNECT_OPTIONS
+from hummingbot.client.command.metrics_command import SUBCOMMANDS as METRICS_SUBCOMMANDS
 from hummingbot.exceptions import ArgumentParserError
 
 if TYPE_CHECKING:
@@ -186,6 +187,11 @@ def load_parser(hummingbot: "HummingbotApplication", command_tabs) -> [ThrowingA
         for i in range(len(args)):
             shortcut_parser.add_argument(f'${i+1}', help=args[i])
 
+    metrics_parser = subparsers.add_parser("metrics", help="Show or manage latency metrics of requests, throttling and order books")
+    metrics_parser.add_argument("option", nargs="?", choices=METRICS_SUBCOMMANDS, default=None, help="Enable, disable or reset metrics collection")
+    metrics_parser.add_argument("--metric", type=str, dest="metric", default=None, help="Only show the given metric (e.g. rest_network)")
+    metrics_parser.set_defaults(func=hummingbot.metrics)
+
     rate_parser = subparsers.add_parser('rate', help="Show rate of a given trading pair")
     rate_parser.add_argument("-p", "--pair", default=None,
                              dest="pair", help="The market trading pair for which you want to get a rate.")
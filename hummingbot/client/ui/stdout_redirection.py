@@ -59,12 +59,10 @@ class StdoutProxy(object):
             return
 
         def write_and_flush():
+            # Logging only adds the lines to the log pane, which is rendered at a fixed rate
             self.log_field.log(text)
 
-        def schedule_write_and_flush():
-            self._ev_loop.run_in_executor(None, write_and_flush)
-
-        self._ev_loop.call_soon_threadsafe(schedule_write_and_flush)
+        self._ev_loop.call_soon_threadsafe(write_and_flush)
 
     def _write(self, data):
         if '\n' in data:
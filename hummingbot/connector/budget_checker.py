@@ -2,9 +2,10 @@ import typing
 from collections import defaultdict
 from copy import copy
 from decimal import Decimal
-from typing import Dict, List
+from typing import Dict, List, Optional, Tuple
 
 from hummingbot.core.data_type.order_candidate import OrderCandidate
+from hummingbot.core.data_type.trade_fee import TradeFeeBase
 
 if typing.TYPE_CHECKING:  # avoid circular import problems
     from hummingbot.connector.exchange_base import ExchangeBase
@@ -28,6 +29,9 @@ class BudgetChecker:
         """
         self._exchange = exchange
         self._locked_collateral: Dict[str, Decimal] = defaultdict(lambda: Decimal("0"))
+        # Only set while a list of candidates is adjusted, see `adjust_candidates`
+        self._batch_fees: Optional[Dict[Tuple, TradeFeeBase]] = None
+        self._batch_balances: Optional[Dict[Tuple[str, bool], Decimal]] = None
 
     def reset_locked_collateral(self):
         """
@@ -45,16 +49,26 @@ class BudgetChecker:
         See the doc string for `adjust_candidate` to learn more about how the adjusted order
         amount is derived.
 
+        The candidates are adjusted in a single pass: the fee is built once for the candidates with the same
+        `fee_key` (trading pair, maker or taker, order type and side) and the balance of each collateral token is
+        read once, the collateral locked by the previous candidates being subtracted from it as for individual checks.
+
         :param order_candidates: A list of candidate orders to check and adjust.
         :param all_or_none: Should the order amount be set to zero on insufficient balance.
         :return: The list of adjusted order candidates.
         """
         self.reset_locked_collateral()
-        adjusted_candidates = [
-            self.adjust_candidate_and_lock_available_collateral(order_candidate, all_or_none)
-            for order_candidate in order_candidates
-        ]
-        self.reset_locked_collateral()
+        self._batch_fees = {}
+        self._batch_balances = {}
+        try:
+            adjusted_candidates = [
+                self.adjust_candidate_and_lock_available_collateral(order_candidate, all_or_none)
+                for order_candidate in order_candidates
+            ]
+        finally:
+            self._batch_fees = None
+            self._batch_balances = None
+            self.reset_locked_collateral()
         return adjusted_candidates
 
     def adjust_candidate_and_lock_available_collateral(
@@ -116,9 +130,19 @@ class BudgetChecker:
         :return: The adjusted order candidate.
         """
         order_candidate = copy(order_candidate)
-        order_candidate.populate_collateral_entries(self._exchange)
+        order_candidate.populate_collateral_entries(self._exchange, self._get_batch_fee(order_candidate))
         return order_candidate
 
+    def _get_batch_fee(self, order_candidate: OrderCandidate) -> Optional[TradeFeeBase]:
+        if self._batch_fees is None:
+            return None
+        fee_key = order_candidate.fee_key
+        fee = self._batch_fees.get(fee_key)
+        if fee is None:
+            fee = order_candidate._get_fee(self._exchange)
+            self._batch_fees[fee_key] = fee
+        return fee
+
     def _get_available_balances(self, order_candidate: OrderCandidate) -> Dict[str, Decimal]:
         available_balances = {}
         balance_fn = (
@@ -126,6 +150,8 @@ class BudgetChecker:
             if not order_candidate.from_total_balances
             else self._exchange.get_balance
         )
+        if self._batch_balances is not None:
+            balance_fn = self._batch_balance_fn(balance_fn, order_candidate.from_total_balances)
 
         if order_candidate.order_collateral is not None:
             token, _ = order_candidate.order_collateral
@@ -145,6 +171,14 @@ class BudgetChecker:
 
         return available_balances
 
+    def _batch_balance_fn(self, balance_fn, from_total_balances: bool):
+        def batch_balance_fn(token: str) -> Decimal:
+            balance_key = (token, from_total_balances)
+            if balance_key not in self._batch_balances:
+                self._batch_balances[balance_key] = balance_fn(token)
+            return self._batch_balances[balance_key]
+        return batch_balance_fn
+
     def _quantize_adjusted_order(self, order_candidate: OrderCandidate) -> OrderCandidate:
         trading_pair = order_candidate.trading_pair
         adjusted_amount = order_candidate.amount
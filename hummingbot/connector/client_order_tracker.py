@@ -291,6 +291,12 @@ class ClientOrderTracker:
 
             updated: bool = tracked_order.update_with_order_update(order_update)
             if updated:
+                if order_update.misc_updates is not None and (
+                        "new_price" in order_update.misc_updates or "new_amount" in order_update.misc_updates):
+                    self.logger().info(
+                        f"Order {tracked_order.client_order_id} amended to {tracked_order.amount} "
+                        f"{tracked_order.base_asset} @ {tracked_order.price} {tracked_order.quote_asset}."
+                    )
                 self._trigger_order_creation(tracked_order, previous_state, order_update.new_state)
                 self._trigger_order_completion(tracked_order, order_update)
         else:
@@ -1,7 +1,7 @@
 import asyncio
 import time
 from decimal import Decimal
-from typing import Dict, List, Set, Tuple, TYPE_CHECKING, Union
+from typing import Dict, List, Optional, Set, Tuple, TYPE_CHECKING, Union
 
 from hummingbot.client.config.trade_fee_schema_loader import TradeFeeSchemaLoader
 from hummingbot.connector.in_flight_order_base import InFlightOrderBase
@@ -267,35 +267,39 @@ cdef class ConnectorBase(NetworkIterator):
         raise NotImplementedError
 
     def batch_order_create(
-        self, orders_to_create: List[Union[LimitOrder, MarketOrder]]
+        self,
+        orders_to_create: List[Union[LimitOrder, MarketOrder]],
+        limit_order_type: OrderType = OrderType.LIMIT,
     ) -> List[Union[LimitOrder, MarketOrder]]:
         """
         Issues a batch order creation as a single API request for exchanges that implement this feature. The default
         implementation of this method is to send the requests discretely (one by one).
         :param orders_to_create: A list of LimitOrder or MarketOrder objects representing the orders to create. The
             order IDs can be blanc.
+        :param limit_order_type: The order type of the limit orders (LIMIT or LIMIT_MAKER).
         :returns: A list of LimitOrder or MarketOrder objects representing the created orders, complete with the
             generated order IDs.
         """
         creation_results = []
         for order in orders_to_create:
-            order_type = OrderType.LIMIT if isinstance(order, LimitOrder) else OrderType.MARKET
-            size = order.quantity if order_type == OrderType.LIMIT else order.amount
+            is_limit_order = isinstance(order, LimitOrder)
+            order_type = limit_order_type if is_limit_order else OrderType.MARKET
+            size = order.quantity if is_limit_order else order.amount
             if order.is_buy:
                 client_order_id = self.buy(
                     trading_pair=order.trading_pair,
                     amount=size,
                     order_type=order_type,
-                    price=order.price if order_type == OrderType.LIMIT else s_decimal_NaN
+                    price=order.price if is_limit_order else s_decimal_NaN
                 )
             else:
                 client_order_id = self.sell(
                     trading_pair=order.trading_pair,
                     amount=size,
                     order_type=order_type,
-                    price=order.price if order_type == OrderType.LIMIT else s_decimal_NaN,
+                    price=order.price if is_limit_order else s_decimal_NaN,
                 )
-            if order_type == OrderType.LIMIT:
+            if is_limit_order:
                 creation_results.append(
                     LimitOrder(
                         client_order_id=client_order_id,
@@ -348,6 +352,45 @@ cdef class ConnectorBase(NetworkIterator):
         for order in orders_to_cancel:
             self.cancel(trading_pair=order.trading_pair, client_order_id=order.client_order_id)
 
+    @property
+    def is_order_amendment_supported(self) -> bool:
+        """
+        True if the connector can change the price and amount of an active order in place, without canceling it.
+        """
+        return False
+
+    def amend_order(
+        self,
+        order: LimitOrder,
+        price: Decimal,
+        amount: Decimal,
+        limit_order_type: OrderType = OrderType.LIMIT,
+    ) -> str:
+        """
+        Changes the price and amount of an active limit order, in place for exchanges that implement this feature
+        (see `is_order_amendment_supported`). The default implementation of this method is to cancel the order and to
+        create a new order with the new price and amount.
+        :param order: The order to amend.
+        :param price: The new price of the order.
+        :param amount: The new amount of the order.
+        :param limit_order_type: The order type of the new order if the order is canceled (LIMIT or LIMIT_MAKER).
+        :returns: The id of the order with the new price and amount, the id of the amended order if it is amended in
+            place.
+        """
+        self.cancel(trading_pair=order.trading_pair, client_order_id=order.client_order_id)
+        if order.is_buy:
+            return self.buy(trading_pair=order.trading_pair, amount=amount, order_type=limit_order_type, price=price)
+        return self.sell(trading_pair=order.trading_pair, amount=amount, order_type=limit_order_type, price=price)
+
+    def get_amended_order(self, client_order_id: str) -> Optional[LimitOrder]:
+        """
+        Returns an order amended in place with `amend_order`, with the price and amount it has in the exchange, once
+        the amendment is complete (applied or failed).
+        :param client_order_id: The id of the amended order.
+        :returns: The amended order, None while the amendment is in progress or if the order is not active.
+        """
+        return None
+
     cdef c_stop_tracking_order(self, str order_id):
         raise NotImplementedError
 
@@ -0,0 +1,357 @@
+import logging
+import math
+import os
+import re
+import struct
+import time
+from enum import IntEnum
+from typing import BinaryIO, Dict, List, NamedTuple, Optional, Tuple, Union
+
+import numpy as np
+import pandas as pd
+
+from hummingbot.connector.connector_base import ConnectorBase
+from hummingbot.core.data_type.common import OrderType, TradeType
+from hummingbot.core.event.event_forwarder import SourceInfoEventForwarder
+from hummingbot.core.event.events import (
+    BuyOrderCompletedEvent,
+    BuyOrderCreatedEvent,
+    MarketEvent,
+    MarketOrderFailureEvent,
+    OrderCancelledEvent,
+    OrderExpiredEvent,
+    OrderFilledEvent,
+    SellOrderCompletedEvent,
+    SellOrderCreatedEvent,
+)
+from hummingbot.logger import HummingbotLogger
+
+EVENT_JOURNAL_MAGIC = b"HBEVJRNL"
+EVENT_JOURNAL_VERSION = 1
+EVENT_JOURNAL_FILE_EXTENSION = ".hbj"
+DEFAULT_MAX_FILE_SIZE = 64 * 1024 * 1024
+
+# Every journal file starts with the magic bytes and the format version, followed by fixed size records
+HEADER_STRUCT = struct.Struct("<8sH6x")
+RECORD_STRUCT = struct.Struct("<BBBddddd40s32s24s")
+RECORD_DTYPE = np.dtype([
+    ("event_type", "u1"),
+    ("trade_type", "u1"),
+    ("order_type", "u1"),
+    ("timestamp", "<f8"),
+    ("recorded_timestamp", "<f8"),
+    ("latency", "<f8"),
+    ("price", "<f8"),
+    ("amount", "<f8"),
+    ("order_id", "S40"),
+    ("connector", "S32"),
+    ("trading_pair", "S24"),
+])
+
+
+class JournalEventType(IntEnum):
+    CREATED = 1
+    FILLED = 2
+    CANCELLED = 3
+    FAILED = 4
+    COMPLETED = 5
+    EXPIRED = 6
+
+
+TERMINAL_EVENT_TYPES = {
+    JournalEventType.CANCELLED,
+    JournalEventType.FAILED,
+    JournalEventType.COMPLETED,
+    JournalEventType.EXPIRED,
+}
+
+
+class _OpenOrder(NamedTuple):
+    creation_timestamp: float
+    trading_pair: str
+    trade_type: int
+    order_type: int
+
+
+class EventJournal:
+    """
+    Writes the order lifecycle events of the markets (created, filled, cancelled, failed, completed, expired) as fixed
+    size binary records, to files rotated once they reach `max_file_size` bytes. Each record has the latency since
+    the creation of the order, when the creation was journaled.
+
+    The journal files are loaded into a DataFrame with `load_event_journal`.
+    """
+    _logger: Optional[HummingbotLogger] = None
+
+    @classmethod
+    def logger(cls) -> HummingbotLogger:
+        if cls._logger is None:
+            cls._logger = logging.getLogger(__name__)
+        return cls._logger
+
+    def __init__(self,
+                 markets: List[ConnectorBase],
+                 journal_dir: str,
+                 journal_name: str,
+                 max_file_size: int = DEFAULT_MAX_FILE_SIZE):
+        if max_file_size < HEADER_STRUCT.size + RECORD_STRUCT.size:
+            raise ValueError(f"The event journal max file size must be at least "
+                             f"{HEADER_STRUCT.size + RECORD_STRUCT.size} bytes.")
+        self._markets: List[ConnectorBase] = markets
+        self._journal_dir: str = journal_dir
+        self._journal_name: str = journal_name
+        self._max_file_size: int = max_file_size
+        self._file: Optional[BinaryIO] = None
+        self._file_size: int = 0
+        self._open_orders: Dict[str, _OpenOrder] = {}
+
+        self._create_order_forwarder = SourceInfoEventForwarder(self._did_create_order)
+        self._fill_order_forwarder = SourceInfoEventForwarder(self._did_fill_order)
+        self._cancel_order_forwarder = SourceInfoEventForwarder(self._did_cancel_order)
+        self._fail_order_forwarder = SourceInfoEventForwarder(self._did_fail_order)
+        self._complete_order_forwarder = SourceInfoEventForwarder(self._did_complete_order)
+        self._expire_order_forwarder = SourceInfoEventForwarder(self._did_expire_order)
+        self._event_pairs: List[Tuple[MarketEvent, SourceInfoEventForwarder]] = [
+            (MarketEvent.BuyOrderCreated, self._create_order_forwarder),
+            (MarketEvent.SellOrderCreated, self._create_order_forwarder),
+            (MarketEvent.OrderFilled, self._fill_order_forwarder),
+            (MarketEvent.OrderCancelled, self._cancel_order_forwarder),
+            (MarketEvent.OrderFailure, self._fail_order_forwarder),
+            (MarketEvent.BuyOrderCompleted, self._complete_order_forwarder),
+            (MarketEvent.SellOrderCompleted, self._complete_order_forwarder),
+            (MarketEvent.OrderExpired, self._expire_order_forwarder),
+        ]
+
+    @property
+    def current_file_path(self) -> Optional[str]:
+        return self._file.name if self._file is not None else None
+
+    def start(self):
+        self._open_new_file()
+        for market in self._markets:
+            for event_tag, forwarder in self._event_pairs:
+                market.add_listener(event_tag, forwarder)
+
+    def stop(self):
+        for market in self._markets:
+            for event_tag, forwarder in self._event_pairs:
+                market.remove_listener(event_tag, forwarder)
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def _open_new_file(self):
+        if self._file is not None:
+            self._file.close()
+        os.makedirs(self._journal_dir, exist_ok=True)
+        file_index = max(journal_file_indexes(self._journal_dir, self._journal_name), default=0) + 1
+        file_path = os.path.join(self._journal_dir, f"{self._journal_name}_{file_index:05d}{EVENT_JOURNAL_FILE_EXTENSION}")
+        self._file = open(file_path, "wb")
+        self._file.write(HEADER_STRUCT.pack(EVENT_JOURNAL_MAGIC, EVENT_JOURNAL_VERSION))
+        self._file_size = HEADER_STRUCT.size
+
+    def _write(self,
+               event_type: JournalEventType,
+               market: ConnectorBase,
+               timestamp: float,
+               order_id: str,
+               trading_pair: Optional[str] = None,
+               trade_type: Optional[int] = None,
+               order_type: Optional[int] = None,
+               price: float = math.nan,
+               amount: float = math.nan):
+        if self._file is None:
+            return
+        if event_type == JournalEventType.CREATED:
+            open_order = _OpenOrder(timestamp, trading_pair, trade_type, order_type)
+            self._open_orders[order_id] = open_order
+        elif event_type in TERMINAL_EVENT_TYPES:
+            open_order = self._open_orders.pop(order_id, None)
+        else:
+            open_order = self._open_orders.get(order_id)
+
+        latency = math.nan
+        if open_order is not None:
+            latency = timestamp - open_order.creation_timestamp
+            trading_pair = trading_pair or open_order.trading_pair
+            trade_type = trade_type or open_order.trade_type
+            order_type = order_type or open_order.order_type
+
+        if self._file_size + RECORD_STRUCT.size > self._max_file_size:
+            self._open_new_file()
+        try:
+            self._file.write(RECORD_STRUCT.pack(
+                event_type,
+                trade_type or 0,
+                order_type or 0,
+                timestamp,
+                time.time(),
+                latency,
+                price,
+                amount,
+                order_id.encode("utf-8"),
+                market.display_name.encode("utf-8"),
+                (trading_pair or "").encode("utf-8"),
+            ))
+            # Flushed on every record, so that the journal is complete if the bot stops unexpectedly
+            self._file.flush()
+            self._file_size += RECORD_STRUCT.size
+        except Exception:
+            self.logger().error(f"Unexpected error writing the {event_type.name} event of {order_id} to the event "
+                                f"journal.", exc_info=True)
+
+    def _did_create_order(self,
+                          event_tag: int,
+                          market: ConnectorBase,
+                          evt: Union[BuyOrderCreatedEvent, SellOrderCreatedEvent]):
+        trade_type = TradeType.BUY if event_tag == MarketEvent.BuyOrderCreated.value else TradeType.SELL
+        self._write(JournalEventType.CREATED,
+                    market,
+                    timestamp=evt.creation_timestamp or evt.timestamp,
+                    order_id=evt.order_id,
+                    trading_pair=evt.trading_pair,
+                    trade_type=trade_type.value,
+                    order_type=evt.type.value,
+                    price=float(evt.price),
+                    amount=float(evt.amount))
+
+    def _did_fill_order(self, event_tag: int, market: ConnectorBase, evt: OrderFilledEvent):
+        self._write(JournalEventType.FILLED,
+                    market,
+                    timestamp=evt.timestamp,
+                    order_id=evt.order_id,
+                    trading_pair=evt.trading_pair,
+                    trade_type=evt.trade_type.value,
+                    order_type=evt.order_type.value,
+                    price=float(evt.price),
+                    amount=float(evt.amount))
+
+    def _did_cancel_order(self, event_tag: int, market: ConnectorBase, evt: OrderCancelledEvent):
+        self._write(JournalEventType.CANCELLED, market, timestamp=evt.timestamp, order_id=evt.order_id)
+
+    def _did_fail_order(self, event_tag: int, market: ConnectorBase, evt: MarketOrderFailureEvent):
+        self._write(JournalEventType.FAILED,
+                    market,
+                    timestamp=evt.timestamp,
+                    order_id=evt.order_id,
+                    order_type=evt.order_type.value)
+
+    def _did_complete_order(self,
+                            event_tag: int,
+                            market: ConnectorBase,
+                            evt: Union[BuyOrderCompletedEvent, SellOrderCompletedEvent]):
+        trade_type = TradeType.BUY if event_tag == MarketEvent.BuyOrderCompleted.value else TradeType.SELL
+        base_amount = float(evt.base_asset_amount)
+        self._write(JournalEventType.COMPLETED,
+                    market,
+                    timestamp=evt.timestamp,
+                    order_id=evt.order_id,
+                    trading_pair=f"{evt.base_asset}-{evt.quote_asset}",
+                    trade_type=trade_type.value,
+                    order_type=evt.order_type.value,
+                    price=float(evt.quote_asset_amount) / base_amount if base_amount else math.nan,
+                    amount=base_amount)
+
+    def _did_expire_order(self, event_tag: int, market: ConnectorBase, evt: OrderExpiredEvent):
+        self._write(JournalEventType.EXPIRED, market, timestamp=evt.timestamp, order_id=evt.order_id)
+
+
+def journal_file_indexes(journal_dir: str, journal_name: str) -> List[int]:
+    pattern = re.compile(rf"^{re.escape(journal_name)}_(\d+){re.escape(EVENT_JOURNAL_FILE_EXTENSION)}$")
+    if not os.path.isdir(journal_dir):
+        return []
+    return sorted(int(match.group(1)) for match in map(pattern.match, os.listdir(journal_dir)) if match is not None)
+
+
+def read_event_journal_file(file_path: str) -> np.ndarray:
+    """
+    Reads the records of a journal file. A record partially written at the end of the file is ignored.
+    """
+    with open(file_path, "rb") as journal_file:
+        magic, version = HEADER_STRUCT.unpack(journal_file.read(HEADER_STRUCT.size))
+        if magic != EVENT_JOURNAL_MAGIC or version != EVENT_JOURNAL_VERSION:
+            raise ValueError(f"{file_path} is not an event journal file of version {EVENT_JOURNAL_VERSION}.")
+        records_count = (os.fstat(journal_file.fileno()).st_size - HEADER_STRUCT.size) // RECORD_DTYPE.itemsize
+        return np.fromfile(journal_file, dtype=RECORD_DTYPE, count=records_count)
+
+
+def load_event_journal(journal_dir: str, journal_name: str) -> pd.DataFrame:
+    """
+    Loads the records of all the files of a journal, in the order they were written.
+
+    The `event_type`, `trade_type` and `order_type` columns are categoricals of the enum names, and `latency` is the
+    time in seconds since the creation of the order (NaN if the creation is not in the journal).
+    """
+    records = [
+        read_event_journal_file(os.path.join(journal_dir, f"{journal_name}_{index:05d}{EVENT_JOURNAL_FILE_EXTENSION}"))
+        for index in journal_file_indexes(journal_dir, journal_name)
+    ]
+    records = np.concatenate(records) if len(records) > 0 else np.empty(0, dtype=RECORD_DTYPE)
+
+    df = pd.DataFrame({
+        "event_type": _enum_categorical(records["event_type"], JournalEventType),
+        "trade_type": _enum_categorical(records["trade_type"], TradeType),
+        "order_type": _enum_categorical(records["order_type"], OrderType),
+        "timestamp": records["timestamp"],
+        "recorded_timestamp": records["recorded_timestamp"],
+        "latency": records["latency"],
+        "price": records["price"],
+        "amount": records["amount"],
+    })
+    for column in ("order_id", "connector", "trading_pair"):
+        # Strings longer than their field are truncated, possibly in the middle of a character
+        df[column] = pd.Series(records[column]).str.decode("utf-8", errors="ignore")
+    return df
+
+
+def _enum_categorical(codes: np.ndarray, enum_class) -> pd.Categorical:
+    members = sorted(enum_class, key=lambda member: member.value)
+    categories = [member.name for member in members]
+    # Unknown values (0) are mapped to NaN
+    index_by_value = np.full(max(member.value for member in members) + 1, -1, dtype=np.int64)
+    index_by_value[[member.value for member in members]] = np.arange(len(members))
+    return pd.Categorical.from_codes(index_by_value[codes], categories=categories)
+
+
+def fill_latency_stats(journal: pd.DataFrame) -> pd.DataFrame:
+    """
+    Returns the statistics of the latency between the creation of the orders and their fills, by connector and
+    trading pair.
+    """
+    fills = journal[(journal["event_type"] == JournalEventType.FILLED.name) & journal["latency"].notna()]
+    grouped = fills.groupby(["connector", "trading_pair"])["latency"]
+    return pd.DataFrame({
+        "fills": grouped.count(),
+        "mean": grouped.mean(),
+        "median": grouped.median(),
+        "p95": grouped.quantile(0.95),
+        "max": grouped.max(),
+    })
+
+
+def cancel_replace_stats(journal: pd.DataFrame, replace_window: float = 1.0) -> pd.DataFrame:
+    """
+    Returns the number of orders created and cancelled, the cancel rate, and the cancel/replace rate (the share of the
+    cancels followed within `replace_window` seconds by the creation of an order on the same side), by connector and
+    trading pair.
+    """
+    events = journal[journal["event_type"].isin([JournalEventType.CREATED.name, JournalEventType.CANCELLED.name])]
+    events = events.sort_values("timestamp", kind="stable")
+    keys = ["connector", "trading_pair", "trade_type"]
+    is_created = events["event_type"] == JournalEventType.CREATED.name
+    next_event_type = events.groupby(keys, observed=True)["event_type"].shift(-1)
+    next_timestamp = events.groupby(keys, observed=True)["timestamp"].shift(-1)
+    replaced = (~is_created
+                & (next_event_type == JournalEventType.CREATED.name)
+                & (next_timestamp - events["timestamp"] <= replace_window))
+
+    stats = pd.DataFrame({
+        "created": is_created,
+        "cancelled": ~is_created,
+        "replaced": replaced,
+        "connector": events["connector"],
+        "trading_pair": events["trading_pair"],
+    }).groupby(["connector", "trading_pair"]).sum()
+    stats["cancel_rate"] = stats["cancelled"] / stats["created"]
+    stats["cancel_replace_rate"] = stats["replaced"] / stats["cancelled"]
+    return stats
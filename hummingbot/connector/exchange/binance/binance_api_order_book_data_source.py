@@ -9,6 +9,7 @@ from hummingbot.core.data_type.order_book_tracker_data_source import OrderBookTr
 from hummingbot.core.web_assistant.connections.data_types import RESTMethod, WSJSONRequest
 from hummingbot.core.web_assistant.web_assistants_factory import WebAssistantsFactory
 from hummingbot.core.web_assistant.ws_assistant import WSAssistant
+from hummingbot.core.web_assistant.ws_stream_multiplexer import WSStreamMultiplexer
 from hummingbot.logger import HummingbotLogger
 
 if TYPE_CHECKING:
@@ -19,6 +20,7 @@ class BinanceAPIOrderBookDataSource(OrderBookTrackerDataSource):
     HEARTBEAT_TIME_INTERVAL = 30.0
     TRADE_STREAM_ID = 1
     DIFF_STREAM_ID = 2
+    TRADING_PAIR_STREAMS_ID = 3
     ONE_HOUR = 60 * 60
 
     _logger: Optional[HummingbotLogger] = None
@@ -27,13 +29,15 @@ class BinanceAPIOrderBookDataSource(OrderBookTrackerDataSource):
                  trading_pairs: List[str],
                  connector: 'BinanceExchange',
                  api_factory: WebAssistantsFactory,
-                 domain: str = CONSTANTS.DEFAULT_DOMAIN):
+                 domain: str = CONSTANTS.DEFAULT_DOMAIN,
+                 ws_multiplexer: Optional[WSStreamMultiplexer] = None):
         super().__init__(trading_pairs)
         self._connector = connector
         self._trade_messages_queue_key = CONSTANTS.TRADE_EVENT_TYPE
         self._diff_messages_queue_key = CONSTANTS.DIFF_EVENT_TYPE
         self._domain = domain
         self._api_factory = api_factory
+        self._ws_multiplexer = ws_multiplexer
 
     async def get_last_traded_prices(self,
                                      trading_pairs: List[str],
@@ -102,6 +106,32 @@ class BinanceAPIOrderBookDataSource(OrderBookTrackerDataSource):
             )
             raise
 
+    async def _subscribe_to_trading_pair(self, ws: WSAssistant, trading_pair: str) -> bool:
+        await ws.send(await self._trading_pair_streams_request(method="SUBSCRIBE", trading_pair=trading_pair))
+        self.logger().info(f"Subscribed to public order book and trade channels of {trading_pair}...")
+        return True
+
+    async def _unsubscribe_from_trading_pair(self, ws: WSAssistant, trading_pair: str) -> bool:
+        await ws.send(await self._trading_pair_streams_request(method="UNSUBSCRIBE", trading_pair=trading_pair))
+        self.logger().info(f"Unsubscribed from public order book and trade channels of {trading_pair}...")
+        return True
+
+    async def _trading_pair_streams_request(self, method: str, trading_pair: str) -> WSJSONRequest:
+        streams = await self._multiplexed_streams_for_trading_pair(trading_pair=trading_pair)
+        payload = {
+            "method": method,
+            "params": streams[self._trade_messages_queue_key] + streams[self._diff_messages_queue_key],
+            "id": self.TRADING_PAIR_STREAMS_ID
+        }
+        return WSJSONRequest(payload=payload)
+
+    async def _multiplexed_streams_for_trading_pair(self, trading_pair: str) -> Dict[str, List[str]]:
+        symbol = await self._connector.exchange_symbol_associated_to_pair(trading_pair=trading_pair)
+        return {
+            self._trade_messages_queue_key: [f"{symbol.lower()}@trade"],
+            self._diff_messages_queue_key: [f"{symbol.lower()}@depth@100ms"],
+        }
+
     async def _connected_websocket_assistant(self) -> WSAssistant:
         ws: WSAssistant = await self._api_factory.get_ws_assistant()
         await ws.connect(ws_url=CONSTANTS.WSS_URL.format(self._domain),
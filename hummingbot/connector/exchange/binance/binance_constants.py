@@ -9,6 +9,7 @@ MAX_ORDER_ID_LEN = 32
 # Base URL
 REST_URL = "https://api.binance.{}/api/"
 WSS_URL = "wss://stream.binance.{}:9443/ws"
+WSS_COMBINED_STREAMS_URL = "wss://stream.binance.{}:9443/stream"
 
 PUBLIC_API_VERSION = "v3"
 PRIVATE_API_VERSION = "v3"
@@ -28,6 +29,9 @@ ORDER_PATH_URL = "/order"
 BINANCE_USER_STREAM_PATH_URL = "/userDataStream"
 
 WS_HEARTBEAT_TIME_INTERVAL = 30
+MAX_STREAMS_PER_CONNECTION = 1024
+# Binance disconnects the websockets that send more than 5 messages per second
+WS_MAX_MESSAGES_PER_SECOND = 5
 
 # Binance params
 
@@ -13,6 +13,7 @@ from hummingbot.connector.exchange.binance import (
 from hummingbot.connector.exchange.binance.binance_api_order_book_data_source import BinanceAPIOrderBookDataSource
 from hummingbot.connector.exchange.binance.binance_api_user_stream_data_source import BinanceAPIUserStreamDataSource
 from hummingbot.connector.exchange.binance.binance_auth import BinanceAuth
+from hummingbot.connector.exchange.binance.binance_ws_stream_multiplexer import BinanceWSStreamMultiplexer
 from hummingbot.connector.exchange_py_base import ExchangePyBase
 from hummingbot.connector.trading_rule import TradingRule
 from hummingbot.connector.utils import TradeFillOrderDetails, combine_to_hb_trading_pair
@@ -148,7 +149,8 @@ class BinanceExchange(ExchangePyBase):
             trading_pairs=self._trading_pairs,
             connector=self,
             domain=self.domain,
-            api_factory=self._web_assistants_factory)
+            api_factory=self._web_assistants_factory,
+            ws_multiplexer=BinanceWSStreamMultiplexer.for_domain(self.domain))
 
     def _create_user_stream_data_source(self) -> UserStreamTrackerDataSource:
         return BinanceAPIUserStreamDataSource(
@@ -0,0 +1,33 @@
+from typing import Any, Dict, List, Optional
+
+from hummingbot.connector.exchange.binance import binance_constants as CONSTANTS
+from hummingbot.core.web_assistant.connections.data_types import WSJSONRequest, WSRequest
+from hummingbot.core.web_assistant.ws_stream_multiplexer import WSStreamMultiplexer
+
+
+class BinanceWSStreamMultiplexer(WSStreamMultiplexer):
+    """
+    Multiplexes the Binance public streams (order book diffs, trades, klines) through the combined streams endpoint,
+    where each message is wrapped as `{"stream": <stream name>, "data": <raw payload>}`.
+    """
+
+    @classmethod
+    def for_domain(cls, domain: str = CONSTANTS.DEFAULT_DOMAIN) -> "BinanceWSStreamMultiplexer":
+        return cls.shared_instance(
+            ws_url=CONSTANTS.WSS_COMBINED_STREAMS_URL.format(domain),
+            max_streams_per_connection=CONSTANTS.MAX_STREAMS_PER_CONNECTION,
+            ping_timeout=CONSTANTS.WS_HEARTBEAT_TIME_INTERVAL,
+            max_messages_per_second=CONSTANTS.WS_MAX_MESSAGES_PER_SECOND,
+        )
+
+    def _build_subscribe_request(self, streams: List[str]) -> WSRequest:
+        return WSJSONRequest(payload={"method": "SUBSCRIBE", "params": streams, "id": self._next_id()})
+
+    def _build_unsubscribe_request(self, streams: List[str]) -> WSRequest:
+        return WSJSONRequest(payload={"method": "UNSUBSCRIBE", "params": streams, "id": self._next_id()})
+
+    def _stream_of_message(self, message: Dict[str, Any]) -> Optional[str]:
+        return message.get("stream")
+
+    def _payload_of_message(self, message: Dict[str, Any]) -> Dict[str, Any]:
+        return message["data"]
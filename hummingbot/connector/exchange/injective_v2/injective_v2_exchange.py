@@ -183,12 +183,17 @@ class InjectiveV2Exchange(ExchangePyBase):
             )
         )
 
-    def batch_order_create(self, orders_to_create: List[Union[MarketOrder, LimitOrder]]) -> List[LimitOrder]:
+    def batch_order_create(
+        self,
+        orders_to_create: List[Union[MarketOrder, LimitOrder]],
+        limit_order_type: OrderType = OrderType.LIMIT,
+    ) -> List[LimitOrder]:
         """
         Issues a batch order creation as a single API request for exchanges that implement this feature. The default
         implementation of this method is to send the requests discretely (one by one).
         :param orders_to_create: A list of LimitOrder or MarketOrder objects representing the orders to create. The order IDs
             can be blanc.
+        :param limit_order_type: The order type of the limit orders (LIMIT or LIMIT_MAKER).
         :returns: A tuple composed of LimitOrder or MarketOrder objects representing the created orders, complete with the generated
             order IDs.
         """
@@ -201,7 +206,8 @@ class InjectiveV2Exchange(ExchangePyBase):
                 max_id_len=self.client_order_id_max_length,
             )
             orders_with_ids_to_create.append(order.copy_with_id(client_order_id=client_order_id))
-        safe_ensure_future(self._execute_batch_order_create(orders_to_create=orders_with_ids_to_create))
+        safe_ensure_future(self._execute_batch_order_create(
+            orders_to_create=orders_with_ids_to_create, limit_order_type=limit_order_type))
         return orders_with_ids_to_create
 
     def batch_order_cancel(self, orders_to_cancel: List[LimitOrder]):
@@ -362,7 +368,11 @@ class InjectiveV2Exchange(ExchangePyBase):
         self._orders_queued_to_create.append(order)
         return None
 
-    async def _execute_batch_order_create(self, orders_to_create: List[Union[MarketOrder, LimitOrder]]):
+    async def _execute_batch_order_create(
+        self,
+        orders_to_create: List[Union[MarketOrder, LimitOrder]],
+        limit_order_type: OrderType = OrderType.LIMIT,
+    ):
         inflight_orders_to_create = []
         for order in orders_to_create:
             valid_order = await self._start_tracking_and_validate_order(
@@ -370,7 +380,7 @@ class InjectiveV2Exchange(ExchangePyBase):
                 order_id=order.client_order_id,
                 trading_pair=order.trading_pair,
                 amount=order.quantity,
-                order_type=order.order_type(),
+                order_type=limit_order_type if isinstance(order, LimitOrder) else order.order_type(),
                 price=order.price,
             )
             if valid_order is not None:
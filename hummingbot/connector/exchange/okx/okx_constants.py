@@ -23,12 +23,17 @@ OKX_ORDER_BOOK_PATH = '/api/v5/market/books'
 
 # Auth required
 OKX_PLACE_ORDER_PATH = "/api/v5/trade/order"
+OKX_BATCH_ORDERS_PATH = "/api/v5/trade/batch-orders"
 OKX_ORDER_DETAILS_PATH = '/api/v5/trade/order'
 OKX_ORDER_CANCEL_PATH = '/api/v5/trade/cancel-order'
 OKX_BATCH_ORDER_CANCEL_PATH = '/api/v5/trade/cancel-batch-orders'
+OKX_AMEND_ORDER_PATH = '/api/v5/trade/amend-order'
 OKX_BALANCE_PATH = '/api/v5/account/balance'
 OKX_TRADE_FILLS_PATH = "/api/v5/trade/fills"
 
+# Maximum number of orders in a batch orders request
+MAX_ORDERS_PER_BATCH = 20
+
 # WS
 OKX_WS_URI_PUBLIC = "wss://ws.okx.com:8443/ws/v5/public"
 OKX_WS_URI_PRIVATE = "wss://ws.okx.com:8443/ws/v5/private"
@@ -57,6 +62,7 @@ ORDER_STATE = {
 
 ORDER_TYPE_MAP = {
     OrderType.LIMIT: "limit",
+    OrderType.LIMIT_MAKER: "post_only",
     OrderType.MARKET: "market",
 }
 
@@ -72,9 +78,11 @@ RATE_LIMITS = [
     RateLimit(limit_id=OKX_TICKER_PATH, limit=20, time_interval=2),
     RateLimit(limit_id=OKX_ORDER_BOOK_PATH, limit=20, time_interval=2),
     RateLimit(limit_id=OKX_PLACE_ORDER_PATH, limit=60, time_interval=2),
+    RateLimit(limit_id=OKX_BATCH_ORDERS_PATH, limit=300, time_interval=2),
     RateLimit(limit_id=OKX_ORDER_DETAILS_PATH, limit=60, time_interval=2),
     RateLimit(limit_id=OKX_ORDER_CANCEL_PATH, limit=60, time_interval=2),
     RateLimit(limit_id=OKX_BATCH_ORDER_CANCEL_PATH, limit=300, time_interval=2),
+    RateLimit(limit_id=OKX_AMEND_ORDER_PATH, limit=60, time_interval=2),
     RateLimit(limit_id=OKX_BALANCE_PATH, limit=10, time_interval=2),
     RateLimit(limit_id=OKX_TRADE_FILLS_PATH, limit=60, time_interval=2),
 ]
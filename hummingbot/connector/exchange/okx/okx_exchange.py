@@ -15,6 +15,7 @@ from hummingbot.connector.utils import combine_to_hb_trading_pair
 from hummingbot.core.data_type.common import OrderType, TradeType
 from hummingbot.core.data_type.in_flight_order import InFlightOrder, OrderState, OrderUpdate, TradeUpdate
 from hummingbot.core.data_type.order_book_tracker_data_source import OrderBookTrackerDataSource
+from hummingbot.core.data_type.order_result import CancelOrderResult, PlaceOrderResult
 from hummingbot.core.data_type.trade_fee import TokenAmount, TradeFeeBase
 from hummingbot.core.data_type.user_stream_tracker_data_source import UserStreamTrackerDataSource
 from hummingbot.core.utils.estimate_fee import build_trade_fee
@@ -28,6 +29,7 @@ if TYPE_CHECKING:
 class OkxExchange(ExchangePyBase):
 
     web_utils = web_utils
+    MAX_ORDERS_PER_BATCH = CONSTANTS.MAX_ORDERS_PER_BATCH
 
     def __init__(self,
                  client_config_map: "ClientConfigAdapter",
@@ -92,6 +94,15 @@ class OkxExchange(ExchangePyBase):
     def is_cancel_request_in_exchange_synchronous(self) -> bool:
         return False
 
+    @property
+    def is_order_amendment_supported(self) -> bool:
+        return True
+
+    @property
+    def is_amend_request_in_exchange_synchronous(self) -> bool:
+        # The amend request is only accepted, its result is reported in the orders channel (amendResult)
+        return False
+
     @property
     def is_trading_required(self) -> bool:
         return self._trading_required
@@ -234,6 +245,105 @@ class OkxExchange(ExchangePyBase):
 
         return final_result
 
+    async def _place_orders(self, orders: List[InFlightOrder]) -> List[PlaceOrderResult]:
+        data = []
+        for order in orders:
+            order_data = {
+                "clOrdId": order.client_order_id,
+                "tdMode": "cash",
+                "ordType": CONSTANTS.ORDER_TYPE_MAP[order.order_type],
+                "side": order.trade_type.name.lower(),
+                "instId": await self.exchange_symbol_associated_to_pair(trading_pair=order.trading_pair),
+                "sz": str(order.amount),
+            }
+            if order.order_type.is_limit_type():
+                order_data["px"] = str(order.price)
+            data.append(order_data)
+
+        response = await self._api_request(
+            path_url=CONSTANTS.OKX_BATCH_ORDERS_PATH,
+            method=RESTMethod.POST,
+            data=data,
+            is_auth_required=True,
+            limit_id=CONSTANTS.OKX_BATCH_ORDERS_PATH,
+        )
+        orders_data = {order_data["clOrdId"]: order_data for order_data in response["data"]}
+        place_order_results = []
+        for order in orders:
+            order_data = orders_data.get(order.client_order_id)
+            exchange_order_id = None
+            exception = None
+            if order_data is None:
+                exception = IOError(f"Error submitting order {order.client_order_id}: {response}")
+            elif order_data["sCode"] != "0":
+                exception = IOError(f"Error submitting order {order.client_order_id}: {order_data['sMsg']}")
+            else:
+                exchange_order_id = str(order_data["ordId"])
+            place_order_results.append(PlaceOrderResult(
+                update_timestamp=self.current_timestamp,
+                client_order_id=order.client_order_id,
+                exchange_order_id=exchange_order_id,
+                trading_pair=order.trading_pair,
+                exception=exception,
+            ))
+        return place_order_results
+
+    async def _place_cancels(self, orders: List[InFlightOrder]) -> List[CancelOrderResult]:
+        data = [{"clOrdId": order.client_order_id, "instId": order.trading_pair} for order in orders]
+        response = await self._api_post(
+            path_url=CONSTANTS.OKX_BATCH_ORDER_CANCEL_PATH,
+            data=data,
+            is_auth_required=True,
+        )
+        cancels_data = {cancel_data["clOrdId"]: cancel_data for cancel_data in response["data"]}
+        cancel_order_results = []
+        for order in orders:
+            cancel_data = cancels_data.get(order.client_order_id)
+            exception = None
+            # Cancelations failed because the order does not exist (51400) or has been cancelled (51401) are
+            # successful, as for single cancelations
+            if cancel_data is None or cancel_data["sCode"] not in ("0", "51400", "51401"):
+                exception = IOError(f"Error cancelling order {order.client_order_id}: {cancel_data or response}")
+            cancel_order_results.append(CancelOrderResult(
+                client_order_id=order.client_order_id,
+                trading_pair=order.trading_pair,
+                exception=exception,
+            ))
+        return cancel_order_results
+
+    async def _place_amend(self,
+                           order_id: str,
+                           tracked_order: InFlightOrder,
+                           price: Decimal,
+                           amount: Decimal) -> Tuple[str, float]:
+        data = {
+            "clOrdId": order_id,
+            "instId": await self.exchange_symbol_associated_to_pair(trading_pair=tracked_order.trading_pair),
+            "newSz": str(amount),
+            "newPx": str(price),
+        }
+        response = await self._api_post(
+            path_url=CONSTANTS.OKX_AMEND_ORDER_PATH,
+            data=data,
+            is_auth_required=True,
+        )
+        amend_data = response["data"][0]
+        if amend_data["sCode"] != "0":
+            raise IOError(f"Error amending order {order_id}: {amend_data['sMsg']}")
+        return str(amend_data["ordId"]), self.current_timestamp
+
+    def _amendment_updates(self, order_data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """
+        Returns the price and amount of an order update reporting the result of an amendment. The order has its new
+        price and amount if the amendment succeeded, and its previous ones if it failed.
+        """
+        amend_result = order_data.get("amendResult", "")
+        if amend_result not in ["0", "-1"]:
+            return None
+        if amend_result == "-1":
+            self.logger().error(f"Failed to amend order {order_data['clOrdId']}: {order_data.get('msg', '')}")
+        return {"new_price": Decimal(order_data["px"]), "new_amount": Decimal(order_data["sz"])}
+
     async def _get_last_traded_price(self, trading_pair: str) -> float:
         params = {"instId": await self.exchange_symbol_associated_to_pair(trading_pair=trading_pair)}
 
@@ -414,6 +524,7 @@ class OkxExchange(ExchangePyBase):
                                 new_state=order_status,
                                 client_order_id=updatable_order.client_order_id,
                                 exchange_order_id=str(data["ordId"]),
+                                misc_updates=self._amendment_updates(order_data=data),
                             )
                             self._order_tracker.process_order_update(order_update=order_update)
 
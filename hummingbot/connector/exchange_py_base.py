@@ -4,13 +4,14 @@ import logging
 import math
 from abc import ABC, abstractmethod
 from decimal import Decimal
-from typing import TYPE_CHECKING, Any, AsyncIterable, Callable, Dict, List, Optional, Tuple
+from typing import TYPE_CHECKING, Any, AsyncIterable, Callable, Dict, List, Optional, Set, Tuple, Union
 
 from async_timeout import timeout
 
 from hummingbot.connector.client_order_tracker import ClientOrderTracker
 from hummingbot.connector.constants import MINUTE, TWELVE_HOURS, s_decimal_0, s_decimal_NaN
 from hummingbot.connector.exchange_base import ExchangeBase
+from hummingbot.connector.quantization_table import QuantizationTable, TradingPairQuantization
 from hummingbot.connector.time_synchronizer import TimeSynchronizer
 from hummingbot.connector.trading_rule import TradingRule
 from hummingbot.connector.utils import get_new_client_order_id
@@ -20,9 +21,11 @@ from hummingbot.core.data_type.cancellation_result import CancellationResult
 from hummingbot.core.data_type.common import OrderType, TradeType
 from hummingbot.core.data_type.in_flight_order import InFlightOrder, OrderState, OrderUpdate, TradeUpdate
 from hummingbot.core.data_type.limit_order import LimitOrder
+from hummingbot.core.data_type.market_order import MarketOrder
 from hummingbot.core.data_type.order_book import OrderBook
 from hummingbot.core.data_type.order_book_tracker import OrderBookTracker
 from hummingbot.core.data_type.order_book_tracker_data_source import OrderBookTrackerDataSource
+from hummingbot.core.data_type.order_result import CancelOrderResult, PlaceOrderResult
 from hummingbot.core.data_type.trade_fee import AddedToCostTradeFee
 from hummingbot.core.data_type.user_stream_tracker import UserStreamTracker
 from hummingbot.core.data_type.user_stream_tracker_data_source import UserStreamTrackerDataSource
@@ -45,6 +48,8 @@ class ExchangePyBase(ExchangeBase, ABC):
     TRADING_RULES_INTERVAL = 30 * MINUTE
     TRADING_FEES_INTERVAL = TWELVE_HOURS
     TICK_INTERVAL_LIMIT = 60.0
+    # Maximum number of orders in a batch create or cancel request, 0 if the exchange has no batch endpoints
+    MAX_ORDERS_PER_BATCH = 0
 
     def __init__(self, client_config_map: "ClientConfigAdapter"):
         super().__init__(client_config_map)
@@ -52,7 +57,13 @@ class ExchangePyBase(ExchangeBase, ABC):
         self._last_poll_timestamp = 0
         self._last_timestamp = 0
         self._trading_rules = {}
+        self._quantization_table = QuantizationTable()
+        # The connectors with their own quanta keep the quantization of the base class
+        self._quantizes_from_table = (
+            type(self).get_order_price_quantum is ExchangePyBase.get_order_price_quantum
+            and type(self).get_order_size_quantum is ExchangePyBase.get_order_size_quantum)
         self._trading_fees = {}
+        self._order_amendments_in_progress: Set[str] = set()
 
         self._status_polling_task: Optional[asyncio.Task] = None
         self._user_stream_tracker_task: Optional[asyncio.Task] = None
@@ -144,6 +155,14 @@ class ExchangePyBase(ExchangeBase, ABC):
     def is_cancel_request_in_exchange_synchronous(self) -> bool:
         raise NotImplementedError
 
+    @property
+    def is_amend_request_in_exchange_synchronous(self) -> bool:
+        """
+        True if the order is amended when the exchange accepts the amend request, False if the exchange reports the
+        result of the amendment later in the order updates (the order is pending amend until then).
+        """
+        return True
+
     @property
     @abstractmethod
     def is_trading_required(self) -> bool:
@@ -220,8 +239,7 @@ class ExchangePyBase(ExchangeBase, ABC):
         :param trading_pair: the trading pair to check for market conditions
         :param price: the starting point price
         """
-        trading_rule = self._trading_rules[trading_pair]
-        return Decimal(trading_rule.min_price_increment)
+        return self.get_quantization(trading_pair).price_quantum
 
     def get_order_size_quantum(self, trading_pair: str, order_size: Decimal) -> Decimal:
         """
@@ -231,8 +249,32 @@ class ExchangePyBase(ExchangeBase, ABC):
         :param trading_pair: the trading pair to check for market conditions
         :param order_size: the starting point order price
         """
-        trading_rule = self._trading_rules[trading_pair]
-        return Decimal(trading_rule.min_base_amount_increment)
+        return self.get_quantization(trading_pair).size_quantum
+
+    def quantize_order_price(self, trading_pair: str, price: Decimal) -> Decimal:
+        """
+        Applies trading rule to quantize order price.
+        """
+        if not self._quantizes_from_table:
+            return super().quantize_order_price(trading_pair, price)
+        return self._quantization_table.get(trading_pair, self._trading_rules[trading_pair]).quantize_price(price)
+
+    def quantize_order_amount(self, trading_pair: str, amount: Decimal) -> Decimal:
+        """
+        Applies trading rule to quantize order amount.
+        """
+        if not self._quantizes_from_table:
+            return super().quantize_order_amount(trading_pair, amount)
+        return self._quantization_table.get(trading_pair, self._trading_rules[trading_pair]).quantize_amount(amount)
+
+    def get_quantization(self, trading_pair: str) -> TradingPairQuantization:
+        """
+        Returns the price and order size quanta of the trading pair and its quantize functions, precomputed from the
+        trading rule.
+
+        :param trading_pair: the trading pair to check for market conditions
+        """
+        return self._quantization_table.get(trading_pair, self._trading_rules[trading_pair])
 
     def get_order_book(self, trading_pair: str) -> OrderBook:
         """
@@ -357,26 +399,128 @@ class ExchangePyBase(ExchangeBase, ABC):
         safe_ensure_future(self._execute_cancel(trading_pair, client_order_id))
         return client_order_id
 
+    def batch_order_create(
+        self,
+        orders_to_create: List[Union[LimitOrder, MarketOrder]],
+        limit_order_type: OrderType = OrderType.LIMIT,
+    ) -> List[Union[LimitOrder, MarketOrder]]:
+        """
+        Creates a promise to create the orders. The orders are sent in batch requests of up to MAX_ORDERS_PER_BATCH
+        orders if the exchange supports them, and are created one by one with `buy` and `sell` otherwise.
+
+        :param orders_to_create: the LimitOrder or MarketOrder objects representing the orders to create. The order
+            IDs can be blank. The position of the orders is used as their position action.
+        :param limit_order_type: the type of order to create for the limit orders (LIMIT, LIMIT_MAKER)
+
+        :return: the orders to create, complete with the ids assigned by the connector (the client ids)
+        """
+        if self.MAX_ORDERS_PER_BATCH <= 0:
+            return [self._create_single_order_of_batch(order, limit_order_type) for order in orders_to_create]
+
+        orders_with_ids_to_create = []
+        for order in orders_to_create:
+            client_order_id = get_new_client_order_id(
+                is_buy=order.is_buy,
+                trading_pair=order.trading_pair,
+                hbot_order_id_prefix=self.client_order_id_prefix,
+                max_id_len=self.client_order_id_max_length
+            )
+            orders_with_ids_to_create.append(order.copy_with_id(client_order_id=client_order_id))
+
+        safe_ensure_future(self._execute_batch_order_create(
+            orders_to_create=orders_with_ids_to_create, limit_order_type=limit_order_type))
+        return orders_with_ids_to_create
+
+    def batch_order_cancel(self, orders_to_cancel: List[LimitOrder]):
+        """
+        Creates a promise to cancel the orders. The cancelations are sent in batch requests of up to
+        MAX_ORDERS_PER_BATCH orders if the exchange supports them, and as concurrent single cancel requests otherwise.
+
+        :param orders_to_cancel: the orders to cancel
+        """
+        if self.MAX_ORDERS_PER_BATCH > 0:
+            safe_ensure_future(self._execute_batch_cancel(orders_to_cancel=orders_to_cancel))
+        else:
+            for order in orders_to_cancel:
+                self.cancel(trading_pair=order.trading_pair, client_order_id=order.client_order_id)
+
+    def amend_order(self,
+                    order: LimitOrder,
+                    price: Decimal,
+                    amount: Decimal,
+                    limit_order_type: OrderType = OrderType.LIMIT) -> Optional[str]:
+        """
+        Creates a promise to change the price and amount of an active order. The order is amended in place if the
+        exchange supports it and the order is open in the exchange. Otherwise it is canceled and an order with the
+        same side, type and position action is created with the new price and amount.
+
+        :param order: the order to amend
+        :param price: the new order price
+        :param amount: the new order amount
+        :param limit_order_type: not used, the new order has the type of the amended order
+
+        :return: the client id of the order with the new price and amount (the id of the order if it is amended in
+            place), or None if the order is not active
+        """
+        tracked_order = self._order_tracker.fetch_tracked_order(order.client_order_id)
+        if tracked_order is None:
+            self.logger().warning(f"Failed to amend order {order.client_order_id} (order not found)")
+            return None
+
+        if (self.is_order_amendment_supported
+                and tracked_order.current_state in [OrderState.OPEN, OrderState.PARTIALLY_FILLED]):
+            self._order_amendments_in_progress.add(tracked_order.client_order_id)
+            safe_ensure_future(self._execute_order_amend(order=tracked_order, price=price, amount=amount))
+            return tracked_order.client_order_id
+
+        self.cancel(trading_pair=tracked_order.trading_pair, client_order_id=tracked_order.client_order_id)
+        create_order = self.buy if tracked_order.trade_type == TradeType.BUY else self.sell
+        return create_order(
+            trading_pair=tracked_order.trading_pair,
+            amount=amount,
+            order_type=tracked_order.order_type,
+            price=price,
+            position_action=tracked_order.position)
+
+    def get_amended_order(self, client_order_id: str) -> Optional[LimitOrder]:
+        """
+        Returns an order amended in place with its price and amount in the exchange, once the amendment is complete
+
+        :param client_order_id: the client id of the amended order
+
+        :return: the amended order, or None while the amendment is in progress or if the order is not active
+        """
+        tracked_order = self._order_tracker.fetch_tracked_order(client_order_id)
+        if (tracked_order is None
+                or tracked_order.is_pending_amend
+                or client_order_id in self._order_amendments_in_progress):
+            return None
+        return tracked_order.to_limit_order()
+
     async def cancel_all(self, timeout_seconds: float) -> List[CancellationResult]:
         """
-        Cancels all currently active orders. The cancellations are performed in parallel tasks.
+        Cancels all currently active orders. The cancellations are performed in batch requests if the exchange
+        supports them, and in parallel tasks otherwise.
 
         :param timeout_seconds: the maximum time (in seconds) the cancel logic should run
 
         :return: a list of CancellationResult instances, one for each of the orders to be cancelled
         """
         incomplete_orders = [o for o in self.in_flight_orders.values() if not o.is_done]
-        tasks = [self._execute_cancel(o.trading_pair, o.client_order_id) for o in incomplete_orders]
         order_id_set = set([o.client_order_id for o in incomplete_orders])
         successful_cancellations = []
 
         try:
             async with timeout(timeout_seconds):
-                cancellation_results = await safe_gather(*tasks, return_exceptions=True)
-                for cr in cancellation_results:
-                    if isinstance(cr, Exception):
-                        continue
-                    client_order_id = cr
+                if self.MAX_ORDERS_PER_BATCH > 0:
+                    cancellation_results = await self._execute_batch_cancel(
+                        orders_to_cancel=[o.to_limit_order() for o in incomplete_orders])
+                    client_order_ids = [cr.order_id for cr in cancellation_results if cr.success]
+                else:
+                    tasks = [self._execute_cancel(o.trading_pair, o.client_order_id) for o in incomplete_orders]
+                    cancellation_results = await safe_gather(*tasks, return_exceptions=True)
+                    client_order_ids = [cr for cr in cancellation_results if not isinstance(cr, Exception)]
+                for client_order_id in client_order_ids:
                     if client_order_id is not None:
                         order_id_set.remove(client_order_id)
                         successful_cancellations.append(CancellationResult(client_order_id, True))
@@ -407,6 +551,54 @@ class ExchangePyBase(ExchangeBase, ABC):
         :param order_type: the type of order to create (MARKET, LIMIT, LIMIT_MAKER)
         :param price: the order price
         """
+        order = await self._track_and_validate_order(
+            trade_type=trade_type,
+            order_id=order_id,
+            trading_pair=trading_pair,
+            amount=amount,
+            order_type=order_type,
+            price=price,
+            **kwargs,
+        )
+        if order is None:
+            return
+        try:
+            await self._place_order_and_process_update(order=order, **kwargs,)
+
+        except asyncio.CancelledError:
+            raise
+        except Exception as ex:
+            self._on_order_failure(
+                order_id=order_id,
+                trading_pair=trading_pair,
+                amount=order.amount,
+                trade_type=trade_type,
+                order_type=order_type,
+                price=order.price,
+                exception=ex,
+                **kwargs,
+            )
+
+    async def _track_and_validate_order(self,
+                                        trade_type: TradeType,
+                                        order_id: str,
+                                        trading_pair: str,
+                                        amount: Decimal,
+                                        order_type: OrderType,
+                                        price: Optional[Decimal] = None,
+                                        **kwargs) -> Optional[InFlightOrder]:
+        """
+        Starts tracking a new order with its quantized price and amount, and checks it against the trading rules.
+
+        :param trade_type: the side of the order (BUY of SELL)
+        :param order_id: the id that should be assigned to the order (the client id)
+        :param trading_pair: the token pair to operate with
+        :param amount: the order amount
+        :param order_type: the type of order to create (MARKET, LIMIT, LIMIT_MAKER)
+        :param price: the order price
+
+        :return: the tracked order, or None if the order is not valid (it is then marked as failed)
+        """
         trading_rule = self._trading_rules[trading_pair]
 
         if order_type in [OrderType.LIMIT, OrderType.LIMIT_MAKER]:
@@ -433,37 +625,23 @@ class ExchangePyBase(ExchangeBase, ABC):
         if order_type not in self.supported_order_types():
             self.logger().error(f"{order_type} is not in the list of supported order types")
             self._update_order_after_failure(order_id=order_id, trading_pair=trading_pair)
-            return
+            return None
 
         elif quantized_amount < trading_rule.min_order_size:
             self.logger().warning(f"{trade_type.name.title()} order amount {amount} is lower than the minimum order "
                                   f"size {trading_rule.min_order_size}. The order will not be created, increase the "
                                   f"amount to be higher than the minimum order size.")
             self._update_order_after_failure(order_id=order_id, trading_pair=trading_pair)
-            return
+            return None
 
         elif notional_size < trading_rule.min_notional_size:
             self.logger().warning(f"{trade_type.name.title()} order notional {notional_size} is lower than the "
                                   f"minimum notional size {trading_rule.min_notional_size}. The order will not be "
                                   f"created. Increase the amount or the price to be higher than the minimum notional.")
             self._update_order_after_failure(order_id=order_id, trading_pair=trading_pair)
-            return
-        try:
-            await self._place_order_and_process_update(order=order, **kwargs,)
+            return None
 
-        except asyncio.CancelledError:
-            raise
-        except Exception as ex:
-            self._on_order_failure(
-                order_id=order_id,
-                trading_pair=trading_pair,
-                amount=quantized_amount,
-                trade_type=trade_type,
-                order_type=order_type,
-                price=price,
-                exception=ex,
-                **kwargs,
-            )
+        return order
 
     async def _place_order_and_process_update(self, order: InFlightOrder, **kwargs) -> str:
         exchange_order_id, update_timestamp = await self._place_order(
@@ -501,7 +679,7 @@ class ExchangePyBase(ExchangeBase, ABC):
         self.logger().network(
             f"Error submitting {trade_type.name.lower()} {order_type.name.upper()} order to {self.name_cap} for "
             f"{amount} {trading_pair} {price}.",
-            exc_info=True,
+            exc_info=exception,
             app_warning_msg=f"Failed to submit {trade_type.name.upper()} order to {self.name_cap}. Check API key and network connection."
         )
         self._update_order_after_failure(order_id=order_id, trading_pair=trading_pair)
@@ -567,6 +745,221 @@ class ExchangePyBase(ExchangeBase, ABC):
 
         return result
 
+    def _batch_order_parameters(self,
+                                order: Union[LimitOrder, MarketOrder],
+                                limit_order_type: OrderType) -> Dict[str, Any]:
+        is_limit_order = isinstance(order, LimitOrder)
+        return {
+            "trade_type": TradeType.BUY if order.is_buy else TradeType.SELL,
+            "order_id": order.client_order_id,
+            "trading_pair": order.trading_pair,
+            "amount": order.quantity,
+            "order_type": limit_order_type if is_limit_order else OrderType.MARKET,
+            "price": order.price if is_limit_order else s_decimal_NaN,
+            "position_action": order.position,
+        }
+
+    def _create_single_order_of_batch(self,
+                                      order: Union[LimitOrder, MarketOrder],
+                                      limit_order_type: OrderType) -> Union[LimitOrder, MarketOrder]:
+        is_limit_order = isinstance(order, LimitOrder)
+        create_order = self.buy if order.is_buy else self.sell
+        client_order_id = create_order(
+            trading_pair=order.trading_pair,
+            amount=order.quantity,
+            order_type=limit_order_type if is_limit_order else OrderType.MARKET,
+            price=order.price if is_limit_order else s_decimal_NaN,
+            position_action=order.position)
+        return order.copy_with_id(client_order_id=client_order_id)
+
+    async def _execute_batch_order_create(self,
+                                          orders_to_create: List[Union[LimitOrder, MarketOrder]],
+                                          limit_order_type: OrderType = OrderType.LIMIT):
+        """
+        Starts tracking the orders and sends the valid ones to the exchange in batches of MAX_ORDERS_PER_BATCH orders
+
+        :param orders_to_create: the orders to create, with their client ids
+        :param limit_order_type: the type of order to create for the limit orders (LIMIT, LIMIT_MAKER)
+        """
+        orders_to_place = []
+        for order in orders_to_create:
+            tracked_order = await self._track_and_validate_order(
+                **self._batch_order_parameters(order, limit_order_type))
+            if tracked_order is not None:
+                orders_to_place.append(tracked_order)
+
+        await safe_gather(*[
+            self._place_orders_and_process_update(orders=orders_to_place[index:index + self.MAX_ORDERS_PER_BATCH])
+            for index in range(0, len(orders_to_place), self.MAX_ORDERS_PER_BATCH)
+        ])
+
+    async def _place_orders_and_process_update(self, orders: List[InFlightOrder]):
+        try:
+            place_order_results = await self._place_orders(orders=orders)
+        except asyncio.CancelledError:
+            raise
+        except Exception as ex:
+            place_order_results = [
+                PlaceOrderResult(
+                    update_timestamp=self.current_timestamp,
+                    client_order_id=order.client_order_id,
+                    exchange_order_id=None,
+                    trading_pair=order.trading_pair,
+                    exception=ex,
+                )
+                for order in orders
+            ]
+
+        for order, place_order_result in zip(orders, place_order_results):
+            if place_order_result.exception is not None:
+                self._on_order_failure(
+                    order_id=order.client_order_id,
+                    trading_pair=order.trading_pair,
+                    amount=order.amount,
+                    trade_type=order.trade_type,
+                    order_type=order.order_type,
+                    price=order.price,
+                    exception=place_order_result.exception,
+                )
+            else:
+                order_update: OrderUpdate = OrderUpdate(
+                    client_order_id=order.client_order_id,
+                    exchange_order_id=str(place_order_result.exchange_order_id),
+                    trading_pair=order.trading_pair,
+                    update_timestamp=place_order_result.update_timestamp,
+                    new_state=OrderState.OPEN,
+                    misc_updates=place_order_result.misc_updates,
+                )
+                self._order_tracker.process_order_update(order_update)
+
+    async def _execute_batch_cancel(self, orders_to_cancel: List[LimitOrder]) -> List[CancellationResult]:
+        """
+        Requests the exchange to cancel the active orders in batches of MAX_ORDERS_PER_BATCH orders
+
+        :param orders_to_cancel: the orders to cancel
+
+        :return: a list of CancellationResult instances, one for each of the orders to be cancelled
+        """
+        results = []
+        tracked_orders_to_cancel = []
+        for order in orders_to_cancel:
+            tracked_order = self._order_tracker.fetch_tracked_order(order.client_order_id)
+            if tracked_order is not None:
+                tracked_orders_to_cancel.append(tracked_order)
+            else:
+                results.append(CancellationResult(order_id=order.client_order_id, success=False))
+
+        batch_results = await safe_gather(*[
+            self._execute_batch_order_cancel(
+                orders_to_cancel=tracked_orders_to_cancel[index:index + self.MAX_ORDERS_PER_BATCH])
+            for index in range(0, len(tracked_orders_to_cancel), self.MAX_ORDERS_PER_BATCH)
+        ])
+        for batch_result in batch_results:
+            results.extend(batch_result)
+        return results
+
+    async def _execute_batch_order_cancel(self, orders_to_cancel: List[InFlightOrder]) -> List[CancellationResult]:
+        try:
+            cancel_order_results = await self._place_cancels(orders=orders_to_cancel)
+        except asyncio.CancelledError:
+            raise
+        except Exception as ex:
+            cancel_order_results = [
+                CancelOrderResult(client_order_id=order.client_order_id, trading_pair=order.trading_pair, exception=ex)
+                for order in orders_to_cancel
+            ]
+
+        update_timestamp = self.current_timestamp
+        if update_timestamp is None or math.isnan(update_timestamp):
+            update_timestamp = self._time()
+        cancelation_results = []
+        for cancel_order_result in cancel_order_results:
+            client_order_id = cancel_order_result.client_order_id
+            exception = cancel_order_result.exception
+            success = False
+            if (cancel_order_result.not_found
+                    or (exception is not None
+                        and self._is_order_not_found_during_cancelation_error(cancelation_exception=exception))):
+                self.logger().warning(f"Failed to cancel order {client_order_id} (order not found)")
+                await self._order_tracker.process_order_not_found(client_order_id)
+            elif exception is not None:
+                self.logger().error(f"Failed to cancel order {client_order_id}", exc_info=exception)
+            else:
+                order_update: OrderUpdate = OrderUpdate(
+                    client_order_id=client_order_id,
+                    trading_pair=cancel_order_result.trading_pair,
+                    update_timestamp=update_timestamp,
+                    new_state=(OrderState.CANCELED
+                               if self.is_cancel_request_in_exchange_synchronous
+                               else OrderState.PENDING_CANCEL),
+                    misc_updates=cancel_order_result.misc_updates,
+                )
+                self._order_tracker.process_order_update(order_update)
+                success = True
+            cancelation_results.append(CancellationResult(order_id=client_order_id, success=success))
+        return cancelation_results
+
+    async def _execute_order_amend(self, order: InFlightOrder, price: Decimal, amount: Decimal):
+        """
+        Requests the exchange to change the price and amount of an open order. The order is pending amend until the
+        exchange answers (or reports the result in the order updates if is_amend_request_in_exchange_synchronous is
+        False), and keeps its price and amount if the amendment fails.
+
+        :param order: the tracked order to amend
+        :param price: the new order price
+        :param amount: the new order amount
+        """
+        try:
+            if order.current_state not in [OrderState.OPEN, OrderState.PARTIALLY_FILLED]:
+                # The order was canceled, filled or is being canceled since the amendment was requested
+                self.logger().info(f"Order {order.client_order_id} not amended, it is no longer open "
+                                   f"({order.current_state.name}).")
+                return
+            await self._amend_order_and_process_update(order=order, price=price, amount=amount)
+        finally:
+            self._order_amendments_in_progress.discard(order.client_order_id)
+
+    async def _amend_order_and_process_update(self, order: InFlightOrder, price: Decimal, amount: Decimal):
+        price = self.quantize_order_price(order.trading_pair, price)
+        amount = self.quantize_order_amount(trading_pair=order.trading_pair, amount=amount)
+        await self._order_tracker.process_order_update(OrderUpdate(
+            client_order_id=order.client_order_id,
+            trading_pair=order.trading_pair,
+            update_timestamp=self.current_timestamp,
+            new_state=OrderState.PENDING_AMEND,
+        ))
+        try:
+            exchange_order_id, update_timestamp = await self._place_amend(
+                order_id=order.client_order_id, tracked_order=order, price=price, amount=amount)
+            if not self.is_amend_request_in_exchange_synchronous:
+                # The order update with the result of the amendment ends the pending amend state
+                return
+            order_update: OrderUpdate = OrderUpdate(
+                client_order_id=order.client_order_id,
+                exchange_order_id=str(exchange_order_id),
+                trading_pair=order.trading_pair,
+                update_timestamp=update_timestamp,
+                new_state=(OrderState.PARTIALLY_FILLED if order.executed_amount_base > s_decimal_0
+                           else OrderState.OPEN),
+                misc_updates={"new_price": price, "new_amount": amount},
+            )
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            self.logger().error(f"Failed to amend order {order.client_order_id}", exc_info=True)
+            order_update: OrderUpdate = OrderUpdate(
+                client_order_id=order.client_order_id,
+                trading_pair=order.trading_pair,
+                update_timestamp=self.current_timestamp,
+                new_state=(OrderState.PARTIALLY_FILLED if order.executed_amount_base > s_decimal_0
+                           else OrderState.OPEN),
+            )
+        if order.is_pending_amend:
+            await self._order_tracker.process_order_update(order_update)
+        elif order.is_open and order_update.misc_updates is not None:
+            # An order update received while the amend request was in flight already ended the amendment state
+            await self._order_tracker.process_order_update(order_update._replace(new_state=order.current_state))
+
     # === Order Tracking ===
 
     def restore_tracking_states(self, saved_states: Dict[str, Any]):
@@ -628,6 +1021,46 @@ class ExchangePyBase(ExchangeBase, ABC):
     async def _place_cancel(self, order_id: str, tracked_order: InFlightOrder):
         raise NotImplementedError
 
+    async def _place_orders(self, orders: List[InFlightOrder]) -> List[PlaceOrderResult]:
+        """
+        Sends the orders to the exchange in a single batch request. Only called when MAX_ORDERS_PER_BATCH is
+        positive, with at most MAX_ORDERS_PER_BATCH orders.
+
+        :param orders: the tracked orders to create
+
+        :return: the result of the creation of each order, in the same order as the orders
+        """
+        raise NotImplementedError
+
+    async def _place_cancels(self, orders: List[InFlightOrder]) -> List[CancelOrderResult]:
+        """
+        Requests the exchange to cancel the orders in a single batch request. Only called when MAX_ORDERS_PER_BATCH
+        is positive, with at most MAX_ORDERS_PER_BATCH orders.
+
+        :param orders: the tracked orders to cancel
+
+        :return: the result of the cancelation of each order
+        """
+        raise NotImplementedError
+
+    async def _place_amend(self,
+                           order_id: str,
+                           tracked_order: InFlightOrder,
+                           price: Decimal,
+                           amount: Decimal) -> Tuple[str, float]:
+        """
+        Requests the exchange to change the price and amount of an open order. Only called when
+        is_order_amendment_supported is True.
+
+        :param order_id: the client id of the order to amend
+        :param tracked_order: the tracked order to amend
+        :param price: the new quantized order price
+        :param amount: the new quantized order amount
+
+        :return: the exchange id of the amended order and the timestamp of the amendment
+        """
+        raise NotImplementedError
+
     @abstractmethod
     async def _place_order(self,
                            order_id: str,
@@ -856,6 +1289,7 @@ class ExchangePyBase(ExchangeBase, ABC):
         self._trading_rules.clear()
         for trading_rule in trading_rules_list:
             self._trading_rules[trading_rule.trading_pair] = trading_rule
+        self._quantization_table.update(trading_rules_list)
         self._initialize_trading_pair_symbols_from_exchange_info(exchange_info=exchange_info)
 
     async def _api_get(self, *args, **kwargs):
@@ -11,7 +11,6 @@ from hummingbot.core.data_type.in_flight_order import OrderState, OrderUpdate
 from hummingbot.core.data_type.trade_fee import TokenAmount
 from hummingbot.core.event.events import TradeType
 from hummingbot.core.gateway.gateway_http_client import GatewayHttpClient
-from hummingbot.core.utils import async_ttl_cache
 from hummingbot.core.utils.async_utils import safe_ensure_future, safe_gather
 from hummingbot.core.utils.tracking_nonce import NonceCreator
 from hummingbot.logger import HummingbotLogger
@@ -142,7 +141,8 @@ class GatewayAlgorandAMM(GatewayEVMAMM):
                 await self._poll_notifier.wait()
                 await safe_gather(
                     self.update_balances(on_interval=True),
-                    self.update_order_status(self.amm_orders)
+                    self.update_order_status(self.amm_orders),
+                    self._update_block_number(),
                 )
                 self._last_poll_timestamp = self.current_timestamp
             except asyncio.CancelledError:
@@ -171,15 +171,13 @@ class GatewayAlgorandAMM(GatewayEVMAMM):
             "Polling for order status updates of %d orders.",
             len(tracked_orders)
         )
-        update_results: List[Union[Dict[str, Any], Exception]] = await safe_gather(*[
-            self._get_gateway_instance().get_transaction_status(
-                self.chain,
-                self.network,
-                tx_hash
-            )
-            for tx_hash in tx_hash_list
-        ], return_exceptions=True)
-        for tracked_order, tx_details in zip(tracked_orders, update_results):
+        update_results: Dict[str, Union[Dict[str, Any], Exception]] = await self._poll_transaction_statuses(
+            tx_hash_list
+        )
+        for tracked_order, tx_hash in zip(tracked_orders, tx_hash_list):
+            if tx_hash not in update_results:
+                continue
+            tx_details = update_results[tx_hash]
             if isinstance(tx_details, Exception):
                 self.logger().error(f"An error occurred fetching transaction status of {tracked_order.client_order_id}")
                 continue
@@ -205,7 +203,6 @@ class GatewayAlgorandAMM(GatewayEVMAMM):
                 )
                 await self._order_tracker.process_order_not_found(tracked_order.client_order_id)
 
-    @async_ttl_cache(ttl=5, maxsize=10)
     async def get_quote_price(
             self,
             trading_pair: str,
@@ -228,9 +225,7 @@ class GatewayAlgorandAMM(GatewayEVMAMM):
 
         # Pull the price from gateway.
         try:
-            resp: Dict[str, Any] = await self._get_gateway_instance().get_price(
-                self.chain, self.network, self.connector_name, base, quote, amount, side
-            )
+            resp: Dict[str, Any] = await self._get_price_response(base, quote, amount, side)
             return self.parse_price_response(base, quote, amount, side, price_response=resp, process_exception=False)
         except asyncio.CancelledError:
             raise
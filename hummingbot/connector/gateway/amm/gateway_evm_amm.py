@@ -5,7 +5,7 @@ import logging
 import re
 import time
 from decimal import Decimal
-from typing import TYPE_CHECKING, Any, Dict, List, Optional, Set, Union, cast
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Set, Tuple, Union, cast
 
 from async_timeout import timeout
 
@@ -14,6 +14,8 @@ from hummingbot.connector.client_order_tracker import ClientOrderTracker
 from hummingbot.connector.connector_base import ConnectorBase
 from hummingbot.connector.gateway.gateway_in_flight_order import GatewayInFlightOrder
 from hummingbot.connector.gateway.gateway_price_shim import GatewayPriceShim
+from hummingbot.connector.gateway.gateway_quote_cache import GatewayQuoteCache
+from hummingbot.connector.gateway.gateway_transaction_polling_schedule import GatewayTransactionPollingSchedule
 from hummingbot.core.data_type.cancellation_result import CancellationResult
 from hummingbot.core.data_type.in_flight_order import OrderState, OrderUpdate, TradeUpdate
 from hummingbot.core.data_type.limit_order import LimitOrder
@@ -29,7 +31,6 @@ from hummingbot.core.event.events import (
 from hummingbot.core.gateway import check_transaction_exceptions
 from hummingbot.core.gateway.gateway_http_client import GatewayHttpClient
 from hummingbot.core.network_iterator import NetworkStatus
-from hummingbot.core.utils import async_ttl_cache
 from hummingbot.core.utils.async_utils import safe_ensure_future, safe_gather
 from hummingbot.core.utils.tracking_nonce import get_tracking_nonce
 from hummingbot.logger import HummingbotLogger
@@ -115,6 +116,8 @@ class GatewayEVMAMM(ConnectorBase):
         self._network_transaction_fee: Optional[TokenAmount] = None
         self._order_tracker: ClientOrderTracker = ClientOrderTracker(connector=self, lost_order_count_limit=10)
         self._amount_quantum_dict = {}
+        self._quote_cache = GatewayQuoteCache(ttl=float(client_config_map.gateway.gateway_quote_cache_ttl))
+        self._transaction_polling_schedule = GatewayTransactionPollingSchedule(min_interval=self.POLL_INTERVAL)
         safe_ensure_future(self.load_token_data())
 
     @classmethod
@@ -262,6 +265,7 @@ class GatewayEVMAMM(ConnectorBase):
             )
             if type(self._chain_info) != list:
                 self._native_currency = self._chain_info.get("nativeCurrency", "ETH")
+                self._quote_cache.update_block_number(self._chain_info.get("currentBlockNumber"))
         except asyncio.CancelledError:
             raise
         except Exception as e:
@@ -408,7 +412,6 @@ class GatewayEVMAMM(ConnectorBase):
             return Decimal(str(price))
         return None
 
-    @async_ttl_cache(ttl=5, maxsize=10)
     async def get_quote_price(
             self,
             trading_pair: str,
@@ -456,9 +459,7 @@ class GatewayEVMAMM(ConnectorBase):
 
         # Pull the price from gateway.
         try:
-            resp: Dict[str, Any] = await self._get_gateway_instance().get_price(
-                self.chain, self.network, self.connector_name, base, quote, amount, side
-            )
+            resp: Dict[str, Any] = await self._get_price_response(base, quote, amount, side)
             return self.parse_price_response(base, quote, amount, side, price_response=resp)
         except asyncio.CancelledError:
             raise
@@ -469,6 +470,51 @@ class GatewayEVMAMM(ConnectorBase):
                 app_warning_msg=str(e)
             )
 
+    async def get_quote_prices(
+            self,
+            trading_pair: str,
+            quotes: List[Tuple[bool, Decimal]],
+            ignore_shim: bool = False
+    ) -> List[Optional[Decimal]]:
+        """
+        Retrieves several quote prices for a trading pair at once. Identical requests are only sent once to Gateway.
+
+        :param trading_pair: The market trading pair
+        :param quotes: The list of (is_buy, amount) quotes required
+        :param ignore_shim: Ignore the price shim, and return the real prices on the network
+        :return: The quote prices, in the same order as the requested quotes.
+        """
+        return list(await safe_gather(*[
+            self.get_quote_price(trading_pair, is_buy, amount, ignore_shim=ignore_shim) for is_buy, amount in quotes
+        ]))
+
+    async def _get_price_response(self, base: str, quote: str, amount: Decimal, side: TradeType) -> Dict[str, Any]:
+        """
+        Requests a price quote to Gateway, reusing the quotes received in the current block within the configured
+        time to live, and coalescing the concurrent requests for the same quote.
+        """
+        key = (self.chain, self.network, self.connector_name, base, quote, amount, side)
+        return await self._quote_cache.get_quote(
+            key,
+            lambda: self._get_gateway_instance().get_price(
+                self.chain, self.network, self.connector_name, base, quote, amount, side
+            ))
+
+    async def _update_block_number(self):
+        """
+        Refreshes the chain block number, to discard the quotes received in previous blocks.
+        """
+        if not self._quote_cache.has_quotes:
+            return
+        try:
+            chain_status = await self._get_gateway_instance().get_network_status(chain=self.chain, network=self.network)
+            self._quote_cache.update_block_number(chain_status.get("currentBlockNumber"))
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            # Without the block number the quotes are discarded only when they expire
+            self._quote_cache.invalidate()
+
     async def get_order_price(
             self,
             trading_pair: str,
@@ -630,6 +676,11 @@ class GatewayEVMAMM(ConnectorBase):
         """
         Stops tracking an order by simply removing it from _in_flight_orders dictionary in ClientOrderTracker.
         """
+        tracked_order: Optional[GatewayInFlightOrder] = self._order_tracker.fetch_tracked_order(order_id)
+        if tracked_order is not None:
+            for tx_hash in [tracked_order.exchange_order_id, tracked_order.cancel_tx_hash]:
+                if tx_hash is not None:
+                    self._transaction_polling_schedule.forget(tx_hash)
         self._order_tracker.stop_tracking_order(client_order_id=order_id)
 
     async def update_token_approval_status(self, tracked_approvals: List[GatewayInFlightOrder]):
@@ -641,15 +692,13 @@ class GatewayEVMAMM(ConnectorBase):
         tx_hash_list: List[str] = await safe_gather(*[
             tracked_approval.get_exchange_order_id() for tracked_approval in tracked_approvals
         ])
-        transaction_states: List[Union[Dict[str, Any], Exception]] = await safe_gather(*[
-            self._get_gateway_instance().get_transaction_status(
-                self.chain,
-                self.network,
-                tx_hash
-            )
-            for tx_hash in tx_hash_list
-        ], return_exceptions=True)
-        for tracked_approval, transaction_status in zip(tracked_approvals, transaction_states):
+        transaction_states: Dict[str, Union[Dict[str, Any], Exception]] = await self._poll_transaction_statuses(
+            tx_hash_list
+        )
+        for tracked_approval, tx_hash in zip(tracked_approvals, tx_hash_list):
+            if tx_hash not in transaction_states:
+                continue
+            transaction_status = transaction_states[tx_hash]
             token_symbol: str = self.get_token_symbol_from_approval_order_id(tracked_approval.client_order_id)
             if isinstance(transaction_status, Exception):
                 self.logger().error(f"Error while trying to approve token {token_symbol} for {self.connector_name}: "
@@ -699,15 +748,14 @@ class GatewayEVMAMM(ConnectorBase):
             "Polling for order status updates of %d canceled orders.",
             len(canceled_tracked_orders)
         )
-        update_results: List[Union[Dict[str, Any], Exception]] = await safe_gather(*[
-            self._get_gateway_instance().get_transaction_status(
-                self.chain,
-                self.network,
-                tx_hash
-            )
-            for tx_hash in [t.cancel_tx_hash for t in canceled_tracked_orders]
-        ], return_exceptions=True)
-        for tracked_order, update_result in zip(canceled_tracked_orders, update_results):
+        tx_hash_list: List[str] = [t.cancel_tx_hash for t in canceled_tracked_orders]
+        update_results: Dict[str, Union[Dict[str, Any], Exception]] = await self._poll_transaction_statuses(
+            tx_hash_list
+        )
+        for tracked_order, tx_hash in zip(canceled_tracked_orders, tx_hash_list):
+            if tx_hash not in update_results:
+                continue
+            update_result = update_results[tx_hash]
             if isinstance(update_result, Exception):
                 raise update_result
             if "txHash" not in update_result:
@@ -748,6 +796,32 @@ class GatewayEVMAMM(ConnectorBase):
                                                f"{self.connector_name} has been canceled.")
                             self.stop_tracking_order(tracked_order.client_order_id)
 
+    async def _poll_transaction_statuses(
+        self,
+        tx_hash_list: List[str],
+        address: Optional[str] = None,
+        fail_silently: bool = False
+    ) -> Dict[str, Union[Dict[str, Any], Exception]]:
+        """
+        Fetches, in a single batched request, the status of the transactions that are due for polling according to
+        their age. Transactions that are not due are left out of the result.
+        """
+        due_tx_hashes: List[str] = self._transaction_polling_schedule.due_transactions(tx_hash_list)
+        if len(due_tx_hashes) < 1:
+            return {}
+        statuses: Dict[str, Union[Dict[str, Any], Exception]] = await self._get_gateway_instance().get_transaction_statuses(
+            chain=self.chain,
+            network=self.network,
+            transaction_hashes=due_tx_hashes,
+            address=address,
+            fail_silently=fail_silently
+        )
+        self._transaction_polling_schedule.mark_polled(due_tx_hashes)
+        for tx_hash, status in statuses.items():
+            if isinstance(status, dict) and (status.get("txStatus") in [1, -1] or status.get("txBlock", 0) > 0):
+                self._transaction_polling_schedule.forget(tx_hash)
+        return statuses
+
     def processs_trade_fill_update(self, tracked_order: GatewayInFlightOrder, fee: Decimal):
         trade_fee: TradeFeeBase = AddedToCostTradeFee(
             flat_fees=[TokenAmount(tracked_order.fee_asset, fee)]
@@ -782,15 +856,13 @@ class GatewayEVMAMM(ConnectorBase):
             "Polling for order status updates of %d orders.",
             len(tracked_orders)
         )
-        update_results: List[Union[Dict[str, Any], Exception]] = await safe_gather(*[
-            self._get_gateway_instance().get_transaction_status(
-                self.chain,
-                self.network,
-                tx_hash
-            )
-            for tx_hash in tx_hash_list
-        ], return_exceptions=True)
-        for tracked_order, tx_details in zip(tracked_orders, update_results):
+        update_results: Dict[str, Union[Dict[str, Any], Exception]] = await self._poll_transaction_statuses(
+            tx_hash_list
+        )
+        for tracked_order, tx_hash in zip(tracked_orders, tx_hash_list):
+            if tx_hash not in update_results:
+                continue
+            tx_details = update_results[tx_hash]
             if isinstance(tx_details, Exception):
                 self.logger().error(f"An error occurred fetching transaction status of {tracked_order.client_order_id}")
                 continue
@@ -918,7 +990,8 @@ class GatewayEVMAMM(ConnectorBase):
                     self.update_balances(on_interval=True),
                     self.update_canceling_transactions(self.canceling_orders),
                     self.update_token_approval_status(self.approval_orders),
-                    self.update_order_status(self.amm_orders)
+                    self.update_order_status(self.amm_orders),
+                    self._update_block_number(),
                 )
                 self._last_poll_timestamp = self.current_timestamp
             except asyncio.CancelledError:
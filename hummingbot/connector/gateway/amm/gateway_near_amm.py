@@ -10,7 +10,6 @@ from hummingbot.core.data_type.cancellation_result import CancellationResult
 from hummingbot.core.data_type.common import TradeType
 from hummingbot.core.data_type.in_flight_order import OrderState, OrderUpdate
 from hummingbot.core.data_type.trade_fee import TokenAmount
-from hummingbot.core.utils import async_ttl_cache
 from hummingbot.core.utils.async_utils import safe_ensure_future, safe_gather
 from hummingbot.logger import HummingbotLogger
 
@@ -73,17 +72,15 @@ class GatewayNearAMM(GatewayEVMAMM):
             "Polling for order status updates of %d orders.",
             len(tracked_orders)
         )
-        update_results: List[Union[Dict[str, Any], Exception]] = await safe_gather(*[
-            self._get_gateway_instance().get_transaction_status(
-                chain=self.chain,
-                network=self.network,
-                transaction_hash=tx_hash,
-                address=self.address,
-                fail_silently=True
-            )
-            for tx_hash in tx_hash_list
-        ], return_exceptions=True)
-        for tracked_order, tx_details in zip(tracked_orders, update_results):
+        update_results: Dict[str, Union[Dict[str, Any], Exception]] = await self._poll_transaction_statuses(
+            tx_hash_list,
+            address=self.address,
+            fail_silently=True
+        )
+        for tracked_order, tx_hash in zip(tracked_orders, tx_hash_list):
+            if tx_hash not in update_results:
+                continue
+            tx_details = update_results[tx_hash]
             if "txHash" not in tx_details:
                 continue
             tx_status: int = tx_details.get("txStatus", -1)
@@ -163,7 +160,6 @@ class GatewayNearAMM(GatewayEVMAMM):
         """
         pass
 
-    @async_ttl_cache(ttl=5, maxsize=10)
     async def get_quote_price(
             self,
             trading_pair: str,
@@ -211,9 +207,7 @@ class GatewayNearAMM(GatewayEVMAMM):
 
         # Pull the price from gateway.
         try:
-            resp: Dict[str, Any] = await self._get_gateway_instance().get_price(
-                self.chain, self.network, self.connector_name, base, quote, amount, side
-            )
+            resp: Dict[str, Any] = await self._get_price_response(base, quote, amount, side)
             return self.parse_price_response(base, quote, amount, side, price_response=resp, process_exception=False)
         except asyncio.CancelledError:
             raise
@@ -0,0 +1,120 @@
+import asyncio
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional, Tuple
+
+
+class GatewayQuoteCache:
+    """
+    Keeps the price quotes received from Gateway for a short period of time, so that the strategies asking for the
+    same (trading pair, side, amount) quote several times within the same tick only trigger one request to Gateway
+    (and one call to the chain node).
+
+    - Quotes expire after `ttl` seconds. A `ttl` of 0 disables the cache, but concurrent requests are still coalesced.
+    - Quotes are also discarded as soon as a new block is reported with `update_block_number`, because the pool
+      reserves (and therefore the price) can only change with a new block.
+    - Concurrent requests for the same quote are coalesced: only the first one is sent to Gateway and the rest wait
+      for its result.
+    - Failed requests are not cached.
+    """
+
+    def __init__(self, ttl: float = 2.0, max_entries: int = 1000):
+        self._ttl = ttl
+        self._max_entries = max_entries
+        self._quotes: "OrderedDict[Hashable, Tuple[float, Optional[int], Dict[str, Any]]]" = OrderedDict()
+        self._in_flight_requests: Dict[Hashable, asyncio.Future] = {}
+        self._block_number: Optional[int] = None
+
+    @property
+    def ttl(self) -> float:
+        return self._ttl
+
+    @ttl.setter
+    def ttl(self, ttl: float):
+        self._ttl = ttl
+        if ttl <= 0:
+            self._quotes.clear()
+
+    @property
+    def block_number(self) -> Optional[int]:
+        return self._block_number
+
+    @property
+    def has_quotes(self) -> bool:
+        return len(self._quotes) > 0
+
+    def update_block_number(self, block_number: Optional[int]):
+        """
+        Registers the latest block number of the chain. All the quotes fetched in previous blocks are discarded.
+        """
+        if block_number is None:
+            return
+        if self._block_number is not None and block_number > self._block_number:
+            self._quotes.clear()
+        self._block_number = block_number
+
+    def invalidate(self):
+        self._quotes.clear()
+
+    async def get_quote(self, key: Hashable, fetch: Callable[[], Awaitable[Dict[str, Any]]]) -> Dict[str, Any]:
+        """
+        Returns the cached quote for `key` if it is still valid, otherwise requests it with `fetch`.
+
+        :param key: the identifier of the quote (e.g. chain, network, connector, base, quote, amount and side)
+        :param fetch: the coroutine function that requests the quote to Gateway
+        :return: the Gateway price response
+        """
+        quote = self._valid_quote(key)
+        if quote is not None:
+            return quote
+
+        in_flight_request = self._in_flight_requests.get(key)
+        if in_flight_request is not None:
+            try:
+                return await asyncio.shield(in_flight_request)
+            except asyncio.CancelledError:
+                if not in_flight_request.cancelled():
+                    raise
+                # The task that sent the request was cancelled, this one sends its own request
+                return await self.get_quote(key, fetch)
+
+        in_flight_request = asyncio.get_event_loop().create_future()
+        self._in_flight_requests[key] = in_flight_request
+        block_number = self._block_number
+        try:
+            quote = await fetch()
+        except asyncio.CancelledError:
+            in_flight_request.cancel()
+            raise
+        except Exception as exception:
+            in_flight_request.set_exception(exception)
+            # Avoid the "exception was never retrieved" warning when there are no other waiters
+            in_flight_request.exception()
+            raise
+        else:
+            in_flight_request.set_result(quote)
+            self._store(key, block_number, quote)
+        finally:
+            del self._in_flight_requests[key]
+        return quote
+
+    def _valid_quote(self, key: Hashable) -> Optional[Dict[str, Any]]:
+        entry = self._quotes.get(key)
+        if entry is None:
+            return None
+        timestamp, block_number, quote = entry
+        if self._time() - timestamp > self._ttl or block_number != self._block_number:
+            del self._quotes[key]
+            return None
+        return quote
+
+    def _store(self, key: Hashable, block_number: Optional[int], quote: Dict[str, Any]):
+        if self._ttl <= 0 or block_number != self._block_number:
+            return
+        self._quotes[key] = (self._time(), block_number, quote)
+        self._quotes.move_to_end(key)
+        while len(self._quotes) > self._max_entries:
+            self._quotes.popitem(last=False)
+
+    def _time(self) -> float:
+        return time.time()
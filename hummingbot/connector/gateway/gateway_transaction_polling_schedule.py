@@ -0,0 +1,60 @@
+import time
+from typing import Dict, Iterable, List, Tuple
+
+
+class GatewayTransactionPollingSchedule:
+    """
+    Decides which of the pending transactions have to be polled in each pass of the status polling loop.
+
+    Recently sent transactions are polled on every pass. Once a transaction is older than `backoff_start` seconds, the
+    interval between two polls of its status doubles every `backoff_start` seconds, up to `max_interval`. Transactions
+    that take long to be mined are therefore polled less and less often, and the number of status queries per pass
+    stays roughly constant when the number of pending transactions grows.
+    """
+
+    def __init__(self, min_interval: float = 1.0, backoff_start: float = 10.0, max_interval: float = 60.0):
+        self._min_interval = min_interval
+        self._backoff_start = backoff_start
+        self._max_interval = max_interval
+        # transaction hash -> (first seen timestamp, last poll timestamp)
+        self._transactions: Dict[str, Tuple[float, float]] = {}
+
+    @property
+    def tracked_transactions_count(self) -> int:
+        return len(self._transactions)
+
+    def poll_interval(self, age: float) -> float:
+        """
+        Returns the minimum time between two polls of a transaction that was first seen `age` seconds ago.
+        """
+        if age < self._backoff_start:
+            return 0
+        exponent = int((age - self._backoff_start) // self._backoff_start)
+        return min(self._max_interval, self._min_interval * 2 ** min(exponent, 32))
+
+    def due_transactions(self, transaction_hashes: Iterable[str]) -> List[str]:
+        """
+        Filters the transactions whose status has to be polled now. New transactions are always due.
+        """
+        now = self._time()
+        due = []
+        for transaction_hash in transaction_hashes:
+            first_seen, last_poll = self._transactions.get(transaction_hash, (now, None))
+            if last_poll is None or now - last_poll >= self.poll_interval(now - first_seen):
+                due.append(transaction_hash)
+        return due
+
+    def mark_polled(self, transaction_hashes: Iterable[str]):
+        now = self._time()
+        for transaction_hash in transaction_hashes:
+            first_seen, _ = self._transactions.get(transaction_hash, (now, now))
+            self._transactions[transaction_hash] = (first_seen, now)
+
+    def forget(self, transaction_hash: str):
+        """
+        Stops tracking a transaction, normally because it reached a final state.
+        """
+        self._transactions.pop(transaction_hash, None)
+
+    def _time(self) -> float:
+        return time.time()
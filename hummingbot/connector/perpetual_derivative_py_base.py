@@ -1,7 +1,7 @@
 import asyncio
 from abc import ABC, abstractmethod
 from decimal import Decimal
-from typing import TYPE_CHECKING, Dict, List, Optional, Tuple
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple, Union
 
 from hummingbot.connector.constants import s_decimal_0, s_decimal_NaN
 from hummingbot.connector.derivative.perpetual_budget_checker import PerpetualBudgetChecker
@@ -11,6 +11,8 @@ from hummingbot.connector.perpetual_trading import PerpetualTrading
 from hummingbot.core.data_type.common import OrderType, PositionAction, PositionMode, TradeType
 from hummingbot.core.data_type.funding_info import FundingInfo
 from hummingbot.core.data_type.in_flight_order import PerpetualDerivativeInFlightOrder
+from hummingbot.core.data_type.limit_order import LimitOrder
+from hummingbot.core.data_type.market_order import MarketOrder
 from hummingbot.core.data_type.perpetual_api_order_book_data_source import PerpetualAPIOrderBookDataSource
 from hummingbot.core.data_type.trade_fee import TradeFeeBase
 from hummingbot.core.event.events import (
@@ -250,6 +252,25 @@ class PerpetualDerivativePyBase(ExchangePyBase, ABC):
             **kwargs,
         )
 
+    async def _execute_batch_order_create(
+        self,
+        orders_to_create: List[Union[LimitOrder, MarketOrder]],
+        limit_order_type: OrderType = OrderType.LIMIT,
+    ):
+        """
+        Starts tracking the orders and sends the valid ones to the exchange in batches of MAX_ORDERS_PER_BATCH orders
+
+        :param orders_to_create: the orders to create, with their client ids and position actions
+        :param limit_order_type: the type of order to create for the limit orders (LIMIT, LIMIT_MAKER)
+        """
+        for order in orders_to_create:
+            if order.position not in self.VALID_POSITION_ACTIONS:
+                raise ValueError(
+                    f"Invalid position action {order.position}. Must be one of {self.VALID_POSITION_ACTIONS}"
+                )
+
+        await super()._execute_batch_order_create(orders_to_create=orders_to_create, limit_order_type=limit_order_type)
+
     def get_fee(
         self,
         base_currency: str,
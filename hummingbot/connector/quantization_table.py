@@ -0,0 +1,71 @@
+from decimal import Decimal
+from typing import Dict, Iterable, Optional
+
+from hummingbot.connector.trading_rule import TradingRule
+
+
+class TradingPairQuantization:
+    """
+    Price and order size quanta of a trading pair, precomputed from its trading rule, with the quantize functions of
+    the connectors. The values are rounded towards zero to a whole number of ticks, with the same results (value and
+    representation) as `ConnectorBase.c_quantize_order_price` and `c_quantize_order_amount`.
+    """
+    __slots__ = ("trading_rule", "price_quantum", "size_quantum")
+
+    def __init__(self, trading_rule: TradingRule):
+        self.trading_rule = trading_rule
+        self.price_quantum = Decimal(trading_rule.min_price_increment)
+        self.size_quantum = Decimal(trading_rule.min_base_amount_increment)
+
+    def quantize_price(self, price: Decimal) -> Decimal:
+        if price.is_nan():
+            return price
+        price_quantum = self.price_quantum
+        return (price // price_quantum) * price_quantum
+
+    def quantize_amount(self, amount: Decimal) -> Decimal:
+        size_quantum = self.size_quantum
+        return (amount // size_quantum) * size_quantum
+
+    def price_ticks(self, price: Decimal) -> int:
+        """
+        The number of price ticks in the quantized price.
+        """
+        return int(price // self.price_quantum)
+
+    def size_ticks(self, amount: Decimal) -> int:
+        """
+        The number of order size ticks in the quantized amount.
+        """
+        return int(amount // self.size_quantum)
+
+
+class QuantizationTable:
+    """
+    The quantization of the trading pairs of a connector, refreshed with its trading rules. An entry is only valid for
+    the `TradingRule` instance it was computed from: the connectors replace the rules when they are updated, so the
+    entries of the replaced rules are computed again on their next use.
+    """
+
+    def __init__(self):
+        self._quantizations: Dict[str, TradingPairQuantization] = {}
+
+    def __len__(self) -> int:
+        return len(self._quantizations)
+
+    def update(self, trading_rules: Iterable[TradingRule]):
+        """
+        Replaces the table with the quantization of the trading rules.
+        """
+        self._quantizations = {trading_rule.trading_pair: TradingPairQuantization(trading_rule)
+                               for trading_rule in trading_rules}
+
+    def get(self, trading_pair: str, trading_rule: TradingRule) -> TradingPairQuantization:
+        """
+        Returns the quantization of the trading pair, computed again if its trading rule changed.
+        """
+        quantization: Optional[TradingPairQuantization] = self._quantizations.get(trading_pair)
+        if quantization is None or quantization.trading_rule is not trading_rule:
+            quantization = TradingPairQuantization(trading_rule)
+            self._quantizations[trading_pair] = quantization
+        return quantization
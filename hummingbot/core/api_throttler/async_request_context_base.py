@@ -6,6 +6,7 @@ from decimal import Decimal
 from typing import List, Tuple
 
 from hummingbot.core.api_throttler.data_types import RateLimit, TaskLog
+from hummingbot.core.utils.latency_metrics import LatencyMetric, LatencyMetricsRegistry
 from hummingbot.logger.logger import HummingbotLogger
 
 arc_logger = None
@@ -88,7 +89,14 @@ class AsyncRequestContextBase(ABC):
                 self._task_logs.append(TaskLog(timestamp=now, rate_limit=limit, weight=weight))
 
     async def __aenter__(self):
-        await self.acquire()
+        latency_metrics = LatencyMetricsRegistry.get_instance()
+        if latency_metrics.enabled:
+            start = time.perf_counter()
+            await self.acquire()
+            limit_id = self._rate_limit.limit_id if self._rate_limit is not None else ""
+            latency_metrics.record(LatencyMetric.THROTTLE_WAIT, limit_id, time.perf_counter() - start)
+        else:
+            await self.acquire()
 
     async def __aexit__(self, exc_type, exc, tb):
         pass
@@ -52,6 +52,7 @@ class PriceType(Enum):
     LastOwnTrade = 5
     InventoryCost = 6
     Custom = 7
+    Microprice = 8
 
 
 class TradeType(Enum):
@@ -32,6 +32,7 @@ class OrderState(Enum):
     APPROVED = 8
     CREATED = 9
     COMPLETED = 10
+    PENDING_AMEND = 11
 
 
 class OrderUpdate(NamedTuple):
@@ -167,13 +168,18 @@ class InFlightOrder:
     def is_pending_cancel_confirmation(self) -> bool:
         return self.current_state == OrderState.PENDING_CANCEL
 
+    @property
+    def is_pending_amend(self) -> bool:
+        return self.current_state == OrderState.PENDING_AMEND
+
     @property
     def is_open(self) -> bool:
         return self.current_state in {
             OrderState.PENDING_CREATE,
             OrderState.OPEN,
             OrderState.PARTIALLY_FILLED,
-            OrderState.PENDING_CANCEL}
+            OrderState.PENDING_CANCEL,
+            OrderState.PENDING_AMEND}
 
     @property
     def is_done(self) -> bool:
@@ -321,15 +327,23 @@ class InFlightOrder:
                 and order_update.exchange_order_id != self.exchange_order_id):
             return False
 
-        prev_data = (self.exchange_order_id, self.current_state)
+        prev_data = (self.exchange_order_id, self.current_state, self.price, self.amount)
 
         if self.exchange_order_id is None and order_update.exchange_order_id is not None:
             self.update_exchange_order_id(order_update.exchange_order_id)
 
+        if order_update.misc_updates is not None:
+            # "new_price" and "new_amount" are set when the order is amended
+            if "new_price" in order_update.misc_updates:
+                self.price = order_update.misc_updates["new_price"]
+            if "new_amount" in order_update.misc_updates:
+                self.amount = order_update.misc_updates["new_amount"]
+                self.check_filled_condition()
+
         self.current_state = order_update.new_state
         self.check_processed_by_exchange_condition()
 
-        updated: bool = prev_data != (self.exchange_order_id, self.current_state)
+        updated: bool = prev_data != (self.exchange_order_id, self.current_state, self.price, self.amount)
 
         if updated:
             self.last_update_timestamp = order_update.update_timestamp
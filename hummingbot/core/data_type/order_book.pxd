@@ -20,10 +20,22 @@ cdef class OrderBook(PubSub):
     cdef double _last_applied_trade
     cdef double _last_trade_price_rest_updated
     cdef bint _dex
+    cdef double _best_bid_amount
+    cdef double _best_ask_amount
+    cdef double _microprice
+    cdef vector[double] _depth_bands_bps
+    cdef double _depth_mid_price
+    cdef vector[double] _bid_depths
+    cdef vector[double] _ask_depths
+    cdef vector[int64_t] _depth_band_reads
+    cdef int64_t _depth_band_read_count
 
     cdef c_apply_diffs(self, vector[OrderBookEntry] bids, vector[OrderBookEntry] asks, int64_t update_id)
     cdef c_apply_snapshot(self, vector[OrderBookEntry] bids, vector[OrderBookEntry] asks, int64_t update_id)
     cdef c_apply_trade(self, object trade_event)
+    cdef c_update_features(self, bint recompute_depth)
+    cdef c_compute_depth(self, size_t band_index)
+    cdef size_t c_get_depth_band_index(self, double depth_bps)
     cdef c_apply_numpy_diffs(self,
                              np.ndarray[np.float64_t, ndim=2] bids_array,
                              np.ndarray[np.float64_t, ndim=2] asks_array)
@@ -34,6 +34,8 @@ cimport numpy as np
 
 ob_logger = None
 NaN = float("nan")
+# Each diff updates the depth of every tracked band, the least recently read band is replaced beyond this number
+MAX_DEPTH_BANDS = 8
 
 
 cdef class OrderBook(PubSub):
@@ -55,6 +57,10 @@ cdef class OrderBook(PubSub):
         self._last_applied_trade = -1000.0
         self._last_trade_price_rest_updated = -1000
         self._dex = dex
+        self._best_bid_amount = self._best_ask_amount = 0
+        self._microprice = float("NaN")
+        self._depth_mid_price = float("NaN")
+        self._depth_band_read_count = 0
 
     cdef c_apply_diffs(self, vector[OrderBookEntry] bids, vector[OrderBookEntry] asks, int64_t update_id):
         cdef:
@@ -65,22 +71,50 @@ cdef class OrderBook(PubSub):
             set[OrderBookEntry].iterator result
             OrderBookEntry top_bid
             OrderBookEntry top_ask
+            OrderBookEntry entry
+            size_t num_depth_bands = self._depth_bands_bps.size()
+            vector[double] bid_depth_floors
+            vector[double] ask_depth_ceilings
+            size_t book_size
+            size_t i
+
+        if self._depth_mid_price != self._depth_mid_price:
+            num_depth_bands = 0
+        for i in range(num_depth_bands):
+            bid_depth_floors.push_back(self._depth_mid_price * (1 - self._depth_bands_bps[i] / 10000))
+            ask_depth_ceilings.push_back(self._depth_mid_price * (1 + self._depth_bands_bps[i] / 10000))
 
         # Apply the diffs. Diffs with 0 amounts mean deletion.
+        # The depth within each band is updated with the amount changes of the entries in the band.
         for bid in bids:
             result = self._bid_book.find(bid)
             if result != bid_book_end:
+                entry = deref(result)
+                for i in range(num_depth_bands):
+                    if entry.getPrice() >= bid_depth_floors[i]:
+                        self._bid_depths[i] -= entry.getAmount()
                 self._bid_book.erase(result)
             if bid.getAmount() > 0:
                 self._bid_book.insert(bid)
+                for i in range(num_depth_bands):
+                    if bid.getPrice() >= bid_depth_floors[i]:
+                        self._bid_depths[i] += bid.getAmount()
         for ask in asks:
             result = self._ask_book.find(ask)
             if result != ask_book_end:
+                entry = deref(result)
+                for i in range(num_depth_bands):
+                    if entry.getPrice() <= ask_depth_ceilings[i]:
+                        self._ask_depths[i] -= entry.getAmount()
                 self._ask_book.erase(result)
             if ask.getAmount() > 0:
                 self._ask_book.insert(ask)
+                for i in range(num_depth_bands):
+                    if ask.getPrice() <= ask_depth_ceilings[i]:
+                        self._ask_depths[i] += ask.getAmount()
 
         # If any overlapping entries between the bid and ask books, centralised: newer entries win, dex: see OrderBookEntry.cpp
+        book_size = self._bid_book.size() + self._ask_book.size()
         truncateOverlapEntries(self._bid_book, self._ask_book, self._dex)
 
         # Record the current best prices, for faster c_get_price() calls.
@@ -93,6 +127,9 @@ cdef class OrderBook(PubSub):
             top_ask = deref(ask_iterator)
             self._best_ask = top_ask.getPrice()
 
+        # The entries removed by the truncation are not tracked in the depth
+        self.c_update_features(book_size != self._bid_book.size() + self._ask_book.size())
+
         # Remember the last diff update ID.
         self._last_diff_uid = update_id
 
@@ -132,10 +169,104 @@ cdef class OrderBook(PubSub):
         # Record the current best prices, for faster c_get_price() calls.
         self._best_bid = best_bid_price
         self._best_ask = best_ask_price
+        self.c_update_features(True)
 
         # Remember the last snapshot update ID.
         self._snapshot_uid = update_id
 
+    cdef c_update_features(self, bint recompute_depth):
+        """
+        Updates the microstructure features after the book entries changed. The top of book amounts and the microprice
+        are read from the top entries, while the depth within the bands is computed again only when the mid price moved
+        (the diffs applied at the same mid price update it incrementally).
+        """
+        cdef:
+            set[OrderBookEntry].reverse_iterator bid_iterator = self._bid_book.rbegin()
+            set[OrderBookEntry].iterator ask_iterator = self._ask_book.begin()
+            OrderBookEntry top_bid
+            OrderBookEntry top_ask
+            double mid_price = NaN
+            size_t i
+
+        self._best_bid_amount = self._best_ask_amount = 0
+        self._microprice = NaN
+        if bid_iterator != self._bid_book.rend():
+            top_bid = deref(bid_iterator)
+            self._best_bid_amount = top_bid.getAmount()
+        if ask_iterator != self._ask_book.end():
+            top_ask = deref(ask_iterator)
+            self._best_ask_amount = top_ask.getAmount()
+        if self._best_bid_amount > 0 and self._best_ask_amount > 0:
+            # The top of book prices weighted by the amount on the opposite side
+            self._microprice = ((top_bid.getPrice() * self._best_ask_amount + top_ask.getPrice() * self._best_bid_amount)
+                                / (self._best_bid_amount + self._best_ask_amount))
+            mid_price = (top_bid.getPrice() + top_ask.getPrice()) / 2
+
+        if recompute_depth or not mid_price == self._depth_mid_price:
+            self._depth_mid_price = mid_price
+            for i in range(self._depth_bands_bps.size()):
+                self.c_compute_depth(i)
+
+    cdef c_compute_depth(self, size_t band_index):
+        cdef:
+            double bid_depth_floor = self._depth_mid_price * (1 - self._depth_bands_bps[band_index] / 10000)
+            double ask_depth_ceiling = self._depth_mid_price * (1 + self._depth_bands_bps[band_index] / 10000)
+            set[OrderBookEntry].reverse_iterator bid_iterator = self._bid_book.rbegin()
+            set[OrderBookEntry].iterator ask_iterator = self._ask_book.begin()
+            OrderBookEntry entry
+            double bid_depth = 0
+            double ask_depth = 0
+
+        if self._depth_mid_price != self._depth_mid_price:
+            self._bid_depths[band_index] = self._ask_depths[band_index] = NaN
+            return
+        while bid_iterator != self._bid_book.rend():
+            entry = deref(bid_iterator)
+            if entry.getPrice() < bid_depth_floor:
+                break
+            bid_depth += entry.getAmount()
+            inc(bid_iterator)
+        while ask_iterator != self._ask_book.end():
+            entry = deref(ask_iterator)
+            if entry.getPrice() > ask_depth_ceiling:
+                break
+            ask_depth += entry.getAmount()
+            inc(ask_iterator)
+        self._bid_depths[band_index] = bid_depth
+        self._ask_depths[band_index] = ask_depth
+
+    cdef size_t c_get_depth_band_index(self, double depth_bps):
+        """
+        Returns the index of the depth tracked for depth_bps, and starts tracking it (computing it once from the book)
+        the first time the band is requested. When MAX_DEPTH_BANDS bands are tracked, the new band replaces the least
+        recently read one, except the first band, which is the one reported by the depth properties.
+        """
+        cdef:
+            size_t band_index = 0
+            size_t i
+
+        self._depth_band_read_count += 1
+        for i in range(self._depth_bands_bps.size()):
+            if self._depth_bands_bps[i] == depth_bps:
+                self._depth_band_reads[i] = self._depth_band_read_count
+                return i
+
+        if self._depth_bands_bps.size() < MAX_DEPTH_BANDS:
+            band_index = self._depth_bands_bps.size()
+            self._depth_bands_bps.push_back(depth_bps)
+            self._bid_depths.push_back(NaN)
+            self._ask_depths.push_back(NaN)
+            self._depth_band_reads.push_back(self._depth_band_read_count)
+        else:
+            band_index = 1
+            for i in range(2, self._depth_bands_bps.size()):
+                if self._depth_band_reads[i] < self._depth_band_reads[band_index]:
+                    band_index = i
+            self._depth_bands_bps[band_index] = depth_bps
+            self._depth_band_reads[band_index] = self._depth_band_read_count
+        self.c_compute_depth(band_index)
+        return band_index
+
     cdef c_apply_trade(self, object trade_event):
         self._last_trade_price = trade_event.price
         self._last_applied_trade = time.perf_counter()
@@ -161,6 +292,62 @@ cdef class OrderBook(PubSub):
     def last_trade_price_rest_updated(self, value: float):
         self._last_trade_price_rest_updated = value
 
+    @property
+    def microprice(self) -> float:
+        """
+        The best bid and ask prices weighted by the amount on the opposite side of the book, NaN if a side is empty.
+        """
+        return self._microprice
+
+    @property
+    def top_of_book_imbalance(self) -> float:
+        """
+        (best bid amount - best ask amount) / (best bid amount + best ask amount), from -1 (all the top of book amount
+        is on the ask side) to 1 (all on the bid side).
+        """
+        cdef double total_amount = self._best_bid_amount + self._best_ask_amount
+        return (self._best_bid_amount - self._best_ask_amount) / total_amount if total_amount > 0 else NaN
+
+    @property
+    def depth_band_bps(self) -> float:
+        """
+        The distance to the mid price, in basis points, of the entries included in the bid and ask depth (the first
+        tracked band when `get_depth_imbalance` or `get_cumulative_depth` added others). The depth is not tracked while
+        the band is 0 (the default).
+        """
+        return self._depth_bands_bps[0] if self._depth_bands_bps.size() > 0 else 0
+
+    @depth_band_bps.setter
+    def depth_band_bps(self, value: float):
+        # Replaces all the tracked bands
+        self._depth_bands_bps.clear()
+        self._bid_depths.clear()
+        self._ask_depths.clear()
+        self._depth_band_reads.clear()
+        if value > 0:
+            self.c_get_depth_band_index(value)
+
+    @property
+    def bid_depth(self) -> float:
+        """
+        The cumulative amount of the bids within the depth band below the mid price.
+        """
+        return self._bid_depths[0] if self._bid_depths.size() > 0 else NaN
+
+    @property
+    def ask_depth(self) -> float:
+        """
+        The cumulative amount of the asks within the depth band above the mid price.
+        """
+        return self._ask_depths[0] if self._ask_depths.size() > 0 else NaN
+
+    @property
+    def depth_imbalance(self) -> float:
+        """
+        (bid depth - ask depth) / (bid depth + ask depth), from -1 to 1.
+        """
+        return self.get_depth_imbalance(self.depth_band_bps) if self._depth_bands_bps.size() > 0 else NaN
+
     @property
     def snapshot_uid(self) -> int:
         return self._snapshot_uid
@@ -475,6 +662,32 @@ cdef class OrderBook(PubSub):
     def get_quote_volume_for_price(self, is_buy: bool, price: float) -> OrderBookQueryResult:
         return self.c_get_quote_volume_for_price(is_buy, price)
 
+    def get_depth_imbalance(self, depth_bps: float) -> float:
+        """
+        The depth imbalance within depth_bps of the mid price, or the top of book imbalance if depth_bps is 0. The
+        order book keeps tracking the depth in each requested band (up to MAX_DEPTH_BANDS, replacing the least recently
+        read one) after the first call, so the next calls are O(1) for the same depth_bps.
+        """
+        cdef:
+            size_t band_index
+            double total_depth
+        if depth_bps <= 0:
+            return self.top_of_book_imbalance
+        band_index = self.c_get_depth_band_index(depth_bps)
+        total_depth = self._bid_depths[band_index] + self._ask_depths[band_index]
+        return (self._bid_depths[band_index] - self._ask_depths[band_index]) / total_depth if total_depth > 0 else NaN
+
+    def get_cumulative_depth(self, is_buy: bool, depth_bps: float) -> float:
+        """
+        The amount of the asks (buy) or bids (sell) within depth_bps of the mid price, tracked as
+        `get_depth_imbalance`.
+        """
+        cdef size_t band_index
+        if depth_bps <= 0:
+            return NaN
+        band_index = self.c_get_depth_band_index(depth_bps)
+        return self._ask_depths[band_index] if is_buy else self._bid_depths[band_index]
+
     def restore_from_snapshot_and_diffs(self, snapshot: OrderBookMessage, diffs: List[OrderBookMessage]):
         replay_position = bisect.bisect_right(diffs, snapshot)
         replay_diffs = diffs[replay_position:]
@@ -13,6 +13,7 @@ from hummingbot.core.data_type.order_book_message import OrderBookMessage, Order
 from hummingbot.core.data_type.order_book_tracker_data_source import OrderBookTrackerDataSource
 from hummingbot.core.event.events import OrderBookTradeEvent
 from hummingbot.core.utils.async_utils import safe_ensure_future
+from hummingbot.core.utils.latency_metrics import LatencyMetric, LatencyMetricsRegistry
 from hummingbot.logger import HummingbotLogger
 
 
@@ -45,6 +46,7 @@ class OrderBookTracker:
         self._order_book_trade_stream: asyncio.Queue = asyncio.Queue()
         self._ev_loop: asyncio.BaseEventLoop = asyncio.get_event_loop()
         self._saved_message_queues: Dict[str, Deque[OrderBookMessage]] = defaultdict(lambda: deque(maxlen=1000))
+        self._latency_metrics: LatencyMetricsRegistry = LatencyMetricsRegistry.get_instance()
 
         self._emit_trade_event_task: Optional[asyncio.Task] = None
         self._init_order_books_task: Optional[asyncio.Task] = None
@@ -142,6 +144,49 @@ class OrderBookTracker:
     async def wait_ready(self):
         await self._order_books_initialized.wait()
 
+    async def add_trading_pair(self, trading_pair: str):
+        """
+        Starts tracking the order book of a new trading pair while the tracker is running. The data source subscribes
+        to the pair streams before the snapshot is requested, so the diffs received meanwhile are applied on top of it.
+        Only the snapshot of the new trading pair is requested.
+
+        :param trading_pair: the trading pair to add
+        """
+        if trading_pair in self._trading_pairs:
+            return
+        await self._data_source.add_trading_pair(trading_pair)
+        if trading_pair not in self._trading_pairs:
+            self._trading_pairs.append(trading_pair)
+        if self._init_order_books_task is None:
+            # The order book will be initialized with the rest of the order books when the tracker starts
+            return
+        order_book = await self._initial_order_book_for_trading_pair(trading_pair)
+        if trading_pair not in self._trading_pairs:
+            # The pair was removed while the snapshot was being requested
+            return
+        self._order_books[trading_pair] = order_book
+        self._tracking_message_queues[trading_pair] = asyncio.Queue()
+        self._tracking_tasks[trading_pair] = safe_ensure_future(self._track_single_book(trading_pair))
+        self.logger().info(f"Initialized order book for {trading_pair}.")
+
+    async def remove_trading_pair(self, trading_pair: str):
+        """
+        Stops tracking the order book of a trading pair and releases all the data kept for it.
+
+        :param trading_pair: the trading pair to remove
+        """
+        await self._data_source.remove_trading_pair(trading_pair)
+        if trading_pair in self._trading_pairs:
+            self._trading_pairs.remove(trading_pair)
+        tracking_task = self._tracking_tasks.pop(trading_pair, None)
+        if tracking_task is not None:
+            tracking_task.cancel()
+        self._order_books.pop(trading_pair, None)
+        self._tracking_message_queues.pop(trading_pair, None)
+        self._past_diffs_windows.pop(trading_pair, None)
+        self._saved_message_queues.pop(trading_pair, None)
+        self.logger().info(f"Stopped tracking order book for {trading_pair}.")
+
     async def _update_last_trade_prices_loop(self):
         '''
         Updates last trade price for all order books through REST API, it is to initiate last_trade_price and as
@@ -159,6 +204,8 @@ class OrderBookTracker:
                         args["domain"] = self._domain
                     last_prices = await self._data_source.get_last_traded_prices(**args)
                     for trading_pair, last_price in last_prices.items():
+                        if trading_pair not in self._order_books:
+                            continue
                         self._order_books[trading_pair].last_trade_price = last_price
                         self._order_books[trading_pair].last_trade_price_rest_updated = time.perf_counter()
                 else:
@@ -176,12 +223,19 @@ class OrderBookTracker:
         """
         Initialize order books
         """
-        for index, trading_pair in enumerate(self._trading_pairs):
-            self._order_books[trading_pair] = await self._initial_order_book_for_trading_pair(trading_pair)
+        trading_pairs = list(self._trading_pairs)
+        for index, trading_pair in enumerate(trading_pairs):
+            if trading_pair not in self._trading_pairs:
+                # The pair was removed while the other order books were being initialized
+                continue
+            order_book = await self._initial_order_book_for_trading_pair(trading_pair)
+            if trading_pair not in self._trading_pairs:
+                continue
+            self._order_books[trading_pair] = order_book
             self._tracking_message_queues[trading_pair] = asyncio.Queue()
             self._tracking_tasks[trading_pair] = safe_ensure_future(self._track_single_book(trading_pair))
             self.logger().info(f"Initialized order book for {trading_pair}. "
-                               f"{index + 1}/{len(self._trading_pairs)} completed.")
+                               f"{index + 1}/{len(trading_pairs)} completed.")
             await self._sleep(delay=1)
         self._order_books_initialized.set()
 
@@ -200,6 +254,10 @@ class OrderBookTracker:
                 trading_pair: str = ob_message.trading_pair
 
                 if trading_pair not in self._tracking_message_queues:
+                    if trading_pair not in self._trading_pairs:
+                        # The pair was removed and the message was received before the unsubscription
+                        messages_rejected += 1
+                        continue
                     messages_queued += 1
                     # Save diff messages received before snapshots are ready
                     self._saved_message_queues[trading_pair].append(ob_message)
@@ -272,7 +330,10 @@ class OrderBookTracker:
                     message = await message_queue.get()
 
                 if message.type is OrderBookMessageType.DIFF:
-                    order_book.apply_diffs(message.bids, message.asks, message.update_id)
+                    if self._latency_metrics.enabled:
+                        self._apply_diffs_with_latency_metrics(trading_pair, order_book, message)
+                    else:
+                        order_book.apply_diffs(message.bids, message.asks, message.update_id)
                     past_diffs_window.append(message)
                     diff_messages_accepted += 1
 
@@ -295,6 +356,14 @@ class OrderBookTracker:
                 )
                 await asyncio.sleep(5.0)
 
+    def _apply_diffs_with_latency_metrics(self, trading_pair: str, order_book: OrderBook, message: OrderBookMessage):
+        # The lag is the time elapsed since the message timestamp (set by the data source when the message was
+        # received or by the exchange) until the diff is applied, including the time spent in the tracker queues.
+        self._latency_metrics.record(LatencyMetric.ORDER_BOOK_LAG, trading_pair, time.time() - message.timestamp)
+        start = time.perf_counter()
+        order_book.apply_diffs(message.bids, message.asks, message.update_id)
+        self._latency_metrics.record(LatencyMetric.ORDER_BOOK_APPLY, trading_pair, time.perf_counter() - start)
+
     async def _emit_trade_event_loop(self):
         last_message_timestamp: float = time.time()
         messages_accepted: int = 0
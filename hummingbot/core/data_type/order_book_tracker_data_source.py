@@ -3,13 +3,16 @@ import logging
 import time
 from abc import ABCMeta, abstractmethod
 from collections import defaultdict
-from typing import Any, Callable, Dict, List, Optional
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional
 
 from hummingbot.core.data_type.order_book import OrderBook
 from hummingbot.core.data_type.order_book_message import OrderBookMessage
 from hummingbot.core.web_assistant.ws_assistant import WSAssistant
 from hummingbot.logger import HummingbotLogger
 
+if TYPE_CHECKING:
+    from hummingbot.core.web_assistant.ws_stream_multiplexer import WSStreamMultiplexer
+
 
 class OrderBookTrackerDataSource(metaclass=ABCMeta):
     FULL_ORDER_BOOK_RESET_DELTA_SECONDS = 60 * 60
@@ -24,6 +27,10 @@ class OrderBookTrackerDataSource(metaclass=ABCMeta):
         self._trading_pairs: List[str] = trading_pairs
         self._order_book_create_function = lambda: OrderBook()
         self._message_queue: Dict[str, asyncio.Queue] = defaultdict(asyncio.Queue)
+        self._ws_multiplexer: Optional["WSStreamMultiplexer"] = None
+        self._multiplexed_streams: Dict[str, Dict[str, List[str]]] = {}
+        self._multiplexed_subscriptions_active: bool = False
+        self._ws_assistant: Optional[WSAssistant] = None
 
     @classmethod
     def logger(cls) -> HummingbotLogger:
@@ -67,16 +74,56 @@ class OrderBookTrackerDataSource(metaclass=ABCMeta):
         order_book.apply_snapshot(snapshot_msg.bids, snapshot_msg.asks, snapshot_msg.update_id)
         return order_book
 
+    async def add_trading_pair(self, trading_pair: str):
+        """
+        Starts listening to the public streams of a new trading pair without interrupting the streams of the other
+        trading pairs when the data source supports incremental subscriptions. Otherwise the websocket connection is
+        restarted to subscribe to the streams of all the trading pairs.
+
+        :param trading_pair: the trading pair to add
+        """
+        if trading_pair in self._trading_pairs:
+            return
+        self._trading_pairs.append(trading_pair)
+        if self._ws_multiplexer is not None:
+            if self._multiplexed_subscriptions_active:
+                await self._subscribe_multiplexed_streams(trading_pair=trading_pair)
+        elif self._ws_assistant is not None:
+            if not await self._subscribe_to_trading_pair(ws=self._ws_assistant, trading_pair=trading_pair):
+                await self._ws_assistant.disconnect()
+
+    async def remove_trading_pair(self, trading_pair: str):
+        """
+        Stops listening to the public streams of a trading pair without interrupting the streams of the other
+        trading pairs when the data source supports incremental subscriptions.
+
+        :param trading_pair: the trading pair to remove
+        """
+        if trading_pair not in self._trading_pairs:
+            return
+        self._trading_pairs.remove(trading_pair)
+        if self._ws_multiplexer is not None:
+            await self._unsubscribe_multiplexed_streams(trading_pair=trading_pair)
+        elif self._ws_assistant is not None:
+            if not await self._unsubscribe_from_trading_pair(ws=self._ws_assistant, trading_pair=trading_pair):
+                await self._ws_assistant.disconnect()
+
     async def listen_for_subscriptions(self):
         """
         Connects to the trade events and order diffs websocket endpoints and listens to the messages sent by the
         exchange. Each message is stored in its own queue.
+        If the data source was configured with a websocket multiplexer, the streams are subscribed through the
+        multiplexer instead, that puts the messages straight into the queues.
         """
+        if self._ws_multiplexer is not None:
+            await self._listen_for_multiplexed_subscriptions()
+            return
         ws: Optional[WSAssistant] = None
         while True:
             try:
                 ws: WSAssistant = await self._connected_websocket_assistant()
                 await self._subscribe_channels(ws)
+                self._ws_assistant = ws
                 await self._process_websocket_messages(websocket_assistant=ws)
             except asyncio.CancelledError:
                 raise
@@ -88,8 +135,32 @@ class OrderBookTrackerDataSource(metaclass=ABCMeta):
                 )
                 await self._sleep(1.0)
             finally:
+                self._ws_assistant = None
                 await self._on_order_stream_interruption(websocket_assistant=ws)
 
+    async def _listen_for_multiplexed_subscriptions(self):
+        try:
+            self._multiplexed_subscriptions_active = True
+            for trading_pair in list(self._trading_pairs):
+                await self._subscribe_multiplexed_streams(trading_pair=trading_pair)
+            self.logger().info("Subscribed to public order book and trade channels...")
+            await asyncio.Event().wait()
+        finally:
+            self._multiplexed_subscriptions_active = False
+            for trading_pair in list(self._multiplexed_streams):
+                await self._unsubscribe_multiplexed_streams(trading_pair=trading_pair)
+
+    async def _subscribe_multiplexed_streams(self, trading_pair: str):
+        streams_per_channel = await self._multiplexed_streams_for_trading_pair(trading_pair=trading_pair)
+        for channel, streams in streams_per_channel.items():
+            await self._ws_multiplexer.subscribe(streams=streams, queue=self._message_queue[channel])
+        self._multiplexed_streams[trading_pair] = streams_per_channel
+
+    async def _unsubscribe_multiplexed_streams(self, trading_pair: str):
+        streams_per_channel = self._multiplexed_streams.pop(trading_pair, {})
+        for channel, streams in streams_per_channel.items():
+            await self._ws_multiplexer.unsubscribe(streams=streams, queue=self._message_queue[channel])
+
     async def listen_for_order_book_diffs(self, ev_loop: asyncio.AbstractEventLoop, output: asyncio.Queue):
         """
         Reads the order diffs events queue. For each event creates a diff message instance and adds it to the
@@ -207,6 +278,42 @@ class OrderBookTrackerDataSource(metaclass=ABCMeta):
         """
         raise NotImplementedError
 
+    async def _subscribe_to_trading_pair(self, ws: WSAssistant, trading_pair: str) -> bool:
+        """
+        Subscribes to the trade events and diff orders events of a single trading pair through the provided websocket
+        connection, that is already subscribed to the streams of the other trading pairs.
+
+        :param ws: the websocket assistant used to connect to the exchange
+        :param trading_pair: the trading pair to subscribe to
+
+        :return: False if the exchange does not support incremental subscriptions, True otherwise
+        """
+        return False
+
+    async def _unsubscribe_from_trading_pair(self, ws: WSAssistant, trading_pair: str) -> bool:
+        """
+        Unsubscribes from the trade events and diff orders events of a single trading pair through the provided
+        websocket connection.
+
+        :param ws: the websocket assistant used to connect to the exchange
+        :param trading_pair: the trading pair to unsubscribe from
+
+        :return: False if the exchange does not support incremental subscriptions, True otherwise
+        """
+        return False
+
+    async def _multiplexed_streams_for_trading_pair(self, trading_pair: str) -> Dict[str, List[str]]:
+        """
+        Returns the names of the websocket streams of a trading pair to subscribe through the websocket multiplexer,
+        grouped by the channel (message queue key) their messages should be stored in.
+        Only required for data sources supporting a websocket multiplexer.
+
+        :param trading_pair: the trading pair to subscribe to
+
+        :return: the stream names for each message channel
+        """
+        raise NotImplementedError
+
     def _channel_originating_message(self, event_message: Dict[str, Any]) -> str:
         """
         Identifies the channel for a particular event message. Used to find the correct queue to add the message in
@@ -2,7 +2,7 @@ import typing
 from collections import defaultdict
 from dataclasses import dataclass, field
 from decimal import Decimal
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 
 from hummingbot.connector.utils import combine_to_hb_trading_pair, split_hb_trading_pair
 from hummingbot.core.data_type.common import OrderType, PositionAction, TradeType
@@ -70,9 +70,21 @@ class OrderCandidate:
     def set_to_zero(self):
         self._scale_order(scaler=Decimal("0"))
 
-    def populate_collateral_entries(self, exchange: 'ExchangeBase'):
+    @property
+    def fee_key(self) -> Tuple:
+        """
+        The order parameters the fee depends on. The candidates with the same key have the same fee (the fee schema
+        does not depend on the order amount or price), so it can be built once for all of them.
+        """
+        return self.trading_pair, self.is_maker, self.order_type, self.order_side
+
+    def populate_collateral_entries(self, exchange: 'ExchangeBase', fee: Optional[TradeFeeBase] = None):
+        """
+        :param exchange: the exchange the order is placed on
+        :param fee: the fee of the order if already known (see `fee_key`), built from the exchange otherwise
+        """
         self._populate_order_collateral_entry(exchange)
-        fee = self._get_fee(exchange)
+        fee = fee if fee is not None else self._get_fee(exchange)
         self._populate_percent_fee_collateral_entry(exchange, fee)
         self._populate_fixed_fee_collateral_entries(fee)
         self._populate_potential_returns_entry(exchange)
@@ -272,6 +284,10 @@ class PerpetualOrderCandidate(OrderCandidate):
     leverage: Decimal = Decimal("1")
     position_close: bool = False
 
+    @property
+    def fee_key(self) -> Tuple:
+        return super().fee_key + (self.position_close,)
+
     def _get_order_collateral_token(self, exchange: 'ExchangeBase') -> Optional[str]:
         if self.position_close:
             oc_token = None  # the contract is the collateral
@@ -3,7 +3,7 @@ import re
 import ssl
 from decimal import Decimal
 from enum import Enum
-from typing import TYPE_CHECKING, Any, Dict, List, Optional, Union
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple, Union
 
 import aiohttp
 from aiohttp import ContentTypeError
@@ -12,6 +12,7 @@ from hummingbot.client.config.security import Security
 from hummingbot.core.data_type.common import OrderType, PositionSide
 from hummingbot.core.data_type.in_flight_order import InFlightOrder
 from hummingbot.core.event.events import TradeType
+from hummingbot.core.utils.async_utils import safe_gather
 from hummingbot.logger import HummingbotLogger
 
 if TYPE_CHECKING:
@@ -47,6 +48,7 @@ class GatewayHttpClient:
     _ghc_logger: Optional[HummingbotLogger] = None
     _shared_client: Optional[aiohttp.ClientSession] = None
     _base_url: str
+    _batch_poll_supported: Optional[bool] = None
 
     __instance = None
 
@@ -425,6 +427,75 @@ class GatewayHttpClient:
             request["address"] = address
         return await self.api_request("post", "chain/poll", request, fail_silently=fail_silently)  # type: ignore
 
+    async def get_transaction_statuses(
+            self,
+            chain: str,
+            network: str,
+            transaction_hashes: List[str],
+            connector: Optional[str] = None,
+            address: Optional[str] = None,
+            fail_silently: bool = False
+    ) -> Dict[str, Union[Dict[str, Any], Exception]]:
+        """
+        Fetches the status of several transactions with a single request to the batched poll route. Gateway versions
+        without the batched route (currently all of them) answer the first call with a 404, and the statuses are
+        then fetched with one request per transaction. Any other failure of the batched request only affects the
+        current call.
+
+        :returns A dictionary with the status (or the exception raised fetching it) of each transaction hash.
+        """
+        statuses: Dict[str, Union[Dict[str, Any], Exception]] = {}
+        if len(transaction_hashes) > 0 and self._batch_poll_supported is not False:
+            request = {
+                "chain": chain,
+                "network": network,
+                "txHashes": transaction_hashes
+            }
+            if connector:
+                request["connector"] = connector
+            if address:
+                request["address"] = address
+            try:
+                response_status, response = await self._request_poll_batch(request)
+            except Exception:
+                self.logger().debug("The batched transactions poll request failed.", exc_info=True)
+                response_status, response = None, None
+            if response_status == 200 and isinstance(response, dict) and isinstance(response.get("transactions"), list):
+                self._batch_poll_supported = True
+                statuses.update({status.get("txHash"): status for status in response["transactions"]})
+                # Transactions the batched route did not report are polled one by one
+                transaction_hashes = [tx_hash for tx_hash in transaction_hashes if tx_hash not in statuses]
+            elif response_status == 404:
+                self.logger().info("Gateway does not support the batched transactions poll, polling them one by one.")
+                self._batch_poll_supported = False
+
+        results = await safe_gather(*[
+            self.get_transaction_status(
+                chain=chain,
+                network=network,
+                transaction_hash=tx_hash,
+                connector=connector,
+                address=address,
+                fail_silently=fail_silently
+            )
+            for tx_hash in transaction_hashes
+        ], return_exceptions=True)
+        statuses.update(zip(transaction_hashes, results))
+        return statuses
+
+    async def _request_poll_batch(self, request: Dict[str, Any]) -> Tuple[int, Any]:
+        """
+        Sends the request to the batched poll route, and returns the HTTP status and the parsed response, so that an
+        unsupported route can be told apart from the other errors.
+        """
+        client = self._http_client(self._client_config_map)
+        response = await client.post(f"{self.base_url}/chain/poll-batch", json=request)
+        try:
+            parsed_response = await response.json()
+        except ContentTypeError:
+            parsed_response = await response.text()
+        return response.status, parsed_response
+
     async def wallet_sign(
         self,
         chain: str,
@@ -0,0 +1,215 @@
+#!/usr/bin/env python
+
+"""
+Startup import profiler, enabled with the `--profile-startup` command line flag of `bin/hummingbot.py` and
+`bin/hummingbot_quickstart.py`.
+
+The profiler is installed in `sys.meta_path` before the client modules are imported, and times the execution of each
+module imported afterwards. The result is a tree of imports, with for each module the cumulative time (including its
+own imports) and the self time.
+
+This module must not import anything from hummingbot, since it is imported before the rest of the client.
+"""
+
+import importlib.abc
+import sys
+import threading
+import time
+from importlib.machinery import ModuleSpec
+from types import ModuleType
+from typing import Dict, List, Optional, Sequence
+
+PROFILE_STARTUP_FLAG = "--profile-startup"
+
+
+class ImportRecord:
+    __slots__ = ("name", "cumulative_time", "children")
+
+    def __init__(self, name: str):
+        self.name = name
+        self.cumulative_time: float = 0.0
+        self.children: List["ImportRecord"] = []
+
+    @property
+    def self_time(self) -> float:
+        return self.cumulative_time - sum(child.cumulative_time for child in self.children)
+
+    def walk(self):
+        for child in self.children:
+            yield child
+            yield from child.walk()
+
+
+class _TimingLoader(importlib.abc.Loader):
+    """
+    Wraps the loader found for a module to time its execution. Attributes other than the module creation and execution
+    (e.g. `get_data`, `is_package`) are delegated to the original loader.
+    """
+
+    def __init__(self, loader: importlib.abc.Loader, profiler: "StartupProfiler", fullname: str):
+        self._loader = loader
+        self._profiler = profiler
+        self._fullname = fullname
+        self._record: Optional[ImportRecord] = None
+        self._start_time = 0.0
+
+    def __getattr__(self, name: str):
+        return getattr(self._loader, name)
+
+    def _start(self):
+        if self._record is None:
+            self._record = self._profiler._enter(self._fullname)
+            self._start_time = time.perf_counter()
+
+    def _finish(self):
+        if self._record is not None:
+            self._profiler._exit(self._record, time.perf_counter() - self._start_time)
+            self._record = None
+
+    def create_module(self, spec: ModuleSpec) -> Optional[ModuleType]:
+        # Extension modules are loaded when they are created, and some loaders import other modules at this step
+        self._start()
+        try:
+            return self._loader.create_module(spec)
+        except BaseException:
+            self._finish()
+            raise
+
+    def exec_module(self, module: ModuleType):
+        self._start()
+        try:
+            self._loader.exec_module(module)
+        finally:
+            self._finish()
+            # Once loaded, the module should not keep a reference to the profiler
+            module.__loader__ = self._loader
+            if getattr(module, "__spec__", None) is not None:
+                module.__spec__.loader = self._loader
+
+
+class _TimingFinder(importlib.abc.MetaPathFinder):
+    """
+    Delegates the search of the module spec to the other finders of `sys.meta_path`, and wraps the loader of the spec
+    found in a `_TimingLoader`.
+    """
+
+    def __init__(self, profiler: "StartupProfiler"):
+        self._profiler = profiler
+
+    def find_spec(self, fullname: str, path: Optional[Sequence[str]], target: Optional[ModuleType] = None):
+        for finder in sys.meta_path:
+            if finder is self or not hasattr(finder, "find_spec"):
+                continue
+            spec = finder.find_spec(fullname, path, target)
+            if spec is not None:
+                if spec.loader is not None and hasattr(spec.loader, "exec_module"):
+                    spec.loader = _TimingLoader(spec.loader, self._profiler, fullname)
+                return spec
+        return None
+
+
+class StartupProfiler:
+    """
+    Records the import time of every module imported between `start()` and `stop()`.
+    """
+
+    def __init__(self):
+        self._root = ImportRecord("<startup>")
+        self._finder = _TimingFinder(self)
+        self._stacks: Dict[int, List[ImportRecord]] = {}
+        self._lock = threading.Lock()
+        self._start_time: Optional[float] = None
+        self._end_time: Optional[float] = None
+
+    @property
+    def is_running(self) -> bool:
+        return self._finder in sys.meta_path
+
+    @property
+    def root(self) -> ImportRecord:
+        return self._root
+
+    @property
+    def elapsed_time(self) -> float:
+        if self._start_time is None:
+            return 0.0
+        end_time = self._end_time if self._end_time is not None else time.perf_counter()
+        return end_time - self._start_time
+
+    def start(self):
+        if not self.is_running:
+            self._start_time = time.perf_counter()
+            self._end_time = None
+            sys.meta_path.insert(0, self._finder)
+
+    def stop(self):
+        if self.is_running:
+            sys.meta_path.remove(self._finder)
+            self._end_time = time.perf_counter()
+
+    def _enter(self, name: str) -> ImportRecord:
+        record = ImportRecord(name)
+        with self._lock:
+            stack = self._stacks.setdefault(threading.get_ident(), [self._root])
+            stack[-1].children.append(record)
+            stack.append(record)
+        return record
+
+    def _exit(self, record: ImportRecord, elapsed: float):
+        record.cumulative_time = elapsed
+        with self._lock:
+            stack = self._stacks[threading.get_ident()]
+            if stack[-1] is record:
+                stack.pop()
+
+    def imports_time(self) -> float:
+        return sum(child.cumulative_time for child in self._root.children)
+
+    def modules_count(self) -> int:
+        return sum(1 for _ in self._root.walk())
+
+    def slowest_modules(self, count: int = 20) -> List[ImportRecord]:
+        return sorted(self._root.walk(), key=lambda record: record.self_time, reverse=True)[:count]
+
+    def summary(self) -> str:
+        return (f"Startup took {self.elapsed_time:.2f} s, {self.imports_time():.2f} s of which importing "
+                f"{self.modules_count()} modules.")
+
+    def report(self, min_time_ms: float = 5.0, slowest_count: int = 20) -> str:
+        """
+        Formats the import tree, leaving out the imports faster than `min_time_ms` (cumulative), and the list of the
+        modules with the highest self time.
+        """
+        lines = [self.summary(), "", f"Import tree (imports under {min_time_ms:g} ms are not shown):",
+                 f"{'cumulative ms':>14} {'self ms':>10}  module"]
+        self._append_tree_lines(lines, self._root, 0, min_time_ms / 1e3)
+        lines.extend(["", f"Slowest {slowest_count} modules by self time:", f"{'self ms':>10}  module"])
+        lines.extend(f"{record.self_time * 1e3:>10.1f}  {record.name}"
+                     for record in self.slowest_modules(slowest_count))
+        return "\n".join(lines)
+
+    def _append_tree_lines(self, lines: List[str], record: ImportRecord, depth: int, min_time: float):
+        for child in record.children:
+            if child.cumulative_time >= min_time:
+                lines.append(f"{child.cumulative_time * 1e3:>14.1f} {child.self_time * 1e3:>10.1f}  "
+                             f"{'  ' * depth}{child.name}")
+                self._append_tree_lines(lines, child, depth + 1, min_time)
+
+
+_startup_profiler: Optional[StartupProfiler] = None
+
+
+def get_startup_profiler() -> Optional[StartupProfiler]:
+    return _startup_profiler
+
+
+def start_startup_profiler_if_requested(argv: Optional[List[str]] = None) -> Optional[StartupProfiler]:
+    """
+    Starts the startup profiler if the `--profile-startup` flag is in the command line arguments.
+    """
+    global _startup_profiler
+    argv = sys.argv if argv is None else argv
+    if PROFILE_STARTUP_FLAG in argv and _startup_profiler is None:
+        _startup_profiler = StartupProfiler()
+        _startup_profiler.start()
+    return _startup_profiler
@@ -0,0 +1,117 @@
+import math
+from collections import deque
+from enum import Enum
+from typing import Any, Deque, Dict, List, Optional, Tuple
+
+
+class LatencyMetric(Enum):
+    REST_NETWORK = "rest_network"
+    REST_SIGN = "rest_sign"
+    REST_PARSE = "rest_parse"
+    THROTTLE_WAIT = "throttle_wait"
+    WS_DECODE = "ws_decode"
+    ORDER_BOOK_LAG = "order_book_lag"
+    ORDER_BOOK_APPLY = "order_book_apply"
+
+
+class LatencyHistogram:
+    """
+    Keeps the latest `max_samples` samples of a latency metric (in seconds) together with the lifetime count, mean
+    and maximum. Percentiles are computed over the retained samples only when a snapshot is requested.
+    """
+
+    __slots__ = ("_samples", "_count", "_total", "_max")
+
+    def __init__(self, max_samples: int = 2048):
+        self._samples: Deque[float] = deque(maxlen=max_samples)
+        self._count: int = 0
+        self._total: float = 0
+        self._max: float = 0
+
+    @property
+    def count(self) -> int:
+        return self._count
+
+    @property
+    def mean(self) -> float:
+        return self._total / self._count if self._count > 0 else 0
+
+    @property
+    def max(self) -> float:
+        return self._max
+
+    def add(self, value: float):
+        self._samples.append(value)
+        self._count += 1
+        self._total += value
+        if value > self._max:
+            self._max = value
+
+    def percentile(self, pct: float) -> float:
+        if len(self._samples) == 0:
+            return 0
+        ordered = sorted(self._samples)
+        index = max(0, math.ceil(pct / 100 * len(ordered)) - 1)
+        return ordered[index]
+
+
+class LatencyMetricsRegistry:
+    """
+    Process wide registry of latency histograms, keyed by metric and by a metric specific key (e.g. the
+    `throttler_limit_id` of a REST request, or the trading pair of an order book).
+
+    The registry is disabled by default. Instrumented components keep a reference to the registry and check
+    `enabled` before taking any measurement, so the instrumentation costs a single attribute lookup when disabled.
+    """
+
+    _shared_instance: Optional["LatencyMetricsRegistry"] = None
+
+    @classmethod
+    def get_instance(cls) -> "LatencyMetricsRegistry":
+        if cls._shared_instance is None:
+            cls._shared_instance = LatencyMetricsRegistry()
+        return cls._shared_instance
+
+    def __init__(self, max_samples: int = 2048):
+        self._max_samples = max_samples
+        self._histograms: Dict[Tuple[LatencyMetric, str], LatencyHistogram] = {}
+        self.enabled: bool = False
+
+    def enable(self):
+        self.enabled = True
+
+    def disable(self):
+        self.enabled = False
+
+    def reset(self):
+        self._histograms.clear()
+
+    def record(self, metric: LatencyMetric, key: str, value: float):
+        if not self.enabled:
+            return
+        histogram = self._histograms.get((metric, key))
+        if histogram is None:
+            histogram = LatencyHistogram(max_samples=self._max_samples)
+            self._histograms[(metric, key)] = histogram
+        histogram.add(value)
+
+    def histogram(self, metric: LatencyMetric, key: str) -> Optional[LatencyHistogram]:
+        return self._histograms.get((metric, key))
+
+    def snapshot(self) -> List[Dict[str, Any]]:
+        """
+        Returns one entry per (metric, key) with the sample count and the mean, p50, p99 and max latencies in
+        milliseconds, sorted by metric and key.
+        """
+        rows = []
+        for (metric, key), histogram in sorted(self._histograms.items(), key=lambda item: (item[0][0].value, item[0][1])):
+            rows.append({
+                "metric": metric.value,
+                "key": key,
+                "count": histogram.count,
+                "mean_ms": histogram.mean * 1e3,
+                "p50_ms": histogram.percentile(50) * 1e3,
+                "p99_ms": histogram.percentile(99) * 1e3,
+                "max_ms": histogram.max * 1e3,
+            })
+        return rows
@@ -2,6 +2,7 @@ from typing import Optional
 
 import aiohttp
 
+from hummingbot.core.web_assistant.connections.json_codec import JSONCodecBase, default_json_codec
 from hummingbot.core.web_assistant.connections.rest_connection import RESTConnection
 from hummingbot.core.web_assistant.connections.ws_connection import WSConnection
 
@@ -18,20 +19,25 @@ class ConnectionsFactory:
     `aiohttp` and `WSConnection`s using `signalr_aio`.
     """
 
-    def __init__(self):
+    def __init__(self, json_codec: Optional[JSONCodecBase] = None):
+        self._json_codec = json_codec or default_json_codec()
         # _ws_independent_session is intended to be used only in unit tests
         self._ws_independent_session: Optional[aiohttp.ClientSession] = None
 
         self._shared_client: Optional[aiohttp.ClientSession] = None
 
+    @property
+    def json_codec(self) -> JSONCodecBase:
+        return self._json_codec
+
     async def get_rest_connection(self) -> RESTConnection:
         shared_client = await self._get_shared_client()
-        connection = RESTConnection(aiohttp_client_session=shared_client)
+        connection = RESTConnection(aiohttp_client_session=shared_client, json_codec=self._json_codec)
         return connection
 
     async def get_ws_connection(self) -> WSConnection:
         shared_client = self._ws_independent_session or await self._get_shared_client()
-        connection = WSConnection(aiohttp_client_session=shared_client)
+        connection = WSConnection(aiohttp_client_session=shared_client, json_codec=self._json_codec)
         return connection
 
     async def _get_shared_client(self) -> aiohttp.ClientSession:
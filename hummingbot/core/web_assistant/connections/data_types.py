@@ -1,3 +1,4 @@
+import copy
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
 from enum import Enum
@@ -6,6 +7,8 @@ from typing import TYPE_CHECKING, Any, Mapping, Optional
 import aiohttp
 import ujson
 
+from hummingbot.core.web_assistant.connections.json_codec import JSONCodecBase, default_json_codec
+
 if TYPE_CHECKING:
     from hummingbot.core.web_assistant.connections.ws_connection import WSConnection
 
@@ -35,6 +38,37 @@ class RESTRequest:
     is_auth_required: bool = False
     throttler_limit_id: Optional[str] = None
 
+    def derive(self) -> "RESTRequest":
+        """Returns a copy of the request that pre-processors and authenticators can modify freely.
+
+        Only the top-level containers (`params`, `data` and `headers`) are copied, which is enough to leave the
+        original request untouched and is much cheaper than a `deepcopy` of the whole request.
+        """
+        derived = copy.copy(self)
+        if self.params is not None:
+            derived.params = dict(self.params)
+        if isinstance(self.data, dict):
+            derived.data = dict(self.data)
+        if self.headers is not None:
+            derived.headers = dict(self.headers)
+        return derived
+
+
+@dataclass
+class RESTRequestTimings:
+    """Latency breakdown (in seconds) of a single request executed by a `RESTAssistant`."""
+    throttler_limit_id: Optional[str]
+    url: Optional[str] = None
+    throttle_wait: float = 0
+    pre_process: float = 0
+    authentication: float = 0
+    network: float = 0
+    parse: float = 0
+
+    @property
+    def total(self) -> float:
+        return self.throttle_wait + self.pre_process + self.authentication + self.network + self.parse
+
 
 @dataclass
 class EndpointRESTRequest(RESTRequest, ABC):
@@ -85,8 +119,9 @@ class RESTResponse:
     status: int
     headers: Optional[Mapping[str, str]]
 
-    def __init__(self, aiohttp_response: aiohttp.ClientResponse):
+    def __init__(self, aiohttp_response: aiohttp.ClientResponse, json_codec: Optional[JSONCodecBase] = None):
         self._aiohttp_response = aiohttp_response
+        self._json_codec = json_codec or default_json_codec()
 
     @property
     def url(self) -> str:
@@ -109,7 +144,7 @@ class RESTResponse:
         return headers_
 
     async def json(self) -> Any:
-        json_ = await self._aiohttp_response.json()
+        json_ = await self._aiohttp_response.json(loads=self._json_codec.loads)
         return json_
 
     async def text(self) -> str:
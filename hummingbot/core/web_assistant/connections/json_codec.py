@@ -0,0 +1,137 @@
+import json
+from abc import ABC, abstractmethod
+from typing import Any, Dict, Optional, Type, Union
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None
+
+try:
+    import msgspec
+except ImportError:  # pragma: no cover
+    msgspec = None
+
+
+class JSONCodecBase(ABC):
+    """Encodes and decodes the JSON payloads exchanged by the `web_assistant` layer.
+
+    `loads` must raise a `ValueError` (`json.JSONDecodeError` is a subclass) when the payload is not valid JSON,
+    so that callers can fall back to the raw message data regardless of the codec in use.
+
+    `dumps` must return a `str`. The default implementation relies on the standard library so that request bodies
+    (and thus the signatures computed over them) are byte-for-byte identical regardless of the decoder in use.
+    """
+
+    name: str = ""
+
+    @abstractmethod
+    def loads(self, data: Union[str, bytes]) -> Any:
+        ...
+
+    def dumps(self, obj: Any) -> str:
+        return json.dumps(obj)
+
+
+class StdlibJSONCodec(JSONCodecBase):
+    """JSON codec based on the standard library `json` module.
+
+    If `raw_numbers` is `True`, JSON numbers are not converted to `int`/`float` but are kept as the literal string
+    that was received (e.g. `"0.00012340"`), so prices and amounts can be converted to `Decimal` (or parsed into
+    arrays) without any loss of precision.
+    """
+
+    name = "stdlib"
+
+    def __init__(self, raw_numbers: bool = False):
+        self._raw_numbers = raw_numbers
+        if raw_numbers:
+            self._decoder = json.JSONDecoder(parse_float=str, parse_int=str)
+        else:
+            self._decoder = json.JSONDecoder()
+
+    @property
+    def raw_numbers(self) -> bool:
+        return self._raw_numbers
+
+    def loads(self, data: Union[str, bytes]) -> Any:
+        if isinstance(data, (bytes, bytearray)):
+            data = data.decode("utf-8")
+        return self._decoder.decode(data)
+
+
+class OrjsonJSONCodec(JSONCodecBase):
+    """JSON codec that decodes with `orjson`.
+
+    `orjson` only supports 64-bit integers. Payloads that can not be decoded by `orjson` are decoded again using the
+    standard library, so the results are always the same as with `StdlibJSONCodec`.
+    """
+
+    name = "orjson"
+
+    def __init__(self):
+        if orjson is None:
+            raise ImportError("The orjson package is required to use the OrjsonJSONCodec.")
+
+    def loads(self, data: Union[str, bytes]) -> Any:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            return json.loads(data)
+
+
+class MsgspecJSONCodec(JSONCodecBase):
+    """JSON codec that decodes with `msgspec`."""
+
+    name = "msgspec"
+
+    def __init__(self):
+        if msgspec is None:
+            raise ImportError("The msgspec package is required to use the MsgspecJSONCodec.")
+        self._decoder = msgspec.json.Decoder()
+
+    def loads(self, data: Union[str, bytes]) -> Any:
+        try:
+            return self._decoder.decode(data)
+        except msgspec.DecodeError:
+            return json.loads(data)
+
+
+JSON_CODECS: Dict[str, Type[JSONCodecBase]] = {
+    StdlibJSONCodec.name: StdlibJSONCodec,
+    OrjsonJSONCodec.name: OrjsonJSONCodec,
+    MsgspecJSONCodec.name: MsgspecJSONCodec,
+}
+
+_default_codec: Optional[JSONCodecBase] = None
+
+
+def get_json_codec(name: Optional[str] = None, raw_numbers: bool = False) -> JSONCodecBase:
+    """Returns a JSON codec instance.
+
+    :param name: the name of the codec (`stdlib`, `orjson` or `msgspec`). If not specified, the fastest codec
+        available in the environment is used, falling back to the standard library.
+    :param raw_numbers: if `True`, numbers are kept as their literal string representation. Only supported by the
+        standard library codec.
+    """
+    if raw_numbers:
+        if name not in (None, StdlibJSONCodec.name):
+            raise ValueError(f"The {name} JSON codec does not support raw numbers.")
+        return StdlibJSONCodec(raw_numbers=True)
+    if name is not None:
+        if name not in JSON_CODECS:
+            raise ValueError(f"Unknown JSON codec {name}. Valid options are {list(JSON_CODECS)}.")
+        return JSON_CODECS[name]()
+    if orjson is not None:
+        return OrjsonJSONCodec()
+    if msgspec is not None:
+        return MsgspecJSONCodec()
+    return StdlibJSONCodec()
+
+
+def default_json_codec() -> JSONCodecBase:
+    """Returns the codec shared by all web assistants that were not configured with a specific codec."""
+    global _default_codec
+    if _default_codec is None:
+        _default_codec = get_json_codec()
+    return _default_codec
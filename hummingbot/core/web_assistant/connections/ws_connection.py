@@ -1,20 +1,25 @@
 import asyncio
 import time
-from json import JSONDecodeError
 from typing import Any, Dict, Mapping, Optional
+from urllib.parse import urlparse
 
 import aiohttp
 
+from hummingbot.core.utils.latency_metrics import LatencyMetric, LatencyMetricsRegistry
 from hummingbot.core.web_assistant.connections.data_types import WSRequest, WSResponse
+from hummingbot.core.web_assistant.connections.json_codec import JSONCodecBase, default_json_codec
 
 
 class WSConnection:
-    def __init__(self, aiohttp_client_session: aiohttp.ClientSession):
+    def __init__(self, aiohttp_client_session: aiohttp.ClientSession, json_codec: Optional[JSONCodecBase] = None):
         self._client_session = aiohttp_client_session
+        self._json_codec = json_codec or default_json_codec()
         self._connection: Optional[aiohttp.ClientWebSocketResponse] = None
         self._connected = False
         self._message_timeout: Optional[float] = None
         self._last_recv_time = 0
+        self._latency_metrics = LatencyMetricsRegistry.get_instance()
+        self._latency_metrics_key = ""
 
     @property
     def last_recv_time(self) -> float:
@@ -39,6 +44,7 @@ class WSConnection:
             heartbeat=ping_timeout,
         )
         self._message_timeout = message_timeout
+        self._latency_metrics_key = urlparse(ws_url).netloc
         self._connected = True
 
     async def disconnect(self):
@@ -125,14 +131,17 @@ class WSConnection:
     async def _send_binary(self, payload: bytes):
         await self._connection.send_bytes(payload)
 
-    @staticmethod
-    def _build_resp(msg: aiohttp.WSMessage) -> WSResponse:
+    def _build_resp(self, msg: aiohttp.WSMessage) -> WSResponse:
         if msg.type == aiohttp.WSMsgType.BINARY:
             data = msg.data
         else:
+            start = time.perf_counter() if self._latency_metrics.enabled else 0
             try:
-                data = msg.json()
-            except JSONDecodeError:
+                data = self._json_codec.loads(msg.data)
+            except ValueError:
                 data = msg.data
+            if start:
+                self._latency_metrics.record(
+                    LatencyMetric.WS_DECODE, self._latency_metrics_key, time.perf_counter() - start)
         response = WSResponse(data)
         return response
@@ -1,11 +1,18 @@
-import json
+import time
 from asyncio import wait_for
-from copy import deepcopy
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Callable, Dict, List, Optional, Union
+from urllib.parse import urlparse
 
 from hummingbot.core.api_throttler.async_throttler_base import AsyncThrottlerBase
+from hummingbot.core.utils.latency_metrics import LatencyMetric, LatencyMetricsRegistry
 from hummingbot.core.web_assistant.auth import AuthBase
-from hummingbot.core.web_assistant.connections.data_types import RESTMethod, RESTRequest, RESTResponse
+from hummingbot.core.web_assistant.connections.data_types import (
+    RESTMethod,
+    RESTRequest,
+    RESTRequestTimings,
+    RESTResponse,
+)
+from hummingbot.core.web_assistant.connections.json_codec import JSONCodecBase, default_json_codec
 from hummingbot.core.web_assistant.connections.rest_connection import RESTConnection
 from hummingbot.core.web_assistant.rest_post_processors import RESTPostProcessorBase
 from hummingbot.core.web_assistant.rest_pre_processors import RESTPreProcessorBase
@@ -17,6 +24,12 @@ class RESTAssistant:
     The class can be injected with additional functionality by passing a list of objects inheriting from
     the `RESTPreProcessorBase` and `RESTPostProcessorBase` classes. The pre-processors are applied to a request
     before it is sent out, while the post-processors are applied to a response before it is returned to the caller.
+
+    `default_headers` are merged once into the per-method header templates used to build every request, so connectors
+    with static headers do not need a pre-processor to add them. If a `timings_hook` is provided, it is called with
+    the `RESTRequestTimings` of every successful request (throttle wait, pre-processing, signing, network and parsing
+    times). The same timings are recorded in the `LatencyMetricsRegistry` when it is enabled. No timing is collected
+    when neither is active.
     """
     def __init__(
         self,
@@ -25,12 +38,19 @@ class RESTAssistant:
         rest_pre_processors: Optional[List[RESTPreProcessorBase]] = None,
         rest_post_processors: Optional[List[RESTPostProcessorBase]] = None,
         auth: Optional[AuthBase] = None,
+        json_codec: Optional[JSONCodecBase] = None,
+        default_headers: Optional[Dict[str, Any]] = None,
+        timings_hook: Optional[Callable[[RESTRequestTimings], None]] = None,
     ):
         self._connection = connection
         self._rest_pre_processors = rest_pre_processors or []
         self._rest_post_processors = rest_post_processors or []
         self._auth = auth
         self._throttler = throttler
+        self._json_codec = json_codec or default_json_codec()
+        self._header_templates = self._build_header_templates(default_headers or {})
+        self._timings_hook = timings_hook
+        self._latency_metrics = LatencyMetricsRegistry.get_instance()
 
     async def execute_request(
         self,
@@ -44,7 +64,8 @@ class RESTAssistant:
         timeout: Optional[float] = None,
         headers: Optional[Dict[str, Any]] = None,
     ) -> Union[str, Dict[str, Any]]:
-        response = await self.execute_request_and_get_response(
+        timings = self._new_timings(throttler_limit_id, url)
+        response = await self._execute_request_and_get_response(
             url=url,
             throttler_limit_id=throttler_limit_id,
             params=params,
@@ -54,8 +75,15 @@ class RESTAssistant:
             return_err=return_err,
             timeout=timeout,
             headers=headers,
+            timings=timings,
         )
-        response_json = await response.json()
+        if timings is None:
+            response_json = await response.json()
+        else:
+            start = time.perf_counter()
+            response_json = await response.json()
+            timings.parse = time.perf_counter() - start
+            self._report_timings(timings)
         return response_json
 
     async def execute_request_and_get_response(
@@ -70,15 +98,50 @@ class RESTAssistant:
             timeout: Optional[float] = None,
             headers: Optional[Dict[str, Any]] = None,
     ) -> RESTResponse:
+        timings = self._new_timings(throttler_limit_id, url)
+        response = await self._execute_request_and_get_response(
+            url=url,
+            throttler_limit_id=throttler_limit_id,
+            params=params,
+            data=data,
+            method=method,
+            is_auth_required=is_auth_required,
+            return_err=return_err,
+            timeout=timeout,
+            headers=headers,
+            timings=timings,
+        )
+        if timings is not None:
+            self._report_timings(timings)
+        return response
 
-        headers = headers or {}
-
-        local_headers = {
-            "Content-Type": ("application/json" if method != RESTMethod.GET else "application/x-www-form-urlencoded")}
+    async def call(self, request: RESTRequest, timeout: Optional[float] = None) -> RESTResponse:
+        timings = self._new_timings(request.throttler_limit_id, request.url)
+        resp = await self._call(request=request.derive(), timeout=timeout, timings=timings)
+        if timings is not None:
+            self._report_timings(timings)
+        return resp
 
-        local_headers.update(headers)
+    async def _execute_request_and_get_response(
+            self,
+            url: str,
+            throttler_limit_id: str,
+            params: Optional[Dict[str, Any]],
+            data: Optional[Dict[str, Any]],
+            method: RESTMethod,
+            is_auth_required: bool,
+            return_err: bool,
+            timeout: Optional[float],
+            headers: Optional[Dict[str, Any]],
+            timings: Optional[RESTRequestTimings],
+    ) -> RESTResponse:
+        local_headers = dict(self._header_templates[method])
+        if headers:
+            local_headers.update(headers)
 
-        data = json.dumps(data) if data is not None else data
+        data = self._json_codec.dumps(data) if data is not None else data
+        # Some auth classes sign the params in place, and the callers retry the requests with the same params
+        params = dict(params) if params is not None else params
 
         request = RESTRequest(
             method=method,
@@ -90,8 +153,11 @@ class RESTAssistant:
             throttler_limit_id=throttler_limit_id
         )
 
+        wait_start = time.perf_counter() if timings is not None else 0
         async with self._throttler.execute_task(limit_id=throttler_limit_id):
-            response = await self.call(request=request, timeout=timeout)
+            if timings is not None:
+                timings.throttle_wait = time.perf_counter() - wait_start
+            response = await self._call(request=request, timeout=timeout, timings=timings)
 
             if 400 <= response.status:
                 if not return_err:
@@ -101,14 +167,51 @@ class RESTAssistant:
                                   f"Error: {error_text}")
             return response
 
-    async def call(self, request: RESTRequest, timeout: Optional[float] = None) -> RESTResponse:
-        request = deepcopy(request)
-        request = await self._pre_process_request(request)
-        request = await self._authenticate(request)
-        resp = await wait_for(self._connection.call(request), timeout)
-        resp = await self._post_process_response(resp)
+    async def _call(
+        self, request: RESTRequest, timeout: Optional[float], timings: Optional[RESTRequestTimings]
+    ) -> RESTResponse:
+        if timings is None:
+            request = await self._pre_process_request(request)
+            request = await self._authenticate(request)
+            resp = await wait_for(self._connection.call(request), timeout)
+            resp = await self._post_process_response(resp)
+        else:
+            start = time.perf_counter()
+            request = await self._pre_process_request(request)
+            pre_processed = time.perf_counter()
+            request = await self._authenticate(request)
+            authenticated = time.perf_counter()
+            resp = await wait_for(self._connection.call(request), timeout)
+            resp = await self._post_process_response(resp)
+            timings.pre_process = pre_processed - start
+            timings.authentication = authenticated - pre_processed
+            timings.network = time.perf_counter() - authenticated
         return resp
 
+    def _new_timings(self, throttler_limit_id: Optional[str], url: Optional[str]) -> Optional[RESTRequestTimings]:
+        if self._timings_hook is None and not self._latency_metrics.enabled:
+            return None
+        return RESTRequestTimings(throttler_limit_id=throttler_limit_id, url=url)
+
+    def _report_timings(self, timings: RESTRequestTimings):
+        if self._timings_hook is not None:
+            self._timings_hook(timings)
+        if self._latency_metrics.enabled:
+            # The throttle wait is recorded by the throttler itself
+            key = f"{urlparse(timings.url or '').netloc} {timings.throttler_limit_id}"
+            self._latency_metrics.record(LatencyMetric.REST_NETWORK, key, timings.network)
+            self._latency_metrics.record(LatencyMetric.REST_SIGN, key, timings.authentication)
+            if timings.parse > 0:
+                self._latency_metrics.record(LatencyMetric.REST_PARSE, key, timings.parse)
+
+    @staticmethod
+    def _build_header_templates(default_headers: Dict[str, Any]) -> Dict[RESTMethod, Dict[str, Any]]:
+        templates = {}
+        for method in RESTMethod:
+            content_type = "application/json" if method != RESTMethod.GET else "application/x-www-form-urlencoded"
+            templates[method] = {"Content-Type": content_type, **default_headers}
+        return templates
+
     async def _pre_process_request(self, request: RESTRequest) -> RESTRequest:
         for pre_processor in self._rest_pre_processors:
             request = await pre_processor.pre_process(request)
@@ -1,8 +1,10 @@
-from typing import List, Optional
+from typing import Any, Callable, Dict, List, Optional
 
 from hummingbot.core.api_throttler.async_throttler_base import AsyncThrottlerBase
 from hummingbot.core.web_assistant.auth import AuthBase
 from hummingbot.core.web_assistant.connections.connections_factory import ConnectionsFactory
+from hummingbot.core.web_assistant.connections.data_types import RESTRequestTimings
+from hummingbot.core.web_assistant.connections.json_codec import JSONCodecBase
 from hummingbot.core.web_assistant.rest_assistant import RESTAssistant
 from hummingbot.core.web_assistant.rest_post_processors import RESTPostProcessorBase
 from hummingbot.core.web_assistant.rest_pre_processors import RESTPreProcessorBase
@@ -19,6 +21,9 @@ class WebAssistantsFactory:
     lists. Consult the documentation of the relevant assistant and/or pre-/post-processor class for
     additional information.
 
+    A specific `JSONCodecBase` can be provided to control how JSON payloads are encoded and decoded. If none is
+    provided the fastest codec available in the environment is used (see `json_codec.get_json_codec`).
+
     todo: integrate AsyncThrottler
     """
     def __init__(
@@ -29,14 +34,19 @@ class WebAssistantsFactory:
         ws_pre_processors: Optional[List[WSPreProcessorBase]] = None,
         ws_post_processors: Optional[List[WSPostProcessorBase]] = None,
         auth: Optional[AuthBase] = None,
+        json_codec: Optional[JSONCodecBase] = None,
+        rest_default_headers: Optional[Dict[str, Any]] = None,
+        rest_timings_hook: Optional[Callable[[RESTRequestTimings], None]] = None,
     ):
-        self._connections_factory = ConnectionsFactory()
+        self._connections_factory = ConnectionsFactory(json_codec=json_codec)
         self._rest_pre_processors = rest_pre_processors or []
         self._rest_post_processors = rest_post_processors or []
         self._ws_pre_processors = ws_pre_processors or []
         self._ws_post_processors = ws_post_processors or []
         self._auth = auth
         self._throttler = throttler
+        self._rest_default_headers = rest_default_headers
+        self._rest_timings_hook = rest_timings_hook
 
     @property
     def throttler(self) -> AsyncThrottlerBase:
@@ -46,6 +56,10 @@ class WebAssistantsFactory:
     def auth(self) -> Optional[AuthBase]:
         return self._auth
 
+    @property
+    def json_codec(self) -> JSONCodecBase:
+        return self._connections_factory.json_codec
+
     async def get_rest_assistant(self) -> RESTAssistant:
         connection = await self._connections_factory.get_rest_connection()
         assistant = RESTAssistant(
@@ -53,7 +67,10 @@ class WebAssistantsFactory:
             throttler=self._throttler,
             rest_pre_processors=self._rest_pre_processors,
             rest_post_processors=self._rest_post_processors,
-            auth=self._auth
+            auth=self._auth,
+            json_codec=self.json_codec,
+            default_headers=self._rest_default_headers,
+            timings_hook=self._rest_timings_hook,
         )
         return assistant
 
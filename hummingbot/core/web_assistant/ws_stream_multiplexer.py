@@ -0,0 +1,304 @@
+import asyncio
+import logging
+from collections import defaultdict
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set
+
+from hummingbot.core.api_throttler.async_throttler import AsyncThrottler
+from hummingbot.core.api_throttler.data_types import RateLimit
+from hummingbot.core.utils.async_utils import safe_ensure_future
+from hummingbot.core.web_assistant.connections.data_types import WSRequest
+from hummingbot.core.web_assistant.web_assistants_factory import WebAssistantsFactory
+from hummingbot.core.web_assistant.ws_assistant import WSAssistant
+from hummingbot.logger import HummingbotLogger
+
+
+class MultiplexedConnection:
+    """
+    A single websocket connection of a `WSStreamMultiplexer` and the streams it is subscribed to.
+    """
+
+    def __init__(self, connection_id: int):
+        self.connection_id = connection_id
+        self.streams: Set[str] = set()
+        self.pending_streams: Set[str] = set()
+        self.ws_assistant: Optional[WSAssistant] = None
+        self.task: Optional[asyncio.Task] = None
+        self.subscribe_task: Optional[asyncio.Task] = None
+        self.lock = asyncio.Lock()
+
+    @property
+    def connected(self) -> bool:
+        return self.ws_assistant is not None
+
+
+class WSStreamMultiplexer:
+    """
+    Shares a minimal number of websocket connections among all the consumers of the public streams of an exchange
+    (order book diffs, trades, candles, etc.) for exchanges that allow subscribing to several streams through the same
+    connection.
+
+    Consumers register an `asyncio.Queue` for a list of stream names. The payload of each message is put straight into
+    the queues of the consumers of the stream it originates from. Streams are assigned to connections holding at
+    most `max_streams_per_connection` streams. Subscriptions are added and removed incrementally on the live
+    connections, and all the streams of a connection are subscribed again when it reconnects. The streams added to a
+    live connection in the same event loop iteration are subscribed with a single request, and all the requests are
+    sent at most `max_messages_per_second` times per second.
+
+    Consumers that need to know about the messages missed while a connection was down register an `on_interruption`
+    callback, called when the connection of their streams is lost.
+
+    Subclasses implement the exchange specific parts: the subscription requests and the identification of the stream
+    of each message.
+    """
+
+    WS_MESSAGES_LIMIT_ID = "WSStreamMultiplexerMessages"
+
+    _logger: Optional[HummingbotLogger] = None
+    _shared_instances: Dict[str, "WSStreamMultiplexer"] = {}
+
+    @classmethod
+    def logger(cls) -> HummingbotLogger:
+        if cls._logger is None:
+            cls._logger = logging.getLogger(HummingbotLogger.logger_name_for_class(cls))
+        return cls._logger
+
+    @classmethod
+    def shared_instance(cls, ws_url: str, **kwargs) -> "WSStreamMultiplexer":
+        """
+        Returns the multiplexer shared by all the consumers of the streams of `ws_url` in the process.
+        """
+        key = f"{cls.__name__}:{ws_url}"
+        instance = WSStreamMultiplexer._shared_instances.get(key)
+        if instance is None:
+            instance = cls(ws_url=ws_url, **kwargs)
+            WSStreamMultiplexer._shared_instances[key] = instance
+        return instance
+
+    def __init__(
+        self,
+        ws_url: str,
+        api_factory: Optional[WebAssistantsFactory] = None,
+        max_streams_per_connection: int = 200,
+        ping_timeout: float = 30.0,
+        max_messages_per_second: Optional[int] = None,
+    ):
+        self._ws_url = ws_url
+        self._api_factory = api_factory or WebAssistantsFactory(throttler=AsyncThrottler(rate_limits=[]))
+        self._max_streams_per_connection = max_streams_per_connection
+        self._ping_timeout = ping_timeout
+        self._messages_throttler: Optional[AsyncThrottler] = None
+        if max_messages_per_second is not None:
+            self._messages_throttler = AsyncThrottler(rate_limits=[
+                RateLimit(limit_id=self.WS_MESSAGES_LIMIT_ID, limit=max_messages_per_second, time_interval=1)])
+        self._consumers: Dict[str, List[asyncio.Queue]] = defaultdict(list)
+        self._interruption_callbacks: Dict[asyncio.Queue, Callable[[], None]] = {}
+        self._connections: List[MultiplexedConnection] = []
+        self._stream_connection: Dict[str, MultiplexedConnection] = {}
+        self._next_connection_id = 0
+        self._next_request_id = 0
+
+    @property
+    def ws_url(self) -> str:
+        return self._ws_url
+
+    @property
+    def streams(self) -> Set[str]:
+        return set(self._stream_connection.keys())
+
+    @property
+    def connections_count(self) -> int:
+        return len(self._connections)
+
+    async def subscribe(self,
+                        streams: Iterable[str],
+                        queue: asyncio.Queue,
+                        on_interruption: Optional[Callable[[], None]] = None):
+        """
+        Registers `queue` as a consumer of `streams`. Streams nobody was subscribed to are subscribed on the exchange.
+
+        :param streams: the exchange names of the streams
+        :param queue: the queue where the payload of the stream messages will be put
+        :param on_interruption: called when the connection of the streams is lost, before they are subscribed again
+        """
+        if on_interruption is not None:
+            self._interruption_callbacks[queue] = on_interruption
+        new_streams_by_connection: Dict[int, List[str]] = defaultdict(list)
+        for stream in streams:
+            if queue not in self._consumers[stream]:
+                self._consumers[stream].append(queue)
+            if stream not in self._stream_connection:
+                connection = self._connection_with_capacity()
+                connection.streams.add(stream)
+                self._stream_connection[stream] = connection
+                new_streams_by_connection[connection.connection_id].append(stream)
+
+        for connection in list(self._connections):
+            new_streams = new_streams_by_connection.get(connection.connection_id)
+            if not new_streams:
+                continue
+            if connection.task is None:
+                connection.task = safe_ensure_future(self._listen_for_messages(connection))
+            else:
+                connection.pending_streams.update(new_streams)
+                if connection.subscribe_task is None:
+                    connection.subscribe_task = safe_ensure_future(self._subscribe_pending_streams(connection))
+
+    async def unsubscribe(self, streams: Iterable[str], queue: asyncio.Queue):
+        """
+        Removes `queue` from the consumers of `streams`. Streams left without consumers are unsubscribed from the
+        exchange, and connections left without streams are closed.
+
+        :param streams: the exchange names of the streams
+        :param queue: the queue that was registered as consumer
+        """
+        removed_streams_by_connection: Dict[int, List[str]] = defaultdict(list)
+        for stream in streams:
+            consumers = self._consumers.get(stream, [])
+            if queue in consumers:
+                consumers.remove(queue)
+            if len(consumers) == 0 and stream in self._stream_connection:
+                del self._consumers[stream]
+                connection = self._stream_connection.pop(stream)
+                connection.streams.discard(stream)
+                if stream in connection.pending_streams:
+                    # Not subscribed on the exchange yet
+                    connection.pending_streams.discard(stream)
+                else:
+                    removed_streams_by_connection[connection.connection_id].append(stream)
+        if not any(queue in consumers for consumers in self._consumers.values()):
+            self._interruption_callbacks.pop(queue, None)
+
+        for connection in list(self._connections):
+            removed_streams = removed_streams_by_connection.get(connection.connection_id)
+            if not removed_streams:
+                continue
+            if len(connection.streams) == 0:
+                await self._close_connection(connection)
+            else:
+                async with connection.lock:
+                    if connection.connected:
+                        await self._send(connection.ws_assistant, self._build_unsubscribe_request(removed_streams))
+
+    async def stop(self):
+        for connection in list(self._connections):
+            await self._close_connection(connection)
+        self._consumers.clear()
+        self._stream_connection.clear()
+        self._interruption_callbacks.clear()
+
+    def _build_subscribe_request(self, streams: List[str]) -> WSRequest:
+        raise NotImplementedError
+
+    def _build_unsubscribe_request(self, streams: List[str]) -> WSRequest:
+        raise NotImplementedError
+
+    def _stream_of_message(self, message: Any) -> Optional[str]:
+        """
+        Returns the name of the stream a message originates from, or `None` for messages that do not belong to a
+        stream (e.g. responses to the subscription requests).
+        """
+        raise NotImplementedError
+
+    def _payload_of_message(self, message: Any) -> Any:
+        """
+        Returns the content of the message delivered to the consumers.
+        """
+        return message
+
+    def _next_id(self) -> int:
+        self._next_request_id += 1
+        return self._next_request_id
+
+    def _connection_with_capacity(self) -> MultiplexedConnection:
+        for connection in self._connections:
+            if len(connection.streams) < self._max_streams_per_connection:
+                return connection
+        connection = MultiplexedConnection(connection_id=self._next_connection_id)
+        self._next_connection_id += 1
+        self._connections.append(connection)
+        return connection
+
+    async def _send(self, ws: WSAssistant, request: WSRequest):
+        if self._messages_throttler is None:
+            await ws.send(request)
+        else:
+            async with self._messages_throttler.execute_task(limit_id=self.WS_MESSAGES_LIMIT_ID):
+                await ws.send(request)
+
+    async def _subscribe_pending_streams(self, connection: MultiplexedConnection):
+        async with connection.lock:
+            connection.subscribe_task = None
+            streams = sorted(connection.pending_streams)
+            connection.pending_streams.clear()
+            # Streams added while the connection is down are subscribed when it reconnects
+            if len(streams) > 0 and connection.connected:
+                await self._send(connection.ws_assistant, self._build_subscribe_request(streams))
+
+    async def _close_connection(self, connection: MultiplexedConnection):
+        if connection in self._connections:
+            self._connections.remove(connection)
+        for stream in connection.streams:
+            self._stream_connection.pop(stream, None)
+        connection.streams.clear()
+        connection.pending_streams.clear()
+        if connection.subscribe_task is not None:
+            connection.subscribe_task.cancel()
+            connection.subscribe_task = None
+        if connection.task is not None:
+            connection.task.cancel()
+            connection.task = None
+        if connection.ws_assistant is not None:
+            await connection.ws_assistant.disconnect()
+            connection.ws_assistant = None
+
+    async def _listen_for_messages(self, connection: MultiplexedConnection):
+        while True:
+            ws: Optional[WSAssistant] = None
+            try:
+                async with connection.lock:
+                    ws = await self._api_factory.get_ws_assistant()
+                    await ws.connect(ws_url=self._ws_url, ping_timeout=self._ping_timeout)
+                    connection.pending_streams.clear()
+                    if len(connection.streams) > 0:
+                        await self._send(ws, self._build_subscribe_request(sorted(connection.streams)))
+                    connection.ws_assistant = ws
+                self.logger().info(
+                    f"Subscribed to {len(connection.streams)} streams through connection {connection.connection_id}.")
+                async for ws_response in ws.iter_messages():
+                    self._dispatch(ws_response.data)
+            except asyncio.CancelledError:
+                raise
+            except ConnectionError as connection_exception:
+                self.logger().warning(f"The websocket connection was closed ({connection_exception})")
+            except Exception:
+                self.logger().exception(
+                    "Unexpected error occurred when listening to multiplexed streams. Retrying in 5 seconds...")
+                await self._sleep(5.0)
+            finally:
+                if connection.ws_assistant is not None:
+                    connection.ws_assistant = None
+                    self._notify_interruption(connection)
+                ws and await ws.disconnect()
+
+    def _notify_interruption(self, connection: MultiplexedConnection):
+        queues = {queue for stream in connection.streams for queue in self._consumers.get(stream, [])}
+        for queue in queues:
+            callback = self._interruption_callbacks.get(queue)
+            if callback is not None:
+                try:
+                    callback()
+                except Exception:
+                    self.logger().exception("Unexpected error notifying a stream interruption.")
+
+    def _dispatch(self, message: Any):
+        if message is None:
+            return
+        stream = self._stream_of_message(message)
+        consumers = self._consumers.get(stream) if stream is not None else None
+        if consumers:
+            payload = self._payload_of_message(message)
+            for queue in consumers:
+                queue.put_nowait(payload)
+
+    async def _sleep(self, delay: float):
+        await asyncio.sleep(delay)
@@ -7,6 +7,7 @@ import numpy as np
 from hummingbot.core.network_iterator import NetworkStatus, safe_ensure_future
 from hummingbot.core.web_assistant.connections.data_types import WSJSONRequest
 from hummingbot.core.web_assistant.ws_assistant import WSAssistant
+from hummingbot.core.web_assistant.ws_stream_multiplexer import WSStreamMultiplexer
 from hummingbot.data_feed.candles_feed.binance_spot_candles import constants as CONSTANTS
 from hummingbot.data_feed.candles_feed.candles_base import CandlesBase
 from hummingbot.logger import HummingbotLogger
@@ -21,8 +22,13 @@ class BinanceSpotCandles(CandlesBase):
             cls._logger = logging.getLogger(__name__)
         return cls._logger
 
-    def __init__(self, trading_pair: str, interval: str = "1m", max_records: int = 150):
+    def __init__(self,
+                 trading_pair: str,
+                 interval: str = "1m",
+                 max_records: int = 150,
+                 ws_multiplexer: Optional[WSStreamMultiplexer] = None):
         super().__init__(trading_pair, interval, max_records)
+        self._ws_multiplexer = ws_multiplexer
 
     @property
     def name(self):
@@ -104,6 +110,9 @@ class BinanceSpotCandles(CandlesBase):
                 )
                 await self._sleep(1.0)
 
+    def _kline_stream_name(self) -> str:
+        return f"{self._ex_trading_pair.lower()}@kline_{self.interval}"
+
     async def _subscribe_channels(self, ws: WSAssistant):
         """
         Subscribes to the candles events through the provided websocket connection.
@@ -111,7 +120,7 @@ class BinanceSpotCandles(CandlesBase):
         """
         try:
             candle_params = []
-            candle_params.append(f"{self._ex_trading_pair.lower()}@kline_{self.interval}")
+            candle_params.append(self._kline_stream_name())
             payload = {
                 "method": "SUBSCRIBE",
                 "params": candle_params,
@@ -130,32 +139,57 @@ class BinanceSpotCandles(CandlesBase):
             )
             raise
 
+    async def listen_for_subscriptions(self):
+        """
+        Subscribes to the klines stream through the websocket multiplexer when one was configured, otherwise opens a
+        dedicated websocket connection. The candles are cleared when the multiplexed connection is lost, so the next
+        kline received after reconnecting fills the candles missed in between from the REST API.
+        """
+        if self._ws_multiplexer is None:
+            await super().listen_for_subscriptions()
+            return
+        stream = self._kline_stream_name()
+        message_queue = asyncio.Queue()
+        try:
+            await self._ws_multiplexer.subscribe(streams=[stream], queue=message_queue, on_interruption=self._candles.clear)
+            self.logger().info("Subscribed to public klines...")
+            while True:
+                data: Dict[str, Any] = await message_queue.get()
+                if data.get("e") == "kline":
+                    self._process_kline_event(data)
+        finally:
+            await self._ws_multiplexer.unsubscribe(streams=[stream], queue=message_queue)
+            self._candles.clear()
+
     async def _process_websocket_messages(self, websocket_assistant: WSAssistant):
         async for ws_response in websocket_assistant.iter_messages():
             data: Dict[str, Any] = ws_response.data
             if data is not None and data.get("e") == "kline":  # data will be None when the websocket is disconnected
-                timestamp = data["k"]["t"]
-                open = data["k"]["o"]
-                high = data["k"]["h"]
-                low = data["k"]["l"]
-                close = data["k"]["c"]
-                volume = data["k"]["v"]
-                quote_asset_volume = data["k"]["q"]
-                n_trades = data["k"]["n"]
-                taker_buy_base_volume = data["k"]["V"]
-                taker_buy_quote_volume = data["k"]["Q"]
-                if len(self._candles) == 0:
-                    self._candles.append(np.array([timestamp, open, high, low, close, volume,
-                                                   quote_asset_volume, n_trades, taker_buy_base_volume,
-                                                   taker_buy_quote_volume]))
-                    safe_ensure_future(self.fill_historical_candles())
-                elif timestamp > int(self._candles[-1][0]):
-                    # TODO: validate also that the diff of timestamp == interval (issue with 1M interval).
-                    self._candles.append(np.array([timestamp, open, high, low, close, volume,
-                                                   quote_asset_volume, n_trades, taker_buy_base_volume,
-                                                   taker_buy_quote_volume]))
-                elif timestamp == int(self._candles[-1][0]):
-                    self._candles.pop()
-                    self._candles.append(np.array([timestamp, open, high, low, close, volume,
-                                                   quote_asset_volume, n_trades, taker_buy_base_volume,
-                                                   taker_buy_quote_volume]))
+                self._process_kline_event(data)
+
+    def _process_kline_event(self, data: Dict[str, Any]):
+        timestamp = data["k"]["t"]
+        open = data["k"]["o"]
+        high = data["k"]["h"]
+        low = data["k"]["l"]
+        close = data["k"]["c"]
+        volume = data["k"]["v"]
+        quote_asset_volume = data["k"]["q"]
+        n_trades = data["k"]["n"]
+        taker_buy_base_volume = data["k"]["V"]
+        taker_buy_quote_volume = data["k"]["Q"]
+        if len(self._candles) == 0:
+            self._candles.append(np.array([timestamp, open, high, low, close, volume,
+                                           quote_asset_volume, n_trades, taker_buy_base_volume,
+                                           taker_buy_quote_volume]))
+            safe_ensure_future(self.fill_historical_candles())
+        elif timestamp > int(self._candles[-1][0]):
+            # TODO: validate also that the diff of timestamp == interval (issue with 1M interval).
+            self._candles.append(np.array([timestamp, open, high, low, close, volume,
+                                           quote_asset_volume, n_trades, taker_buy_base_volume,
+                                           taker_buy_quote_volume]))
+        elif timestamp == int(self._candles[-1][0]):
+            self._candles.pop()
+            self._candles.append(np.array([timestamp, open, high, low, close, volume,
+                                           quote_asset_volume, n_trades, taker_buy_base_volume,
+                                           taker_buy_quote_volume]))
@@ -1,7 +1,7 @@
 import asyncio
 import os
 from collections import deque
-from typing import Optional
+from typing import List, Optional, Sequence
 
 import pandas as pd
 from bidict import bidict
@@ -118,6 +118,20 @@ class CandlesBase(NetworkBase):
         """
         return pd.DataFrame(self._candles, columns=self.columns, dtype=float)
 
+    def get_candles_after(self, timestamp: float) -> List[Sequence]:
+        """
+        This method returns the candles with a timestamp after the one given, from the oldest to the newest, without
+        building a DataFrame. Only the candles returned are visited.
+        :param timestamp: timestamp of the last candle already known
+        """
+        candles = []
+        for candle in reversed(self._candles):
+            if float(candle[0]) <= timestamp:
+                break
+            candles.append(candle)
+        candles.reverse()
+        return candles
+
     def get_exchange_trading_pair(self, trading_pair):
         raise NotImplementedError
 
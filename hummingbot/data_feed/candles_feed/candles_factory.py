@@ -1,7 +1,9 @@
-from typing import Dict, Type
+from typing import Callable, Dict, Type
 
 from pydantic import BaseModel
 
+from hummingbot.connector.exchange.binance.binance_ws_stream_multiplexer import BinanceWSStreamMultiplexer
+from hummingbot.core.web_assistant.ws_stream_multiplexer import WSStreamMultiplexer
 from hummingbot.data_feed.candles_feed.ascend_ex_spot_candles.ascend_ex_spot_candles import AscendExSpotCandles
 from hummingbot.data_feed.candles_feed.binance_perpetual_candles import BinancePerpetualCandles
 from hummingbot.data_feed.candles_feed.binance_spot_candles import BinanceSpotCandles
@@ -41,6 +43,7 @@ class CandlesFactory:
     """
     The CandlesFactory class creates and returns a Candle object based on the specified configuration.
     It uses a mapping of connector names to their respective candle classes.
+    Candles of the exchanges with a websocket multiplexer share the websocket connections of the exchange connector.
     """
     _candles_map: Dict[str, Type[CandlesBase]] = {
         "binance_perpetual": BinancePerpetualCandles,
@@ -52,6 +55,9 @@ class CandlesFactory:
         "okx_perpetual": OKXPerpetualCandles,
         "kraken": KrakenSpotCandles
     }
+    _ws_multiplexers: Dict[str, Callable[[], WSStreamMultiplexer]] = {
+        "binance": BinanceWSStreamMultiplexer.for_domain,
+    }
 
     @classmethod
     def get_candle(cls, candles_config: CandlesConfig) -> CandlesBase:
@@ -64,10 +70,15 @@ class CandlesFactory:
         """
         connector_class = cls._candles_map.get(candles_config.connector)
         if connector_class:
+            kwargs = {}
+            ws_multiplexer_getter = cls._ws_multiplexers.get(candles_config.connector)
+            if ws_multiplexer_getter is not None:
+                kwargs["ws_multiplexer"] = ws_multiplexer_getter()
             return connector_class(
                 candles_config.trading_pair,
                 candles_config.interval,
-                candles_config.max_records
+                candles_config.max_records,
+                **kwargs
             )
         else:
             raise UnsupportedConnectorException(candles_config.connector)
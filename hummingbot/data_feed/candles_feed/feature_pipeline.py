@@ -0,0 +1,136 @@
+import logging
+import math
+from collections import deque
+from typing import Callable, Deque, Dict, List, Optional, Sequence, Tuple
+
+import pandas as pd
+
+from hummingbot.data_feed.candles_feed.candles_base import CandlesBase
+from hummingbot.data_feed.candles_feed.incremental_indicators import IncrementalIndicator
+from hummingbot.logger import HummingbotLogger
+
+CandleClosedListener = Callable[["CandlesFeaturePipeline"], None]
+
+
+class CandlesFeaturePipeline:
+    """
+    Computes the indicators of a candles feed incrementally. Each closed candle is processed once by the indicators,
+    and the candle still open is recomputed on each update from the state of the indicators, so an update costs O(1)
+    instead of O(window) when the indicators are computed over the candles DataFrame.
+
+    The pipelines are created and updated by the `MarketDataProvider`, one for each candles feed, and shared by the
+    controllers using the same feed.
+    """
+    _logger: Optional[HummingbotLogger] = None
+
+    @classmethod
+    def logger(cls) -> HummingbotLogger:
+        if cls._logger is None:
+            cls._logger = logging.getLogger(__name__)
+        return cls._logger
+
+    def __init__(self, candles_feed: CandlesBase, indicators: Sequence[IncrementalIndicator] = ()):
+        self._candles_feed = candles_feed
+        self._indicators: Dict[str, IncrementalIndicator] = {}
+        # Same number of candles as the feed, with the open one
+        self._closed_rows: Deque[Tuple[float, ...]] = deque(maxlen=max(candles_feed.max_records - 1, 1))
+        self._open_row: Optional[Tuple[float, ...]] = None
+        self._last_closed_timestamp = -math.inf
+        self._candle_closed_listeners: List[CandleClosedListener] = []
+        for indicator in indicators:
+            self.add_indicator(indicator)
+
+    @property
+    def candles_feed(self) -> CandlesBase:
+        return self._candles_feed
+
+    @property
+    def indicators(self) -> List[IncrementalIndicator]:
+        return list(self._indicators.values())
+
+    @property
+    def columns(self) -> List[str]:
+        return CandlesBase.columns + [column for indicator in self._indicators.values() for column in indicator.columns]
+
+    @property
+    def last_closed_timestamp(self) -> float:
+        return self._last_closed_timestamp
+
+    @property
+    def features(self) -> Dict[str, float]:
+        """
+        The candle and indicator values of the last candle (the one still open), by column.
+        """
+        row = self._open_row if self._open_row is not None else (self._closed_rows[-1] if self._closed_rows else None)
+        if row is None:
+            return {}
+        return dict(zip(self.columns, row))
+
+    @property
+    def features_df(self) -> pd.DataFrame:
+        """
+        The candles with their indicator values, the last one being the candle still open. Meant for display and
+        analysis: use `features` for the last values, since building the DataFrame costs O(window).
+        """
+        rows = list(self._closed_rows)
+        if self._open_row is not None:
+            rows.append(self._open_row)
+        return pd.DataFrame(rows, columns=self.columns, dtype=float)
+
+    def add_indicator(self, indicator: IncrementalIndicator) -> IncrementalIndicator:
+        """
+        Adds the indicator to the pipeline, unless an indicator with the same name is already computed, and returns
+        the one computed. A new indicator makes the next update process again all the candles of the feed.
+        """
+        existing_indicator = self._indicators.get(indicator.name)
+        if existing_indicator is not None:
+            return existing_indicator
+        self._indicators[indicator.name] = indicator
+        self._reset()
+        return indicator
+
+    def add_candle_closed_listener(self, listener: CandleClosedListener):
+        self._candle_closed_listeners.append(listener)
+
+    def remove_candle_closed_listener(self, listener: CandleClosedListener):
+        self._candle_closed_listeners.remove(listener)
+
+    def update(self) -> bool:
+        """
+        Processes the candles received by the feed since the last update.
+        :return: True if at least one candle closed since the last update
+        """
+        if not self._candles_feed.ready:
+            return False
+        candles = self._candles_feed.get_candles_after(self._last_closed_timestamp)
+        if len(candles) == 0:
+            return False
+        if self._last_closed_timestamp != -math.inf and len(candles) >= self._candles_feed.max_records:
+            # None of the candles of the feed was processed (the feed was down for longer than its window), the
+            # indicators have to start again from the candles of the feed
+            self._reset()
+
+        for candle in candles[:-1]:
+            candle = tuple(float(value) for value in candle)
+            self._closed_rows.append(
+                candle + tuple(value for indicator in self._indicators.values() for value in indicator.update(candle)))
+        open_candle = tuple(float(value) for value in candles[-1])
+        self._open_row = open_candle + tuple(
+            value for indicator in self._indicators.values() for value in indicator.peek(open_candle))
+
+        candle_closed = len(candles) > 1
+        if candle_closed:
+            self._last_closed_timestamp = self._closed_rows[-1][0]
+            for listener in list(self._candle_closed_listeners):
+                try:
+                    listener(self)
+                except Exception:
+                    self.logger().error("Unexpected error notifying a candle close.", exc_info=True)
+        return candle_closed
+
+    def _reset(self):
+        for indicator in self._indicators.values():
+            indicator.reset()
+        self._closed_rows.clear()
+        self._open_row = None
+        self._last_closed_timestamp = -math.inf
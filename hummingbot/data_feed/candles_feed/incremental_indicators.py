@@ -0,0 +1,277 @@
+import math
+import sys
+from collections import deque
+from typing import Deque, List, Sequence, Tuple
+
+from hummingbot.data_feed.candles_feed.candles_base import CandlesBase
+
+CLOSE_INDEX = CandlesBase.columns.index("close")
+
+
+class IncrementalIndicator:
+    """
+    Base class of the indicators computed one candle at a time, used by the `CandlesFeaturePipeline`.
+
+    `update()` adds a closed candle to the state of the indicator, and `peek()` computes the value of the indicator
+    for the candle still open, without changing the state. Both are O(1).
+
+    The column names are the ones of the matching pandas_ta indicators, and the values are the same once the
+    indicator has seen enough candles. The indicators with an exponential average (EMA, MACD, RSI) keep the whole
+    history of the candles instead of the last window only, so they can differ slightly from the pandas_ta values
+    computed over a short window.
+    """
+
+    @property
+    def name(self) -> str:
+        """
+        Identifies the indicator and its parameters, two indicators with the same name compute the same values.
+        """
+        return "_".join(self.columns)
+
+    @property
+    def columns(self) -> List[str]:
+        raise NotImplementedError
+
+    def reset(self):
+        raise NotImplementedError
+
+    def update(self, candle: Sequence[float]) -> Tuple[float, ...]:
+        raise NotImplementedError
+
+    def peek(self, candle: Sequence[float]) -> Tuple[float, ...]:
+        raise NotImplementedError
+
+
+class _ExponentialAverage:
+    """
+    EMA seeded with the simple average of the first `length` values, as pandas_ta computes it.
+    """
+
+    def __init__(self, length: int):
+        self.length = length
+        self.alpha = 2 / (length + 1)
+        self.count = 0
+        self.seed_sum = 0.0
+        self.value = math.nan
+
+    def next_state(self, value: float) -> Tuple[int, float, float]:
+        count = self.count + 1
+        if count < self.length:
+            return count, self.seed_sum + value, math.nan
+        if count == self.length:
+            seed_sum = self.seed_sum + value
+            return count, seed_sum, seed_sum / self.length
+        return count, self.seed_sum, self.alpha * value + (1 - self.alpha) * self.value
+
+    def update(self, value: float) -> float:
+        self.count, self.seed_sum, self.value = self.next_state(value)
+        return self.value
+
+    def peek(self, value: float) -> float:
+        return self.next_state(value)[2]
+
+
+class _RollingWindow:
+    """
+    Sums of the last `length` values and of their squares. The values are shifted by a reference value to limit the
+    loss of precision of the variance, and the sums are recomputed every `length` values to avoid the drift of the
+    rounding errors.
+    """
+
+    def __init__(self, length: int):
+        self.length = length
+        self.values: Deque[float] = deque(maxlen=length)
+        self.shift = math.nan
+        self.shifted_sum = 0.0
+        self.shifted_squares_sum = 0.0
+        self.updates_count = 0
+
+    def next_sums(self, value: float) -> Tuple[float, float, int]:
+        shift = value if math.isnan(self.shift) else self.shift
+        shifted_value = value - shift
+        shifted_sum = self.shifted_sum + shifted_value
+        shifted_squares_sum = self.shifted_squares_sum + shifted_value * shifted_value
+        count = len(self.values) + 1
+        if count > self.length:
+            removed_value = self.values[0] - shift
+            shifted_sum -= removed_value
+            shifted_squares_sum -= removed_value * removed_value
+            count = self.length
+        return shifted_sum, shifted_squares_sum, count
+
+    def update(self, value: float):
+        if math.isnan(self.shift):
+            self.shift = value
+        self.shifted_sum, self.shifted_squares_sum, _ = self.next_sums(value)
+        self.values.append(value)
+        self.updates_count += 1
+        if self.updates_count % self.length == 0:
+            self.shift = sum(self.values) / len(self.values)
+            self.shifted_sum = sum(value - self.shift for value in self.values)
+            self.shifted_squares_sum = sum((value - self.shift) ** 2 for value in self.values)
+
+    def mean_and_std(self, value: float, peek: bool) -> Tuple[float, float]:
+        if peek:
+            shifted_sum, shifted_squares_sum, count = self.next_sums(value)
+            shift = value if math.isnan(self.shift) else self.shift
+        else:
+            shifted_sum, shifted_squares_sum, count = self.shifted_sum, self.shifted_squares_sum, len(self.values)
+            shift = self.shift
+        if count < self.length:
+            return math.nan, math.nan
+        shifted_mean = shifted_sum / count
+        variance = max(shifted_squares_sum / count - shifted_mean * shifted_mean, 0.0)
+        return shifted_mean + shift, math.sqrt(variance)
+
+
+class EMA(IncrementalIndicator):
+    def __init__(self, length: int):
+        self._length = length
+        self._average = _ExponentialAverage(length)
+
+    @property
+    def columns(self) -> List[str]:
+        return [f"EMA_{self._length}"]
+
+    def reset(self):
+        self._average = _ExponentialAverage(self._length)
+
+    def update(self, candle: Sequence[float]) -> Tuple[float, ...]:
+        return (self._average.update(candle[CLOSE_INDEX]),)
+
+    def peek(self, candle: Sequence[float]) -> Tuple[float, ...]:
+        return (self._average.peek(candle[CLOSE_INDEX]),)
+
+
+class SMA(IncrementalIndicator):
+    def __init__(self, length: int):
+        self._length = length
+        self._window = _RollingWindow(length)
+
+    @property
+    def columns(self) -> List[str]:
+        return [f"SMA_{self._length}"]
+
+    def reset(self):
+        self._window = _RollingWindow(self._length)
+
+    def update(self, candle: Sequence[float]) -> Tuple[float, ...]:
+        self._window.update(candle[CLOSE_INDEX])
+        return (self._window.mean_and_std(candle[CLOSE_INDEX], peek=False)[0],)
+
+    def peek(self, candle: Sequence[float]) -> Tuple[float, ...]:
+        return (self._window.mean_and_std(candle[CLOSE_INDEX], peek=True)[0],)
+
+
+class BollingerBands(IncrementalIndicator):
+    """
+    Lower, middle and upper bands, bandwidth and percent, as the pandas_ta `bbands` (SMA, population standard
+    deviation).
+    """
+
+    def __init__(self, length: int, std: float):
+        self._length = length
+        self._std = float(std)
+        self._window = _RollingWindow(length)
+
+    @property
+    def columns(self) -> List[str]:
+        suffix = f"{self._length}_{self._std}"
+        return [f"BBL_{suffix}", f"BBM_{suffix}", f"BBU_{suffix}", f"BBB_{suffix}", f"BBP_{suffix}"]
+
+    def reset(self):
+        self._window = _RollingWindow(self._length)
+
+    def update(self, candle: Sequence[float]) -> Tuple[float, ...]:
+        self._window.update(candle[CLOSE_INDEX])
+        return self._bands(candle[CLOSE_INDEX], peek=False)
+
+    def peek(self, candle: Sequence[float]) -> Tuple[float, ...]:
+        return self._bands(candle[CLOSE_INDEX], peek=True)
+
+    def _bands(self, close: float, peek: bool) -> Tuple[float, ...]:
+        mid, std = self._window.mean_and_std(close, peek=peek)
+        lower = mid - self._std * std
+        upper = mid + self._std * std
+        # As pandas_ta non_zero_range, to avoid the division by zero when the price did not move
+        bands_range = (upper - lower) or sys.float_info.epsilon
+        return lower, mid, upper, 100 * bands_range / mid, (close - lower) / bands_range
+
+
+class MACD(IncrementalIndicator):
+    """
+    MACD line, histogram and signal line, as the pandas_ta `macd`.
+    """
+
+    def __init__(self, fast: int, slow: int, signal: int):
+        self._fast, self._slow = min(fast, slow), max(fast, slow)
+        self._signal = signal
+        self.reset()
+
+    @property
+    def columns(self) -> List[str]:
+        suffix = f"{self._fast}_{self._slow}_{self._signal}"
+        return [f"MACD_{suffix}", f"MACDh_{suffix}", f"MACDs_{suffix}"]
+
+    def reset(self):
+        self._fast_average = _ExponentialAverage(self._fast)
+        self._slow_average = _ExponentialAverage(self._slow)
+        self._signal_average = _ExponentialAverage(self._signal)
+
+    def update(self, candle: Sequence[float]) -> Tuple[float, ...]:
+        macd = self._fast_average.update(candle[CLOSE_INDEX]) - self._slow_average.update(candle[CLOSE_INDEX])
+        # The signal line starts with the first MACD value
+        signal = self._signal_average.update(macd) if not math.isnan(macd) else math.nan
+        return macd, macd - signal, signal
+
+    def peek(self, candle: Sequence[float]) -> Tuple[float, ...]:
+        macd = self._fast_average.peek(candle[CLOSE_INDEX]) - self._slow_average.peek(candle[CLOSE_INDEX])
+        signal = self._signal_average.peek(macd) if not math.isnan(macd) else math.nan
+        return macd, macd - signal, signal
+
+
+class RSI(IncrementalIndicator):
+    """
+    RSI with the averages of the gains and losses computed as the pandas_ta `rma` (adjusted EWM of alpha 1 / length).
+    """
+
+    def __init__(self, length: int):
+        self._length = length
+        self._decay = 1 - 1 / length
+        self.reset()
+
+    @property
+    def columns(self) -> List[str]:
+        return [f"RSI_{self._length}"]
+
+    def reset(self):
+        self._previous_close = math.nan
+        self._count = 0
+        self._gains_sum = 0.0
+        self._losses_sum = 0.0
+        self._weights_sum = 0.0
+
+    def _next_state(self, close: float) -> Tuple[int, float, float, float]:
+        if math.isnan(self._previous_close):
+            return self._count, self._gains_sum, self._losses_sum, self._weights_sum
+        change = close - self._previous_close
+        return (self._count + 1,
+                max(change, 0.0) + self._decay * self._gains_sum,
+                max(-change, 0.0) + self._decay * self._losses_sum,
+                1.0 + self._decay * self._weights_sum)
+
+    def _rsi(self, count: int, gains_sum: float, losses_sum: float, weights_sum: float) -> float:
+        if count < self._length:
+            return math.nan
+        average_gain = gains_sum / weights_sum
+        average_loss = losses_sum / weights_sum
+        total = average_gain + average_loss
+        return 100 * average_gain / total if total != 0 else math.nan
+
+    def update(self, candle: Sequence[float]) -> Tuple[float, ...]:
+        self._count, self._gains_sum, self._losses_sum, self._weights_sum = self._next_state(candle[CLOSE_INDEX])
+        self._previous_close = candle[CLOSE_INDEX]
+        return (self._rsi(self._count, self._gains_sum, self._losses_sum, self._weights_sum),)
+
+    def peek(self, candle: Sequence[float]) -> Tuple[float, ...]:
+        return (self._rsi(*self._next_state(candle[CLOSE_INDEX])),)
@@ -1,4 +1,4 @@
-from typing import Dict, List, Tuple
+from typing import Dict, List, Sequence, Tuple
 
 import pandas as pd
 
@@ -6,17 +6,21 @@ from hummingbot.connector.connector_base import ConnectorBase
 from hummingbot.core.data_type.common import PriceType
 from hummingbot.core.data_type.order_book_query_result import OrderBookQueryResult
 from hummingbot.data_feed.candles_feed.candles_factory import CandlesConfig, CandlesFactory
+from hummingbot.data_feed.candles_feed.feature_pipeline import CandlesFeaturePipeline
+from hummingbot.data_feed.candles_feed.incremental_indicators import IncrementalIndicator
 
 
 class MarketDataProvider:
     def __init__(self, connectors: Dict[str, ConnectorBase]):
         self.candles_feeds = {}  # Stores instances of candle feeds
+        self.feature_pipelines: Dict[str, CandlesFeaturePipeline] = {}  # Stores the indicators of the candle feeds
         self.connectors = connectors  # Stores instances of connectors
 
     def stop(self):
         for candle_feed in self.candles_feeds.values():
             candle_feed.stop()
         self.candles_feeds.clear()
+        self.feature_pipelines.clear()
 
     @property
     def ready(self) -> bool:
@@ -80,6 +84,7 @@ class MarketDataProvider:
         if candle_feed and hasattr(candle_feed, 'stop'):
             candle_feed.stop()
             del self.candles_feeds[key]
+            self.feature_pipelines.pop(key, None)
 
     def get_connector(self, connector_name: str) -> ConnectorBase:
         """
@@ -130,6 +135,37 @@ class MarketDataProvider:
         ))
         return candles.candles_df.iloc[-max_records:]
 
+    def get_candles_feature_pipeline(self, connector_name: str, trading_pair: str, interval: str,
+                                     max_records: int = 500,
+                                     indicators: Sequence[IncrementalIndicator] = ()) -> CandlesFeaturePipeline:
+        """
+        Retrieves the feature pipeline of the candles feed, with the indicators given added, updated with the candles
+        received since the last call. The pipeline is shared by all the callers using the same candles feed.
+        :param connector_name: str
+        :param trading_pair: str
+        :param interval: str
+        :param max_records: int
+        :param indicators: indicators to compute, the ones already computed by the pipeline are not added again
+        :return: CandlesFeaturePipeline
+        """
+        config = CandlesConfig(
+            connector=connector_name,
+            trading_pair=trading_pair,
+            interval=interval,
+            max_records=max_records,
+        )
+        candles = self.get_candles_feed(config)
+        key = self._generate_candle_feed_key(config)
+        pipeline = self.feature_pipelines.get(key)
+        if pipeline is None or pipeline.candles_feed is not candles:
+            # The feed was replaced by one with more records
+            pipeline = CandlesFeaturePipeline(candles, pipeline.indicators if pipeline is not None else ())
+            self.feature_pipelines[key] = pipeline
+        for indicator in indicators:
+            pipeline.add_indicator(indicator)
+        pipeline.update()
+        return pipeline
+
     def get_trading_pairs(self, connector_name: str):
         """
         Retrieves the trading pairs from the specified connector.
@@ -154,6 +190,32 @@ class MarketDataProvider:
         order_book = self.get_order_book(connector_name, trading_pair)
         return order_book.get_price_for_volume(is_buy, volume)
 
+    def get_order_book_imbalance(self, connector_name: str, trading_pair: str, depth_bps: float = 0) -> float:
+        """
+        Gets the imbalance between the bid and ask amounts of the order book, from -1 (asks only) to 1 (bids only).
+
+        :param connector_name: The name of the connector.
+        :param trading_pair: The trading pair for which to retrieve the data.
+        :param depth_bps: The distance to the mid price, in basis points, of the entries included (0 for the top of
+        book). The order book tracks the depth of the recently requested bands as its diffs are applied.
+        :return: The imbalance, NaN if the order book is empty.
+        """
+        order_book = self.get_order_book(connector_name, trading_pair)
+        return order_book.get_depth_imbalance(depth_bps)
+
+    def get_cumulative_depth(self, connector_name: str, trading_pair: str, depth_bps: float, is_buy: bool) -> float:
+        """
+        Gets the amount available on the order book within a distance of the mid price.
+
+        :param connector_name: The name of the connector.
+        :param trading_pair: The trading pair for which to retrieve the data.
+        :param depth_bps: The distance to the mid price, in basis points.
+        :param is_buy: True if buying (amount of the asks), False if selling (amount of the bids).
+        :return: The cumulative amount in base asset.
+        """
+        order_book = self.get_order_book(connector_name, trading_pair)
+        return order_book.get_cumulative_depth(is_buy, depth_bps)
+
     def get_order_book_snapshot(self, connector_name, trading_pair) -> Tuple[pd.DataFrame, pd.DataFrame]:
         """
         Retrieves the order book snapshot for a trading pair from the specified connector, as a tuple of bid and ask in
@@ -0,0 +1,221 @@
+import atexit
+import copy
+import logging
+import queue
+import threading
+import time
+from collections import defaultdict
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from hummingbot.logger import HummingbotLogger
+
+DEFAULT_MAX_SIZE = 10000
+DEFAULT_SAMPLING_LEVEL = "DEBUG"
+DEFAULT_SAMPLING_THRESHOLD = 0.5
+DEFAULT_SAMPLING_RATE = 10
+DEFAULT_DROP_REPORT_INTERVAL = 60.0
+STOP_TIMEOUT = 5.0
+
+
+class LogQueue:
+    """
+    Bounded queue of log records, passed to their handlers by a background thread so that formatting and I/O do not
+    happen on the event loop thread.
+
+    Logging never blocks: when the queue is filled beyond `sampling_threshold`, only one in `sampling_rate` records
+    at or below `sampling_level` is kept, and any record is dropped when the queue is full. The dropped records are
+    counted by level, and reported with a warning at most every `drop_report_interval` seconds.
+    """
+    _logger: Optional[HummingbotLogger] = None
+
+    @classmethod
+    def logger(cls) -> HummingbotLogger:
+        if cls._logger is None:
+            cls._logger = logging.getLogger(__name__)
+        return cls._logger
+
+    def __init__(self,
+                 max_size: int = DEFAULT_MAX_SIZE,
+                 sampling_level: int = logging.DEBUG,
+                 sampling_threshold: float = DEFAULT_SAMPLING_THRESHOLD,
+                 sampling_rate: int = DEFAULT_SAMPLING_RATE,
+                 drop_report_interval: float = DEFAULT_DROP_REPORT_INTERVAL):
+        if max_size <= 0:
+            raise ValueError("The log queue max_size must be positive.")
+        if not 0 <= sampling_threshold <= 1:
+            raise ValueError("The log queue sampling_threshold must be between 0 and 1.")
+        if sampling_rate < 1:
+            raise ValueError("The log queue sampling_rate must be at least 1.")
+        # SimpleQueue is much faster to put to than Queue, the size is bounded in `put()`
+        self._queue: queue.SimpleQueue = queue.SimpleQueue()
+        self._max_size = max_size
+        self._sampling_level = sampling_level
+        self._sampling_size = int(max_size * sampling_threshold)
+        self._sampling_rate = sampling_rate
+        self._drop_report_interval = drop_report_interval
+        self._sampled_records_count = 0
+        self._dropped_records: Dict[str, int] = defaultdict(int)
+        self._reported_dropped_count = 0
+        self._last_drop_report_time = 0.0
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def dropped_records(self) -> Dict[str, int]:
+        return dict(self._dropped_records)
+
+    @property
+    def dropped_count(self) -> int:
+        return sum(self._dropped_records.values())
+
+    @property
+    def size(self) -> int:
+        return self._queue.qsize()
+
+    @property
+    def is_running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self):
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._process_records, name="LogQueue", daemon=True)
+            self._thread.start()
+
+    def stop(self):
+        """
+        Processes the records left in the queue, then stops the background thread.
+        """
+        if self._thread is not None:
+            self._queue.put(None)
+            self._thread.join(STOP_TIMEOUT)
+            self._thread = None
+
+    def put(self, record: logging.LogRecord, handlers: Tuple[logging.Handler, ...]) -> bool:
+        """
+        Queues the record for the handlers, unless the record is sampled out or the queue is full.
+
+        :return: True if the record is queued
+        """
+        size = self._queue.qsize()
+        if size >= self._max_size:
+            self._dropped_records[record.levelname] += 1
+            return False
+        if record.levelno <= self._sampling_level and size >= self._sampling_size:
+            self._sampled_records_count += 1
+            if self._sampled_records_count % self._sampling_rate != 0:
+                self._dropped_records[record.levelname] += 1
+                return False
+        self._queue.put((record, handlers))
+        return True
+
+    def _process_records(self):
+        while True:
+            item = self._queue.get()
+            if item is None:
+                break
+            record, handlers = item
+            for handler in handlers:
+                if record.levelno >= handler.level:
+                    try:
+                        handler.handle(record)
+                    except Exception:
+                        handler.handleError(record)
+            self._report_dropped_records()
+
+    def _report_dropped_records(self):
+        dropped_count = self.dropped_count
+        now = time.monotonic()
+        if (dropped_count > self._reported_dropped_count
+                and now - self._last_drop_report_time >= self._drop_report_interval):
+            self._last_drop_report_time = now
+            self.logger().warning(
+                f"{dropped_count - self._reported_dropped_count} log records were dropped by the log queue "
+                f"({', '.join(f'{level}: {count}' for level, count in sorted(self._dropped_records.items()))} "
+                f"in total)."
+            )
+            self._reported_dropped_count = dropped_count
+
+
+class LogQueueHandler(logging.Handler):
+    """
+    Replaces the handlers of a logger, and sends the records to them through the log queue.
+    """
+
+    def __init__(self, log_queue: LogQueue, handlers: Tuple[logging.Handler, ...]):
+        super().__init__(level=min(handler.level for handler in handlers))
+        self._log_queue = log_queue
+        self._handlers = handlers
+
+    @property
+    def handlers(self) -> Tuple[logging.Handler, ...]:
+        return self._handlers
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # The message arguments are merged now, since they could be modified before the record is handled. The
+        # formatting of the record (time, exception traceback) is left to the handlers.
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        return record
+
+    def emit(self, record: logging.LogRecord):
+        try:
+            self._log_queue.put(self.prepare(record), self._handlers)
+        except Exception:
+            self.handleError(record)
+
+
+_log_queue: Optional[LogQueue] = None
+
+
+def get_log_queue() -> Optional[LogQueue]:
+    return _log_queue
+
+
+def start_log_queue(queue_config: Dict[str, Any], logger_names: Iterable[str]) -> LogQueue:
+    """
+    Starts the log queue configured in the `queue` section of the logging configuration file, and moves the handlers
+    of the root logger and of the loggers named to it.
+    """
+    global _log_queue
+    stop_log_queue()
+
+    sampling_level = logging.getLevelName(str(queue_config.get("sampling_level", DEFAULT_SAMPLING_LEVEL)).upper())
+    if not isinstance(sampling_level, int):
+        raise ValueError(f"Invalid log queue sampling_level {queue_config.get('sampling_level')}.")
+    log_queue = LogQueue(
+        max_size=int(queue_config.get("max_size", DEFAULT_MAX_SIZE)),
+        sampling_level=sampling_level,
+        sampling_threshold=float(queue_config.get("sampling_threshold", DEFAULT_SAMPLING_THRESHOLD)),
+        sampling_rate=int(queue_config.get("sampling_rate", DEFAULT_SAMPLING_RATE)),
+        drop_report_interval=float(queue_config.get("drop_report_interval", DEFAULT_DROP_REPORT_INTERVAL)),
+    )
+
+    for logger in [logging.getLogger()] + [logging.getLogger(name) for name in logger_names]:
+        handlers: List[logging.Handler] = []
+        for handler in list(logger.handlers):
+            if isinstance(handler, LogQueueHandler):
+                # Left by a previous log queue
+                logger.removeHandler(handler)
+                handlers.extend(handler.handlers)
+            elif not isinstance(handler, logging.NullHandler):
+                logger.removeHandler(handler)
+                handlers.append(handler)
+        if len(handlers) > 0:
+            logger.addHandler(LogQueueHandler(log_queue, tuple(handlers)))
+
+    log_queue.start()
+    _log_queue = log_queue
+    return log_queue
+
+
+def stop_log_queue():
+    """
+    Passes the queued records to their handlers and stops the log queue, if started.
+    """
+    global _log_queue
+    if _log_queue is not None:
+        _log_queue.stop()
+        _log_queue = None
+
+
+atexit.register(stop_log_queue)
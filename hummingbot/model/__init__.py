@@ -8,6 +8,7 @@ def get_declarative_base():
     from .metadata import Metadata  # noqa: F401
     from .order import Order  # noqa: F401
     from .order_status import OrderStatus  # noqa: F401
+    from .performance_checkpoint import PerformanceCheckpoint  # noqa: F401
     from .range_position_collected_fees import RangePositionCollectedFees  # noqa: F401
     from .range_position_update import RangePositionUpdate  # noqa: F401
     from .trade_fill import TradeFill  # noqa: F401
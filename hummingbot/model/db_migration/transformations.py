@@ -3,6 +3,7 @@ from sqlalchemy import Column, Integer, Text
 from hummingbot.model.db_migration.base_transformation import DatabaseTransformation
 from hummingbot.model.decimal_type_decorator import SqliteDecimal
 from hummingbot.model.sql_connection_manager import SQLConnectionManager
+from hummingbot.model.trade_fill import TradeFill
 
 
 class AddExchangeOrderIdColumnToOrders(DatabaseTransformation):
@@ -149,3 +150,22 @@ class AddTradeFeeInQuote(DatabaseTransformation):
     @property
     def to_version(self):
         return 20230516
+
+
+class AddTradeFillConfigMarketSymbolTimestampIndex(DatabaseTransformation):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+
+    def apply(self, db_handle: SQLConnectionManager) -> SQLConnectionManager:
+        index = next(index for index in TradeFill.__table__.indexes
+                     if index.name == "tf_config_market_symbol_timestamp_index")
+        index.create(db_handle.engine, checkfirst=True)
+        return db_handle
+
+    @property
+    def name(self):
+        return "AddTradeFillConfigMarketSymbolTimestampIndex"
+
+    @property
+    def to_version(self):
+        return 20261019
@@ -9,6 +9,7 @@ class SqliteDecimal(TypeDecorator):
     stored in Sqlite database.
     """
     impl = BigInteger
+    cache_ok = True
 
     def __init__(self, scale):
         """
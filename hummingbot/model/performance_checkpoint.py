@@ -0,0 +1,22 @@
+from sqlalchemy import JSON, BigInteger, Column, Text
+
+from hummingbot.model import HummingbotBase
+
+
+class PerformanceCheckpoint(HummingbotBase):
+    """
+    The performance totals of the fills of a strategy config since `start_timestamp`, up to the fill `last_fill_id` (a
+    TradeFill rowid), so that the history report only has to process the fills recorded after it.
+    """
+    __tablename__ = "PerformanceCheckpoint"
+
+    config_file_path = Column(Text, primary_key=True, nullable=False)
+    config_fingerprint = Column(Text, nullable=False)
+    start_timestamp = Column(BigInteger, nullable=False)
+    last_fill_id = Column(BigInteger, nullable=False)
+    state = Column(JSON, nullable=False)
+
+    def __repr__(self) -> str:
+        return f"PerformanceCheckpoint(config_file_path='{self.config_file_path}', " \
+               f"config_fingerprint='{self.config_fingerprint}', start_timestamp={self.start_timestamp}, " \
+               f"last_fill_id={self.last_fill_id})"
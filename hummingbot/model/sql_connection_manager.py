@@ -1,9 +1,9 @@
 import logging
 from enum import Enum
 from os.path import join
-from typing import TYPE_CHECKING, Optional
+from typing import TYPE_CHECKING, Any, Dict, Optional
 
-from sqlalchemy import MetaData, create_engine, inspect
+from sqlalchemy import MetaData, create_engine, event, inspect
 from sqlalchemy.engine.base import Engine
 from sqlalchemy.orm import Query, Session, sessionmaker
 from sqlalchemy.schema import DropConstraint, ForeignKeyConstraint, Table
@@ -12,6 +12,7 @@ from hummingbot import data_path
 from hummingbot.logger.logger import HummingbotLogger
 from hummingbot.model import get_declarative_base
 from hummingbot.model.metadata import Metadata as LocalMetadata
+from hummingbot.model.trade_fill_aggregates import DecimalProductSum
 from hummingbot.model.transaction_base import TransactionBase
 
 if TYPE_CHECKING:
@@ -27,7 +28,7 @@ class SQLConnectionManager(TransactionBase):
     _scm_trade_fills_instance: Optional["SQLConnectionManager"] = None
 
     LOCAL_DB_VERSION_KEY = "local_db_version"
-    LOCAL_DB_VERSION_VALUE = "20230516"
+    LOCAL_DB_VERSION_VALUE = "20261019"
 
     @classmethod
     def logger(cls) -> HummingbotLogger:
@@ -72,7 +73,11 @@ class SQLConnectionManager(TransactionBase):
         self.db_path = db_path
 
         if connection_type is SQLConnectionType.TRADE_FILLS:
-            self._engine: Engine = create_engine(client_config_map.db_mode.get_url(self.db_path))
+            self._engine: Engine = create_engine(client_config_map.db_mode.get_url(self.db_path),
+                                                 **client_config_map.db_mode.get_engine_kwargs(self.db_path))
+            self._set_connection_pragmas(client_config_map.db_mode.get_connection_pragmas())
+            if self._engine.dialect.name == "sqlite":
+                event.listen(self._engine, "connect", DecimalProductSum.register)
             self._metadata: MetaData = self.get_declarative_base().metadata
             self._metadata.create_all(self._engine)
 
@@ -96,6 +101,18 @@ class SQLConnectionManager(TransactionBase):
         if connection_type is SQLConnectionType.TRADE_FILLS and (not called_from_migrator):
             self.check_and_migrate_db(client_config_map)
 
+    def _set_connection_pragmas(self, pragmas: Dict[str, Any]):
+        if len(pragmas) == 0:
+            return
+
+        def set_pragmas(dbapi_connection, connection_record):
+            cursor = dbapi_connection.cursor()
+            for name, value in pragmas.items():
+                cursor.execute(f"PRAGMA {name}={value}")
+            cursor.close()
+
+        event.listen(self._engine, "connect", set_pragmas)
+
     @property
     def engine(self) -> Engine:
         return self._engine
@@ -1,10 +1,10 @@
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterator, List, Optional
 
 import numpy
 import pandas as pd
 from sqlalchemy import JSON, BigInteger, Column, ForeignKey, Index, Integer, Text
-from sqlalchemy.orm import Session, relationship
+from sqlalchemy.orm import Query, Session, relationship
 
 from hummingbot.core.event.events import PositionAction
 from hummingbot.model import HummingbotBase
@@ -20,7 +20,9 @@ class TradeFill(HummingbotBase):
                       Index("tf_market_base_asset_timestamp_index",
                             "market", "base_asset", "timestamp"),
                       Index("tf_market_quote_asset_timestamp_index",
-                            "market", "quote_asset", "timestamp")
+                            "market", "quote_asset", "timestamp"),
+                      Index("tf_config_market_symbol_timestamp_index",
+                            "config_file_path", "market", "symbol", "timestamp")
                       )
 
     config_file_path = Column(Text, nullable=False)
@@ -62,6 +64,46 @@ class TradeFill(HummingbotBase):
                    start_time: int = None,
                    end_time: int = None,
                    ) -> Optional[List["TradeFill"]]:
+        trades: Optional[List[TradeFill]] = TradeFill._trades_query(
+            sql_session, strategy, market, trading_pair, base_asset, quote_asset, trade_type, order_type, start_time,
+            end_time
+        ).all()
+        return trades
+
+    @staticmethod
+    def stream_trades(sql_session: Session,
+                      strategy: str = None,
+                      market: str = None,
+                      trading_pair: str = None,
+                      base_asset: str = None,
+                      quote_asset: str = None,
+                      trade_type: str = None,
+                      order_type: str = None,
+                      start_time: int = None,
+                      end_time: int = None,
+                      batch_size: int = 1000,
+                      ) -> Iterator["TradeFill"]:
+        """
+        Same as `get_trades`, but the rows are fetched from the database in batches of `batch_size` while they are
+        iterated, instead of loading all of them in memory at once.
+        """
+        return iter(TradeFill._trades_query(
+            sql_session, strategy, market, trading_pair, base_asset, quote_asset, trade_type, order_type, start_time,
+            end_time
+        ).yield_per(batch_size))
+
+    @staticmethod
+    def _trades_query(sql_session: Session,
+                      strategy: Optional[str],
+                      market: Optional[str],
+                      trading_pair: Optional[str],
+                      base_asset: Optional[str],
+                      quote_asset: Optional[str],
+                      trade_type: Optional[str],
+                      order_type: Optional[str],
+                      start_time: Optional[int],
+                      end_time: Optional[int],
+                      ) -> Query:
         filters = []
         if strategy is not None:
             filters.append(TradeFill.strategy == strategy)
@@ -82,12 +124,10 @@ class TradeFill(HummingbotBase):
         if end_time is not None:
             filters.append(TradeFill.timestamp <= end_time)
 
-        trades: Optional[List[TradeFill]] = (sql_session
-                                             .query(TradeFill)
-                                             .filter(*filters)
-                                             .order_by(TradeFill.timestamp.asc())
-                                             .all())
-        return trades
+        return (sql_session
+                .query(TradeFill)
+                .filter(*filters)
+                .order_by(TradeFill.timestamp.asc()))
 
     @classmethod
     def to_pandas(cls, trades: List):
@@ -0,0 +1,340 @@
+from dataclasses import dataclass, field
+from decimal import Context, Decimal
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Union
+
+from sqlalchemy import BigInteger, Numeric, case, cast, func, literal_column, type_coerce
+from sqlalchemy.orm import Query, Session
+from sqlalchemy.sql.elements import ColumnElement
+
+from hummingbot.core.data_type.common import PositionAction, TradeType
+from hummingbot.core.data_type.trade_fee import DeductedFromReturnsTradeFee
+from hummingbot.model.trade_fill import TradeFill
+
+s_decimal_0 = Decimal("0")
+
+# The SQLite rowid of the fills, which increases in insertion order. TradeFill has no autoincrement id, the rowid
+# identifies the fills recorded since a previous aggregation, including the ones recorded late with older timestamps.
+TRADE_FILL_ROW_ID = literal_column('"TradeFill".rowid')
+
+
+class DecimalProductSum:
+    """
+    SQLite aggregate function (`decimal_product_sum`) summing the products of its arguments with Decimal precision,
+    as SQLite only has integers, which overflow, and floats. The arguments are integers or decimal strings, the rows
+    with a NULL argument are ignored and the sum is returned as a string.
+    """
+    name = "decimal_product_sum"
+    context = Context(prec=100)
+
+    def __init__(self):
+        self._total = s_decimal_0
+
+    def step(self, *factors: Union[int, str, None]):
+        if any(factor is None for factor in factors):
+            return
+        product = Decimal(1)
+        for factor in factors:
+            product = self.context.multiply(product, Decimal(factor))
+        self._total = self.context.add(self._total, product)
+
+    def finalize(self) -> str:
+        return str(self._total)
+
+    @classmethod
+    def register(cls, dbapi_connection, connection_record):
+        dbapi_connection.create_aggregate(cls.name, -1, cls)
+
+
+@dataclass
+class TradeSideSummary:
+    """
+    Totals of the fills of one side (buy or sell) of a market, computed by the database.
+    """
+    count: int = 0
+    base_volume: Decimal = s_decimal_0
+    quote_volume: Decimal = s_decimal_0
+    nil_position_count: int = 0
+    percent_fee_count: int = 0
+    percent_fee_volume: Decimal = s_decimal_0
+    deducted_fee_volume: Decimal = s_decimal_0
+
+    @property
+    def are_derivatives(self) -> bool:
+        return self.count > 0 and self.nil_position_count == 0
+
+    def merge(self, other: "TradeSideSummary"):
+        self.count += other.count
+        self.base_volume += other.base_volume
+        self.quote_volume += other.quote_volume
+        self.nil_position_count += other.nil_position_count
+        self.percent_fee_count += other.percent_fee_count
+        self.percent_fee_volume += other.percent_fee_volume
+        self.deducted_fee_volume += other.deducted_fee_volume
+
+    def subtract(self, other: "TradeSideSummary"):
+        self.count -= other.count
+        self.base_volume -= other.base_volume
+        self.quote_volume -= other.quote_volume
+        self.nil_position_count -= other.nil_position_count
+        self.percent_fee_count -= other.percent_fee_count
+        self.percent_fee_volume -= other.percent_fee_volume
+        self.deducted_fee_volume -= other.deducted_fee_volume
+
+    def to_json(self) -> Dict[str, Any]:
+        return {name: str(value) if isinstance(value, Decimal) else value for name, value in self.__dict__.items()}
+
+    @classmethod
+    def from_json(cls, data: Dict[str, Any]) -> "TradeSideSummary":
+        return TradeSideSummary(**{name: Decimal(value) if isinstance(value, str) else value
+                                   for name, value in data.items()})
+
+
+@dataclass
+class MarketTradesSummary:
+    """
+    Totals of the fills of one (market, trading pair), with everything `PerformanceMetrics` needs except the
+    pairing of derivative positions, which requires the individual fills.
+    """
+    market: str
+    symbol: str
+    buys: TradeSideSummary = field(default_factory=TradeSideSummary)
+    sells: TradeSideSummary = field(default_factory=TradeSideSummary)
+    first_timestamp: int = 0
+    first_price: Decimal = s_decimal_0
+    last_timestamp: int = 0
+    last_price: Decimal = s_decimal_0
+    flat_fees: Dict[str, Decimal] = field(default_factory=dict)
+
+    @property
+    def num_trades(self) -> int:
+        return self.buys.count + self.sells.count
+
+    @property
+    def are_derivatives(self) -> bool:
+        return self.buys.are_derivatives or self.sells.are_derivatives
+
+    def merge(self, other: "MarketTradesSummary"):
+        """
+        Adds the totals of `other`, the summary of fills recorded after the fills of this summary.
+        """
+        if other.num_trades > 0:
+            if self.num_trades == 0 or other.first_timestamp < self.first_timestamp:
+                self.first_timestamp, self.first_price = other.first_timestamp, other.first_price
+            if self.num_trades == 0 or other.last_timestamp >= self.last_timestamp:
+                self.last_timestamp, self.last_price = other.last_timestamp, other.last_price
+        self.buys.merge(other.buys)
+        self.sells.merge(other.sells)
+        for token, amount in other.flat_fees.items():
+            self.flat_fees[token] = self.flat_fees.get(token, s_decimal_0) + amount
+
+    def subtract(self, other: "MarketTradesSummary"):
+        """
+        Removes the totals of `other`, the summary of a part of the fills of this summary. The first and last prices
+        are not updated, they have to be queried again if the fills of `other` included them.
+        """
+        self.buys.subtract(other.buys)
+        self.sells.subtract(other.sells)
+        for token, amount in other.flat_fees.items():
+            remaining_amount = self.flat_fees.get(token, s_decimal_0) - amount
+            if remaining_amount == s_decimal_0:
+                self.flat_fees.pop(token, None)
+            else:
+                self.flat_fees[token] = remaining_amount
+
+    def to_json(self) -> Dict[str, Any]:
+        return {
+            "market": self.market,
+            "symbol": self.symbol,
+            "buys": self.buys.to_json(),
+            "sells": self.sells.to_json(),
+            "first_timestamp": self.first_timestamp,
+            "first_price": str(self.first_price),
+            "last_timestamp": self.last_timestamp,
+            "last_price": str(self.last_price),
+            "flat_fees": {token: str(amount) for token, amount in self.flat_fees.items()},
+        }
+
+    @classmethod
+    def from_json(cls, data: Dict[str, Any]) -> "MarketTradesSummary":
+        return MarketTradesSummary(
+            market=data["market"],
+            symbol=data["symbol"],
+            buys=TradeSideSummary.from_json(data["buys"]),
+            sells=TradeSideSummary.from_json(data["sells"]),
+            first_timestamp=data["first_timestamp"],
+            first_price=Decimal(data["first_price"]),
+            last_timestamp=data["last_timestamp"],
+            last_price=Decimal(data["last_price"]),
+            flat_fees={token: Decimal(amount) for token, amount in data["flat_fees"].items()},
+        )
+
+
+class TradeFillAggregates:
+    """
+    Computes the per market totals of the trade fills of a strategy config in the database (counts, volumes and fees)
+    so that the history report does not have to load every fill. The fills are only loaded, in batches, when the
+    per fill detail is required (flat fees and derivative positions pairing).
+
+    The config file path is matched with `LIKE` (as `_get_trades_from_session` does) only to resolve the stored config
+    file paths. All the other queries compare them with equality, to use the
+    (config_file_path, market, symbol, timestamp) index.
+
+    The fills can be limited to the ones before `end_timestamp` (excluded), and to the ones recorded after the fill
+    `after_fill_id` and up to the fill `until_fill_id` (included), to aggregate only the fills recorded since a
+    previous aggregation. The fill ids are SQLite rowids.
+    """
+
+    def __init__(self,
+                 sql_session: Session,
+                 start_timestamp: int,
+                 config_file_path: Optional[str] = None,
+                 batch_size: int = 1000,
+                 end_timestamp: Optional[int] = None,
+                 after_fill_id: Optional[int] = None,
+                 until_fill_id: Optional[int] = None):
+        self._session = sql_session
+        self._start_timestamp = start_timestamp
+        self._config_file_path = config_file_path
+        self._batch_size = batch_size
+        self._end_timestamp = end_timestamp
+        self._after_fill_id = after_fill_id
+        self._until_fill_id = until_fill_id
+        self._config_file_paths: Optional[List[str]] = None
+
+    def has_trades(self) -> bool:
+        return self._session.query(TradeFill.timestamp).filter(*self._filters()).first() is not None
+
+    def last_fill_id(self) -> Optional[int]:
+        """
+        Returns the id of the last recorded fill, or `None` if there are no fills.
+        """
+        return self._session.query(func.max(TRADE_FILL_ROW_ID)).filter(*self._filters()).scalar()
+
+    def market_summaries(self) -> List[MarketTradesSummary]:
+        summaries: Dict[Tuple[str, str], MarketTradesSummary] = {}
+        for row in self._side_totals_query():
+            (market, symbol, trade_type, count, base_volume, quote_volume, nil_position_count, percent_fee_count,
+             percent_fee_volume, deducted_fee_volume) = row
+            summary = summaries.get((market, symbol))
+            if summary is None:
+                summary = MarketTradesSummary(market=market, symbol=symbol)
+                summaries[(market, symbol)] = summary
+            if trade_type.upper() == TradeType.BUY.name:
+                side = summary.buys
+            elif trade_type.upper() == TradeType.SELL.name:
+                side = summary.sells
+            else:
+                continue
+            side.count += count
+            side.base_volume += self._from_scaled_int(base_volume)
+            side.quote_volume += self._from_scaled_product(quote_volume)
+            side.nil_position_count += nil_position_count or 0
+            side.percent_fee_count += percent_fee_count or 0
+            side.percent_fee_volume += self._from_scaled_product(percent_fee_volume)
+            side.deducted_fee_volume += self._from_scaled_product(deducted_fee_volume)
+
+        for summary in summaries.values():
+            summary.first_timestamp, summary.first_price = self.edge_fill(summary.market, summary.symbol, first=True)
+            summary.last_timestamp, summary.last_price = self.edge_fill(summary.market, summary.symbol, first=False)
+            summary.flat_fees = self._flat_fees(summary.market, summary.symbol)
+        return list(summaries.values())
+
+    def stream_trades(self, market: str, symbol: str) -> Iterator[TradeFill]:
+        """
+        Iterates the fills of a market in chronological order, loading them from the database in batches.
+        """
+        return iter(self._market_query(self._session.query(TradeFill), market, symbol)
+                    .order_by(TradeFill.timestamp.asc())
+                    .yield_per(self._batch_size))
+
+    def edge_fill(self, market: str, symbol: str, first: bool) -> Tuple[int, Decimal]:
+        """
+        Returns the timestamp and the price of the first (or last) fill of a market.
+        """
+        order = TradeFill.timestamp.asc() if first else TradeFill.timestamp.desc()
+        row = (self._market_query(self._session.query(TradeFill.timestamp, TradeFill.price), market, symbol)
+               .order_by(order)
+               .first())
+        return (row[0], Decimal(str(row[1]))) if row is not None else (0, s_decimal_0)
+
+    def _filters(self) -> list:
+        filters = [TradeFill.timestamp >= self._start_timestamp]
+        if self._end_timestamp is not None:
+            filters.append(TradeFill.timestamp < self._end_timestamp)
+        if self._config_file_path is not None:
+            filters.append(TradeFill.config_file_path.in_(self._matching_config_file_paths()))
+        if self._after_fill_id is not None:
+            filters.append(TRADE_FILL_ROW_ID > self._after_fill_id)
+        if self._until_fill_id is not None:
+            filters.append(TRADE_FILL_ROW_ID <= self._until_fill_id)
+        return filters
+
+    def _matching_config_file_paths(self) -> List[str]:
+        if self._config_file_paths is None:
+            self._config_file_paths = [
+                row[0] for row in (self._session
+                                   .query(TradeFill.config_file_path)
+                                   .filter(TradeFill.config_file_path.like(f"%{self._config_file_path}%"))
+                                   .distinct())
+            ]
+        return self._config_file_paths
+
+    def _market_query(self, query: Query, market: str, symbol: str) -> Query:
+        return query.filter(*self._filters(), TradeFill.market == market, TradeFill.symbol == symbol)
+
+    def _side_totals_query(self) -> Query:
+        # Prices and amounts are stored as integers (see SqliteDecimal)
+        amount = type_coerce(TradeFill.amount, BigInteger)
+        price = type_coerce(TradeFill.price, BigInteger)
+        percent_fee = TradeFill.trade_fee["percent"].as_string()
+        fee_type = TradeFill.trade_fee["fee_type"].as_string()
+        deducted_percent_fee = case(
+            (fee_type == DeductedFromReturnsTradeFee.type_descriptor_for_json(), percent_fee), else_=None)
+        return (self._session
+                .query(TradeFill.market,
+                       TradeFill.symbol,
+                       TradeFill.trade_type,
+                       func.count(),
+                       func.sum(amount),
+                       self._product_sum(amount, price),
+                       func.sum(case((TradeFill.position == PositionAction.NIL.value, 1), else_=0)),
+                       func.count(percent_fee),
+                       self._product_sum(amount, price, percent_fee),
+                       self._product_sum(amount, price, deducted_percent_fee))
+                .filter(*self._filters())
+                .group_by(TradeFill.market, TradeFill.symbol, TradeFill.trade_type))
+
+    def _flat_fees(self, market: str, symbol: str) -> Dict[str, Decimal]:
+        flat_fees: Dict[str, Decimal] = {}
+        query = (self._market_query(self._session.query(TradeFill.trade_fee), market, symbol)
+                 .filter(TradeFill.trade_fee[("flat_fees", 0)].as_string().isnot(None))
+                 .yield_per(self._batch_size))
+        for (trade_fee,) in query:
+            for flat_fee in trade_fee.get("flat_fees", []):
+                flat_fees[flat_fee["token"]] = flat_fees.get(flat_fee["token"], s_decimal_0) + Decimal(
+                    flat_fee["amount"])
+        return flat_fees
+
+    @staticmethod
+    def _from_scaled_int(value: Optional[int]) -> Decimal:
+        if value is None:
+            return s_decimal_0
+        return Decimal(value) / TradeFill.amount.type.multiplier_int
+
+    def _product_sum(self, *factors: ColumnElement) -> ColumnElement:
+        """
+        Sums the products of the factors without overflows or float rounding: with `DecimalProductSum` on SQLite
+        (registered by `SQLConnectionManager`), as NUMERIC on the other database engines.
+        """
+        if self._session.get_bind().dialect.name == "sqlite":
+            return getattr(func, DecimalProductSum.name)(*factors)
+        product = cast(factors[0], Numeric)
+        for factor in factors[1:]:
+            product = product * cast(factor, Numeric)
+        return func.sum(product)
+
+    @staticmethod
+    def _from_scaled_product(value: Union[str, Decimal, None]) -> Decimal:
+        if value is None:
+            return s_decimal_0
+        return Decimal(value) / (TradeFill.amount.type.multiplier_int * TradeFill.price.type.multiplier_int)
@@ -117,6 +117,18 @@ class HistoryCommandMessage(RPCMessage):
         trades: Optional[List[Any]] = []
 
 
+class MetricsCommandMessage(RPCMessage):
+    class Request(RPCMessage.Request):
+        enable: Optional[bool] = None
+        reset: Optional[bool] = False
+
+    class Response(RPCMessage.Response):
+        status: Optional[int] = MQTT_STATUS_CODE.SUCCESS
+        msg: Optional[str] = ''
+        enabled: Optional[bool] = False
+        metrics: Optional[List[Dict[str, Any]]] = []
+
+
 class BalanceLimitCommandMessage(RPCMessage):
     class Request(RPCMessage.Request):
         exchange: str
@@ -29,6 +29,7 @@ from hummingbot.core.event import events
 from hummingbot.core.event.event_forwarder import SourceInfoEventForwarder
 from hummingbot.core.pubsub import PubSub
 from hummingbot.core.utils.async_utils import call_sync, safe_ensure_future
+from hummingbot.core.utils.latency_metrics import LatencyMetricsRegistry
 from hummingbot.notifier.notifier_base import NotifierBase
 from hummingbot.remote_iface.messages import (
     MQTT_STATUS_CODE,
@@ -41,6 +42,7 @@ from hummingbot.remote_iface.messages import (
     ImportCommandMessage,
     InternalEventMessage,
     LogMessage,
+    MetricsCommandMessage,
     NotifyMessage,
     StartCommandMessage,
     StatusCommandMessage,
@@ -61,6 +63,7 @@ class CommandTopicSpecs:
     BALANCE_LIMIT: str = '/balance/limit'
     BALANCE_PAPER: str = '/balance/paper'
     COMMAND_SHORTCUT: str = '/command_shortcuts'
+    METRICS: str = '/metrics'
 
 
 class TopicSpecs:
@@ -100,6 +103,7 @@ class MQTTCommands:
         self._balance_limit_uri = f'{topic_prefix}{TopicSpecs.COMMANDS.BALANCE_LIMIT}'
         self._balance_paper_uri = f'{topic_prefix}{TopicSpecs.COMMANDS.BALANCE_PAPER}'
         self._shortcuts_uri = f'{topic_prefix}{TopicSpecs.COMMANDS.COMMAND_SHORTCUT}'
+        self._metrics_uri = f'{topic_prefix}{TopicSpecs.COMMANDS.METRICS}'
 
         self._init_commands()
 
@@ -149,6 +153,11 @@ class MQTTCommands:
             msg_type=CommandShortcutMessage,
             on_request=self._on_cmd_command_shortcut
         )
+        self._node.create_rpc(
+            rpc_name=self._metrics_uri,
+            msg_type=MetricsCommandMessage,
+            on_request=self._on_cmd_metrics
+        )
 
     def _on_cmd_start(self, msg: StartCommandMessage.Request):
         response = StartCommandMessage.Response()
@@ -359,6 +368,23 @@ class MQTTCommands:
             response.msg = str(e)
         return response
 
+    def _on_cmd_metrics(self, msg: MetricsCommandMessage.Request):
+        response = MetricsCommandMessage.Response()
+        try:
+            registry = LatencyMetricsRegistry.get_instance()
+            if msg.enable is True:
+                registry.enable()
+            elif msg.enable is False:
+                registry.disable()
+            response.enabled = registry.enabled
+            response.metrics = registry.snapshot()
+            if msg.reset:
+                registry.reset()
+        except Exception as e:
+            response.status = MQTT_STATUS_CODE.ERROR
+            response.msg = str(e)
+        return response
+
 
 class MQTTMarketEventForwarder:
     @classmethod
@@ -3,7 +3,7 @@ from __future__ import annotations
 import asyncio
 import importlib
 import inspect
-from typing import Callable, Dict, List, Set
+from typing import Any, Callable, Dict, List, Optional, Set
 
 from pydantic import Field, validator
 
@@ -11,6 +11,7 @@ from hummingbot.client.config.config_data_types import BaseClientModel, ClientFi
 from hummingbot.core.utils.async_utils import safe_ensure_future
 from hummingbot.data_feed.candles_feed.candles_factory import CandlesConfig
 from hummingbot.data_feed.market_data_provider import MarketDataProvider
+from hummingbot.smart_components.controllers.controller_worker_pool import ControllerWorkerPool, MarketDataSnapshot
 from hummingbot.smart_components.models.base import SmartComponentStatus
 from hummingbot.smart_components.models.executor_actions import ExecutorAction
 from hummingbot.smart_components.models.executors_info import ExecutorInfo
@@ -115,11 +116,13 @@ class ControllerBase(SmartComponentBase):
     Base class for controllers.
     """
     def __init__(self, config: ControllerConfigBase, market_data_provider: MarketDataProvider,
-                 actions_queue: asyncio.Queue, update_interval: float = 1.0):
+                 actions_queue: asyncio.Queue, update_interval: float = 1.0,
+                 worker_pool: Optional[ControllerWorkerPool] = None):
         super().__init__(update_interval=update_interval)
         self.config = config
         self.executors_info: List[ExecutorInfo] = []
         self.market_data_provider: MarketDataProvider = market_data_provider
+        self.worker_pool: Optional[ControllerWorkerPool] = worker_pool
         self.actions_queue: asyncio.Queue = actions_queue
         self.processed_data = {}
         self.executors_update_event = asyncio.Event()
@@ -152,7 +155,10 @@ class ControllerBase(SmartComponentBase):
 
     async def control_task(self):
         if self.market_data_provider.ready and self.executors_update_event.is_set():
-            await self.update_processed_data()
+            if self.worker_pool is not None and self.can_use_worker_pool:
+                await self.update_processed_data_in_worker_pool()
+            else:
+                await self.update_processed_data()
             executor_actions: List[ExecutorAction] = self.determine_executor_actions()
             if len(executor_actions) > 0:
                 self.logger().debug(f"Sending actions: {executor_actions}")
@@ -175,6 +181,31 @@ class ControllerBase(SmartComponentBase):
         """
         raise NotImplementedError
 
+    @classmethod
+    def compute_processed_data(cls, config: ControllerConfigBase, market_data: MarketDataProvider) -> Dict[str, Any]:
+        """
+        This method can be overridden by the derived classes to compute the processed data from the configuration and
+        the market data only, so that it can run in the controllers worker pool. The market data is a
+        MarketDataSnapshot when it runs in the pool, with the candles of the candles_config and the mid prices of
+        the markets of the controller.
+        """
+        raise NotImplementedError
+
+    @property
+    def can_use_worker_pool(self) -> bool:
+        return type(self).compute_processed_data.__func__ is not ControllerBase.compute_processed_data.__func__
+
+    def get_market_data_snapshot(self) -> MarketDataSnapshot:
+        return MarketDataSnapshot.take(self.market_data_provider, self.config.candles_config,
+                                       self.config.update_markets({}))
+
+    async def update_processed_data_in_worker_pool(self):
+        """
+        Computes the processed data in the worker pool, from a snapshot of the market data taken on the event loop.
+        """
+        self.processed_data = await self.worker_pool.run(
+            self.config.id, type(self).compute_processed_data, self.config, self.get_market_data_snapshot())
+
     def determine_executor_actions(self) -> List[ExecutorAction]:
         """
         This method should be overridden by the derived classes to implement the logic to determine the actions
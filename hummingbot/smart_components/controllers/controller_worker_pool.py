@@ -0,0 +1,193 @@
+import asyncio
+import logging
+import multiprocessing
+import time
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from decimal import Decimal
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import pandas as pd
+
+from hummingbot.core.data_type.common import PriceType
+from hummingbot.data_feed.candles_feed.candles_factory import CandlesConfig
+from hummingbot.data_feed.market_data_provider import MarketDataProvider
+from hummingbot.logger import HummingbotLogger
+
+WORKER_POOL_MODES = ("none", "thread", "process")
+
+
+class MarketDataSnapshot:
+    """
+    Copy of the candles and mid prices used by a controller, taken on the event loop so that the processed data can be
+    computed in a worker without reading the feeds while they are updated. It has the same `get_candles_df` and
+    `get_price_by_type` methods as the `MarketDataProvider`, and can be sent to a worker process.
+    """
+
+    def __init__(self,
+                 candles: Dict[Tuple[str, str, str], pd.DataFrame],
+                 prices: Dict[Tuple[str, str, PriceType], Decimal]):
+        self._candles = candles
+        self._prices = prices
+
+    @classmethod
+    def take(cls,
+             market_data_provider: MarketDataProvider,
+             candles_configs: List[CandlesConfig],
+             markets: Dict[str, set]) -> "MarketDataSnapshot":
+        candles = {}
+        for config in candles_configs:
+            candles_df = market_data_provider.get_candles_df(config.connector, config.trading_pair, config.interval,
+                                                             config.max_records)
+            candles[(config.connector, config.trading_pair, config.interval)] = candles_df.copy()
+        prices = {}
+        for connector_name, trading_pairs in markets.items():
+            if connector_name not in market_data_provider.connectors:
+                continue
+            for trading_pair in trading_pairs:
+                prices[(connector_name, trading_pair, PriceType.MidPrice)] = market_data_provider.get_price_by_type(
+                    connector_name, trading_pair, PriceType.MidPrice)
+        return cls(candles, prices)
+
+    def get_candles_df(self, connector_name: str, trading_pair: str, interval: str, max_records: int = 500):
+        candles_df = self._candles.get((connector_name, trading_pair, interval))
+        if candles_df is None:
+            raise KeyError(f"The candles {connector_name} {trading_pair} {interval} are not in the candles_config of "
+                           f"the controller.")
+        return candles_df.iloc[-max_records:]
+
+    def get_price_by_type(self, connector_name: str, trading_pair: str, price_type: PriceType):
+        price = self._prices.get((connector_name, trading_pair, price_type))
+        if price is None:
+            raise KeyError(f"The {price_type.name} of {trading_pair} on {connector_name} is not in the market data "
+                           f"snapshot (only the mid prices of the controller markets are).")
+        return price
+
+
+class ControllerWorkerMetrics:
+    """
+    Queue wait (from the submission to the start of the computation in the worker) and compute time of the processed
+    data updates of a controller, in seconds.
+    """
+
+    def __init__(self):
+        self.runs_count = 0
+        self.timeouts_count = 0
+        self.errors_count = 0
+        self.last_queue_wait = 0.0
+        self.total_queue_wait = 0.0
+        self.max_queue_wait = 0.0
+        self.last_compute_time = 0.0
+        self.total_compute_time = 0.0
+        self.max_compute_time = 0.0
+
+    @property
+    def average_queue_wait(self) -> float:
+        return self.total_queue_wait / self.runs_count if self.runs_count > 0 else 0.0
+
+    @property
+    def average_compute_time(self) -> float:
+        return self.total_compute_time / self.runs_count if self.runs_count > 0 else 0.0
+
+    def add_run(self, queue_wait: float, compute_time: float):
+        self.runs_count += 1
+        self.last_queue_wait = queue_wait
+        self.total_queue_wait += queue_wait
+        self.max_queue_wait = max(self.max_queue_wait, queue_wait)
+        self.last_compute_time = compute_time
+        self.total_compute_time += compute_time
+        self.max_compute_time = max(self.max_compute_time, compute_time)
+
+    def format_status(self) -> str:
+        return (f"Worker pool: {self.runs_count} updates | "
+                f"Queue wait (ms): avg {self.average_queue_wait * 1e3:.1f} max {self.max_queue_wait * 1e3:.1f} | "
+                f"Compute (ms): avg {self.average_compute_time * 1e3:.1f} max {self.max_compute_time * 1e3:.1f} | "
+                f"Timeouts: {self.timeouts_count} | Errors: {self.errors_count}")
+
+
+def _timed_call(func: Callable, args: Tuple) -> Tuple[Any, float, float]:
+    # Runs in the worker, the wall clock is used to compare the times of different processes
+    start_time = time.time()
+    result = func(*args)
+    return result, start_time, time.time() - start_time
+
+
+class ControllerWorkerPool:
+    """
+    Runs the computation of the processed data of the controllers in a thread or process pool, so that it does not
+    block the event loop. At most `max_workers` computations are submitted at the same time, the others wait for
+    their turn on the event loop, and a computation taking more than `timeout` seconds is abandoned (the worker
+    keeps running it, but its result is dropped).
+
+    In process mode, the function, its arguments and its result must be picklable, and the worker processes import
+    the controller modules when they run them for the first time.
+    """
+    _logger: Optional[HummingbotLogger] = None
+
+    @classmethod
+    def logger(cls) -> HummingbotLogger:
+        if cls._logger is None:
+            cls._logger = logging.getLogger(__name__)
+        return cls._logger
+
+    def __init__(self, mode: str = "thread", max_workers: int = 2, timeout: float = 10.0):
+        if mode not in ("thread", "process"):
+            raise ValueError(f"Invalid controller worker pool mode {mode}, expected thread or process.")
+        if max_workers < 1:
+            raise ValueError("The controller worker pool needs at least one worker.")
+        self._mode = mode
+        self._max_workers = max_workers
+        self._timeout = timeout
+        self._executor: Optional[Executor] = None
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._metrics: Dict[str, ControllerWorkerMetrics] = {}
+
+    @property
+    def mode(self) -> str:
+        return self._mode
+
+    @property
+    def metrics(self) -> Dict[str, ControllerWorkerMetrics]:
+        return self._metrics
+
+    def get_metrics(self, controller_id: str) -> ControllerWorkerMetrics:
+        if controller_id not in self._metrics:
+            self._metrics[controller_id] = ControllerWorkerMetrics()
+        return self._metrics[controller_id]
+
+    def _get_executor(self) -> Executor:
+        if self._executor is None:
+            if self._mode == "process":
+                # Forking would copy the threads and the sockets of the client
+                self._executor = ProcessPoolExecutor(max_workers=self._max_workers,
+                                                     mp_context=multiprocessing.get_context("spawn"))
+            else:
+                self._executor = ThreadPoolExecutor(max_workers=self._max_workers,
+                                                    thread_name_prefix="ControllerWorker")
+        return self._executor
+
+    async def run(self, controller_id: str, func: Callable, *args) -> Any:
+        """
+        Runs `func(*args)` in the pool and returns its result.
+        :raises asyncio.TimeoutError: if the computation takes more than the pool timeout
+        """
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self._max_workers)
+        metrics = self.get_metrics(controller_id)
+        submit_time = time.time()
+        async with self._semaphore:
+            future = asyncio.get_running_loop().run_in_executor(self._get_executor(), _timed_call, func, args)
+            try:
+                result, start_time, compute_time = await asyncio.wait_for(future, timeout=self._timeout)
+            except asyncio.TimeoutError:
+                metrics.timeouts_count += 1
+                raise
+            except Exception:
+                metrics.errors_count += 1
+                raise
+        metrics.add_run(queue_wait=max(start_time - submit_time, 0.0), compute_time=compute_time)
+        return result
+
+    def shutdown(self):
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
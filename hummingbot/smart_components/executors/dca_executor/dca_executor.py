@@ -399,10 +399,12 @@ class DCAExecutor(ExecutorBase):
             self._close_orders.append(TrackedOrder(order_id=order_id))
 
     def cancel_open_orders(self):
-        for tracked_order in self._open_orders:
-            if tracked_order.order and tracked_order.order.is_open:
-                self._strategy.cancel(connector_name=self.config.connector_name, trading_pair=self.config.trading_pair,
-                                      order_id=tracked_order.order_id)
+        order_ids = [tracked_order.order_id for tracked_order in self._open_orders
+                     if tracked_order.order and tracked_order.order.is_open]
+        if order_ids:
+            self._strategy.batch_cancel(connector_name=self.config.connector_name,
+                                        trading_pair=self.config.trading_pair,
+                                        order_ids=order_ids)
 
     def _is_within_activation_bounds(self, order_price: Decimal, close_price: Decimal) -> bool:
         """
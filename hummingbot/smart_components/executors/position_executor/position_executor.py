@@ -443,8 +443,10 @@ class PositionExecutor(ExecutorBase):
             if self.config.triple_barrier_config.take_profit_order_type.is_limit_type():
                 if not self._take_profit_limit_order:
                     self.place_take_profit_limit_order()
-                elif self._take_profit_limit_order.order and not math.isclose(self._take_profit_limit_order.order.amount,
-                                                                              self._open_order.executed_amount_base):
+                elif (self._take_profit_limit_order.order
+                      and not self._take_profit_limit_order.order.is_pending_amend
+                      and not math.isclose(self._take_profit_limit_order.order.amount,
+                                           self._open_order.executed_amount_base)):
                     self.renew_take_profit_order()
             elif self.net_pnl_pct >= self.config.triple_barrier_config.take_profit:
                 self.place_close_order_and_cancel_open_orders(close_type=CloseType.TAKE_PROFIT)
@@ -479,12 +481,24 @@ class PositionExecutor(ExecutorBase):
 
     def renew_take_profit_order(self):
         """
-        This method is responsible for renewing the take profit order.
+        This method is responsible for renewing the take profit order. The order is amended to the open filled amount,
+        in place if the exchange supports it. If the order is no longer active, it is canceled and placed again.
 
         :return: None
         """
-        self.cancel_take_profit()
-        self.place_take_profit_limit_order()
+        order_id = self._strategy.amend(
+            connector_name=self.config.connector_name,
+            trading_pair=self.config.trading_pair,
+            order_id=self._take_profit_limit_order.order_id,
+            price=self.take_profit_price,
+            amount=self.open_filled_amount,
+            order_type=self.config.triple_barrier_config.take_profit_order_type,
+        )
+        if order_id is None:
+            self.cancel_take_profit()
+            self.place_take_profit_limit_order()
+        elif order_id != self._take_profit_limit_order.order_id:
+            self._take_profit_limit_order = TrackedOrder(order_id=order_id)
         self.logger().debug("Renewing take profit order")
 
     def cancel_take_profit(self):
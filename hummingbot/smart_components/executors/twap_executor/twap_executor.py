@@ -209,9 +209,10 @@ class TWAPExecutor(ExecutorBase):
             await asyncio.sleep(5)
 
     def cancel_open_orders(self):
-        for order in self._order_plan.values():
-            if order and order.order and order.order.is_open:
-                self._strategy.cancel(self.config.connector_name, self.config.trading_pair, order.order_id)
+        order_ids = [order.order_id for order in self._order_plan.values()
+                     if order and order.order and order.order.is_open]
+        if order_ids:
+            self._strategy.batch_cancel(self.config.connector_name, self.config.trading_pair, order_ids)
 
     def early_stop(self):
         self.close_execution_by(CloseType.EARLY_STOP)
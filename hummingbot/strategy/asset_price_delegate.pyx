@@ -13,6 +13,12 @@ cdef class AssetPriceDelegate:
     def get_price_by_type(self, price_type: PriceType) -> Decimal:
         raise NotImplementedError
 
+    def get_order_book_imbalance(self, depth_bps: Decimal = Decimal("0")) -> Decimal:
+        raise NotImplementedError
+
+    def get_cumulative_depth(self, depth_bps: Decimal, is_buy: bool) -> Decimal:
+        raise NotImplementedError
+
     cdef object c_get_mid_price(self):
         raise NotImplementedError
 
@@ -32,6 +32,7 @@ from hummingbot.strategy.avellaneda_market_making.avellaneda_market_making_confi
     MultiOrderLevelModel,
     TrackHangingOrdersModel,
 )
+from hummingbot.strategy.batch_proposal import BatchProposalEngine
 from hummingbot.strategy.conditional_execution_state import (
     RunAlwaysExecutionState,
     RunInTimeConditionalExecutionState
@@ -843,8 +844,11 @@ cdef class AvellanedaMarketMakingStrategy(StrategyBase):
     def is_algorithm_changed(self) -> bool:
         return self.c_is_algorithm_changed()
 
+    def _get_level_step(self):
+        return ((self._optimal_spread / 2) / 100) * self.level_distances
+
     def _get_level_spreads(self):
-        level_step = ((self._optimal_spread / 2) / 100) * self.level_distances
+        level_step = self._get_level_step()
 
         bid_level_spreads = [i * level_step for i in range(self.order_levels)]
         ask_level_spreads = [i * level_step for i in range(self.order_levels)]
@@ -880,8 +884,11 @@ cdef class AvellanedaMarketMakingStrategy(StrategyBase):
             ExchangeBase market = self._market_info.market
             list buys = []
             list sells = []
-        bid_level_spreads, ask_level_spreads = self._get_level_spreads()
         size = market.c_quantize_order_amount(self.trading_pair, self._config_map.order_amount)
+        engine = BatchProposalEngine.for_market(market, self.trading_pair, self._optimal_bid, size)
+        if size > 0 and engine is not None:
+            return self.create_order_levels_in_batch(engine, size)
+        bid_level_spreads, ask_level_spreads = self._get_level_spreads()
         if size > 0:
             for level in range(self.order_levels):
                 bid_price = market.c_quantize_order_price(self.trading_pair,
@@ -896,6 +903,19 @@ cdef class AvellanedaMarketMakingStrategy(StrategyBase):
     def create_proposal_based_on_order_levels(self):
         return self._create_proposal_based_on_order_levels()
 
+    def create_order_levels_in_batch(self, engine: BatchProposalEngine, size: Decimal):
+        """
+        Computes the order levels with the batch proposal engine, with the same prices as the level by level
+        computation of _create_proposal_based_on_order_levels.
+        """
+        level_step = self._get_level_step()
+        size_ticks = engine.linear_levels(size, Decimal("0"), self.order_levels, engine.size_quantum)
+        bid_price_ticks = engine.linear_levels(self._optimal_bid, -level_step, self.order_levels, engine.price_quantum)
+        ask_price_ticks = engine.linear_levels(self._optimal_ask, level_step, self.order_levels, engine.price_quantum)
+        buys = [PriceSize(price, size) for price, size in engine.to_decimal_levels(bid_price_ticks, size_ticks)]
+        sells = [PriceSize(price, size) for price, size in engine.to_decimal_levels(ask_price_ticks, size_ticks)]
+        return buys, sells
+
     cdef _create_basic_proposal(self):
         cdef:
             ExchangeBase market = self._market_info.market
@@ -989,6 +1009,12 @@ cdef class AvellanedaMarketMakingStrategy(StrategyBase):
 
         base_balance, quote_balance = self.adjusted_available_balance_for_orders_budget_constrain()
 
+        engine = BatchProposalEngine.for_market(market, self.trading_pair, self.get_price(),
+                                                self._config_map.order_amount)
+        if engine is not None:
+            self.apply_budget_constraint_in_batch(engine, proposal, base_balance, quote_balance)
+            return
+
         for buy in proposal.buys:
             buy_fee = market.c_get_fee(self.base_asset, self.quote_asset, OrderType.LIMIT, TradeType.BUY,
                                        buy.size, buy.price)
@@ -1025,6 +1051,23 @@ cdef class AvellanedaMarketMakingStrategy(StrategyBase):
     def apply_budget_constraint(self, proposal: Proposal):
         return self.c_apply_budget_constraint(proposal)
 
+    def apply_budget_constraint_in_batch(self, engine: BatchProposalEngine, proposal: Proposal,
+                                         base_balance: Decimal, quote_balance: Decimal):
+        if len(proposal.buys) > 0:
+            buy_fee_percent = engine.fee_percent(self._market_info.market, self.base_asset, self.quote_asset,
+                                                 TradeType.BUY, proposal.buys[0].price, proposal.buys[0].size)
+            sizes = engine.fit_buy_budget([buy.price for buy in proposal.buys], [buy.size for buy in proposal.buys],
+                                          buy_fee_percent, quote_balance)
+            for buy, size in zip(proposal.buys, sizes):
+                buy.size = size
+            proposal.buys = [o for o in proposal.buys if o.size > 0]
+
+        if len(proposal.sells) > 0:
+            sizes = engine.fit_sell_budget([sell.size for sell in proposal.sells], base_balance)
+            for sell, size in zip(proposal.sells, sizes):
+                sell.size = size
+            proposal.sells = [o for o in proposal.sells if o.size > 0]
+
     # Compare the market price with the top bid and top ask price
     cdef c_apply_order_optimization(self, object proposal):
         cdef:
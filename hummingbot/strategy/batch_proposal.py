@@ -0,0 +1,217 @@
+from decimal import Decimal
+from typing import Callable, List, Optional, Tuple
+
+import numpy as np
+
+from hummingbot.connector.exchange_base import ExchangeBase
+from hummingbot.connector.exchange_py_base import ExchangePyBase
+from hummingbot.core.data_type.common import OrderType, TradeType
+
+# The float quotients closer than this (relative) to an integer number of ticks are quantized again with Decimal,
+# since rounding errors could put them on the other side of the tick
+_TICK_TOLERANCE = 1e-9
+# Larger numbers of ticks are not all representable in float, they are kept as Python integers
+_MAX_FLOAT_TICKS = 2 ** 53
+
+ExactValue = Callable[[int], Decimal]
+
+
+class BatchProposalEngine:
+    """
+    Computes the prices and sizes of the order levels of a market making proposal, their quantization and the budget
+    fitting as numpy array operations, instead of level by level with Decimal arithmetic and one call to the connector
+    per level. Prices and sizes are quantized to integer numbers of ticks, and only converted to Decimal values
+    (ticks * quantum, so exactly on the tick grid) when the orders of the proposal are built.
+
+    The results are the same as the ones of the Decimal path: the values too close to a tick boundary to be quantized
+    reliably in float are quantized again with Decimal, and so are the budgets too close to a cumulative order cost.
+    Two assumptions are made, which hold for the `ExchangePyBase` connectors:
+    - the price and size quanta do not depend on the price or the size (they come from the trading rules)
+    - the fee percentage of the orders of a side does not depend on their price or size
+    """
+
+    def __init__(self, price_quantum: Decimal, size_quantum: Decimal):
+        self._price_quantum = price_quantum
+        self._size_quantum = size_quantum
+        self._float_price_quantum = float(price_quantum)
+        self._float_size_quantum = float(size_quantum)
+
+    @property
+    def price_quantum(self) -> Decimal:
+        return self._price_quantum
+
+    @property
+    def size_quantum(self) -> Decimal:
+        return self._size_quantum
+
+    @staticmethod
+    def is_supported(market: ExchangeBase) -> bool:
+        # The other connectors (paper trade, gateway) can quantize with price dependent quanta or rounding rules
+        return isinstance(market, ExchangePyBase)
+
+    @classmethod
+    def for_market(cls,
+                   market: ExchangeBase,
+                   trading_pair: str,
+                   price: Decimal,
+                   size: Decimal) -> Optional["BatchProposalEngine"]:
+        """
+        Returns an engine with the quanta of the trading pair, or None if the proposals on the market have to be
+        computed level by level.
+        """
+        if not cls.is_supported(market) or not price.is_finite():
+            return None
+        return cls(market.get_order_price_quantum(trading_pair, price), market.get_order_size_quantum(trading_pair, size))
+
+    def quantize_prices(self, prices: np.ndarray, exact_price: ExactValue) -> np.ndarray:
+        """
+        :param prices: the prices to quantize
+        :param exact_price: returns the Decimal price of a level, used when the float one is too close to a tick
+        :return: the quantized prices, in number of price ticks (Python integers if some are too large for float)
+        """
+        return self._quantize(prices, self._float_price_quantum, self._price_quantum, exact_price)
+
+    def linear_levels(self,
+                      first_value: Decimal,
+                      level_step: Decimal,
+                      levels: int,
+                      quantum: Decimal,
+                      exact_value: Optional[ExactValue] = None) -> np.ndarray:
+        """
+        Quantizes `first_value + level * level_step` for each level, in number of ticks of `quantum`.
+        :param exact_value: returns the Decimal value of a level as computed by the strategy, by default
+        `first_value + level * level_step`
+        """
+        first_ticks = first_value / quantum
+        step_ticks = level_step / quantum
+        if first_ticks == first_ticks.to_integral_value() and step_ticks == step_ticks.to_integral_value():
+            # All the values are on the tick grid, the integer tick arithmetic is exact
+            last_ticks = first_ticks + step_ticks * max(levels - 1, 0)
+            dtype = object if max(abs(first_ticks), abs(last_ticks)) >= _MAX_FLOAT_TICKS else np.float64
+            return int(first_ticks) + int(step_ticks) * np.arange(levels, dtype=dtype)
+        values = float(first_value) + float(level_step) * np.arange(levels, dtype=np.float64)
+        if exact_value is None:
+            exact_value = lambda level: first_value + level * level_step  # noqa: E731
+        return self._quantize(values, float(quantum), quantum, exact_value)
+
+    def fit_buy_budget(self,
+                       prices: List[Decimal],
+                       sizes: List[Decimal],
+                       fee_percent: Decimal,
+                       quote_balance: Decimal) -> List[Decimal]:
+        """
+        Reduces the buy sizes so that the cost of the orders, fees included, fits in the quote balance. The orders
+        are funded in sequence: the first one the balance cannot fund fully gets the rest of the balance, quantized,
+        and the next ones get nothing.
+        :return: the new sizes
+        """
+        fee_factor = 1 + float(fee_percent)
+        unit_costs = np.array([float(price) for price in prices]) * fee_factor
+        costs = np.array([float(size) for size in sizes]) * unit_costs
+        partial_size = self._fit_budget(costs, unit_costs, float(quote_balance))
+        if partial_size is None:
+            return self._exact_fit_buy_budget(prices, sizes, fee_percent, quote_balance)
+        return self._fitted_sizes(sizes, *partial_size)
+
+    def fit_sell_budget(self, sizes: List[Decimal], base_balance: Decimal) -> List[Decimal]:
+        """
+        Reduces the sell sizes so that they fit in the base balance, funding the orders in sequence.
+        :return: the new sizes
+        """
+        costs = np.array([float(size) for size in sizes])
+        partial_size = self._fit_budget(costs, np.ones(len(costs)), float(base_balance))
+        if partial_size is None:
+            return self._exact_fit_sell_budget(sizes, base_balance)
+        return self._fitted_sizes(sizes, *partial_size)
+
+    @staticmethod
+    def fee_percent(market: ExchangeBase,
+                    base_asset: str,
+                    quote_asset: str,
+                    trade_type: TradeType,
+                    price: Decimal,
+                    size: Decimal) -> Decimal:
+        """
+        The fee percentage of the limit orders of a side, requested once instead of once per level.
+        """
+        return market.get_fee(base_asset, quote_asset, OrderType.LIMIT, trade_type, size, price).percent
+
+    def to_decimal_levels(self, price_ticks: np.ndarray, size_ticks: np.ndarray) -> List[Tuple[Decimal, Decimal]]:
+        """
+        Converts the levels with a positive size to exact Decimal prices and sizes.
+        """
+        return [(Decimal(int(price)) * self._price_quantum, Decimal(int(size)) * self._size_quantum)
+                for price, size in zip(price_ticks, size_ticks)
+                if size > 0]
+
+    def _fit_budget(self, costs: np.ndarray, unit_costs: np.ndarray, balance: float) -> Optional[Tuple[int, int]]:
+        """
+        :return: the first level the balance cannot fund fully (the number of levels if it funds them all) and its
+        size in ticks, or None if the float costs are too close to the balance to decide
+        """
+        cumulative_costs = np.cumsum(costs)
+        if np.any(np.abs(cumulative_costs - balance) <= _TICK_TOLERANCE * max(abs(balance), 1.0)):
+            return None
+        unfunded = np.nonzero(cumulative_costs > balance)[0]
+        if len(unfunded) == 0:
+            return len(costs), 0
+        level = int(unfunded[0])
+        remaining_balance = balance - (cumulative_costs[level - 1] if level > 0 else 0.0)
+        if remaining_balance <= 0:
+            return level, 0
+        level_tick_cost = unit_costs[level] * self._float_size_quantum
+        quotient = remaining_balance / level_tick_cost
+        # The error of the remaining balance is relative to the whole balance
+        if abs(quotient - np.rint(quotient)) <= _TICK_TOLERANCE * max(balance / level_tick_cost, 1.0):
+            return None
+        return level, int(np.trunc(quotient))
+
+    def _fitted_sizes(self, sizes: List[Decimal], unfunded_level: int, partial_size_ticks: int) -> List[Decimal]:
+        fitted_sizes = list(sizes[:unfunded_level])
+        if unfunded_level < len(sizes):
+            fitted_sizes.append(Decimal(partial_size_ticks) * self._size_quantum)
+            fitted_sizes.extend([Decimal(0)] * (len(sizes) - unfunded_level - 1))
+        return fitted_sizes
+
+    @staticmethod
+    def _quantize(values: np.ndarray, float_quantum: float, quantum: Decimal, exact_value: ExactValue) -> np.ndarray:
+        quotients = values / float_quantum
+        if len(quotients) > 0 and np.max(np.abs(quotients)) >= _MAX_FLOAT_TICKS:
+            return np.array([int(exact_value(level) // quantum) for level in range(len(values))], dtype=object)
+        # Rounded towards zero, as the Decimal floor division of the connectors
+        ticks = np.trunc(quotients)
+        ambiguous = np.abs(quotients - np.rint(quotients)) <= _TICK_TOLERANCE * np.maximum(np.abs(quotients), 1.0)
+        for level in np.nonzero(ambiguous)[0]:
+            ticks[level] = int(exact_value(int(level)) // quantum)
+        return ticks
+
+    def _exact_fit_buy_budget(self,
+                              prices: List[Decimal],
+                              sizes: List[Decimal],
+                              fee_percent: Decimal,
+                              quote_balance: Decimal) -> List[Decimal]:
+        fitted_sizes = []
+        for price, size in zip(prices, sizes):
+            quote_size = size * price * (Decimal(1) + fee_percent)
+            if quote_balance < quote_size:
+                size = ((quote_balance / (price * (Decimal(1) + fee_percent))) // self._size_quantum) * self._size_quantum
+                quote_balance = Decimal(0)
+            elif quote_balance == Decimal(0):
+                size = Decimal(0)
+            else:
+                quote_balance -= quote_size
+            fitted_sizes.append(size)
+        return fitted_sizes
+
+    def _exact_fit_sell_budget(self, sizes: List[Decimal], base_balance: Decimal) -> List[Decimal]:
+        fitted_sizes = []
+        for size in sizes:
+            if base_balance < size:
+                size = (base_balance // self._size_quantum) * self._size_quantum
+                base_balance = Decimal(0)
+            elif base_balance == Decimal(0):
+                size = Decimal(0)
+            else:
+                base_balance -= size
+            fitted_sizes.append(size)
+        return fitted_sizes
@@ -20,6 +20,14 @@ cdef class OrderBookAssetPriceDelegate(AssetPriceDelegate):
     def get_price_by_type(self, price_type: PriceType) -> Decimal:
         return self._market.get_price_by_type(self._trading_pair, price_type)
 
+    def get_order_book_imbalance(self, depth_bps: Decimal = Decimal("0")) -> Decimal:
+        order_book = self._market.get_order_book(self._trading_pair)
+        return Decimal(str(order_book.get_depth_imbalance(float(depth_bps))))
+
+    def get_cumulative_depth(self, depth_bps: Decimal, is_buy: bool) -> Decimal:
+        order_book = self._market.get_order_book(self._trading_pair)
+        return Decimal(str(order_book.get_cumulative_depth(is_buy, float(depth_bps))))
+
     @property
     def market(self) -> ExchangeBase:
         return self._market
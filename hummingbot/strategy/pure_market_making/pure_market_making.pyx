@@ -9,13 +9,14 @@ import pandas as pd
 from hummingbot.connector.exchange_base import ExchangeBase
 from hummingbot.connector.exchange_base cimport ExchangeBase
 from hummingbot.core.clock cimport Clock
-from hummingbot.core.data_type.common import OrderType, PriceType, TradeType
+from hummingbot.core.data_type.common import OrderType, PositionAction, PriceType, TradeType
 from hummingbot.core.data_type.limit_order cimport LimitOrder
 from hummingbot.core.data_type.limit_order import LimitOrder
 from hummingbot.core.network_iterator import NetworkStatus
 from hummingbot.core.utils import map_df_to_str
 from hummingbot.strategy.asset_price_delegate cimport AssetPriceDelegate
 from hummingbot.strategy.asset_price_delegate import AssetPriceDelegate
+from hummingbot.strategy.batch_proposal import BatchProposalEngine
 from hummingbot.strategy.hanging_orders_tracker import CreatedPairOfOrders, HangingOrdersTracker
 from hummingbot.strategy.market_trading_pair_tuple import MarketTradingPairTuple
 from hummingbot.strategy.order_book_asset_price_delegate cimport OrderBookAssetPriceDelegate
@@ -801,6 +802,10 @@ cdef class PureMarketMakingStrategy(StrategyBase):
                         if size > 0 and price > 0:
                             sells.append(PriceSize(price, size))
         else:
+            engine = BatchProposalEngine.for_market(market, self.trading_pair, self.get_price(), self._order_amount)
+            if engine is not None:
+                buys, sells = self.create_order_levels_in_batch(engine, buy_reference_price, sell_reference_price)
+                return Proposal(buys, sells)
             if not buy_reference_price.is_nan():
                 for level in range(0, self._buy_levels):
                     price = buy_reference_price * (Decimal("1") - self._bid_spread - (level * self._order_level_spread))
@@ -820,6 +825,39 @@ cdef class PureMarketMakingStrategy(StrategyBase):
 
         return Proposal(buys, sells)
 
+    def create_base_proposal(self):
+        return self.c_create_base_proposal()
+
+    def create_order_levels_in_batch(self, engine: BatchProposalEngine, buy_reference_price: Decimal,
+                                     sell_reference_price: Decimal):
+        """
+        Computes the order levels with the batch proposal engine, with the same prices and sizes as the level by level
+        computation of c_create_base_proposal.
+        """
+        buys = []
+        sells = []
+        size_ticks = engine.linear_levels(self._order_amount, self._order_level_amount,
+                                          max(self._buy_levels, self._sell_levels), engine.size_quantum)
+        if not buy_reference_price.is_nan():
+            price_ticks = engine.linear_levels(
+                buy_reference_price * (Decimal("1") - self._bid_spread),
+                -buy_reference_price * self._order_level_spread,
+                self._buy_levels,
+                engine.price_quantum,
+                lambda level: buy_reference_price * (Decimal("1") - self._bid_spread - (level * self._order_level_spread)))
+            buys = [PriceSize(price, size)
+                    for price, size in engine.to_decimal_levels(price_ticks, size_ticks[:self._buy_levels])]
+        if not sell_reference_price.is_nan():
+            price_ticks = engine.linear_levels(
+                sell_reference_price * (Decimal("1") + self._ask_spread),
+                sell_reference_price * self._order_level_spread,
+                self._sell_levels,
+                engine.price_quantum,
+                lambda level: sell_reference_price * (Decimal("1") + self._ask_spread + (level * self._order_level_spread)))
+            sells = [PriceSize(price, size)
+                     for price, size in engine.to_decimal_levels(price_ticks, size_ticks[:self._sell_levels])]
+        return buys, sells
+
     cdef tuple c_get_adjusted_available_balance(self, list orders):
         """
         Calculates the available balance, plus the amount attributed to orders.
@@ -935,6 +973,11 @@ cdef class PureMarketMakingStrategy(StrategyBase):
 
         base_balance, quote_balance = self.adjusted_available_balance_for_orders_budget_constrain()
 
+        engine = BatchProposalEngine.for_market(market, self.trading_pair, self.get_price(), self._order_amount)
+        if engine is not None:
+            self.apply_budget_constraint_in_batch(engine, proposal, base_balance, quote_balance)
+            return
+
         for buy in proposal.buys:
             buy_fee = market.c_get_fee(self.base_asset, self.quote_asset, OrderType.LIMIT, TradeType.BUY,
                                        buy.size, buy.price)
@@ -968,6 +1011,26 @@ cdef class PureMarketMakingStrategy(StrategyBase):
 
         proposal.sells = [o for o in proposal.sells if o.size > 0]
 
+    def apply_budget_constraint(self, proposal: Proposal):
+        return self.c_apply_budget_constraint(proposal)
+
+    def apply_budget_constraint_in_batch(self, engine: BatchProposalEngine, proposal: Proposal,
+                                         base_balance: Decimal, quote_balance: Decimal):
+        if len(proposal.buys) > 0:
+            buy_fee_percent = engine.fee_percent(self._market_info.market, self.base_asset, self.quote_asset,
+                                                 TradeType.BUY, proposal.buys[0].price, proposal.buys[0].size)
+            sizes = engine.fit_buy_budget([buy.price for buy in proposal.buys], [buy.size for buy in proposal.buys],
+                                          buy_fee_percent, quote_balance)
+            for buy, size in zip(proposal.buys, sizes):
+                buy.size = size
+            proposal.buys = [o for o in proposal.buys if o.size > 0]
+
+        if len(proposal.sells) > 0:
+            sizes = engine.fit_sell_budget([sell.size for sell in proposal.sells], base_balance)
+            for sell, size in zip(proposal.sells, sizes):
+                sell.size = size
+            proposal.sells = [o for o in proposal.sells if o.size > 0]
+
     cdef c_filter_out_takers(self, object proposal):
         cdef:
             ExchangeBase market = self._market_info.market
@@ -1181,8 +1244,7 @@ cdef class PureMarketMakingStrategy(StrategyBase):
             list active_orders = self.active_non_hanging_orders
 
         if active_orders and any(order_age(o, self._current_timestamp) > self._max_order_age for o in active_orders):
-            for order in active_orders:
-                self.c_cancel_order(self._market_info, order.client_order_id)
+            self.c_batch_cancel_orders(self._market_info, [order.client_order_id for order in active_orders])
 
     cdef c_cancel_active_orders(self, object proposal):
         """
@@ -1210,15 +1272,41 @@ cdef class PureMarketMakingStrategy(StrategyBase):
                     self.c_is_within_tolerance(active_sell_prices, proposal_sells):
                 to_defer_canceling = True
 
-        if not to_defer_canceling:
+        if not to_defer_canceling and not self.c_amend_active_orders(proposal):
             self._hanging_orders_tracker.update_strategy_orders_with_equivalent_orders()
-            for order in self.active_non_hanging_orders:
-                # If is about to be added to hanging_orders then don't cancel
-                if not self._hanging_orders_tracker.is_potential_hanging_order(order):
-                    self.c_cancel_order(self._market_info, order.client_order_id)
+            # If is about to be added to hanging_orders then don't cancel
+            self.c_batch_cancel_orders(self._market_info,
+                                       [order.client_order_id for order in self.active_non_hanging_orders
+                                        if not self._hanging_orders_tracker.is_potential_hanging_order(order)])
         # else:
         #     self.set_timers()
 
+    cdef bint c_amend_active_orders(self, object proposal):
+        """
+        Amends the active orders to the prices and sizes of the proposal, instead of canceling them and creating the
+        proposal orders, if the market amends orders in place and only the prices or sizes of the orders changed
+        """
+        cdef:
+            ExchangeBase market = self._market_info.market
+            list active_orders = self.active_non_hanging_orders
+            list active_buys
+            list active_sells
+
+        if proposal is None or self._hanging_orders_enabled or not market.is_order_amendment_supported:
+            return False
+        active_buys = sorted([o for o in active_orders if o.is_buy], key=lambda o: o.price, reverse=True)
+        active_sells = sorted([o for o in active_orders if not o.is_buy], key=lambda o: o.price)
+        if len(active_buys) != len(proposal.buys) or len(active_sells) != len(proposal.sells):
+            return False
+
+        for order, price_size in (list(zip(active_buys, sorted(proposal.buys, key=lambda b: b.price, reverse=True)))
+                                  + list(zip(active_sells, sorted(proposal.sells, key=lambda s: s.price)))):
+            if order.price != price_size.price or order.quantity != price_size.size:
+                self.c_amend_limit_order(self._market_info, order.client_order_id, price_size.price, price_size.size,
+                                         self._limit_order_type)
+        self.set_timers()
+        return True
+
     # Cancel Non-Hanging, Active Orders if Spreads are below minimum_spread
     cdef c_cancel_orders_below_min_spread(self):
         cdef:
@@ -1226,13 +1314,16 @@ cdef class PureMarketMakingStrategy(StrategyBase):
             object price = self.get_price()
         active_orders = [order for order in active_orders
                          if order.client_order_id not in self.hanging_order_ids]
+        order_ids_to_cancel = []
         for order in active_orders:
             negation = -1 if order.is_buy else 1
             if (negation * (order.price - price) / price) < self._minimum_spread:
                 self.logger().info(f"Order is below minimum spread ({self._minimum_spread})."
                                    f" Canceling Order: ({'Buy' if order.is_buy else 'Sell'}) "
                                    f"ID - {order.client_order_id}")
-                self.c_cancel_order(self._market_info, order.client_order_id)
+                order_ids_to_cancel.append(order.client_order_id)
+        if order_ids_to_cancel:
+            self.c_batch_cancel_orders(self._market_info, order_ids_to_cancel)
 
     cdef bint c_to_create_orders(self, object proposal):
         non_hanging_orders_non_cancelled = [o for o in self.active_non_hanging_orders if not
@@ -1245,9 +1336,8 @@ cdef class PureMarketMakingStrategy(StrategyBase):
 
     cdef c_execute_orders_proposal(self, object proposal):
         cdef:
-            double expiration_seconds = NaN
-            str bid_order_id, ask_order_id
-            bint orders_created = False
+            list orders_to_create = []
+            list created_orders
         # Number of pair of orders to track for hanging orders
         number_of_pairs = min((len(proposal.buys), len(proposal.sells))) if self._hanging_orders_enabled else 0
 
@@ -1260,20 +1350,6 @@ cdef class PureMarketMakingStrategy(StrategyBase):
                     f"({self.trading_pair}) Creating {len(proposal.buys)} bid orders "
                     f"at (Size, Price): {price_quote_str}"
                 )
-            for idx, buy in enumerate(proposal.buys):
-                bid_order_id = self.c_buy_with_specific_market(
-                    self._market_info,
-                    buy.size,
-                    order_type=self._limit_order_type,
-                    price=buy.price,
-                    expiration_seconds=expiration_seconds
-                )
-                orders_created = True
-                if idx < number_of_pairs:
-                    order = next((o for o in self.active_orders if o.client_order_id == bid_order_id))
-                    if order:
-                        self._hanging_orders_tracker.add_current_pairs_of_proposal_orders_executed_by_strategy(
-                            CreatedPairOfOrders(order, None))
         if len(proposal.sells) > 0:
             if self._logging_options & self.OPTION_LOG_CREATE_ORDER:
                 price_quote_str = [f"{sell.size.normalize()} {self.base_asset}, "
@@ -1283,21 +1359,33 @@ cdef class PureMarketMakingStrategy(StrategyBase):
                     f"({self.trading_pair}) Creating {len(proposal.sells)} ask "
                     f"orders at (Size, Price): {price_quote_str}"
                 )
-            for idx, sell in enumerate(proposal.sells):
-                ask_order_id = self.c_sell_with_specific_market(
-                    self._market_info,
-                    sell.size,
-                    order_type=self._limit_order_type,
-                    price=sell.price,
-                    expiration_seconds=expiration_seconds
-                )
-                orders_created = True
-                if idx < number_of_pairs:
-                    order = next((o for o in self.active_orders if o.client_order_id == ask_order_id))
-                    if order:
-                        self._hanging_orders_tracker.current_created_pairs_of_orders[idx].sell_order = order
-        if orders_created:
-            self.set_timers()
+        # The bids and asks of the proposal are created with a single batch order creation
+        for is_buy, price_sizes in ((True, proposal.buys), (False, proposal.sells)):
+            for price_size in price_sizes:
+                orders_to_create.append(LimitOrder(client_order_id="",
+                                                   trading_pair=self.trading_pair,
+                                                   is_buy=is_buy,
+                                                   base_currency=self.base_asset,
+                                                   quote_currency=self.quote_asset,
+                                                   price=price_size.price,
+                                                   quantity=price_size.size,
+                                                   position=PositionAction.OPEN))
+        if len(orders_to_create) == 0:
+            return
+        created_orders = self.c_batch_create_limit_orders(self._market_info, orders_to_create, self._limit_order_type)
+
+        bid_orders = created_orders[:len(proposal.buys)]
+        ask_orders = created_orders[len(proposal.buys):]
+        for idx in range(number_of_pairs):
+            bid_order = next((o for o in self.active_orders if o.client_order_id == bid_orders[idx].client_order_id))
+            if bid_order:
+                self._hanging_orders_tracker.add_current_pairs_of_proposal_orders_executed_by_strategy(
+                    CreatedPairOfOrders(bid_order, None))
+        for idx in range(number_of_pairs):
+            ask_order = next((o for o in self.active_orders if o.client_order_id == ask_orders[idx].client_order_id))
+            if ask_order:
+                self._hanging_orders_tracker.current_created_pairs_of_orders[idx].sell_order = ask_order
+        self.set_timers()
 
     cdef set_timers(self):
         cdef double next_cycle = self._current_timestamp + self._order_refresh_time
@@ -1323,6 +1411,8 @@ cdef class PureMarketMakingStrategy(StrategyBase):
             return PriceType.LastOwnTrade
         elif price_type_str == 'inventory_cost':
             return PriceType.InventoryCost
+        elif price_type_str == "microprice":
+            return PriceType.Microprice
         elif price_type_str == "custom":
             return PriceType.Custom
         else:
@@ -89,6 +89,7 @@ def validate_price_type(value: str) -> Optional[str]:
                         "best_bid",
                         "best_ask",
                         "inventory_cost",
+                        "microprice",
                         }
         if value not in valid_values:
             error = "Invalid price type."
@@ -341,7 +342,7 @@ pure_market_making_config_map = {
     "price_type":
         ConfigVar(key="price_type",
                   prompt="Which price type to use? ("
-                         "mid_price/last_price/last_own_trade_price/best_bid/best_ask/inventory_cost) >>> ",
+                         "mid_price/last_price/last_own_trade_price/best_bid/best_ask/inventory_cost/microprice) >>> ",
                   type_str="str",
                   required_if=lambda: pure_market_making_config_map.get("price_source").value != "custom_api",
                   default="mid_price",
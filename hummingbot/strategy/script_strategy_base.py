@@ -144,6 +144,44 @@ class ScriptStrategyBase(StrategyPyBase):
         market_pair = self._market_trading_pair_tuple(connector_name, trading_pair)
         self.cancel_order(market_trading_pair_tuple=market_pair, order_id=order_id)
 
+    def batch_cancel(self,
+                     connector_name: str,
+                     trading_pair: str,
+                     order_ids: List[str]):
+        """
+        A wrapper function to batch_cancel_orders, the orders are cancelled in batch requests if the exchange
+        supports them.
+
+        :param connector_name: The name of the connector
+        :param trading_pair: The market trading pair
+        :param order_ids: The identifiers assigned by the client of the orders to be cancelled
+        """
+        market_pair = self._market_trading_pair_tuple(connector_name, trading_pair)
+        self.batch_cancel_orders(market_trading_pair_tuple=market_pair, order_ids=order_ids)
+
+    def amend(self,
+              connector_name: str,
+              trading_pair: str,
+              order_id: str,
+              price: Decimal,
+              amount: Decimal,
+              order_type: OrderType = OrderType.LIMIT) -> Optional[str]:
+        """
+        A wrapper function to amend_limit_order, the order is amended in place if the exchange supports it and
+        replaced by a new order otherwise.
+
+        :param connector_name: The name of the connector
+        :param trading_pair: The market trading pair
+        :param order_id: The identifier assigned by the client of the order to be amended
+        :param price: The new order price
+        :param amount: The new order amount in base token value
+        :param order_type: The type of the new order if the order is replaced
+
+        :return: The client assigned id of the order with the new price and amount, None if the order is not active
+        """
+        market_pair = self._market_trading_pair_tuple(connector_name, trading_pair)
+        return self.amend_limit_order(market_pair, order_id, price, amount, order_type)
+
     def get_active_orders(self, connector_name: str) -> List[LimitOrder]:
         """
         Returns a list of active orders for a connector.
@@ -27,6 +27,7 @@ cdef class StrategyBase(TimeIterator):
         EventListener _sb_range_position_closed_listener
         bint _sb_delegate_lock
         public OrderTracker _sb_order_tracker
+        dict _sb_amended_limit_orders
 
     cdef c_add_markets(self, list markets)
     cdef c_remove_markets(self, list markets)
@@ -59,6 +60,12 @@ cdef class StrategyBase(TimeIterator):
     cdef str c_sell_with_specific_market(self, object market_trading_pair_tuple, object amount, object order_type = *,
                                          object price = *, double expiration_seconds = *, position_action = *, )
     cdef c_cancel_order(self, object market_pair, str order_id)
+    cdef list c_batch_create_limit_orders(self, object market_trading_pair_tuple, list orders_to_create,
+                                          object order_type = *)
+    cdef c_batch_cancel_orders(self, object market_trading_pair_tuple, list order_ids)
+    cdef str c_amend_limit_order(self, object market_trading_pair_tuple, str order_id, object price, object quantity,
+                                 object order_type = *)
+    cdef c_update_amended_limit_orders(self)
 
     cdef c_start_tracking_limit_order(self, object market_pair, str order_id, bint is_buy, object price,
                                       object quantity)
@@ -2,7 +2,8 @@ from decimal import Decimal
 import logging
 import pandas as pd
 from typing import (
-    List)
+    List,
+    Optional)
 
 from hummingbot.core.clock cimport Clock
 from hummingbot.core.event.events import MarketEvent, AccountEvent
@@ -11,6 +12,7 @@ from hummingbot.core.network_iterator import NetworkStatus
 from hummingbot.strategy.market_trading_pair_tuple import MarketTradingPairTuple
 from hummingbot.core.time_iterator cimport TimeIterator
 from hummingbot.connector.connector_base cimport ConnectorBase
+from hummingbot.core.data_type.limit_order cimport LimitOrder
 from hummingbot.core.data_type.trade import Trade
 from hummingbot.core.event.events import OrderFilledEvent
 from hummingbot.core.data_type.common import OrderType, PositionAction
@@ -162,6 +164,8 @@ cdef class StrategyBase(TimeIterator):
         self._sb_delegate_lock = False
 
         self._sb_order_tracker = OrderTracker()
+        # The market pairs of the limit orders amended in place, until their amendment is complete
+        self._sb_amended_limit_orders = {}
 
     def init_params(self, *args, **kwargs):
         """
@@ -304,6 +308,7 @@ cdef class StrategyBase(TimeIterator):
     cdef c_tick(self, double timestamp):
         TimeIterator.c_tick(self, timestamp)
         self._sb_order_tracker.c_tick(timestamp)
+        self.c_update_amended_limit_orders()
 
     cdef c_stop(self, Clock clock):
         TimeIterator.c_stop(self, clock)
@@ -597,6 +602,142 @@ cdef class StrategyBase(TimeIterator):
 
     def cancel_order(self, market_trading_pair_tuple: MarketTradingPairTuple, order_id: str):
         self.c_cancel_order(market_trading_pair_tuple, order_id)
+
+    def batch_create_limit_orders(self, market_trading_pair_tuple, orders_to_create, order_type=OrderType.LIMIT):
+        return self.c_batch_create_limit_orders(market_trading_pair_tuple, orders_to_create, order_type)
+
+    cdef list c_batch_create_limit_orders(self, object market_trading_pair_tuple, list orders_to_create,
+                                          object order_type=OrderType.LIMIT):
+        """
+        Creates the limit orders with a single batch order creation of the market, which sends them in batch
+        requests if the exchange supports them.
+
+        :param market_trading_pair_tuple: the market of the orders
+        :param orders_to_create: the LimitOrder objects representing the orders to create (the ids can be blank)
+        :param order_type: the type of the orders (LIMIT, LIMIT_MAKER)
+
+        :return: the orders to create, with the ids assigned by the market
+        """
+        if self._sb_delegate_lock:
+            raise RuntimeError("Delegates are not allowed to execute orders directly.")
+
+        cdef:
+            ConnectorBase market = market_trading_pair_tuple.market
+            list created_orders
+
+        if market not in self._sb_markets:
+            raise ValueError(f"Market object for batch order is not in the whitelisted markets set.")
+
+        created_orders = market.batch_order_create(orders_to_create, limit_order_type=order_type)
+        for order in created_orders:
+            self.c_start_tracking_limit_order(market_trading_pair_tuple, order.client_order_id, order.is_buy,
+                                              order.price, order.quantity)
+        return created_orders
+
+    def batch_cancel_orders(self, market_trading_pair_tuple: MarketTradingPairTuple, order_ids: List[str]):
+        self.c_batch_cancel_orders(market_trading_pair_tuple, order_ids)
+
+    cdef c_batch_cancel_orders(self, object market_trading_pair_tuple, list order_ids):
+        """
+        Cancels the orders with a single batch order cancelation of the market, which sends them in batch requests if
+        the exchange supports them.
+
+        :param market_trading_pair_tuple: the market of the orders
+        :param order_ids: the client ids of the orders to cancel
+        """
+        cdef:
+            ConnectorBase market = market_trading_pair_tuple.market
+            list orders_to_cancel = []
+            LimitOrder limit_order
+
+        for order_id in order_ids:
+            if self._sb_order_tracker.c_check_and_track_cancel(order_id):
+                self.log_with_clock(
+                    logging.INFO,
+                    f"({market_trading_pair_tuple.trading_pair}) Canceling the limit order {order_id}."
+                )
+                limit_order = self._sb_order_tracker.c_get_limit_order(market_trading_pair_tuple, order_id)
+                if limit_order is not None:
+                    orders_to_cancel.append(limit_order)
+                else:
+                    market.c_cancel(market_trading_pair_tuple.trading_pair, order_id)
+        if len(orders_to_cancel) > 0:
+            market.batch_order_cancel(orders_to_cancel)
+
+    def amend_limit_order(self, market_trading_pair_tuple: MarketTradingPairTuple, order_id: str, price: Decimal,
+                          quantity: Decimal, order_type=OrderType.LIMIT) -> Optional[str]:
+        return self.c_amend_limit_order(market_trading_pair_tuple, order_id, price, quantity, order_type)
+
+    cdef str c_amend_limit_order(self, object market_trading_pair_tuple, str order_id, object price, object quantity,
+                                 object order_type=OrderType.LIMIT):
+        """
+        Changes the price and quantity of an active limit order. The order is amended in place if the market supports
+        it, otherwise the market cancels it and creates a new order, which is tracked instead.
+
+        :param market_trading_pair_tuple: the market of the order
+        :param order_id: the client id of the order to amend
+        :param price: the new price of the order
+        :param quantity: the new quantity of the order
+        :param order_type: the type of the new order if the order is canceled (LIMIT, LIMIT_MAKER)
+
+        :return: the id of the order with the new price and quantity, None if the order is not active
+        """
+        if self._sb_delegate_lock:
+            raise RuntimeError("Delegates are not allowed to execute orders directly.")
+
+        cdef:
+            ConnectorBase market = market_trading_pair_tuple.market
+            LimitOrder limit_order
+            str new_order_id
+
+        if market not in self._sb_markets:
+            raise ValueError(f"Market object for amend order is not in the whitelisted markets set.")
+
+        limit_order = self._sb_order_tracker.c_get_limit_order(market_trading_pair_tuple, order_id)
+        if limit_order is None or self._sb_order_tracker.c_has_in_flight_cancel(order_id):
+            return None
+        new_order_id = market.amend_order(limit_order, price, quantity, limit_order_type=order_type)
+        if new_order_id is None:
+            return None
+        if new_order_id == order_id:
+            self._sb_amended_limit_orders[order_id] = market_trading_pair_tuple
+            self.log_with_clock(
+                logging.INFO,
+                f"({market_trading_pair_tuple.trading_pair}) Amending the limit order {order_id} to "
+                f"{quantity} @ {price}."
+            )
+        else:
+            self._sb_order_tracker.c_check_and_track_cancel(order_id)
+            self.log_with_clock(
+                logging.INFO,
+                f"({market_trading_pair_tuple.trading_pair}) Canceling the limit order {order_id}, replaced by "
+                f"{new_order_id} ({quantity} @ {price})."
+            )
+        self.c_start_tracking_limit_order(market_trading_pair_tuple, new_order_id, limit_order.is_buy, price,
+                                          quantity)
+        return new_order_id
+
+    cdef c_update_amended_limit_orders(self):
+        """
+        Tracks the limit orders amended in place with the price and quantity they have in the market once their
+        amendment is complete, so that the orders whose amendment failed keep their previous price and quantity.
+        """
+        cdef:
+            LimitOrder limit_order
+            object amended_order
+
+        for order_id, market_pair in list(self._sb_amended_limit_orders.items()):
+            limit_order = self._sb_order_tracker.c_get_limit_order(market_pair, order_id)
+            if limit_order is None:
+                del self._sb_amended_limit_orders[order_id]
+                continue
+            amended_order = market_pair.market.get_amended_order(order_id)
+            if amended_order is None:
+                continue
+            del self._sb_amended_limit_orders[order_id]
+            if amended_order.price != limit_order.price or amended_order.quantity != limit_order.quantity:
+                self.c_start_tracking_limit_order(market_pair, order_id, limit_order.is_buy, amended_order.price,
+                                                  amended_order.quantity)
     # ----------------------------------------------------------------------------------------------------------
     # </editor-fold>
 
@@ -19,6 +19,7 @@ from hummingbot.data_feed.candles_feed.candles_factory import CandlesConfig
 from hummingbot.data_feed.market_data_provider import MarketDataProvider
 from hummingbot.exceptions import InvalidController
 from hummingbot.smart_components.controllers.controller_base import ControllerBase, ControllerConfigBase
+from hummingbot.smart_components.controllers.controller_worker_pool import WORKER_POOL_MODES, ControllerWorkerPool
 from hummingbot.smart_components.controllers.directional_trading_controller_base import (
     DirectionalTradingControllerConfigBase,
 )
@@ -74,6 +75,39 @@ class StrategyV2ConfigBase(BaseClientModel):
         )
     )
 
+    controllers_worker_pool: str = Field(
+        default="none",
+        client_data=ClientFieldData(
+            prompt_on_new=False,
+            prompt=lambda mi: (
+                "Enter where the controllers that support it compute their processed data, off the event loop "
+                f"({'/'.join(WORKER_POOL_MODES)}): "
+            ),
+        )
+    )
+    controllers_worker_pool_size: int = Field(
+        default=2,
+        gt=0,
+        client_data=ClientFieldData(
+            prompt_on_new=False,
+            prompt=lambda mi: "Enter the number of controller computations that can run at the same time (e.g. 2): ",
+        )
+    )
+    controllers_update_timeout: float = Field(
+        default=10.0,
+        gt=0,
+        client_data=ClientFieldData(
+            prompt_on_new=False,
+            prompt=lambda mi: "Enter the timeout in seconds of a controller computation in the worker pool (e.g. 10): ",
+        )
+    )
+
+    @validator("controllers_worker_pool", pre=True, always=True)
+    def validate_controllers_worker_pool(cls, v):
+        if v not in WORKER_POOL_MODES:
+            raise ValueError(f"Invalid controllers worker pool {v}, expected one of {', '.join(WORKER_POOL_MODES)}.")
+        return v
+
     @validator("controllers_config", pre=True, always=True)
     def parse_controllers_config(cls, v):
         # Parse string input into a list of file pathsq
@@ -204,6 +238,11 @@ class StrategyV2Base(ScriptStrategyBase):
         # Initialize the market data provider
         self.market_data_provider = MarketDataProvider(connectors)
         self.market_data_provider.initialize_candles_feed_list(config.candles_config)
+        self.controllers_worker_pool: Optional[ControllerWorkerPool] = None
+        if config.controllers_worker_pool != "none":
+            self.controllers_worker_pool = ControllerWorkerPool(mode=config.controllers_worker_pool,
+                                                                max_workers=config.controllers_worker_pool_size,
+                                                                timeout=config.controllers_update_timeout)
         self.controllers: Dict[str, ControllerBase] = {}
         self.initialize_controllers()
 
@@ -218,7 +257,8 @@ class StrategyV2Base(ScriptStrategyBase):
 
     def add_controller(self, config: ControllerConfigBase):
         try:
-            controller = config.get_controller_class()(config, self.market_data_provider, self.actions_queue)
+            controller = config.get_controller_class()(config, self.market_data_provider, self.actions_queue,
+                                                       worker_pool=self.controllers_worker_pool)
             controller.start()
             self.controllers[config.id] = controller
         except Exception as e:
@@ -278,6 +318,8 @@ class StrategyV2Base(ScriptStrategyBase):
         self.listen_to_executor_actions_task.cancel()
         for controller in self.controllers.values():
             controller.stop()
+        if self.controllers_worker_pool is not None:
+            self.controllers_worker_pool.shutdown()
 
     def on_tick(self):
         self.update_executors_info()
@@ -371,6 +413,8 @@ class StrategyV2Base(ScriptStrategyBase):
             extra_info.append(f"\n\nController: {controller_id}")
             # Append controller market data metrics
             extra_info.extend(controller.to_format_status())
+            if self.controllers_worker_pool is not None and controller_id in self.controllers_worker_pool.metrics:
+                extra_info.append(self.controllers_worker_pool.metrics[controller_id].format_status())
             executors_list = self.get_executors_by_controller(controller_id)
             if len(executors_list) == 0:
                 extra_info.append("No executors found.")
@@ -0,0 +1,86 @@
+#!/usr/bin/env python
+"""
+Compares the time taken by the pure market making strategy to create its proposal and apply the budget constraint,
+level by level with Decimal arithmetic and with the batch proposal engine, for several numbers of order levels.
+
+Usage:
+    PYTHONPATH=. python test/debug/benchmark_batch_proposal.py [--levels 10 50 200] [--runs N]
+
+The paper trade exchange is used as market. It is not supported by the engine (its quantization does not come from
+trading rules), so the engine is created from its quanta for the batch measures.
+"""
+
+import argparse
+import statistics
+import time
+from decimal import Decimal
+from typing import List
+from unittest.mock import patch
+
+from hummingbot.client.config.client_config_map import ClientConfigMap
+from hummingbot.client.config.config_helpers import ClientConfigAdapter
+from hummingbot.connector.exchange.paper_trade.paper_trade_exchange import QuantizationParams
+from hummingbot.connector.test_support.mock_paper_exchange import MockPaperExchange
+from hummingbot.strategy.batch_proposal import BatchProposalEngine
+from hummingbot.strategy.market_trading_pair_tuple import MarketTradingPairTuple
+from hummingbot.strategy.pure_market_making.pure_market_making import PureMarketMakingStrategy
+
+TRADING_PAIR = "HBOT-ETH"
+
+
+def create_strategy(levels: int) -> PureMarketMakingStrategy:
+    market = MockPaperExchange(client_config_map=ClientConfigAdapter(ClientConfigMap()))
+    market.set_balanced_order_book(TRADING_PAIR, mid_price=100, min_price=1, max_price=200, price_step_size=1,
+                                   volume_step_size=10)
+    market.set_quantization_param(QuantizationParams(TRADING_PAIR, 4, 4, 4, 4))
+    # Enough to fund about two thirds of the levels
+    market.set_balance("HBOT", Decimal(levels))
+    market.set_balance("ETH", Decimal(levels * 100))
+    strategy = PureMarketMakingStrategy()
+    strategy.init_params(
+        MarketTradingPairTuple(market, TRADING_PAIR, "HBOT", "ETH"),
+        bid_spread=Decimal("0.0013"),
+        ask_spread=Decimal("0.0017"),
+        order_amount=Decimal("1.1"),
+        order_levels=levels,
+        order_level_spread=Decimal("0.0007"),
+        order_level_amount=Decimal("0.01"),
+        minimum_spread=-1,
+    )
+    return strategy
+
+
+def batch_engine(market, trading_pair: str, price: Decimal, size: Decimal) -> BatchProposalEngine:
+    return BatchProposalEngine(market.get_order_price_quantum(trading_pair, price),
+                               market.get_order_size_quantum(trading_pair, size))
+
+
+def measure(strategy: PureMarketMakingStrategy, runs: int) -> List[float]:
+    times = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        proposal = strategy.create_base_proposal()
+        strategy.apply_budget_constraint(proposal)
+        times.append(time.perf_counter() - start)
+    return times
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the proposal creation of the pure market making strategy.")
+    parser.add_argument("--levels", type=int, nargs="+", default=[10, 50, 200])
+    parser.add_argument("--runs", type=int, default=200)
+    args = parser.parse_args()
+
+    for levels in args.levels:
+        strategy = create_strategy(levels)
+        decimal_times = measure(strategy, args.runs)
+        with patch.object(BatchProposalEngine, "for_market", side_effect=batch_engine):
+            batch_times = measure(strategy, args.runs)
+        decimal_time = statistics.median(decimal_times)
+        batch_time = statistics.median(batch_times)
+        print(f"{levels:>4} levels: decimal {decimal_time * 1e3:8.3f} ms | batch {batch_time * 1e3:8.3f} ms | "
+              f"x{decimal_time / batch_time:.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+#!/usr/bin/env python
+"""
+Compares the time taken to create the connector settings at startup, from the connector manifest and by importing
+the utils module of every connector. Each measure runs in a new interpreter, to include the import time.
+
+Usage:
+    PYTHONPATH=. python test/debug/benchmark_connector_settings_startup.py [--runs N]
+
+The manifest is generated first if it does not exist (see `bin/generate_connector_manifest.py`).
+"""
+
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+from os.path import exists
+from typing import Dict, List
+
+from hummingbot.client.settings import CONNECTOR_MANIFEST_PATH, AllConnectorSettings
+
+MEASURE_SCRIPT = """
+import json
+import sys
+import time
+
+start = time.perf_counter()
+from hummingbot.client.settings import AllConnectorSettings
+if {scan}:
+    AllConnectorSettings._load_connector_manifest = classmethod(lambda cls, *args, **kwargs: None)
+modules_before = len(sys.modules)
+settings_start = time.perf_counter()
+settings = AllConnectorSettings.create_connector_settings()
+end = time.perf_counter()
+print(json.dumps({{
+    "total": end - start,
+    "settings": end - settings_start,
+    "modules": len(sys.modules) - modules_before,
+    "connectors": len(settings),
+}}))
+"""
+
+
+def measure(scan: bool, runs: int) -> Dict[str, float]:
+    results: List[Dict[str, float]] = []
+    for _ in range(runs):
+        output = subprocess.run(
+            [sys.executable, "-c", MEASURE_SCRIPT.format(scan=scan)], capture_output=True, text=True, check=True
+        ).stdout
+        results.append(json.loads(output.strip().splitlines()[-1]))
+    return {key: statistics.median(result[key] for result in results) for key in results[0]}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the creation of the connector settings at startup.")
+    parser.add_argument("--runs", type=int, default=5)
+    args = parser.parse_args()
+
+    if not exists(CONNECTOR_MANIFEST_PATH):
+        AllConnectorSettings.generate_connector_manifest()
+
+    for label, scan in (("scan", True), ("manifest", False)):
+        result = measure(scan, args.runs)
+        print(f"{label:>8}: {result['settings'] * 1e3:8.1f} ms to create {result['connectors']:.0f} connector "
+              f"settings ({result['modules']:.0f} modules imported), {result['total'] * 1e3:8.1f} ms with the "
+              f"import of hummingbot.client.settings")
+
+
+if __name__ == "__main__":
+    main()
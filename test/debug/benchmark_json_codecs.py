@@ -0,0 +1,98 @@
+#!/usr/bin/env python
+"""
+Compares the decoding throughput of the JSON codecs available to the `web_assistant` layer.
+
+Usage:
+    PYTHONPATH=. python test/debug/benchmark_json_codecs.py [--frames <file with one captured frame per line>] [--iterations N]
+
+When no frames file is given, synthetic frames reproducing the shape of Binance `depthUpdate` and OKX `books`
+messages are used.
+"""
+
+import argparse
+import json
+import random
+import time
+from typing import Dict, List
+
+from hummingbot.core.web_assistant.connections.json_codec import JSON_CODECS, StdlibJSONCodec, get_json_codec
+
+
+def binance_depth_update_frame(levels: int) -> str:
+    return json.dumps({
+        "e": "depthUpdate",
+        "E": 1700000000000,
+        "s": "BTCUSDT",
+        "U": 157,
+        "u": 160,
+        "b": [[f"{30000 - i * 0.01:.2f}", f"{random.uniform(0, 5):.8f}"] for i in range(levels)],
+        "a": [[f"{30000 + i * 0.01:.2f}", f"{random.uniform(0, 5):.8f}"] for i in range(levels)],
+    })
+
+
+def okx_books_frame(levels: int) -> str:
+    return json.dumps({
+        "arg": {"channel": "books", "instId": "BTC-USDT"},
+        "action": "update",
+        "data": [{
+            "asks": [[f"{30000 + i * 0.1:.1f}", f"{random.uniform(0, 5):.8f}", "0", "2"] for i in range(levels)],
+            "bids": [[f"{30000 - i * 0.1:.1f}", f"{random.uniform(0, 5):.8f}", "0", "2"] for i in range(levels)],
+            "ts": "1700000000000",
+            "checksum": -855196043,
+        }],
+    })
+
+
+def synthetic_frames() -> List[str]:
+    frames = []
+    for levels in (1, 5, 20, 100, 400):
+        frames.append(binance_depth_update_frame(levels))
+        frames.append(okx_books_frame(levels))
+    return frames
+
+
+def load_frames(path: str) -> List[str]:
+    with open(path, "r") as f:
+        return [line.strip() for line in f if line.strip()]
+
+
+def benchmark(frames: List[str], iterations: int) -> Dict[str, float]:
+    codecs = [StdlibJSONCodec(), StdlibJSONCodec(raw_numbers=True)]
+    for name in JSON_CODECS:
+        if name == StdlibJSONCodec.name:
+            continue
+        try:
+            codecs.append(get_json_codec(name))
+        except ImportError:
+            print(f"Skipping {name} (not installed)")
+
+    results = {}
+    for codec in codecs:
+        label = f"{codec.name}{' (raw numbers)' if getattr(codec, 'raw_numbers', False) else ''}"
+        start = time.perf_counter()
+        for _ in range(iterations):
+            for frame in frames:
+                codec.loads(frame)
+        elapsed = time.perf_counter() - start
+        results[label] = iterations * len(frames) / elapsed
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark JSON codecs over exchange websocket frames.")
+    parser.add_argument("--frames", type=str, default=None, help="File with one JSON frame per line.")
+    parser.add_argument("--iterations", type=int, default=2000)
+    args = parser.parse_args()
+
+    frames = load_frames(args.frames) if args.frames else synthetic_frames()
+    total_bytes = sum(len(frame) for frame in frames)
+    print(f"{len(frames)} frames, {total_bytes} bytes per iteration, {args.iterations} iterations")
+
+    results = benchmark(frames, args.iterations)
+    baseline = results[StdlibJSONCodec.name]
+    for label, frames_per_sec in results.items():
+        print(f"{label:>22}: {frames_per_sec:12,.0f} frames/s ({frames_per_sec / baseline:.2f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+#!/usr/bin/env python
+"""
+Measures the quantize calls per second of an `ExchangePyBase` connector: with the quanta read from the trading rules
+on every call (as before the quantization table), through the connector with the quantization table, and with the
+quantization of the trading pair held by the caller.
+
+Usage:
+    PYTHONPATH=. python test/debug/benchmark_quantization.py [--calls N]
+"""
+
+import argparse
+import timeit
+from decimal import Decimal
+
+from hummingbot.client.config.client_config_map import ClientConfigMap
+from hummingbot.client.config.config_helpers import ClientConfigAdapter
+from hummingbot.connector.exchange.binance.binance_exchange import BinanceExchange
+from hummingbot.connector.trading_rule import TradingRule
+
+TRADING_PAIR = "COINALPHA-HBOT"
+
+
+class TradingRuleQuantaExchange(BinanceExchange):
+    # Connectors with their own quanta use the quantization of the connector base class
+    def get_order_price_quantum(self, trading_pair: str, price: Decimal) -> Decimal:
+        trading_rule = self._trading_rules[trading_pair]
+        return Decimal(trading_rule.min_price_increment)
+
+    def get_order_size_quantum(self, trading_pair: str, order_size: Decimal) -> Decimal:
+        trading_rule = self._trading_rules[trading_pair]
+        return Decimal(trading_rule.min_base_amount_increment)
+
+
+def create_exchange(exchange_class) -> BinanceExchange:
+    exchange = exchange_class(
+        client_config_map=ClientConfigAdapter(ClientConfigMap()),
+        binance_api_key="",
+        binance_api_secret="",
+        trading_pairs=[TRADING_PAIR],
+        trading_required=False)
+    exchange._trading_rules[TRADING_PAIR] = TradingRule(TRADING_PAIR,
+                                                        min_price_increment=Decimal("0.01"),
+                                                        min_base_amount_increment=Decimal("0.001"))
+    return exchange
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the quantization of order prices and amounts.")
+    parser.add_argument("--calls", type=int, default=500000)
+    args = parser.parse_args()
+
+    value = Decimal("1234.56789123")
+    trading_rule_exchange = create_exchange(TradingRuleQuantaExchange)
+    exchange = create_exchange(BinanceExchange)
+    quantization = exchange.get_quantization(TRADING_PAIR)
+    measures = {
+        "trading rule price": lambda: trading_rule_exchange.quantize_order_price(TRADING_PAIR, value),
+        "trading rule amount": lambda: trading_rule_exchange.quantize_order_amount(TRADING_PAIR, value),
+        "table price": lambda: exchange.quantize_order_price(TRADING_PAIR, value),
+        "table amount": lambda: exchange.quantize_order_amount(TRADING_PAIR, value),
+        "held quantization price": lambda: quantization.quantize_price(value),
+        "held quantization amount": lambda: quantization.quantize_amount(value),
+    }
+    for label, measure in measures.items():
+        duration = min(timeit.repeat(measure, number=args.calls, repeat=3))
+        print(f"{label:>24}: {args.calls / duration / 1e6:6.2f} M calls/s")
+
+
+if __name__ == "__main__":
+    main()
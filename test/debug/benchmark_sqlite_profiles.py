@@ -0,0 +1,128 @@
+#!/usr/bin/env python
+"""
+Compares the throughput of `MarketsRecorder` under each SQLite `db_mode` profile, by replaying synthetic order
+created and order filled events (one database transaction per event, as in a live bot).
+
+Usage:
+    PYTHONPATH=. python test/debug/benchmark_sqlite_profiles.py [--events N] [--db-dir <directory>]
+"""
+
+import argparse
+import os
+import tempfile
+import time
+from decimal import Decimal
+from typing import Dict, List
+
+from hummingbot.client.config.client_config_map import (
+    ClientConfigMap,
+    DBMode,
+    DBSqliteMode,
+    DBSqlitePerformanceMode,
+    MarketDataCollectionConfigMap,
+)
+from hummingbot.client.config.config_helpers import ClientConfigAdapter
+from hummingbot.connector.markets_recorder import MarketsRecorder
+from hummingbot.core.data_type.common import OrderType, TradeType
+from hummingbot.core.data_type.trade_fee import AddedToCostTradeFee
+from hummingbot.core.event.events import BuyOrderCreatedEvent, MarketEvent, OrderFilledEvent
+from hummingbot.model.sql_connection_manager import SQLConnectionManager, SQLConnectionType
+
+TRADING_PAIR = "COINALPHA-HBOT"
+
+
+class BenchmarkMarket:
+    """
+    The part of the connector interface used by `MarketsRecorder` to record order events.
+    """
+    display_name = "benchmark_exchange"
+    tracking_states: Dict[str, str] = {}
+
+    def add_trade_fills_from_market_recorder(self, current_trade_fills):
+        pass
+
+    def add_exchange_order_ids_from_market_recorder(self, current_exchange_order_ids):
+        pass
+
+
+def synthetic_events(count: int) -> List[tuple]:
+    events = []
+    timestamp = 1700000000.0
+    for i in range(count // 2):
+        order_id = f"OID-{i}"
+        price = Decimal("100") + Decimal(i % 100) / Decimal("100")
+        events.append((MarketEvent.BuyOrderCreated, BuyOrderCreatedEvent(
+            timestamp=timestamp,
+            type=OrderType.LIMIT,
+            trading_pair=TRADING_PAIR,
+            amount=Decimal("1"),
+            price=price,
+            order_id=order_id,
+            creation_timestamp=timestamp,
+            exchange_order_id=f"EOID-{i}",
+        )))
+        events.append((MarketEvent.OrderFilled, OrderFilledEvent(
+            timestamp=timestamp + 0.5,
+            order_id=order_id,
+            trading_pair=TRADING_PAIR,
+            trade_type=TradeType.BUY,
+            order_type=OrderType.LIMIT,
+            price=price,
+            amount=Decimal("1"),
+            trade_fee=AddedToCostTradeFee(percent=Decimal("0.001")),
+            exchange_trade_id=f"TID-{i}",
+        )))
+        timestamp += 1
+    return events
+
+
+def benchmark(db_mode: DBMode, db_path: str, events: List[tuple]) -> float:
+    client_config_map = ClientConfigAdapter(ClientConfigMap())
+    client_config_map.db_mode = db_mode
+    sql = SQLConnectionManager(client_config_map, SQLConnectionType.TRADE_FILLS, db_path=db_path)
+    market = BenchmarkMarket()
+    recorder = MarketsRecorder(
+        sql=sql,
+        markets=[market],
+        config_file_path=os.path.basename(db_path),
+        strategy_name="benchmark",
+        market_data_collection=MarketDataCollectionConfigMap(market_data_collection_enabled=False),
+    )
+    # The trades CSV export is not part of the database write path
+    recorder.append_to_csv = lambda trade: None
+
+    start = time.perf_counter()
+    for event_type, event in events:
+        if event_type is MarketEvent.OrderFilled:
+            recorder._did_fill_order(event_type.value, market, event)
+        else:
+            recorder._did_create_order(event_type.value, market, event)
+    elapsed = time.perf_counter() - start
+    sql.engine.dispose()
+    return len(events) / elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark MarketsRecorder writes under each SQLite db_mode profile.")
+    parser.add_argument("--events", type=int, default=100000)
+    parser.add_argument("--db-dir", type=str, default=None, help="Directory of the benchmark databases.")
+    args = parser.parse_args()
+
+    events = synthetic_events(args.events)
+    profiles = {
+        DBSqliteMode.Config.title: DBSqliteMode(),
+        DBSqlitePerformanceMode.Config.title: DBSqlitePerformanceMode(),
+    }
+    print(f"Replaying {len(events)} order events through MarketsRecorder")
+
+    with tempfile.TemporaryDirectory(dir=args.db_dir) as db_dir:
+        results = {name: benchmark(db_mode, os.path.join(db_dir, f"{name}.sqlite"), events)
+                   for name, db_mode in profiles.items()}
+
+    baseline = results[DBSqliteMode.Config.title]
+    for name, events_per_sec in results.items():
+        print(f"{name:>30}: {events_per_sec:10,.0f} events/s ({events_per_sec / baseline:.2f}x)")
+
+
+if __name__ == "__main__":
+    main()
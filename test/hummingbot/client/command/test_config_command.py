@@ -86,6 +86,7 @@ class ConfigCommandTest(unittest.TestCase):
                            "    | gateway                           |                      |\n"
                            "    | ∟ gateway_api_host                | localhost            |\n"
                            "    | ∟ gateway_api_port                | 15888                |\n"
+                           "    | ∟ gateway_quote_cache_ttl         | 2                    |\n"
                            "    | rate_oracle_source                | binance              |\n"
                            "    | global_token                      |                      |\n"
                            "    | ∟ global_token_name               | USDT                 |\n"
@@ -100,6 +101,9 @@ class ConfigCommandTest(unittest.TestCase):
                            "    | ∟ market_data_collection_enabled  | True                 |\n"
                            "    | ∟ market_data_collection_interval | 60                   |\n"
                            "    | ∟ market_data_collection_depth    | 20                   |\n"
+                           "    | event_journal                     |                      |\n"
+                           "    | ∟ event_journal_enabled           | False                |\n"
+                           "    | ∟ event_journal_max_file_size     | 64                   |\n"
                            "    +-----------------------------------+----------------------+")
 
         self.assertEqual(df_str_expected, captures[1])
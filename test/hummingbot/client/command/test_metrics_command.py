@@ -0,0 +1,81 @@
+import asyncio
+import unittest
+from typing import Awaitable
+from unittest.mock import MagicMock, patch
+
+from hummingbot.client.config.client_config_map import ClientConfigMap
+from hummingbot.client.config.config_helpers import ClientConfigAdapter, read_system_configs_from_yml
+from hummingbot.client.hummingbot_application import HummingbotApplication
+from hummingbot.core.utils.latency_metrics import LatencyMetric, LatencyMetricsRegistry
+
+
+class MetricsCommandTest(unittest.TestCase):
+    @patch("hummingbot.core.utils.trading_pair_fetcher.TradingPairFetcher")
+    def setUp(self, _: MagicMock) -> None:
+        super().setUp()
+        self.ev_loop = asyncio.get_event_loop()
+
+        self.async_run_with_timeout(read_system_configs_from_yml())
+        self.client_config_map = ClientConfigAdapter(ClientConfigMap())
+
+        self.app = HummingbotApplication(client_config_map=self.client_config_map)
+        self.registry = LatencyMetricsRegistry.get_instance()
+        self.registry.reset()
+
+    def tearDown(self) -> None:
+        self.registry.disable()
+        self.registry.reset()
+        super().tearDown()
+
+    def async_run_with_timeout(self, coroutine: Awaitable, timeout: float = 1):
+        ret = self.ev_loop.run_until_complete(asyncio.wait_for(coroutine, timeout))
+        return ret
+
+    @patch("hummingbot.client.hummingbot_application.HummingbotApplication.notify")
+    def test_enable_disable_and_reset(self, notify_mock):
+        captures = []
+        notify_mock.side_effect = lambda s: captures.append(s)
+
+        self.app.metrics("enable")
+        self.assertTrue(self.registry.enabled)
+        self.registry.record(LatencyMetric.REST_NETWORK, "key", 0.1)
+
+        self.app.metrics("reset")
+        self.assertEqual([], self.registry.snapshot())
+
+        self.app.metrics("disable")
+        self.assertFalse(self.registry.enabled)
+
+        self.assertEqual(
+            ["Latency metrics collection enabled.",
+             "Latency metrics have been reset.",
+             "Latency metrics collection disabled."],
+            captures)
+
+    @patch("hummingbot.client.hummingbot_application.HummingbotApplication.notify")
+    def test_show_metrics(self, notify_mock):
+        captures = []
+        notify_mock.side_effect = lambda s: captures.append(s)
+        self.registry.enable()
+        self.registry.record(LatencyMetric.REST_NETWORK, "/api/v3/order", 0.1)
+        self.registry.record(LatencyMetric.WS_DECODE, "stream.binance.com", 0.001)
+
+        self.app.metrics(metric="rest_network")
+
+        self.assertEqual(1, len(captures))
+        self.assertIn("Latency metrics collection is enabled.", captures[0])
+        self.assertIn("/api/v3/order", captures[0])
+        self.assertIn("p99 (ms)", captures[0])
+        self.assertNotIn("stream.binance.com", captures[0])
+
+    @patch("hummingbot.client.hummingbot_application.HummingbotApplication.notify")
+    def test_show_metrics_when_nothing_recorded(self, notify_mock):
+        captures = []
+        notify_mock.side_effect = lambda s: captures.append(s)
+
+        self.app.metrics()
+
+        self.assertEqual(
+            "\n  Latency metrics collection is disabled (use 'metrics enable' to start collecting)."
+            "\n  No metrics recorded.",
+            captures[0])
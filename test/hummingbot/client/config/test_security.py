@@ -1,15 +1,24 @@
 import asyncio
+import threading
 import unittest
 from pathlib import Path
 from tempfile import TemporaryDirectory
 from typing import Awaitable
+from unittest.mock import patch
 
 from hummingbot.client.config import config_crypt, config_helpers, security
-from hummingbot.client.config.config_crypt import ETHKeyFileSecretManger, store_password_verification, validate_password
+from hummingbot.client.config.config_crypt import (
+    CachedETHKeyFileSecretManager,
+    ETHKeyFileSecretManger,
+    store_password_verification,
+    validate_password,
+)
 from hummingbot.client.config.config_helpers import (
     ClientConfigAdapter,
     api_keys_from_connector_config_map,
     get_connector_config_yml_path,
+    get_connector_hb_config,
+    read_yml_file,
     save_to_yml,
 )
 from hummingbot.client.config.security import Security
@@ -150,3 +159,71 @@ class SecurityTest(unittest.TestCase):
         binance_loaded_config = Security.decrypted_value(binance_config.connector)
 
         self.assertEqual(binance_config, binance_loaded_config)
+
+    def test_cached_secrets_manager_derives_each_key_once(self):
+        password = "som-password"
+        store_password_verification(CachedETHKeyFileSecretManager(password))
+        secrets_manager = CachedETHKeyFileSecretManager(password)
+
+        with patch.object(config_crypt, "_derive_key", wraps=config_crypt._derive_key) as derive_key_mock:
+            self.assertTrue(validate_password(secrets_manager))
+            encrypted_values = [secrets_manager.encrypt_secret_value("attr", f"value_{i}") for i in range(5)]
+            decrypted_values = [secrets_manager.decrypt_secret_value("attr", value) for value in encrypted_values]
+
+        self.assertEqual(1, derive_key_mock.call_count)
+        self.assertEqual([f"value_{i}" for i in range(5)], decrypted_values)
+        self.assertNotEqual(encrypted_values[0], encrypted_values[1])
+        self.assertFalse(any(secrets_manager.needs_reencryption(value) for value in encrypted_values))
+        # The values can still be decrypted by the keyfile secrets manager
+        self.assertEqual("value_0", ETHKeyFileSecretManger(password).decrypt_secret_value("attr", encrypted_values[0]))
+        self.assertFalse(validate_password(CachedETHKeyFileSecretManager("another-password")))
+
+    def test_login_encrypts_legacy_secrets_again(self):
+        password = "som-password"
+        legacy_secrets_manager = ETHKeyFileSecretManger(password)
+        store_password_verification(legacy_secrets_manager)
+        Security.secrets_manager = legacy_secrets_manager
+        config_map = self.store_binance_config()
+        legacy_api_key = read_yml_file(get_connector_config_yml_path(self.connector))["binance_api_key"]
+
+        secrets_manager = CachedETHKeyFileSecretManager(password)
+        self.assertTrue(validate_password(secrets_manager))
+        self.assertTrue(secrets_manager.needs_reencryption(legacy_api_key))
+        Security.secrets_manager = secrets_manager
+        Security.decrypt_all()
+
+        self.assertEqual(api_keys_from_connector_config_map(config_map), Security.api_keys(self.connector))
+        encrypted_data = read_yml_file(get_connector_config_yml_path(self.connector))
+        self.assertFalse(secrets_manager.needs_reencryption(encrypted_data["binance_api_key"]))
+        self.assertFalse(secrets_manager.needs_reencryption(encrypted_data["binance_api_secret"]))
+        self.assertEqual(self.api_key,
+                         legacy_secrets_manager.decrypt_secret_value("api_key", encrypted_data["binance_api_key"]))
+
+    def test_decrypt_all_decrypts_the_files_in_parallel(self):
+        password = "som-password"
+        secrets_manager = CachedETHKeyFileSecretManager(password)
+        store_password_verification(secrets_manager)
+        Security.secrets_manager = secrets_manager
+        connectors = ["binance", "binance_us", "kucoin"]
+        for connector in connectors:
+            config_map = ClientConfigAdapter(get_connector_hb_config(connector))
+            for traversal_item in config_map.traverse():
+                if traversal_item.client_field_data is not None and traversal_item.client_field_data.is_secure:
+                    config_map.setattr_no_validation(traversal_item.attr, f"{connector}_{traversal_item.attr}")
+            save_to_yml(get_connector_config_yml_path(connector), config_map)
+
+        decrypt_connector_config = Security.decrypt_connector_config
+        thread_names = []
+
+        def decrypt_in_thread(file_path):
+            thread_names.append(threading.current_thread().name)
+            decrypt_connector_config(file_path)
+
+        with patch.object(Security, "decrypt_connector_config", side_effect=decrypt_in_thread):
+            Security.decrypt_all()
+
+        self.assertEqual(len(connectors), len(thread_names))
+        self.assertTrue(all(name.startswith("ConfigDecryption") for name in thread_names))
+        self.assertTrue(Security.is_decryption_done())
+        self.assertEqual(set(connectors), set(Security.all_decrypted_values()))
+        self.assertEqual("kucoin_kucoin_api_key", Security.api_keys("kucoin")["kucoin_api_key"])
@@ -5,7 +5,7 @@ from decimal import Decimal
 from typing import Awaitable
 from unittest.mock import MagicMock, patch
 
-from hummingbot.client.performance import PerformanceMetrics
+from hummingbot.client.performance import DerivativePositionPairing, PerformanceMetrics
 from hummingbot.core.data_type.common import OrderType, PositionAction, TradeType
 from hummingbot.core.data_type.trade import Trade
 from hummingbot.core.data_type.trade_fee import AddedToCostTradeFee, DeductedFromReturnsTradeFee, TokenAmount
@@ -230,6 +230,63 @@ class PerformanceMetricsUnitTest(unittest.TestCase):
         self.assertEqual(metrics.trade_pnl, Decimal("1000"))
         self.assertEqual(metrics.total_pnl, Decimal("650"))
 
+    def test_aggregate_orders_does_not_modify_fills(self):
+        trades = [self.mock_trade(id="order1", amount=100, price=10),
+                  self.mock_trade(id="order1", amount=300, price=20)]
+
+        aggregated = PerformanceMetrics.aggregate_orders(trades)
+
+        self.assertEqual(1, len(aggregated))
+        self.assertEqual(400, aggregated[0].amount)
+        self.assertEqual(15, aggregated[0].price)
+        self.assertEqual(100, trades[0].amount)
+        self.assertEqual(10, trades[0].price)
+
+    def test_derivative_trade_pnl_pairs_positions_in_fifo_order(self):
+        trades = [
+            self.mock_trade(id="order1", amount=Decimal("1"), price=Decimal("10"), position="OPEN", type="BUY"),
+            self.mock_trade(id="order2", amount=Decimal("1"), price=Decimal("12"), position="OPEN", type="BUY"),
+            self.mock_trade(id="order3", amount=Decimal("2"), price=Decimal("30"), position="OPEN", type="SELL"),
+            self.mock_trade(id="order4", amount=Decimal("1"), price=Decimal("15"), position="CLOSE", type="SELL"),
+            self.mock_trade(id="order4", amount=Decimal("1"), price=Decimal("17"), position="CLOSE", type="SELL"),
+            self.mock_trade(id="order5", amount=Decimal("2"), price=Decimal("25"), position="CLOSE", type="BUY"),
+            self.mock_trade(id="order6", amount=Decimal("1"), price=Decimal("20"), position="CLOSE", type="SELL"),
+        ]
+
+        pnl = PerformanceMetrics.derivative_trade_pnl(iter(trades))
+
+        # order1 closed by order4 (avg price 16, amount 2), order2 by order6, order3 by order5
+        expected = (Decimal("16") - Decimal("10")) * 2 + (Decimal("20") - Decimal("12")) + (Decimal("30") - Decimal("25")) * 2
+        self.assertEqual(expected, pnl)
+
+    def test_derivative_trade_pnl_ignores_unclosed_positions(self):
+        trades = [
+            self.mock_trade(id="order1", amount=Decimal("1"), price=Decimal("10"), position="OPEN", type="BUY"),
+            self.mock_trade(id="order2", amount=Decimal("1"), price=Decimal("12"), position="OPEN", type="BUY"),
+            self.mock_trade(id="order3", amount=Decimal("1"), price=Decimal("11"), position="CLOSE", type="SELL"),
+        ]
+
+        self.assertEqual(Decimal("1"), PerformanceMetrics.derivative_trade_pnl(trades))
+
+    def test_derivative_position_pairing_settles_old_pairs(self):
+        trades = [
+            self.mock_trade(id="order1", amount=Decimal("1"), price=Decimal("10"), position="OPEN", type="BUY"),
+            self.mock_trade(id="order2", amount=Decimal("1"), price=Decimal("12"), position="CLOSE", type="SELL"),
+            self.mock_trade(id="order3", amount=Decimal("1"), price=Decimal("20"), position="OPEN", type="SELL"),
+            self.mock_trade(id="order4", amount=Decimal("1"), price=Decimal("15"), position="CLOSE", type="BUY"),
+            self.mock_trade(id="order4", amount=Decimal("1"), price=Decimal("17"), position="CLOSE", type="BUY"),
+        ]
+        pairing = DerivativePositionPairing(max_unsettled_pairs=1)
+
+        pairing.add_fills(trades)
+        restored = DerivativePositionPairing.from_json(pairing.to_json(), max_unsettled_pairs=1)
+
+        # The first pair is settled, the second one still accounts for the second fill of order4
+        self.assertEqual(2, len(pairing.to_json()["orders"]))
+        self.assertEqual(Decimal("2") + (Decimal("20") - Decimal("16")) * 2, pairing.pnl())
+        self.assertEqual(pairing.pnl(), restored.pnl())
+        self.assertEqual(pairing.to_json(), restored.to_json())
+
     def test_smart_round(self):
         value = PerformanceMetrics.smart_round(None)
         self.assertIsNone(value)
@@ -0,0 +1,183 @@
+import unittest
+from decimal import Decimal
+from typing import List
+
+from hummingbot.client.config.client_config_map import ClientConfigMap
+from hummingbot.client.config.config_helpers import ClientConfigAdapter
+from hummingbot.client.performance_checkpoints import PerformanceCheckpoints
+from hummingbot.core.data_type.common import PositionAction
+from hummingbot.core.data_type.trade_fee import AddedToCostTradeFee, TokenAmount
+from hummingbot.model.order import Order  # noqa — Order needs to be defined for TradeFill
+from hummingbot.model.order_status import OrderStatus  # noqa — Order needs to be defined for TradeFill
+from hummingbot.model.performance_checkpoint import PerformanceCheckpoint
+from hummingbot.model.sql_connection_manager import SQLConnectionManager, SQLConnectionType
+from hummingbot.model.trade_fill import TradeFill
+from hummingbot.model.trade_fill_aggregates import TradeFillAggregates
+
+
+class PerformanceCheckpointsTest(unittest.TestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        self.sql = SQLConnectionManager(
+            ClientConfigAdapter(ClientConfigMap()), SQLConnectionType.TRADE_FILLS, db_path=""
+        )
+        self.config_file_path = "conf_pure_mm_1.yml"
+
+    def trade_fill(self,
+                   timestamp: int,
+                   order_id: str,
+                   trade_type: str,
+                   price: str,
+                   amount: str,
+                   market: str = "binance",
+                   position: str = PositionAction.NIL.value) -> TradeFill:
+        return TradeFill(
+            config_file_path=self.config_file_path,
+            strategy="pure_market_making",
+            market=market,
+            symbol="COINALPHA-HBOT",
+            base_asset="COINALPHA",
+            quote_asset="HBOT",
+            timestamp=timestamp,
+            order_id=order_id,
+            trade_type=trade_type,
+            order_type="LIMIT",
+            price=Decimal(price),
+            amount=Decimal(amount),
+            trade_fee=AddedToCostTradeFee(
+                percent=Decimal("0.001"), flat_fees=[TokenAmount("BNB", Decimal("0.01"))]).to_json(),
+            exchange_trade_id=f"{order_id}-{timestamp}",
+            position=position,
+        )
+
+    def store(self, trades: List[TradeFill]):
+        with self.sql.get_new_session() as session:
+            with session.begin():
+                session.add_all(trades)
+
+    def market_performances(self, start_timestamp: int = 0, fingerprint: str = "fingerprint"):
+        with self.sql.get_new_session() as session:
+            return PerformanceCheckpoints(
+                session, start_timestamp, self.config_file_path, fingerprint).market_performances()
+
+    def checkpoint(self) -> PerformanceCheckpoint:
+        with self.sql.get_new_session() as session:
+            return session.get(PerformanceCheckpoint, self.config_file_path)
+
+    def test_incremental_update_matches_full_aggregation(self):
+        self.store([
+            self.trade_fill(1000, "OID1", "BUY", "10", "1"),
+            self.trade_fill(1001, "OID2", "SELL", "11", "2"),
+        ])
+        self.market_performances()
+        # The new fills include one with the same timestamp as the last fill of the checkpoint
+        self.store([
+            self.trade_fill(1001, "OID3", "BUY", "10.5", "0.5"),
+            self.trade_fill(1002, "OID4", "SELL", "12", "1"),
+            self.trade_fill(1003, "OID5", "BUY", "9", "3", market="kucoin"),
+        ])
+
+        incremental = {summary.market: summary for summary, _ in self.market_performances()}
+        with self.sql.get_new_session() as session:
+            full = {summary.market: summary
+                    for summary in TradeFillAggregates(session, 0, self.config_file_path).market_summaries()}
+
+        self.assertEqual(full, incremental)
+        self.assertEqual(4, incremental["binance"].num_trades)
+        self.assertEqual(Decimal("0.04"), incremental["binance"].flat_fees["BNB"])
+        self.assertEqual(5, self.checkpoint().last_fill_id)
+
+    def test_fills_recorded_late_with_older_timestamp_are_included(self):
+        self.store([self.trade_fill(1000, "OID1", "BUY", "10", "1"),
+                    self.trade_fill(2000, "OID2", "SELL", "11", "2")])
+        self.market_performances()
+        self.store([self.trade_fill(1500, "OID3", "BUY", "9", "1"),
+                    self.trade_fill(500, "OID4", "SELL", "8", "1")])
+
+        (summary, _), = self.market_performances()
+
+        self.assertEqual(4, summary.num_trades)
+        self.assertEqual(Decimal("8"), summary.first_price)
+        self.assertEqual(Decimal("11"), summary.last_price)
+
+    def test_checkpoint_updated_when_start_moves_forward(self):
+        self.store([
+            self.trade_fill(1000, "OID1", "BUY", "10", "1"),
+            self.trade_fill(2000, "OID2", "SELL", "11", "2"),
+            self.trade_fill(3000, "OID3", "BUY", "12", "1", market="kucoin"),
+        ])
+        self.market_performances(start_timestamp=500)
+        self.store([self.trade_fill(4000, "OID4", "SELL", "13", "1")])
+
+        moved = {summary.market: summary for summary, _ in self.market_performances(start_timestamp=1500)}
+        with self.sql.get_new_session() as session:
+            full = {summary.market: summary
+                    for summary in TradeFillAggregates(session, 1500, self.config_file_path).market_summaries()}
+
+        self.assertEqual(full, moved)
+        self.assertEqual(2, moved["binance"].num_trades)
+        self.assertEqual(Decimal("11"), moved["binance"].first_price)
+        self.assertEqual(1500, self.checkpoint().start_timestamp)
+        self.assertEqual(4, self.checkpoint().last_fill_id)
+
+        moved = {summary.market: summary for summary, _ in self.market_performances(start_timestamp=3500)}
+        self.assertEqual(["binance"], list(moved))
+        self.assertEqual(1, moved["binance"].num_trades)
+
+    def test_checkpoint_unchanged_without_new_fills(self):
+        self.store([self.trade_fill(1000, "OID1", "BUY", "10", "1")])
+        first = self.market_performances()
+        second = self.market_performances()
+
+        self.assertEqual([summary for summary, _ in first], [summary for summary, _ in second])
+        self.assertEqual(1, second[0][0].num_trades)
+
+    def test_checkpoint_rebuilt_when_fingerprint_changes_or_start_moves_backward(self):
+        self.store([
+            self.trade_fill(1000, "OID1", "BUY", "10", "1"),
+            self.trade_fill(2000, "OID2", "SELL", "11", "2"),
+        ])
+        self.market_performances()
+
+        performances = self.market_performances(start_timestamp=1500)
+        self.assertEqual(1, performances[0][0].num_trades)
+        self.assertEqual(1500, self.checkpoint().start_timestamp)
+
+        self.store([self.trade_fill(3000, "OID3", "BUY", "10", "1")])
+        performances = self.market_performances(start_timestamp=1500, fingerprint="new fingerprint")
+        self.assertEqual(2, performances[0][0].num_trades)
+        self.assertEqual("new fingerprint", self.checkpoint().config_fingerprint)
+
+        performances = self.market_performances(start_timestamp=0, fingerprint="new fingerprint")
+        self.assertEqual(3, performances[0][0].num_trades)
+        self.assertEqual(0, self.checkpoint().start_timestamp)
+
+    def test_derivative_pairing_continued_from_checkpoint(self):
+        fills = [
+            self.trade_fill(1000, "OID1", "BUY", "10", "1", position=PositionAction.OPEN.value),
+            self.trade_fill(1001, "OID2", "SELL", "15", "2", position=PositionAction.OPEN.value),
+            self.trade_fill(1002, "OID3", "SELL", "12", "1", position=PositionAction.CLOSE.value),
+            self.trade_fill(1003, "OID4", "BUY", "14", "2", position=PositionAction.CLOSE.value),
+        ]
+        self.store(fills[:2])
+        self.market_performances()
+        self.store(fills[2:])
+
+        (summary, pairing), = self.market_performances()
+
+        self.assertTrue(summary.are_derivatives)
+        self.assertEqual(Decimal("4"), pairing.pnl())
+
+    def test_derivative_positions_paired_again_when_start_moves_forward(self):
+        self.store([
+            self.trade_fill(1000, "OID1", "BUY", "10", "1", position=PositionAction.OPEN.value),
+            self.trade_fill(1001, "OID2", "SELL", "12", "1", position=PositionAction.CLOSE.value),
+            self.trade_fill(2000, "OID3", "BUY", "20", "1", position=PositionAction.OPEN.value),
+            self.trade_fill(2001, "OID4", "SELL", "25", "1", position=PositionAction.CLOSE.value),
+        ])
+        (_, pairing), = self.market_performances()
+        self.assertEqual(Decimal("7"), pairing.pnl())
+
+        (_, pairing), = self.market_performances(start_timestamp=1500)
+
+        self.assertEqual(Decimal("5"), pairing.pnl())
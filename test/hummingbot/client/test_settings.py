@@ -1,9 +1,17 @@
+import json
+import tempfile
 import unittest
+from pathlib import Path
 from unittest.mock import MagicMock, patch
 
 from pydantic import SecretStr
 
-from hummingbot.client.settings import ConnectorSetting, ConnectorType
+from hummingbot.client.settings import (
+    AllConnectorSettings,
+    ConnectorConfigKeysReference,
+    ConnectorSetting,
+    ConnectorType,
+)
 from hummingbot.connector.exchange.binance.binance_utils import BinanceConfigMap
 from hummingbot.connector.gateway.clob_spot.data_sources.injective.injective_api_data_source import (
     InjectiveAPIDataSource,
@@ -195,3 +203,82 @@ class SettingsTest(unittest.TestCase):
 
         self.assertIsInstance(api_data_source, KujiraAPIDataSource)
         self.assertEqual(expected_params_without_api_data_source, params)
+
+
+class AllConnectorSettingsManifestTest(unittest.TestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        self.manifest_dir = tempfile.TemporaryDirectory()
+        self.manifest_path = Path(self.manifest_dir.name) / "connector_manifest.json"
+
+    def tearDown(self) -> None:
+        self.manifest_dir.cleanup()
+        super().tearDown()
+
+    def test_settings_loaded_from_manifest_match_scanned_settings(self):
+        AllConnectorSettings.generate_connector_manifest(self.manifest_path)
+
+        scanned_settings = AllConnectorSettings._scan_connector_settings()
+        manifest_settings = AllConnectorSettings._load_connector_manifest(self.manifest_path)
+
+        self.assertEqual(set(scanned_settings), set(manifest_settings))
+        for name, scanned_setting in scanned_settings.items():
+            manifest_setting = manifest_settings[name]
+            self.assertEqual(scanned_setting._replace(config_keys=None), manifest_setting._replace(config_keys=None))
+            self.assertIs(scanned_setting.config_keys, manifest_setting.config_keys)
+
+    def test_config_keys_loaded_on_access(self):
+        AllConnectorSettings.generate_connector_manifest(self.manifest_path)
+
+        binance_setting = AllConnectorSettings._load_connector_manifest(self.manifest_path)["binance"]
+
+        self.assertEqual(
+            ConnectorConfigKeysReference("hummingbot.connector.exchange.binance.binance_utils"),
+            binance_setting._asdict()["config_keys"],
+        )
+        self.assertIsInstance(binance_setting.config_keys, BinanceConfigMap)
+
+    def test_outdated_manifest_not_used(self):
+        AllConnectorSettings.generate_connector_manifest(self.manifest_path)
+        with open(self.manifest_path) as fd:
+            manifest = json.load(fd)
+        manifest["fingerprint"] = "outdated"
+        with open(self.manifest_path, "w") as fd:
+            json.dump(manifest, fd)
+
+        self.assertIsNone(AllConnectorSettings._load_connector_manifest(self.manifest_path))
+
+    def test_fingerprint_changes_with_any_module_of_the_connector_packages(self):
+        connector_path = Path(self.manifest_dir.name) / "dummy_connector"
+        connector_path.mkdir()
+        (connector_path / "dummy_connector_utils.py").write_text("from .dummy_connector_constants import EXAMPLE_PAIR\n")
+        constants_path = connector_path / "dummy_connector_constants.py"
+        constants_path.write_text("EXAMPLE_PAIR = 'ZRX-ETH'\n")
+        connector_dirs = [("exchange", "dummy_connector", str(connector_path))]
+
+        with patch.object(AllConnectorSettings, "_connector_dirs", return_value=connector_dirs):
+            fingerprint = AllConnectorSettings._connector_utils_fingerprint()
+            constants_path.write_text("EXAMPLE_PAIR = 'BTC-USDT'\n")
+
+            self.assertNotEqual(fingerprint, AllConnectorSettings._connector_utils_fingerprint())
+
+    def test_paper_trade_settings_keep_config_keys_reference(self):
+        AllConnectorSettings.generate_connector_manifest(self.manifest_path)
+        manifest_settings = AllConnectorSettings._load_connector_manifest(self.manifest_path)
+
+        with patch.object(AllConnectorSettings, "all_connector_settings", manifest_settings):
+            with patch.object(ConnectorConfigKeysReference, "load") as load_mock:
+                AllConnectorSettings.initialize_paper_trade_settings(["binance"])
+                paper_trade_setting = manifest_settings["binance_paper_trade"]
+
+        load_mock.assert_not_called()
+        self.assertEqual(manifest_settings["binance"]._asdict()["config_keys"],
+                         paper_trade_setting._asdict()["config_keys"])
+
+    def test_connectors_scanned_without_manifest(self):
+        with patch("hummingbot.client.settings.CONNECTOR_MANIFEST_PATH", self.manifest_path):
+            with patch("hummingbot.client.settings.GatewayConnectionSetting.load", return_value=[]):
+                settings = AllConnectorSettings.create_connector_settings()
+
+        self.assertIn("binance", settings)
+        self.assertIsInstance(settings["binance"]._asdict()["config_keys"], BinanceConfigMap)
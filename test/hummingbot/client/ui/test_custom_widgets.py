@@ -1,12 +1,15 @@
 import asyncio
+import threading
 import unittest
+from test.isolated_asyncio_wrapper_test_case import IsolatedAsyncioWrapperTestCase
 from typing import Awaitable
+from unittest.mock import patch
 
 from prompt_toolkit.document import Document
 
 from hummingbot.client.config.client_config_map import ClientConfigMap
 from hummingbot.client.config.config_helpers import ClientConfigAdapter, read_system_configs_from_yml
-from hummingbot.client.ui.custom_widgets import FormattedTextLexer
+from hummingbot.client.ui.custom_widgets import CustomTextArea, FormattedTextLexer
 
 
 class CustomWidgetUnitTests(unittest.TestCase):
@@ -91,3 +94,51 @@ class CustomWidgetUnitTests(unittest.TestCase):
         line_fragments = get_line(1)
         self.assertEqual(0, len(line_fragments))
         self.assertEqual(expected_fragments, line_fragments)
+
+
+class CustomTextAreaTest(IsolatedAsyncioWrapperTestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        self.text_area = CustomTextArea(max_line_count=3, render_interval=0.01)
+
+    def test_log_without_running_loop_updates_the_document(self):
+        text_area = CustomTextArea(max_line_count=3, initial_text="header")
+
+        text_area.log("first\nsecond")
+        text_area.log("third")
+
+        self.assertEqual("first\nsecond\nthird", text_area.text)
+        self.assertEqual(len(text_area.text), text_area.document.cursor_position)
+        self.assertEqual(3, len(text_area.log_lines))
+
+    async def test_logs_are_rendered_once_per_interval(self):
+        with patch.object(self.text_area, "render", wraps=self.text_area.render) as render_mock:
+            for i in range(100):
+                self.text_area.log(f"line {i}")
+
+            self.assertEqual("", self.text_area.text)
+            await asyncio.sleep(0.05)
+
+        self.assertEqual(1, render_mock.call_count)
+        self.assertEqual("line 97\nline 98\nline 99", self.text_area.text)
+
+    async def test_unsaved_and_silent_logs(self):
+        self.text_area.log("saved")
+        self.text_area.log("live\nupdate", save_log=False)
+        self.text_area.log("silent", silent=True)
+        await asyncio.sleep(0.05)
+
+        self.assertEqual("live\nupdate", self.text_area.text)
+
+        self.text_area.log("new")
+        await asyncio.sleep(0.05)
+
+        self.assertEqual("saved\nsilent\nnew", self.text_area.text)
+
+    async def test_log_from_another_thread(self):
+        thread = threading.Thread(target=self.text_area.log, args=("from thread",))
+        thread.start()
+        thread.join()
+        await asyncio.sleep(0.05)
+
+        self.assertEqual("\nfrom thread", self.text_area.text)
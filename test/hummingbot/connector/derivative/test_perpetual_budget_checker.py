@@ -1,6 +1,7 @@
 import unittest
 from decimal import Decimal
 from test.mock.mock_perp_connector import MockPerpConnector
+from unittest.mock import patch
 
 from hummingbot.client.config.client_config_map import ClientConfigMap
 from hummingbot.client.config.config_helpers import ClientConfigAdapter
@@ -10,6 +11,7 @@ from hummingbot.connector.utils import combine_to_hb_trading_pair
 from hummingbot.core.data_type.common import OrderType, TradeType
 from hummingbot.core.data_type.order_candidate import PerpetualOrderCandidate
 from hummingbot.core.data_type.trade_fee import TradeFeeSchema
+from hummingbot.core.utils.estimate_fee import build_perpetual_trade_fee
 
 
 class PerpetualBudgetCheckerTest(unittest.TestCase):
@@ -275,3 +277,34 @@ class PerpetualBudgetCheckerTest(unittest.TestCase):
         self.assertEqual(Decimal("0.099"), adjusted_candidate.percent_fee_value.amount)  # 9.9 * 0.01
         self.assertEqual(0, len(adjusted_candidate.fixed_fee_collaterals))
         self.assertIsNone(adjusted_candidate.potential_returns)  # order results in position open
+
+    def test_adjust_candidates(self):
+        self.exchange.set_balance(self.quote_asset, Decimal("10"))
+        order_candidates = [
+            PerpetualOrderCandidate(
+                trading_pair=self.trading_pair,
+                is_maker=True,
+                order_type=OrderType.LIMIT,
+                order_side=TradeType.BUY,
+                amount=Decimal("4"),
+                price=Decimal("2"),
+                leverage=Decimal("2"),
+                position_close=position_close,
+            )
+            for position_close in [False, True, False, True, False]
+        ]
+        self.budget_checker.reset_locked_collateral()
+        expected_candidates = [
+            self.budget_checker.adjust_candidate_and_lock_available_collateral(order_candidate, all_or_none=True)
+            for order_candidate in order_candidates
+        ]
+        self.budget_checker.reset_locked_collateral()
+
+        with patch("hummingbot.core.data_type.order_candidate.build_perpetual_trade_fee",
+                   wraps=build_perpetual_trade_fee) as fee_mock:
+            adjusted_candidates = self.budget_checker.adjust_candidates(order_candidates, all_or_none=True)
+
+        self.assertEqual(expected_candidates, adjusted_candidates)
+        # The position close candidates do not lock collateral
+        self.assertEqual([Decimal("4")] * 4 + [Decimal("0")], [candidate.amount for candidate in adjusted_candidates])
+        self.assertEqual(2, fee_mock.call_count)
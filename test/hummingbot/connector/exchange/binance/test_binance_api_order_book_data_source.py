@@ -13,6 +13,7 @@ from hummingbot.client.config.config_helpers import ClientConfigAdapter
 from hummingbot.connector.exchange.binance import binance_constants as CONSTANTS, binance_web_utils as web_utils
 from hummingbot.connector.exchange.binance.binance_api_order_book_data_source import BinanceAPIOrderBookDataSource
 from hummingbot.connector.exchange.binance.binance_exchange import BinanceExchange
+from hummingbot.connector.exchange.binance.binance_ws_stream_multiplexer import BinanceWSStreamMultiplexer
 from hummingbot.connector.test_support.network_mocking_assistant import NetworkMockingAssistant
 from hummingbot.core.data_type.order_book import OrderBook
 from hummingbot.core.data_type.order_book_message import OrderBookMessage
@@ -215,6 +216,104 @@ class BinanceAPIOrderBookDataSourceUnitTests(unittest.TestCase):
             "Subscribed to public order book and trade channels..."
         ))
 
+    @patch("aiohttp.ClientSession.ws_connect", new_callable=AsyncMock)
+    def test_listen_for_subscriptions_through_multiplexer_dispatches_to_channel_queues(self, ws_connect_mock):
+        ws_connect_mock.return_value = self.mocking_assistant.create_websocket_mock()
+        multiplexer = BinanceWSStreamMultiplexer(ws_url=CONSTANTS.WSS_COMBINED_STREAMS_URL.format(self.domain))
+        self.data_source._ws_multiplexer = multiplexer
+
+        trade_event = {"e": "trade", "s": self.ex_trading_pair, "t": 12345}
+        diff_event = {"e": "depthUpdate", "s": self.ex_trading_pair, "U": 157, "u": 160, "b": [], "a": []}
+        self.mocking_assistant.add_websocket_aiohttp_message(
+            websocket_mock=ws_connect_mock.return_value,
+            message=json.dumps({"result": None, "id": 1}))
+        self.mocking_assistant.add_websocket_aiohttp_message(
+            websocket_mock=ws_connect_mock.return_value,
+            message=json.dumps({"stream": f"{self.ex_trading_pair.lower()}@trade", "data": trade_event}))
+        self.mocking_assistant.add_websocket_aiohttp_message(
+            websocket_mock=ws_connect_mock.return_value,
+            message=json.dumps({"stream": f"{self.ex_trading_pair.lower()}@depth@100ms", "data": diff_event}))
+
+        self.listening_task = self.ev_loop.create_task(self.data_source.listen_for_subscriptions())
+        self.mocking_assistant.run_until_all_aiohttp_messages_delivered(ws_connect_mock.return_value)
+
+        sent_subscription_messages = self.mocking_assistant.json_messages_sent_through_websocket(
+            websocket_mock=ws_connect_mock.return_value)
+        self.assertEqual(1, len(sent_subscription_messages))
+        self.assertEqual("SUBSCRIBE", sent_subscription_messages[0]["method"])
+        self.assertEqual(
+            [f"{self.ex_trading_pair.lower()}@depth@100ms", f"{self.ex_trading_pair.lower()}@trade"],
+            sent_subscription_messages[0]["params"])
+        self.assertEqual(CONSTANTS.WSS_COMBINED_STREAMS_URL.format(self.domain), ws_connect_mock.call_args[0][0])
+        self.assertEqual(trade_event, self.data_source._message_queue[CONSTANTS.TRADE_EVENT_TYPE].get_nowait())
+        self.assertEqual(diff_event, self.data_source._message_queue[CONSTANTS.DIFF_EVENT_TYPE].get_nowait())
+
+        self.listening_task.cancel()
+        self.async_run_with_timeout(asyncio.sleep(0.1))
+        self.assertEqual(set(), multiplexer.streams)
+
+    @patch("aiohttp.ClientSession.ws_connect", new_callable=AsyncMock)
+    def test_add_and_remove_trading_pair_on_live_connection(self, ws_connect_mock):
+        ws_connect_mock.return_value = self.mocking_assistant.create_websocket_mock()
+        new_ex_trading_pair = "COINBETAHBOT"
+        self.connector._set_trading_pair_symbol_map(
+            bidict({self.ex_trading_pair: self.trading_pair, new_ex_trading_pair: "COINBETA-HBOT"}))
+        self.mocking_assistant.add_websocket_aiohttp_message(
+            websocket_mock=ws_connect_mock.return_value,
+            message=json.dumps({"result": None, "id": 1}))
+
+        self.listening_task = self.ev_loop.create_task(self.data_source.listen_for_subscriptions())
+        self.mocking_assistant.run_until_all_aiohttp_messages_delivered(ws_connect_mock.return_value)
+
+        self.async_run_with_timeout(self.data_source.add_trading_pair("COINBETA-HBOT"))
+        self.async_run_with_timeout(self.data_source.remove_trading_pair(self.trading_pair))
+
+        sent_messages = self.mocking_assistant.json_messages_sent_through_websocket(
+            websocket_mock=ws_connect_mock.return_value)
+        self.assertEqual(1, ws_connect_mock.call_count)
+        self.assertEqual(4, len(sent_messages))
+        self.assertEqual(
+            {"method": "SUBSCRIBE",
+             "params": [f"{new_ex_trading_pair.lower()}@trade", f"{new_ex_trading_pair.lower()}@depth@100ms"],
+             "id": 3},
+            sent_messages[2])
+        self.assertEqual(
+            {"method": "UNSUBSCRIBE",
+             "params": [f"{self.ex_trading_pair.lower()}@trade", f"{self.ex_trading_pair.lower()}@depth@100ms"],
+             "id": 3},
+            sent_messages[3])
+        self.assertEqual(["COINBETA-HBOT"], self.data_source._trading_pairs)
+
+    @patch("aiohttp.ClientSession.ws_connect", new_callable=AsyncMock)
+    def test_add_and_remove_trading_pair_through_multiplexer(self, ws_connect_mock):
+        ws_connect_mock.return_value = self.mocking_assistant.create_websocket_mock()
+        multiplexer = BinanceWSStreamMultiplexer(ws_url=CONSTANTS.WSS_COMBINED_STREAMS_URL.format(self.domain))
+        self.data_source._ws_multiplexer = multiplexer
+        new_ex_trading_pair = "COINBETAHBOT"
+        self.connector._set_trading_pair_symbol_map(
+            bidict({self.ex_trading_pair: self.trading_pair, new_ex_trading_pair: "COINBETA-HBOT"}))
+        self.mocking_assistant.add_websocket_aiohttp_message(
+            websocket_mock=ws_connect_mock.return_value,
+            message=json.dumps({"result": None, "id": 1}))
+
+        self.listening_task = self.ev_loop.create_task(self.data_source.listen_for_subscriptions())
+        self.mocking_assistant.run_until_all_aiohttp_messages_delivered(ws_connect_mock.return_value)
+
+        self.async_run_with_timeout(self.data_source.add_trading_pair("COINBETA-HBOT"))
+        self.async_run_with_timeout(self.data_source.remove_trading_pair(self.trading_pair))
+
+        self.assertEqual(1, ws_connect_mock.call_count)
+        self.assertEqual(
+            {f"{new_ex_trading_pair.lower()}@trade", f"{new_ex_trading_pair.lower()}@depth@100ms"},
+            multiplexer.streams)
+        sent_messages = self.mocking_assistant.json_messages_sent_through_websocket(
+            websocket_mock=ws_connect_mock.return_value)
+        self.assertEqual("UNSUBSCRIBE", sent_messages[-1]["method"])
+
+        self.listening_task.cancel()
+        self.async_run_with_timeout(asyncio.sleep(0.1))
+        self.assertEqual(set(), multiplexer.streams)
+
     @patch("hummingbot.core.data_type.order_book_tracker_data_source.OrderBookTrackerDataSource._sleep")
     @patch("aiohttp.ClientSession.ws_connect")
     def test_listen_for_subscriptions_raises_cancel_exception(self, mock_ws, _: AsyncMock):
@@ -17,6 +17,7 @@ from hummingbot.connector.trading_rule import TradingRule
 from hummingbot.connector.utils import get_new_client_order_id
 from hummingbot.core.data_type.common import OrderType, TradeType
 from hummingbot.core.data_type.in_flight_order import InFlightOrder, OrderState
+from hummingbot.core.data_type.limit_order import LimitOrder
 from hummingbot.core.data_type.trade_fee import DeductedFromReturnsTradeFee, TokenAmount, TradeFeeBase
 from hummingbot.core.event.events import MarketOrderFailureEvent, OrderFilledEvent
 
@@ -1378,3 +1379,110 @@ class BinanceExchangeTests(AbstractExchangeConnectorTests.ExchangeConnectorTests
                 "isBestMatch": True
             }
         ]
+
+    @aioresponses()
+    def test_batch_order_create_without_batch_endpoints_sends_single_orders(self, mock_api):
+        self._simulate_trading_rules_initialized()
+        self.exchange._set_current_timestamp(1640780000)
+        mock_api.post(self.order_creation_url,
+                      body=json.dumps(self.order_creation_request_successful_mock_response),
+                      repeat=True)
+        orders_to_create = [
+            LimitOrder(client_order_id="",
+                       trading_pair=self.trading_pair,
+                       is_buy=is_buy,
+                       base_currency=self.base_asset,
+                       quote_currency=self.quote_asset,
+                       price=Decimal("10000"),
+                       quantity=Decimal("100"))
+            for is_buy in (True, False)
+        ]
+
+        created_orders = self.exchange.batch_order_create(orders_to_create, limit_order_type=OrderType.LIMIT_MAKER)
+        self.async_run_with_timeout(self._wait_for_created_events(len(orders_to_create)))
+
+        order_requests = self._all_executed_requests(mock_api, self.order_creation_url)
+        self.assertEqual(2, len(order_requests))
+        self.assertEqual([order.client_order_id for order in created_orders],
+                         [dict(request.kwargs["data"])["newClientOrderId"] for request in order_requests])
+        self.assertEqual({"LIMIT_MAKER"}, {dict(request.kwargs["data"])["type"] for request in order_requests})
+        self.assertEqual(created_orders[0].client_order_id, self.buy_order_created_logger.event_log[0].order_id)
+        self.assertEqual(created_orders[1].client_order_id, self.sell_order_created_logger.event_log[0].order_id)
+
+    @aioresponses()
+    def test_batch_order_cancel_without_batch_endpoints_sends_single_cancelations(self, mock_api):
+        self.exchange._set_current_timestamp(1640780000)
+        for order_id in ("11", "12"):
+            self.exchange.start_tracking_order(
+                order_id=order_id,
+                exchange_order_id=order_id,
+                trading_pair=self.trading_pair,
+                trade_type=TradeType.BUY,
+                price=Decimal("10000"),
+                amount=Decimal("100"),
+                order_type=OrderType.LIMIT,
+            )
+        orders = [self.exchange.in_flight_orders["11"], self.exchange.in_flight_orders["12"]]
+        url = ""
+        for order in orders:
+            url = self.configure_successful_cancelation_response(order=order, mock_api=mock_api)
+
+        self.exchange.batch_order_cancel([order.to_limit_order() for order in orders])
+        self.async_run_with_timeout(self._wait_for_cancelled_events(len(orders)))
+
+        self.assertEqual(2, len(self._all_executed_requests(mock_api, url)))
+        self.assertEqual({"11", "12"}, {event.order_id for event in self.order_cancelled_logger.event_log})
+        self.assertTrue(all(order.is_cancelled for order in orders))
+
+    @aioresponses()
+    def test_amend_order_without_amend_endpoint_cancels_and_creates_an_order(self, mock_api):
+        self._simulate_trading_rules_initialized()
+        self.exchange._set_current_timestamp(1640780000)
+        self.exchange.start_tracking_order(
+            order_id="11",
+            exchange_order_id="11",
+            trading_pair=self.trading_pair,
+            trade_type=TradeType.SELL,
+            price=Decimal("10000"),
+            amount=Decimal("100"),
+            order_type=OrderType.LIMIT_MAKER,
+        )
+        order = self.exchange.in_flight_orders["11"]
+        self.configure_successful_cancelation_response(order=order, mock_api=mock_api)
+        mock_api.post(self.order_creation_url, body=json.dumps(self.order_creation_request_successful_mock_response))
+
+        new_order_id = self.exchange.amend_order(order.to_limit_order(), price=Decimal("10100"), amount=Decimal("90"))
+        self.async_run_with_timeout(self._wait_for_created_events(1))
+        self.async_run_with_timeout(self._wait_for_cancelled_events(1))
+
+        self.assertNotEqual("11", new_order_id)
+        # The cancelation and the creation requests are sent to the same endpoint
+        self.assertEqual(["DELETE", "POST"], sorted(method for method, _ in mock_api.requests))
+        order_request = dict(next(requests[0] for (method, _), requests in mock_api.requests.items()
+                                  if method == "POST").kwargs["data"])
+        self.assertEqual(new_order_id, order_request["newClientOrderId"])
+        self.assertEqual("SELL", order_request["side"])
+        self.assertEqual("LIMIT_MAKER", order_request["type"])
+        self.assertEqual(Decimal("10100"), Decimal(order_request["price"]))
+        self.assertEqual(Decimal("90"), Decimal(order_request["quantity"]))
+        self.assertTrue(order.is_cancelled)
+
+    def test_amend_order_not_tracked_is_not_replaced(self):
+        order = LimitOrder(client_order_id="11",
+                           trading_pair=self.trading_pair,
+                           is_buy=True,
+                           base_currency=self.base_asset,
+                           quote_currency=self.quote_asset,
+                           price=Decimal("10000"),
+                           quantity=Decimal("100"))
+
+        self.assertIsNone(self.exchange.amend_order(order, price=Decimal("10100"), amount=Decimal("90")))
+        self.assertTrue(self.is_logged("WARNING", "Failed to amend order 11 (order not found)"))
+
+    async def _wait_for_created_events(self, events_count: int):
+        while len(self.buy_order_created_logger.event_log) + len(self.sell_order_created_logger.event_log) < events_count:
+            await asyncio.sleep(0.01)
+
+    async def _wait_for_cancelled_events(self, events_count: int):
+        while len(self.order_cancelled_logger.event_log) < events_count:
+            await asyncio.sleep(0.01)
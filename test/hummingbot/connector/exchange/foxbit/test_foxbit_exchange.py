@@ -22,6 +22,7 @@ from hummingbot.connector.test_support.network_mocking_assistant import NetworkM
 from hummingbot.connector.trading_rule import TradingRule
 from hummingbot.core.data_type.common import OrderType, TradeType
 from hummingbot.core.data_type.in_flight_order import InFlightOrder
+from hummingbot.core.data_type.limit_order import LimitOrder
 from hummingbot.core.data_type.trade_fee import DeductedFromReturnsTradeFee, TokenAmount, TradeFeeBase
 
 
@@ -932,6 +933,36 @@ class FoxbitExchangeTests(AbstractExchangeConnectorTests.ExchangeConnectorTests)
                                                                          Decimal(22354.01)))
         self.assertIsNone(_order)
 
+    @aioresponses()
+    def test_batch_order_create_creates_the_orders_with_buy_and_sell(self, mock_api):
+        self._simulate_trading_rules_initialized()
+        self.exchange._set_current_timestamp(1640780000)
+        mock_api.post(self.order_creation_url,
+                      body=json.dumps(self.order_creation_request_successful_mock_response),
+                      repeat=True)
+        orders_to_create = [
+            LimitOrder(client_order_id="",
+                       trading_pair=self.trading_pair,
+                       is_buy=is_buy,
+                       base_currency=self.base_asset,
+                       quote_currency=self.quote_asset,
+                       price=Decimal("10000"),
+                       quantity=Decimal("100"))
+            for is_buy in (True, False)
+        ]
+
+        created_orders = self.exchange.batch_order_create(orders_to_create)
+        self.async_run_with_timeout(self._wait_for_created_events(len(orders_to_create)))
+
+        # The orders get the client ids of the Foxbit buy and sell overrides
+        self.assertEqual(utils.get_client_order_id(is_buy=True)[:4], created_orders[0].client_order_id[:4])
+        self.assertEqual(utils.get_client_order_id(is_buy=False)[:4], created_orders[1].client_order_id[:4])
+        order_requests = self._all_executed_requests(mock_api, self.order_creation_url)
+        self.assertEqual([order.client_order_id for order in created_orders],
+                         [eval(request.kwargs["data"])["client_order_id"] for request in order_requests])
+        self.assertEqual(created_orders[0].client_order_id, self.buy_order_created_logger.event_log[0].order_id)
+        self.assertEqual(created_orders[1].client_order_id, self.sell_order_created_logger.event_log[0].order_id)
+
     @aioresponses()
     def test_create_limit_buy_order_raises_error(self, mock_api):
         self._simulate_trading_rules_initialized()
@@ -1192,3 +1223,7 @@ class FoxbitExchangeTests(AbstractExchangeConnectorTests.ExchangeConnectorTests)
     @aioresponses()
     def test_lost_order_user_stream_full_fill_events_are_processed(self, mock_api):
         pass
+
+    async def _wait_for_created_events(self, events_count: int):
+        while len(self.buy_order_created_logger.event_log) + len(self.sell_order_created_logger.event_log) < events_count:
+            await asyncio.sleep(0.01)
@@ -3,9 +3,9 @@ import json
 import re
 from decimal import Decimal
 from typing import Any, Callable, List, Optional, Tuple
-from unittest.mock import patch
+from unittest.mock import AsyncMock, patch
 
-from aioresponses import aioresponses
+from aioresponses import CallbackResult, aioresponses
 from aioresponses.core import RequestCall
 
 from hummingbot.client.config.client_config_map import ClientConfigMap
@@ -15,7 +15,8 @@ from hummingbot.connector.exchange.okx.okx_exchange import OkxExchange
 from hummingbot.connector.test_support.exchange_connector_test import AbstractExchangeConnectorTests
 from hummingbot.connector.trading_rule import TradingRule
 from hummingbot.connector.utils import get_new_client_order_id
-from hummingbot.core.data_type.in_flight_order import InFlightOrder
+from hummingbot.core.data_type.in_flight_order import InFlightOrder, OrderState, OrderUpdate
+from hummingbot.core.data_type.limit_order import LimitOrder
 from hummingbot.core.data_type.trade_fee import AddedToCostTradeFee, TokenAmount, TradeFeeBase
 from hummingbot.core.event.events import OrderCancelledEvent, OrderType, TradeType
 
@@ -542,12 +543,24 @@ class OkxExchangeTests(AbstractExchangeConnectorTests.ExchangeConnectorTests):
         """
         :return: a list of all configured URLs for the cancelations
         """
-        all_urls = []
-        url = self.configure_successful_cancelation_response(order=successful_order, mock_api=mock_api)
-        all_urls.append(url)
-        url = self.configure_erroneous_cancelation_response(order=erroneous_order, mock_api=mock_api)
-        all_urls.append(url)
-        return all_urls
+        # All the orders are canceled with a single batch cancelation request
+        url = web_utils.private_rest_url(path_url=CONSTANTS.OKX_BATCH_ORDER_CANCEL_PATH)
+        response = {
+            "code": "2",
+            "msg": "",
+            "data": [
+                self._order_cancelation_request_successful_mock_response(response_scode=0, order=successful_order)[
+                    "data"][0],
+                {
+                    "clOrdId": erroneous_order.client_order_id,
+                    "ordId": erroneous_order.exchange_order_id,
+                    "sCode": "1",
+                    "sMsg": "Error"
+                },
+            ]
+        }
+        mock_api.post(url, body=json.dumps(response))
+        return [url]
 
     def configure_order_not_found_error_cancelation_response(
             self, order: InFlightOrder, mock_api: aioresponses,
@@ -1182,3 +1195,312 @@ class OkxExchangeTests(AbstractExchangeConnectorTests.ExchangeConnectorTests):
             else:
                 self.assertIn(order.client_order_id, self.exchange.in_flight_orders)
                 self.assertTrue(order.is_pending_cancel_confirmation)
+
+    def _batch_orders_mock_response(self, url: str, data: str, failed_client_order_ids: List[str]):
+        response = {
+            "code": "2" if failed_client_order_ids else "0",
+            "msg": "",
+            "data": [
+                {
+                    "clOrdId": order_data["clOrdId"],
+                    "ordId": "" if order_data["clOrdId"] in failed_client_order_ids else f"EOID-{order_data['clOrdId']}",
+                    "tag": "",
+                    "sCode": "51008" if order_data["clOrdId"] in failed_client_order_ids else "0",
+                    "sMsg": "Insufficient balance" if order_data["clOrdId"] in failed_client_order_ids else "",
+                }
+                for order_data in json.loads(data)
+            ]
+        }
+        return CallbackResult(body=json.dumps(response))
+
+    async def _wait_for_events(self, events_count: int):
+        while (len(self.buy_order_created_logger.event_log) + len(self.sell_order_created_logger.event_log)
+               + len(self.order_failure_logger.event_log)) < events_count:
+            await asyncio.sleep(0.01)
+
+    @aioresponses()
+    def test_batch_order_create_sends_a_request_per_batch_of_orders(self, mock_api):
+        self._simulate_trading_rules_initialized()
+        self.exchange._set_current_timestamp(1640780000)
+        url = web_utils.private_rest_url(path_url=CONSTANTS.OKX_BATCH_ORDERS_PATH)
+        failed_client_order_ids = []
+        mock_api.post(url,
+                      callback=lambda url, **kwargs: self._batch_orders_mock_response(
+                          url, kwargs["data"], failed_client_order_ids),
+                      repeat=True)
+        # A ladder of 20 levels on each side
+        orders_to_create = [
+            LimitOrder(client_order_id="",
+                       trading_pair=self.trading_pair,
+                       is_buy=is_buy,
+                       base_currency=self.base_asset,
+                       quote_currency=self.quote_asset,
+                       price=Decimal("10000") + (-level if is_buy else level + 1),
+                       quantity=Decimal("1"))
+            for is_buy in (True, False) for level in range(20)
+        ]
+
+        created_orders = self.exchange.batch_order_create(orders_to_create, limit_order_type=OrderType.LIMIT_MAKER)
+        failed_client_order_ids.append(created_orders[-1].client_order_id)
+        self.async_run_with_timeout(self._wait_for_events(len(orders_to_create)))
+
+        batch_requests = self._all_executed_requests(mock_api, url)
+        self.assertEqual(2, len(batch_requests))
+        self.validate_auth_credentials_present(batch_requests[0])
+        requested_orders = [order_data for request in batch_requests for order_data in json.loads(request.kwargs["data"])]
+        self.assertEqual(CONSTANTS.MAX_ORDERS_PER_BATCH, len(json.loads(batch_requests[0].kwargs["data"])))
+        self.assertEqual([order.client_order_id for order in created_orders],
+                         [order_data["clOrdId"] for order_data in requested_orders])
+        self.assertEqual({"post_only"}, {order_data["ordType"] for order_data in requested_orders})
+        self.assertEqual(created_orders[0].price, Decimal(requested_orders[0]["px"]))
+        self.assertEqual("buy", requested_orders[0]["side"])
+        self.assertEqual("sell", requested_orders[-1]["side"])
+
+        self.assertEqual(20, len(self.buy_order_created_logger.event_log))
+        self.assertEqual(19, len(self.sell_order_created_logger.event_log))
+        self.assertEqual(1, len(self.order_failure_logger.event_log))
+        self.assertEqual(created_orders[-1].client_order_id, self.order_failure_logger.event_log[0].order_id)
+        self.assertEqual(f"EOID-{created_orders[0].client_order_id}",
+                         self.exchange.in_flight_orders[created_orders[0].client_order_id].exchange_order_id)
+        self.assertEqual(OrderType.LIMIT_MAKER,
+                         self.exchange.in_flight_orders[created_orders[0].client_order_id].order_type)
+
+    @aioresponses()
+    def test_batch_order_create_failure_fails_all_the_orders_of_the_batch(self, mock_api):
+        self._simulate_trading_rules_initialized()
+        self.exchange._set_current_timestamp(1640780000)
+        url = web_utils.private_rest_url(path_url=CONSTANTS.OKX_BATCH_ORDERS_PATH)
+        mock_api.post(url, status=400)
+        orders_to_create = [
+            LimitOrder(client_order_id="",
+                       trading_pair=self.trading_pair,
+                       is_buy=is_buy,
+                       base_currency=self.base_asset,
+                       quote_currency=self.quote_asset,
+                       price=Decimal("10000"),
+                       quantity=Decimal("1"))
+            for is_buy in (True, False)
+        ]
+
+        created_orders = self.exchange.batch_order_create(orders_to_create)
+        self.async_run_with_timeout(self._wait_for_events(len(orders_to_create)))
+
+        self.assertEqual(1, len(self._all_executed_requests(mock_api, url)))
+        self.assertEqual([order.client_order_id for order in created_orders],
+                         [event.order_id for event in self.order_failure_logger.event_log])
+        self.assertEqual(0, len(self.exchange.in_flight_orders))
+
+    @aioresponses()
+    def test_batch_order_cancel(self, mock_api):
+        self.exchange._set_current_timestamp(1640780000)
+        for order_id, trade_type in (("11", TradeType.BUY), ("12", TradeType.SELL)):
+            self.exchange.start_tracking_order(
+                order_id=order_id,
+                exchange_order_id=f"EOID-{order_id}",
+                trading_pair=self.trading_pair,
+                trade_type=trade_type,
+                price=Decimal("10000"),
+                amount=Decimal("100"),
+                order_type=OrderType.LIMIT,
+            )
+        orders = [self.exchange.in_flight_orders["11"], self.exchange.in_flight_orders["12"]]
+        url = self.configure_one_successful_one_erroneous_cancel_all_response(
+            successful_order=orders[0], erroneous_order=orders[1], mock_api=mock_api)[0]
+
+        self.exchange.batch_order_cancel([order.to_limit_order() for order in orders])
+        self.async_run_with_timeout(self._wait_for_pending_cancel(orders[0]))
+
+        cancel_requests = self._all_executed_requests(mock_api, url)
+        self.assertEqual(1, len(cancel_requests))
+        self.validate_auth_credentials_present(cancel_requests[0])
+        self.assertEqual([{"clOrdId": "11", "instId": self.trading_pair}, {"clOrdId": "12", "instId": self.trading_pair}],
+                         json.loads(cancel_requests[0].kwargs["data"]))
+        self.assertTrue(orders[0].is_pending_cancel_confirmation)
+        self.assertFalse(orders[1].is_pending_cancel_confirmation)
+        self.assertTrue(self.is_logged("ERROR", "Failed to cancel order 12"))
+
+    async def _wait_for_pending_cancel(self, order: InFlightOrder):
+        while not order.is_pending_cancel_confirmation:
+            await asyncio.sleep(0.01)
+
+    def _open_order(self, order_id: str) -> InFlightOrder:
+        self.exchange.start_tracking_order(
+            order_id=order_id,
+            exchange_order_id=f"EOID-{order_id}",
+            trading_pair=self.trading_pair,
+            trade_type=TradeType.BUY,
+            price=Decimal("10000"),
+            amount=Decimal("100"),
+            order_type=OrderType.LIMIT,
+        )
+        order = self.exchange.in_flight_orders[order_id]
+        order.update_with_order_update(OrderUpdate(
+            client_order_id=order_id,
+            trading_pair=self.trading_pair,
+            update_timestamp=self.exchange.current_timestamp,
+            new_state=OrderState.OPEN,
+        ))
+        return order
+
+    @staticmethod
+    def _amend_order_mock_response(order_id: str, error_code: str = "0") -> dict:
+        return {
+            "code": error_code,
+            "msg": "",
+            "data": [
+                {
+                    "clOrdId": order_id,
+                    "ordId": f"EOID-{order_id}",
+                    "reqId": "",
+                    "sCode": error_code,
+                    "sMsg": "Order modification failed" if error_code != "0" else "",
+                }
+            ]
+        }
+
+    @aioresponses()
+    def test_amend_order_in_place(self, mock_api):
+        self._simulate_trading_rules_initialized()
+        self.exchange._set_current_timestamp(1640780000)
+        order = self._open_order("11")
+        url = web_utils.private_rest_url(path_url=CONSTANTS.OKX_AMEND_ORDER_PATH)
+        mock_api.post(url, body=json.dumps(self._amend_order_mock_response("11")))
+
+        order_id = self.exchange.amend_order(order.to_limit_order(), price=Decimal("10100.123456"), amount=Decimal("90"))
+        self.async_run_with_timeout(self._wait_for_amend_request(mock_api, url))
+
+        self.assertEqual("11", order_id)
+        amend_request = self._all_executed_requests(mock_api, url)[0]
+        self.validate_auth_credentials_present(amend_request)
+        self.assertEqual({"clOrdId": "11", "instId": self.exchange_symbol_for_tokens(self.base_asset, self.quote_asset),
+                          "newSz": "90.000000", "newPx": "10100.1234"},
+                         json.loads(amend_request.kwargs["data"]))
+        # The amend request is only accepted, the order is amended when the orders channel reports it
+        self.assertEqual(OrderState.PENDING_AMEND, order.current_state)
+        self.assertEqual(Decimal("10000"), order.price)
+        self.assertIsNone(self.exchange.get_amended_order("11"))
+
+        self._process_user_stream_events([self._amend_result_event(order, "10100.1234", "90.000000", "0")])
+
+        self.assertEqual(Decimal("10100.1234"), order.price)
+        self.assertEqual(Decimal("90"), order.amount)
+        self.assertEqual(OrderState.OPEN, order.current_state)
+        self.assertEqual(Decimal("10100.1234"), self.exchange.get_amended_order("11").price)
+        self.assertEqual(0, len(self.order_cancelled_logger.event_log))
+        self.assertTrue(self.is_logged("INFO", f"Order 11 amended to 90.000000 {self.base_asset} @ 10100.1234 "
+                                               f"{self.quote_asset}."))
+
+    @aioresponses()
+    def test_amend_order_applied_when_amend_result_received_before_response(self, mock_api):
+        self._simulate_trading_rules_initialized()
+        self.exchange._set_current_timestamp(1640780000)
+        order = self._open_order("11")
+        url = web_utils.private_rest_url(path_url=CONSTANTS.OKX_AMEND_ORDER_PATH)
+
+        def amend_result_before_response(*args, **kwargs):
+            # The orders channel reports the amended order before the amend request response
+            order.update_with_order_update(OrderUpdate(
+                client_order_id="11",
+                trading_pair=self.trading_pair,
+                update_timestamp=self.exchange.current_timestamp,
+                new_state=OrderState.OPEN,
+                misc_updates={"new_price": Decimal("10100"), "new_amount": Decimal("90")},
+            ))
+
+        mock_api.post(url, body=json.dumps(self._amend_order_mock_response("11")),
+                      callback=amend_result_before_response)
+
+        self.exchange.amend_order(order.to_limit_order(), price=Decimal("10100"), amount=Decimal("90"))
+        self.async_run_with_timeout(self._wait_for_amended_price(order, Decimal("10100")))
+        self.async_run_with_timeout(asyncio.sleep(0.1))
+
+        self.assertEqual(Decimal("90"), order.amount)
+        self.assertEqual(OrderState.OPEN, order.current_state)
+
+    @aioresponses()
+    def test_amend_order_failure_reported_by_the_orders_channel_keeps_the_order(self, mock_api):
+        self._simulate_trading_rules_initialized()
+        self.exchange._set_current_timestamp(1640780000)
+        order = self._open_order("11")
+        url = web_utils.private_rest_url(path_url=CONSTANTS.OKX_AMEND_ORDER_PATH)
+        mock_api.post(url, body=json.dumps(self._amend_order_mock_response("11")))
+
+        self.exchange.amend_order(order.to_limit_order(), price=Decimal("10100"), amount=Decimal("90"))
+        self.async_run_with_timeout(self._wait_for_amend_request(mock_api, url))
+        self._process_user_stream_events(
+            [self._amend_result_event(order, "10000", "100", "-1", msg="Order modification failed")])
+
+        self.assertEqual(Decimal("10000"), order.price)
+        self.assertEqual(Decimal("100"), order.amount)
+        self.assertEqual(OrderState.OPEN, order.current_state)
+        self.assertEqual(Decimal("10000"), self.exchange.get_amended_order("11").price)
+        self.assertTrue(self.is_logged("ERROR", "Failed to amend order 11: Order modification failed"))
+
+    @aioresponses()
+    def test_amend_order_failure_keeps_the_order(self, mock_api):
+        self._simulate_trading_rules_initialized()
+        self.exchange._set_current_timestamp(1640780000)
+        order = self._open_order("11")
+        url = web_utils.private_rest_url(path_url=CONSTANTS.OKX_AMEND_ORDER_PATH)
+        mock_api.post(url, body=json.dumps(self._amend_order_mock_response("11", error_code="51503")))
+
+        self.exchange.amend_order(order.to_limit_order(), price=Decimal("10100"), amount=Decimal("90"))
+        self.async_run_with_timeout(self._wait_for_amendment_end(order))
+
+        self.assertEqual(1, len(self._all_executed_requests(mock_api, url)))
+        self.assertEqual(Decimal("10000"), order.price)
+        self.assertEqual(Decimal("100"), order.amount)
+        self.assertEqual(OrderState.OPEN, order.current_state)
+        self.assertTrue(self.is_logged("ERROR", "Failed to amend order 11"))
+
+    @aioresponses()
+    def test_amend_order_not_sent_when_order_no_longer_open(self, mock_api):
+        self._simulate_trading_rules_initialized()
+        self.exchange._set_current_timestamp(1640780000)
+        order = self._open_order("11")
+        url = web_utils.private_rest_url(path_url=CONSTANTS.OKX_AMEND_ORDER_PATH)
+        mock_api.post(url, body=json.dumps(self._amend_order_mock_response("11")))
+
+        self.exchange.amend_order(order.to_limit_order(), price=Decimal("10100"), amount=Decimal("90"))
+        # The order is canceled before the amendment task runs
+        order.update_with_order_update(OrderUpdate(
+            client_order_id="11",
+            trading_pair=self.trading_pair,
+            update_timestamp=self.exchange.current_timestamp,
+            new_state=OrderState.PENDING_CANCEL,
+        ))
+        self.async_run_with_timeout(asyncio.sleep(0.1))
+
+        self.assertEqual(0, len(self._all_executed_requests(mock_api, url)))
+        self.assertEqual(OrderState.PENDING_CANCEL, order.current_state)
+        self.assertEqual(Decimal("10000"), order.price)
+        self.assertTrue(self.is_logged("INFO", "Order 11 not amended, it is no longer open (PENDING_CANCEL)."))
+
+    def _amend_result_event(self, order: InFlightOrder, price: str, amount: str, amend_result: str, msg: str = ""):
+        event = self.order_event_for_new_order_websocket_update(order=order)
+        event["data"][0].update({"px": price, "sz": amount, "amendResult": amend_result, "msg": msg})
+        return event
+
+    def _process_user_stream_events(self, events: List[dict]):
+        mock_queue = AsyncMock()
+        mock_queue.get.side_effect = events + [asyncio.CancelledError]
+        self.exchange._user_stream_tracker._user_stream = mock_queue
+        try:
+            self.async_run_with_timeout(self.exchange._user_stream_event_listener())
+        except asyncio.CancelledError:
+            pass
+        # The order updates are processed in their own tasks
+        self.async_run_with_timeout(asyncio.sleep(0.01))
+
+    async def _wait_for_amend_request(self, mock_api: aioresponses, url: str):
+        while len(self._all_executed_requests(mock_api, url)) == 0:
+            await asyncio.sleep(0.01)
+        await asyncio.sleep(0.01)
+
+    async def _wait_for_amended_price(self, order: InFlightOrder, price: Decimal):
+        while order.price != price:
+            await asyncio.sleep(0.01)
+
+    async def _wait_for_amendment_end(self, order: InFlightOrder):
+        while not self.is_logged("ERROR", f"Failed to amend order {order.client_order_id}") or order.is_pending_amend:
+            await asyncio.sleep(0.01)
@@ -0,0 +1,120 @@
+import asyncio
+import unittest
+from typing import Awaitable
+from unittest.mock import AsyncMock, patch
+
+from hummingbot.connector.gateway.gateway_quote_cache import GatewayQuoteCache
+
+
+class GatewayQuoteCacheTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        super().setUpClass()
+        cls.ev_loop = asyncio.get_event_loop()
+        cls.key = ("ethereum", "mainnet", "uniswap", "WETH", "DAI", "1", "BUY")
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.cache = GatewayQuoteCache(ttl=2.0)
+        self.quote = {"price": "1800"}
+
+    def async_run_with_timeout(self, coroutine: Awaitable, timeout: float = 1):
+        ret = self.ev_loop.run_until_complete(asyncio.wait_for(coroutine, timeout))
+        return ret
+
+    def test_quote_reused_within_ttl(self):
+        fetch = AsyncMock(return_value=self.quote)
+
+        with patch.object(self.cache, "_time", return_value=1000):
+            self.async_run_with_timeout(self.cache.get_quote(self.key, fetch))
+        with patch.object(self.cache, "_time", return_value=1001.5):
+            result = self.async_run_with_timeout(self.cache.get_quote(self.key, fetch))
+
+        self.assertEqual(self.quote, result)
+        self.assertEqual(1, fetch.await_count)
+
+    def test_quote_requested_again_after_ttl(self):
+        fetch = AsyncMock(return_value=self.quote)
+
+        with patch.object(self.cache, "_time", return_value=1000):
+            self.async_run_with_timeout(self.cache.get_quote(self.key, fetch))
+        with patch.object(self.cache, "_time", return_value=1002.5):
+            self.async_run_with_timeout(self.cache.get_quote(self.key, fetch))
+
+        self.assertEqual(2, fetch.await_count)
+
+    def test_new_block_invalidates_quotes(self):
+        fetch = AsyncMock(return_value=self.quote)
+        self.cache.update_block_number(100)
+
+        self.async_run_with_timeout(self.cache.get_quote(self.key, fetch))
+        self.cache.update_block_number(100)
+        self.async_run_with_timeout(self.cache.get_quote(self.key, fetch))
+        self.assertEqual(1, fetch.await_count)
+
+        self.cache.update_block_number(101)
+        self.assertFalse(self.cache.has_quotes)
+        self.async_run_with_timeout(self.cache.get_quote(self.key, fetch))
+        self.assertEqual(2, fetch.await_count)
+
+    def test_concurrent_requests_are_coalesced(self):
+        release = asyncio.Event()
+        calls = []
+
+        async def fetch():
+            calls.append(1)
+            await release.wait()
+            return self.quote
+
+        async def run():
+            tasks = [asyncio.ensure_future(self.cache.get_quote(self.key, fetch)) for _ in range(5)]
+            await asyncio.sleep(0)
+            release.set()
+            return await asyncio.gather(*tasks)
+
+        results = self.async_run_with_timeout(run())
+
+        self.assertEqual(1, len(calls))
+        self.assertEqual([self.quote] * 5, results)
+
+    def test_failed_request_is_propagated_and_not_cached(self):
+        responses = [IOError("Gateway error"), self.quote]
+
+        async def fetch():
+            await asyncio.sleep(0)
+            response = responses.pop(0)
+            if isinstance(response, Exception):
+                raise response
+            return response
+
+        async def run():
+            first, second = await asyncio.gather(
+                self.cache.get_quote(self.key, fetch),
+                self.cache.get_quote(self.key, fetch),
+                return_exceptions=True)
+            return first, second
+
+        first, second = self.async_run_with_timeout(run())
+
+        self.assertIsInstance(first, IOError)
+        self.assertIsInstance(second, IOError)
+        self.assertEqual(self.quote, self.async_run_with_timeout(self.cache.get_quote(self.key, fetch)))
+
+    def test_zero_ttl_disables_cache(self):
+        self.cache.ttl = 0
+        fetch = AsyncMock(return_value=self.quote)
+
+        self.async_run_with_timeout(self.cache.get_quote(self.key, fetch))
+        self.async_run_with_timeout(self.cache.get_quote(self.key, fetch))
+
+        self.assertEqual(2, fetch.await_count)
+
+    def test_oldest_quotes_evicted_when_full(self):
+        cache = GatewayQuoteCache(ttl=10, max_entries=2)
+        fetch = AsyncMock(return_value=self.quote)
+
+        for amount in ("1", "2", "3"):
+            self.async_run_with_timeout(cache.get_quote(("WETH", amount), fetch))
+        self.async_run_with_timeout(cache.get_quote(("WETH", "1"), fetch))
+
+        self.assertEqual(4, fetch.await_count)
@@ -0,0 +1,144 @@
+import asyncio
+import unittest
+from test.mock.mock_gateway_transaction_status import MockGatewayTransactionStatusAPI
+from typing import Awaitable
+from unittest.mock import AsyncMock, patch
+
+from hummingbot.client.config.client_config_map import ClientConfigMap
+from hummingbot.client.config.config_helpers import ClientConfigAdapter
+from hummingbot.connector.gateway.gateway_transaction_polling_schedule import GatewayTransactionPollingSchedule
+from hummingbot.core.gateway.gateway_http_client import GatewayHttpClient
+
+
+class GatewayTransactionPollingScheduleTest(unittest.TestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        self.schedule = GatewayTransactionPollingSchedule(min_interval=1.0, backoff_start=10.0, max_interval=60.0)
+
+    def test_poll_interval_grows_exponentially_with_age(self):
+        self.assertEqual(0, self.schedule.poll_interval(5))
+        self.assertEqual(1, self.schedule.poll_interval(10))
+        self.assertEqual(2, self.schedule.poll_interval(20))
+        self.assertEqual(4, self.schedule.poll_interval(30))
+        self.assertEqual(32, self.schedule.poll_interval(60))
+        self.assertEqual(60, self.schedule.poll_interval(1000))
+
+    def test_new_transactions_are_due(self):
+        with patch.object(self.schedule, "_time", return_value=1000):
+            self.assertEqual(["0x1", "0x2"], self.schedule.due_transactions(["0x1", "0x2"]))
+
+    def test_recent_transactions_are_polled_on_every_pass(self):
+        with patch.object(self.schedule, "_time", return_value=1000):
+            self.schedule.mark_polled(["0x1"])
+        with patch.object(self.schedule, "_time", return_value=1000.5):
+            self.assertEqual(["0x1"], self.schedule.due_transactions(["0x1"]))
+
+    def test_old_transactions_are_polled_less_often(self):
+        with patch.object(self.schedule, "_time", return_value=1000):
+            self.schedule.mark_polled(["0x1"])
+        with patch.object(self.schedule, "_time", return_value=1060):
+            self.schedule.mark_polled(["0x1"])
+        with patch.object(self.schedule, "_time", return_value=1100):
+            self.assertEqual([], self.schedule.due_transactions(["0x1"]))
+        with patch.object(self.schedule, "_time", return_value=1120):
+            self.assertEqual(["0x1"], self.schedule.due_transactions(["0x1"]))
+
+    def test_forget_transaction(self):
+        self.schedule.mark_polled(["0x1", "0x2"])
+        self.schedule.forget("0x1")
+        self.schedule.forget("0x3")
+
+        self.assertEqual(1, self.schedule.tracked_transactions_count)
+
+    def test_polls_per_pass_stay_bounded_with_pending_transactions(self):
+        polls = 0
+        for second in range(600):
+            now = 1000 + second
+            with patch.object(self.schedule, "_time", return_value=now):
+                # One new transaction every second, none of them gets mined
+                tx_hashes = [f"0x{i}" for i in range(second + 1)]
+                due = self.schedule.due_transactions(tx_hashes)
+                self.schedule.mark_polled(due)
+                if second >= 540:
+                    polls += len(due)
+
+        # 600 pending transactions would require 36000 polls in the last minute without the backoff
+        self.assertLess(polls, 3600)
+
+
+class GatewayTransactionStatusesTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        super().setUpClass()
+        cls.ev_loop = asyncio.get_event_loop()
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.shared_gateway = GatewayHttpClient._GatewayHttpClient__instance
+        self.gateway = GatewayHttpClient(client_config_map=ClientConfigAdapter(ClientConfigMap()))
+        self.api = MockGatewayTransactionStatusAPI()
+        self.gateway.api_request = self.api.api_request
+        self.gateway._request_poll_batch = self.api.request_poll_batch
+        self.api.set_transaction_status("0x1", tx_status=1)
+        self.api.set_transaction_status("0x2", tx_status=0)
+
+    def tearDown(self) -> None:
+        GatewayHttpClient._GatewayHttpClient__instance = self.shared_gateway
+        super().tearDown()
+
+    def async_run_with_timeout(self, coroutine: Awaitable, timeout: float = 1):
+        ret = self.ev_loop.run_until_complete(asyncio.wait_for(coroutine, timeout))
+        return ret
+
+    def test_statuses_fetched_with_one_batched_request(self):
+        statuses = self.async_run_with_timeout(
+            self.gateway.get_transaction_statuses("ethereum", "mainnet", ["0x1", "0x2"]))
+
+        self.assertEqual(1, statuses["0x1"]["txStatus"])
+        self.assertEqual(0, statuses["0x2"]["txStatus"])
+        self.assertEqual(1, len(self.api.requests))
+        self.assertEqual(["0x1", "0x2"], self.api.requests_to("chain/poll-batch")[0]["txHashes"])
+
+    def test_statuses_fetched_one_by_one_when_batched_route_not_supported(self):
+        self.api.batch_route_supported = False
+
+        statuses = self.async_run_with_timeout(
+            self.gateway.get_transaction_statuses("ethereum", "mainnet", ["0x1", "0x2"]))
+        self.assertEqual(1, statuses["0x1"]["txStatus"])
+        self.assertEqual(0, statuses["0x2"]["txStatus"])
+        self.assertEqual(1, len(self.api.requests_to("chain/poll-batch")))
+        self.assertEqual(2, len(self.api.requests_to("chain/poll")))
+
+        # The batched route is not requested again
+        self.async_run_with_timeout(self.gateway.get_transaction_statuses("ethereum", "mainnet", ["0x2"]))
+        self.assertEqual(1, len(self.api.requests_to("chain/poll-batch")))
+        self.assertEqual(3, len(self.api.requests_to("chain/poll")))
+
+    def test_batched_route_requested_again_after_transient_errors(self):
+        self.api.batch_route_error_status = 500
+
+        statuses = self.async_run_with_timeout(
+            self.gateway.get_transaction_statuses("ethereum", "mainnet", ["0x1", "0x2"]))
+        self.assertEqual(1, statuses["0x1"]["txStatus"])
+        self.assertEqual(2, len(self.api.requests_to("chain/poll")))
+
+        self.gateway._request_poll_batch = AsyncMock(side_effect=asyncio.TimeoutError())
+        self.async_run_with_timeout(self.gateway.get_transaction_statuses("ethereum", "mainnet", ["0x2"]))
+        self.assertEqual(3, len(self.api.requests_to("chain/poll")))
+
+        self.api.batch_route_error_status = None
+        self.gateway._request_poll_batch = self.api.request_poll_batch
+        self.async_run_with_timeout(self.gateway.get_transaction_statuses("ethereum", "mainnet", ["0x1", "0x2"]))
+        self.assertEqual(2, len(self.api.requests_to("chain/poll-batch")))
+        self.assertEqual(3, len(self.api.requests_to("chain/poll")))
+
+    def test_transactions_missing_in_batched_response_polled_one_by_one(self):
+        async def partial_batch_response(request):
+            return await self.api.request_poll_batch(dict(request, txHashes=request["txHashes"][:1]))
+        self.gateway._request_poll_batch = partial_batch_response
+
+        statuses = self.async_run_with_timeout(
+            self.gateway.get_transaction_statuses("ethereum", "mainnet", ["0x1", "0x2"]))
+
+        self.assertEqual(0, statuses["0x2"]["txStatus"])
+        self.assertEqual(["0x2"], [params["txHash"] for params in self.api.requests_to("chain/poll")])
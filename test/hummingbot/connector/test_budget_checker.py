@@ -1,5 +1,6 @@
 import unittest
 from decimal import Decimal
+from unittest.mock import patch
 
 from hummingbot.client.config.client_config_map import ClientConfigMap
 from hummingbot.client.config.config_helpers import ClientConfigAdapter
@@ -10,6 +11,17 @@ from hummingbot.connector.utils import combine_to_hb_trading_pair
 from hummingbot.core.data_type.common import OrderType, TradeType
 from hummingbot.core.data_type.order_candidate import OrderCandidate
 from hummingbot.core.data_type.trade_fee import TokenAmount, TradeFeeSchema
+from hummingbot.core.utils.estimate_fee import build_trade_fee
+
+
+class BalanceCallsCountingExchange(MockPaperExchange):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.balance_calls = []
+
+    def get_available_balance(self, currency: str) -> Decimal:
+        self.balance_calls.append(currency)
+        return super().get_available_balance(currency)
 
 
 class BudgetCheckerTest(unittest.TestCase):
@@ -580,3 +592,67 @@ class BudgetCheckerTest(unittest.TestCase):
 
         self.assertEqual(Decimal("7"), first_adjusted_candidate.amount)
         self.assertEqual(Decimal("5"), second_adjusted_candidate.amount)
+
+    def test_adjust_candidates_builds_fees_and_reads_balances_once(self):
+        order_candidates = [
+            OrderCandidate(
+                trading_pair=self.trading_pair,
+                is_maker=True,
+                order_type=OrderType.LIMIT,
+                order_side=side,
+                amount=Decimal("4"),
+                price=Decimal("2"),
+            )
+            for side in [TradeType.BUY, TradeType.SELL] * 5
+        ]
+
+        exchange = BalanceCallsCountingExchange(
+            client_config_map=ClientConfigAdapter(ClientConfigMap()),
+            trade_fee_schema=TradeFeeSchema(maker_percent_fee_decimal=Decimal("0.01")))
+        exchange.set_balance(self.base_asset, Decimal("10"))
+        exchange.set_balance(self.quote_asset, Decimal("50"))
+
+        with patch("hummingbot.core.data_type.order_candidate.build_trade_fee", wraps=build_trade_fee) as fee_mock:
+            adjusted_candidates = exchange.budget_checker.adjust_candidates(order_candidates, all_or_none=False)
+
+        self.assertEqual(2, fee_mock.call_count)
+        self.assertEqual([self.quote_asset, self.base_asset], exchange.balance_calls)
+        # The collateral of the previous candidates is locked: 10 COINALPHA fund two and a half sells of 4 COINALPHA
+        self.assertEqual([Decimal("4"), Decimal("4"), Decimal("2"), Decimal("0"), Decimal("0")],
+                         [candidate.amount for candidate in adjusted_candidates[1::2]])
+
+    def test_adjust_candidates_same_as_individual_adjustments(self):
+        q_params = QuantizationParams(
+            trading_pair=self.trading_pair,
+            price_precision=8,
+            price_decimals=2,
+            order_size_precision=8,
+            order_size_decimals=2,
+        )
+        self.exchange.set_quantization_param(q_params)
+        self.exchange.set_balance(self.base_asset, Decimal("10"))
+        self.exchange.set_balance(self.quote_asset, Decimal("50"))
+        order_candidates = [
+            OrderCandidate(
+                trading_pair=self.trading_pair,
+                is_maker=level % 3 != 0,
+                order_type=OrderType.LIMIT,
+                order_side=TradeType.BUY if level % 2 == 0 else TradeType.SELL,
+                amount=Decimal("1.5") + level,
+                price=Decimal("2") + Decimal("0.1") * level,
+            )
+            for level in range(8)
+        ]
+        for all_or_none in (True, False):
+            self.budget_checker.reset_locked_collateral()
+            expected_candidates = [
+                self.budget_checker.adjust_candidate_and_lock_available_collateral(order_candidate, all_or_none)
+                for order_candidate in order_candidates
+            ]
+            self.budget_checker.reset_locked_collateral()
+
+            adjusted_candidates = self.budget_checker.adjust_candidates(order_candidates, all_or_none)
+
+            self.assertEqual(expected_candidates, adjusted_candidates)
+            self.assertIn(Decimal("0"), [candidate.amount for candidate in adjusted_candidates])
+            self.assertEqual(Decimal("1.5"), order_candidates[0].amount)
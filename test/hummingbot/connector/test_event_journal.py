@@ -0,0 +1,177 @@
+import math
+import os
+import tempfile
+import unittest
+from decimal import Decimal
+
+from hummingbot.connector.event_journal import (
+    HEADER_STRUCT,
+    RECORD_DTYPE,
+    RECORD_STRUCT,
+    EventJournal,
+    cancel_replace_stats,
+    fill_latency_stats,
+    journal_file_indexes,
+    load_event_journal,
+    read_event_journal_file,
+)
+from hummingbot.core.data_type.common import OrderType, TradeType
+from hummingbot.core.data_type.trade_fee import AddedToCostTradeFee
+from hummingbot.core.event.events import (
+    BuyOrderCreatedEvent,
+    MarketEvent,
+    OrderCancelledEvent,
+    OrderFilledEvent,
+    SellOrderCreatedEvent,
+)
+from hummingbot.core.pubsub import PubSub
+
+
+class MockMarket(PubSub):
+    display_name = "mock_exchange"
+
+
+class EventJournalTest(unittest.TestCase):
+    trading_pair = "COINALPHA-HBOT"
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.journal_dir = self.temp_dir.name
+        self.market = MockMarket()
+        self.journal = EventJournal([self.market], self.journal_dir, "test_journal")
+        self.journal.start()
+
+    def tearDown(self) -> None:
+        self.journal.stop()
+        self.temp_dir.cleanup()
+        super().tearDown()
+
+    def create_order(self, order_id: str, timestamp: float, trade_type: TradeType = TradeType.BUY):
+        event_class, event_tag = (
+            (BuyOrderCreatedEvent, MarketEvent.BuyOrderCreated)
+            if trade_type == TradeType.BUY
+            else (SellOrderCreatedEvent, MarketEvent.SellOrderCreated)
+        )
+        self.market.trigger_event(event_tag, event_class(
+            timestamp=timestamp,
+            type=OrderType.LIMIT,
+            trading_pair=self.trading_pair,
+            amount=Decimal("2"),
+            price=Decimal("100"),
+            order_id=order_id,
+            creation_timestamp=timestamp,
+        ))
+
+    def fill_order(self, order_id: str, timestamp: float, trade_type: TradeType = TradeType.BUY):
+        self.market.trigger_event(MarketEvent.OrderFilled, OrderFilledEvent(
+            timestamp=timestamp,
+            order_id=order_id,
+            trading_pair=self.trading_pair,
+            trade_type=trade_type,
+            order_type=OrderType.LIMIT,
+            price=Decimal("101"),
+            amount=Decimal("1"),
+            trade_fee=AddedToCostTradeFee(),
+        ))
+
+    def cancel_order(self, order_id: str, timestamp: float):
+        self.market.trigger_event(MarketEvent.OrderCancelled, OrderCancelledEvent(timestamp, order_id))
+
+    def test_record_struct_matches_record_dtype(self):
+        self.assertEqual(RECORD_STRUCT.size, RECORD_DTYPE.itemsize)
+
+    def test_order_events_are_journaled(self):
+        self.create_order("OID1", 1000)
+        self.fill_order("OID1", 1002.5)
+        self.cancel_order("OID1", 1003)
+        self.cancel_order("OID2", 1004)
+        self.journal.stop()
+
+        journal = load_event_journal(self.journal_dir, "test_journal")
+
+        self.assertEqual(["CREATED", "FILLED", "CANCELLED", "CANCELLED"], list(journal["event_type"]))
+        self.assertEqual(["OID1", "OID1", "OID1", "OID2"], list(journal["order_id"]))
+        self.assertEqual({"mock_exchange"}, set(journal["connector"]))
+        self.assertEqual([self.trading_pair] * 3 + [""], list(journal["trading_pair"]))
+        self.assertEqual(["BUY", "BUY", "BUY"], list(journal["trade_type"][:3]))
+        self.assertTrue(isinstance(journal["trade_type"][3], float) and math.isnan(journal["trade_type"][3]))
+        self.assertEqual([0, 2.5, 3], list(journal["latency"][:3]))
+        self.assertTrue(math.isnan(journal["latency"][3]))
+        self.assertEqual([100, 101], list(journal["price"][:2]))
+        self.assertEqual([2, 1], list(journal["amount"][:2]))
+
+    def test_events_are_not_journaled_after_stop(self):
+        self.journal.stop()
+        self.create_order("OID1", 1000)
+
+        self.assertEqual(0, len(load_event_journal(self.journal_dir, "test_journal")))
+
+    def test_journal_files_are_rotated(self):
+        self.journal.stop()
+        self.journal = EventJournal([self.market], self.journal_dir, "test_journal",
+                                    max_file_size=HEADER_STRUCT.size + 2 * RECORD_STRUCT.size)
+        self.journal.start()
+
+        for i in range(5):
+            self.create_order(f"OID{i}", 1000 + i)
+        self.journal.stop()
+
+        self.assertEqual([1, 2, 3, 4], journal_file_indexes(self.journal_dir, "test_journal"))
+        journal = load_event_journal(self.journal_dir, "test_journal")
+        self.assertEqual([f"OID{i}" for i in range(5)], list(journal["order_id"]))
+
+    def test_partially_written_record_is_ignored(self):
+        self.create_order("OID1", 1000)
+        self.create_order("OID2", 1001)
+        file_path = self.journal.current_file_path
+        self.journal.stop()
+        with open(file_path, "r+b") as journal_file:
+            journal_file.truncate(HEADER_STRUCT.size + RECORD_STRUCT.size + 10)
+
+        records = read_event_journal_file(file_path)
+
+        self.assertEqual(1, len(records))
+        self.assertEqual(b"OID1", records["order_id"][0])
+
+    def test_invalid_journal_file_raises_error(self):
+        file_path = os.path.join(self.journal_dir, "other_00001.hbj")
+        with open(file_path, "wb") as journal_file:
+            journal_file.write(b"\x00" * 64)
+
+        with self.assertRaises(ValueError):
+            read_event_journal_file(file_path)
+
+    def test_fill_latency_stats(self):
+        self.create_order("OID1", 1000)
+        self.fill_order("OID1", 1001)
+        self.create_order("OID2", 1000)
+        self.fill_order("OID2", 1003)
+        self.fill_order("OID3", 1004)
+        self.journal.stop()
+
+        stats = fill_latency_stats(load_event_journal(self.journal_dir, "test_journal"))
+
+        row = stats.loc[("mock_exchange", self.trading_pair)]
+        self.assertEqual(2, row["fills"])
+        self.assertEqual(2, row["mean"])
+        self.assertEqual(2, row["median"])
+        self.assertEqual(3, row["max"])
+
+    def test_cancel_replace_stats(self):
+        self.create_order("OID1", 1000)
+        self.cancel_order("OID1", 1010)
+        self.create_order("OID2", 1010.5)
+        self.cancel_order("OID2", 1020)
+        self.create_order("OID3", 1030)
+        self.create_order("OID4", 1030, trade_type=TradeType.SELL)
+        self.journal.stop()
+
+        stats = cancel_replace_stats(load_event_journal(self.journal_dir, "test_journal"), replace_window=1)
+
+        row = stats.loc[("mock_exchange", self.trading_pair)]
+        self.assertEqual(4, row["created"])
+        self.assertEqual(2, row["cancelled"])
+        self.assertEqual(1, row["replaced"])
+        self.assertEqual(0.5, row["cancel_rate"])
+        self.assertEqual(0.5, row["cancel_replace_rate"])
@@ -0,0 +1,109 @@
+import random
+import unittest
+from decimal import Decimal
+
+from hummingbot.client.config.client_config_map import ClientConfigMap
+from hummingbot.client.config.config_helpers import ClientConfigAdapter
+from hummingbot.connector.exchange.binance.binance_exchange import BinanceExchange
+from hummingbot.connector.exchange_base import ExchangeBase
+from hummingbot.connector.quantization_table import QuantizationTable, TradingPairQuantization
+from hummingbot.connector.trading_rule import TradingRule
+
+
+class TradingPairQuantizationTest(unittest.TestCase):
+    def test_quantize_as_the_connectors(self):
+        rng = random.Random(42)
+        for price_quantum, size_quantum in [("0.01", "0.001"), ("0.0010", "10"), ("0.5", "1E+1"), ("0.25", "0.00000001")]:
+            quantization = TradingPairQuantization(TradingRule("COINALPHA-HBOT",
+                                                               min_price_increment=Decimal(price_quantum),
+                                                               min_base_amount_increment=Decimal(size_quantum)))
+            for _ in range(100):
+                value = Decimal(rng.randint(-10 ** 9, 10 ** 9)) / Decimal(10 ** rng.randint(0, 8))
+                expected_price = (value // Decimal(price_quantum)) * Decimal(price_quantum)
+                expected_amount = (value // Decimal(size_quantum)) * Decimal(size_quantum)
+
+                self.assertEqual(str(expected_price), str(quantization.quantize_price(value)))
+                self.assertEqual(str(expected_amount), str(quantization.quantize_amount(value)))
+                self.assertEqual(expected_price, quantization.price_ticks(value) * Decimal(price_quantum))
+                self.assertEqual(expected_amount, quantization.size_ticks(value) * Decimal(size_quantum))
+
+    def test_nan_price_is_not_quantized(self):
+        quantization = TradingPairQuantization(TradingRule("COINALPHA-HBOT"))
+
+        self.assertTrue(quantization.quantize_price(Decimal("NaN")).is_nan())
+
+
+class QuantizationTableTest(unittest.TestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        self.trading_rule = TradingRule("COINALPHA-HBOT",
+                                        min_price_increment=Decimal("0.01"),
+                                        min_base_amount_increment=Decimal("0.001"))
+        self.table = QuantizationTable()
+
+    def test_update_replaces_the_table(self):
+        self.table.get("OTHER-HBOT", TradingRule("OTHER-HBOT"))
+
+        self.table.update([self.trading_rule])
+
+        self.assertEqual(1, len(self.table))
+        quantization = self.table.get("COINALPHA-HBOT", self.trading_rule)
+        self.assertIs(self.trading_rule, quantization.trading_rule)
+        self.assertEqual(Decimal("0.01"), quantization.price_quantum)
+        self.assertEqual(Decimal("0.001"), quantization.size_quantum)
+
+    def test_entry_computed_again_when_the_trading_rule_changes(self):
+        quantization = self.table.get("COINALPHA-HBOT", self.trading_rule)
+        self.assertIs(quantization, self.table.get("COINALPHA-HBOT", self.trading_rule))
+
+        new_trading_rule = TradingRule("COINALPHA-HBOT",
+                                       min_price_increment=Decimal("0.1"),
+                                       min_base_amount_increment=Decimal("1"))
+        new_quantization = self.table.get("COINALPHA-HBOT", new_trading_rule)
+
+        self.assertEqual(Decimal("0.1"), new_quantization.price_quantum)
+        self.assertEqual(Decimal("1"), new_quantization.size_quantum)
+        self.assertEqual(1, len(self.table))
+
+
+class ExchangePyBaseQuantizationTest(unittest.TestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        self.trading_pair = "COINALPHA-HBOT"
+        self.exchange = BinanceExchange(
+            client_config_map=ClientConfigAdapter(ClientConfigMap()),
+            binance_api_key="",
+            binance_api_secret="",
+            trading_pairs=[self.trading_pair],
+            trading_required=False)
+        self.exchange._trading_rules[self.trading_pair] = TradingRule(self.trading_pair,
+                                                                      min_price_increment=Decimal("0.01"),
+                                                                      min_base_amount_increment=Decimal("0.001"))
+
+    def test_quantize_from_the_table(self):
+        value = Decimal("1234.56789")
+
+        self.assertEqual(Decimal("0.01"), self.exchange.get_order_price_quantum(self.trading_pair, value))
+        self.assertEqual(Decimal("0.001"), self.exchange.get_order_size_quantum(self.trading_pair, value))
+        self.assertEqual(Decimal("1234.56"), self.exchange.quantize_order_price(self.trading_pair, value))
+        self.assertEqual(Decimal("1234.567"), self.exchange.quantize_order_amount(self.trading_pair, value))
+        self.assertEqual(ExchangeBase.quantize_order_price(self.exchange, self.trading_pair, value),
+                         self.exchange.quantize_order_price(self.trading_pair, value))
+        self.assertEqual(ExchangeBase.quantize_order_amount(self.exchange, self.trading_pair, value),
+                         self.exchange.quantize_order_amount(self.trading_pair, value))
+
+    def test_quantize_with_the_new_trading_rules(self):
+        value = Decimal("1234.56789")
+        self.exchange.quantize_order_amount(self.trading_pair, value)
+
+        self.exchange._trading_rules[self.trading_pair] = TradingRule(self.trading_pair,
+                                                                      min_price_increment=Decimal("1"),
+                                                                      min_base_amount_increment=Decimal("0.1"))
+
+        self.assertEqual(Decimal("1234"), self.exchange.quantize_order_price(self.trading_pair, value))
+        self.assertEqual(Decimal("1234.5"), self.exchange.quantize_order_amount(self.trading_pair, value))
+        self.assertEqual(Decimal("0.1"), self.exchange.get_quantization(self.trading_pair).size_quantum)
+
+    def test_unknown_trading_pair_raises_error(self):
+        with self.assertRaises(KeyError):
+            self.exchange.quantize_order_amount("UNKNOWN-HBOT", Decimal("1"))
@@ -541,6 +541,48 @@ class InFlightOrderPyUnitTests(unittest.TestCase):
         self.assertEqual(0, len(order.order_fills))
         self.assertTrue(order.is_done)
 
+    def test_update_with_order_update_amended_order(self):
+        order: InFlightOrder = InFlightOrder(
+            client_order_id=self.client_order_id,
+            exchange_order_id=self.exchange_order_id,
+            trading_pair=self.trading_pair,
+            order_type=OrderType.LIMIT,
+            trade_type=TradeType.BUY,
+            amount=Decimal("1000.0"),
+            creation_timestamp=1640001112.0,
+            price=Decimal("1.0"),
+            initial_state=OrderState.OPEN,
+        )
+
+        pending_amend_update: OrderUpdate = OrderUpdate(
+            client_order_id=self.client_order_id,
+            trading_pair=self.trading_pair,
+            update_timestamp=1,
+            new_state=OrderState.PENDING_AMEND,
+        )
+
+        self.assertTrue(order.update_with_order_update(pending_amend_update))
+        self.assertTrue(order.is_pending_amend)
+        self.assertTrue(order.is_open)
+        self.assertEqual(Decimal("1.0"), order.price)
+
+        amended_update: OrderUpdate = OrderUpdate(
+            client_order_id=self.client_order_id,
+            trading_pair=self.trading_pair,
+            update_timestamp=2,
+            new_state=OrderState.OPEN,
+            misc_updates={"new_price": Decimal("1.1"), "new_amount": Decimal("900")},
+        )
+
+        self.assertTrue(order.update_with_order_update(amended_update))
+        self.assertFalse(order.is_pending_amend)
+        self.assertEqual(Decimal("1.1"), order.price)
+        self.assertEqual(Decimal("900"), order.amount)
+        self.assertEqual(2, order.last_update_timestamp)
+
+        self.assertFalse(order.update_with_order_update(amended_update._replace(update_timestamp=3)))
+        self.assertEqual(2, order.last_update_timestamp)
+
     def test_update_exchange_id_with_order_update(self):
         order: InFlightOrder = InFlightOrder(
             client_order_id=self.client_order_id,
@@ -1,8 +1,10 @@
 #!/usr/bin/env python
 
 import logging
+import math
+import random
 import unittest
-from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.data_type.order_book import MAX_DEPTH_BANDS, OrderBook
 import numpy as np
 
 
@@ -50,6 +52,124 @@ class OrderBookUnitTest(unittest.TestCase):
         self.assertEqual(best_bid, [50., 0.01, 6.])
         self.assertEqual(best_ask, 0)
 
+    def test_microprice_and_top_of_book_imbalance(self):
+        order_book = OrderBook()
+        self.assertTrue(math.isnan(order_book.microprice))
+        self.assertTrue(math.isnan(order_book.top_of_book_imbalance))
+
+        bids_array = np.array([[98, 5, 1], [99, 3, 1]], dtype=np.float64)
+        asks_array = np.array([[101, 1, 1], [102, 5, 1]], dtype=np.float64)
+        order_book.apply_numpy_snapshot(bids_array, asks_array)
+
+        self.assertAlmostEqual((99 * 1 + 101 * 3) / 4, order_book.microprice)
+        self.assertAlmostEqual(0.5, order_book.top_of_book_imbalance)
+        self.assertAlmostEqual(0.5, order_book.get_depth_imbalance(0))
+
+        order_book.apply_numpy_diffs(np.array([[99, 1, 2]], dtype=np.float64), np.array([[101, 3, 2]], dtype=np.float64))
+
+        self.assertAlmostEqual((99 * 3 + 101 * 1) / 4, order_book.microprice)
+        self.assertAlmostEqual(-0.5, order_book.top_of_book_imbalance)
+
+        order_book.apply_numpy_diffs(np.empty((0, 3)), np.array([[101, 0, 3], [102, 0, 3]], dtype=np.float64))
+
+        self.assertTrue(math.isnan(order_book.microprice))
+        self.assertAlmostEqual(1, order_book.top_of_book_imbalance)
+
+    def test_depth_not_tracked_without_band(self):
+        order_book = OrderBook()
+        order_book.apply_numpy_snapshot(np.array([[99, 1, 1]], dtype=np.float64),
+                                        np.array([[101, 1, 1]], dtype=np.float64))
+
+        self.assertEqual(0, order_book.depth_band_bps)
+        self.assertTrue(math.isnan(order_book.bid_depth))
+        self.assertTrue(math.isnan(order_book.ask_depth))
+
+        self.assertEqual(1, order_book.get_cumulative_depth(True, 100))
+        self.assertEqual(100, order_book.depth_band_bps)
+        self.assertEqual(1, order_book.bid_depth)
+
+    def test_depth_tracked_as_the_diffs_are_applied(self):
+        rng = random.Random(42)
+        for dex in (False, True):
+            order_book = OrderBook(dex=dex)
+            order_book.apply_numpy_snapshot(np.array([[100 - i, i, 1] for i in range(1, 30)], dtype=np.float64),
+                                            np.array([[100 + i, i, 1] for i in range(1, 30)], dtype=np.float64))
+            order_book.depth_band_bps = 50
+            for update_id in range(2, 1000):
+                bids = [[rng.randint(85, 101), rng.choice([0, rng.random() * 5]), update_id]
+                        for _ in range(rng.randint(0, 3))]
+                asks = [[rng.randint(99, 115), rng.choice([0, rng.random() * 5]), update_id]
+                        for _ in range(rng.randint(0, 3))]
+                order_book.apply_numpy_diffs(np.array(bids, dtype=np.float64).reshape(-1, 3),
+                                             np.array(asks, dtype=np.float64).reshape(-1, 3))
+
+                bids_df, asks_df = order_book.snapshot
+                if len(bids_df) == 0 or len(asks_df) == 0:
+                    self.assertTrue(math.isnan(order_book.bid_depth))
+                    continue
+                mid_price = (bids_df.price.iloc[0] + asks_df.price.iloc[0]) / 2
+                bid_depth = bids_df.amount[bids_df.price >= mid_price * (1 - 0.005)].sum()
+                ask_depth = asks_df.amount[asks_df.price <= mid_price * (1 + 0.005)].sum()
+                self.assertAlmostEqual(bid_depth, order_book.bid_depth)
+                self.assertAlmostEqual(ask_depth, order_book.ask_depth)
+                if bid_depth + ask_depth > 0:
+                    self.assertAlmostEqual((bid_depth - ask_depth) / (bid_depth + ask_depth),
+                                           order_book.get_depth_imbalance(50))
+
+    def test_depth_tracked_for_each_requested_band(self):
+        rng = random.Random(7)
+        order_book = OrderBook()
+        order_book.apply_numpy_snapshot(np.array([[100 - i, i, 1] for i in range(1, 30)], dtype=np.float64),
+                                        np.array([[100 + i, i, 1] for i in range(1, 30)], dtype=np.float64))
+        self.assertEqual(1 + 2, order_book.get_cumulative_depth(False, 250))
+        self.assertEqual(sum(range(1, 11)), order_book.get_cumulative_depth(True, 1000))
+
+        for update_id in range(2, 500):
+            bids = [[rng.randint(85, 101), rng.choice([0, rng.random() * 5]), update_id]
+                    for _ in range(rng.randint(0, 3))]
+            asks = [[rng.randint(99, 115), rng.choice([0, rng.random() * 5]), update_id]
+                    for _ in range(rng.randint(0, 3))]
+            order_book.apply_numpy_diffs(np.array(bids, dtype=np.float64).reshape(-1, 3),
+                                         np.array(asks, dtype=np.float64).reshape(-1, 3))
+
+            bids_df, asks_df = order_book.snapshot
+            if len(bids_df) == 0 or len(asks_df) == 0:
+                continue
+            mid_price = (bids_df.price.iloc[0] + asks_df.price.iloc[0]) / 2
+            for depth_bps in (250, 1000):
+                bid_depth = bids_df.amount[bids_df.price >= mid_price * (1 - depth_bps / 10000)].sum()
+                ask_depth = asks_df.amount[asks_df.price <= mid_price * (1 + depth_bps / 10000)].sum()
+                self.assertAlmostEqual(bid_depth, order_book.get_cumulative_depth(False, depth_bps))
+                self.assertAlmostEqual(ask_depth, order_book.get_cumulative_depth(True, depth_bps))
+        # The first requested band is still the one reported by the depth properties
+        self.assertEqual(250, order_book.depth_band_bps)
+
+    def test_least_recently_read_depth_band_replaced_beyond_the_limit(self):
+        order_book = OrderBook()
+        order_book.apply_numpy_snapshot(np.array([[100 - i, 1, 1] for i in range(1, 10)], dtype=np.float64),
+                                        np.array([[100 + i, 1, 1] for i in range(1, 10)], dtype=np.float64))
+        for depth_bps in range(1, MAX_DEPTH_BANDS + 1):
+            order_book.get_cumulative_depth(True, depth_bps * 100)
+        # Reading the 200 bps band again makes the 300 bps band the least recently read one
+        self.assertEqual(2, order_book.get_cumulative_depth(True, 200))
+
+        for depth_bps in range(MAX_DEPTH_BANDS + 1, 2 * MAX_DEPTH_BANDS):
+            self.assertEqual(min(depth_bps, 9), order_book.get_cumulative_depth(True, depth_bps * 100))
+            self.assertEqual(min(depth_bps, 9), order_book.get_cumulative_depth(False, depth_bps * 100))
+
+        # The replaced bands are computed again from the book
+        self.assertEqual(3, order_book.get_cumulative_depth(False, 300))
+        self.assertEqual(0, order_book.get_depth_imbalance(300))
+        order_book.apply_numpy_diffs(np.array([[99, 3, 2]], dtype=np.float64), np.empty((0, 3)))
+        self.assertEqual(5, order_book.get_cumulative_depth(False, 300))
+        # The first band is the one reported by the depth properties, and is never replaced
+        self.assertEqual(100, order_book.depth_band_bps)
+        self.assertEqual(3, order_book.bid_depth)
+
+        order_book.depth_band_bps = 10000
+        self.assertEqual(10000, order_book.depth_band_bps)
+        self.assertEqual(9, order_book.get_cumulative_depth(True, 10000))
+
 
 def main():
     logging.basicConfig(level=logging.INFO)
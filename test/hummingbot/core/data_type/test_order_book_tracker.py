@@ -0,0 +1,95 @@
+import asyncio
+import unittest
+from typing import Awaitable
+from unittest.mock import AsyncMock, MagicMock
+
+from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.data_type.order_book_message import OrderBookMessage, OrderBookMessageType
+from hummingbot.core.data_type.order_book_tracker import OrderBookTracker
+from hummingbot.core.data_type.order_book_tracker_data_source import OrderBookTrackerDataSource
+
+
+class OrderBookTrackerDynamicTradingPairsTests(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        super().setUpClass()
+        cls.ev_loop = asyncio.get_event_loop()
+        cls.trading_pair = "COINALPHA-HBOT"
+        cls.new_trading_pair = "COINBETA-HBOT"
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.trading_pairs = [self.trading_pair]
+        self.data_source = MagicMock(spec=OrderBookTrackerDataSource)
+        self.data_source.get_new_order_book = AsyncMock(side_effect=lambda trading_pair: OrderBook())
+        self.data_source.add_trading_pair = AsyncMock()
+        self.data_source.remove_trading_pair = AsyncMock()
+        self.tracker = OrderBookTracker(data_source=self.data_source, trading_pairs=self.trading_pairs)
+
+        # Simulate start()
+        self.tracker._init_order_books_task = MagicMock()
+        self.tracker._order_books[self.trading_pair] = OrderBook()
+        self.tracker._tracking_message_queues[self.trading_pair] = asyncio.Queue()
+        self.tracker._order_books_initialized.set()
+
+    def tearDown(self) -> None:
+        for task in self.tracker._tracking_tasks.values():
+            task.cancel()
+        super().tearDown()
+
+    def async_run_with_timeout(self, coroutine: Awaitable, timeout: float = 1):
+        ret = self.ev_loop.run_until_complete(asyncio.wait_for(coroutine, timeout))
+        return ret
+
+    def test_add_trading_pair_fetches_only_the_new_order_book(self):
+        self.async_run_with_timeout(self.tracker.add_trading_pair(self.new_trading_pair))
+
+        self.data_source.add_trading_pair.assert_awaited_once_with(self.new_trading_pair)
+        self.data_source.get_new_order_book.assert_awaited_once_with(self.new_trading_pair)
+        self.assertIn(self.new_trading_pair, self.tracker.order_books)
+        self.assertIn(self.new_trading_pair, self.tracker._tracking_tasks)
+        self.assertEqual([self.trading_pair, self.new_trading_pair], self.trading_pairs)
+
+    def test_add_tracked_trading_pair_does_nothing(self):
+        self.async_run_with_timeout(self.tracker.add_trading_pair(self.trading_pair))
+
+        self.data_source.add_trading_pair.assert_not_awaited()
+        self.data_source.get_new_order_book.assert_not_awaited()
+
+    def test_add_trading_pair_before_start_defers_initialization(self):
+        self.tracker._init_order_books_task = None
+
+        self.async_run_with_timeout(self.tracker.add_trading_pair(self.new_trading_pair))
+
+        self.data_source.get_new_order_book.assert_not_awaited()
+        self.assertIn(self.new_trading_pair, self.trading_pairs)
+        self.assertNotIn(self.new_trading_pair, self.tracker.order_books)
+
+    def test_remove_trading_pair_releases_its_data(self):
+        self.async_run_with_timeout(self.tracker.add_trading_pair(self.new_trading_pair))
+        tracking_task = self.tracker._tracking_tasks[self.new_trading_pair]
+        self.tracker._past_diffs_windows[self.new_trading_pair].append(MagicMock())
+
+        self.async_run_with_timeout(self.tracker.remove_trading_pair(self.new_trading_pair))
+        self.async_run_with_timeout(asyncio.sleep(0))
+
+        self.data_source.remove_trading_pair.assert_awaited_once_with(self.new_trading_pair)
+        self.assertTrue(tracking_task.cancelled())
+        self.assertNotIn(self.new_trading_pair, self.tracker.order_books)
+        self.assertNotIn(self.new_trading_pair, self.tracker._tracking_message_queues)
+        self.assertNotIn(self.new_trading_pair, self.tracker._past_diffs_windows)
+        self.assertEqual([self.trading_pair], self.trading_pairs)
+
+    def test_diff_messages_of_removed_trading_pair_are_not_saved(self):
+        self.async_run_with_timeout(self.tracker.remove_trading_pair(self.trading_pair))
+        diff_message = OrderBookMessage(
+            message_type=OrderBookMessageType.DIFF,
+            content={"trading_pair": self.trading_pair, "update_id": 1, "bids": [], "asks": []},
+            timestamp=1640000000)
+        self.tracker._order_book_diff_stream.put_nowait(diff_message)
+
+        router_task = self.ev_loop.create_task(self.tracker._order_book_diff_router())
+        self.async_run_with_timeout(asyncio.sleep(0.1))
+        router_task.cancel()
+
+        self.assertNotIn(self.trading_pair, self.tracker._saved_message_queues)
@@ -0,0 +1,79 @@
+import sys
+import tempfile
+from pathlib import Path
+from unittest import TestCase
+
+from hummingbot.core.management.startup_profiler import StartupProfiler, start_startup_profiler_if_requested
+
+
+class StartupProfilerTest(TestCase):
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.modules_dir = tempfile.TemporaryDirectory()
+        package_dir = Path(self.modules_dir.name) / "profiled_package"
+        package_dir.mkdir()
+        (package_dir / "__init__.py").write_text("from profiled_package import child_module\n")
+        (package_dir / "child_module.py").write_text("import profiled_package.leaf_module\nVALUE = 1\n")
+        (package_dir / "leaf_module.py").write_text("VALUE = 2\n")
+        sys.path.insert(0, self.modules_dir.name)
+        self.profiler = StartupProfiler()
+
+    def tearDown(self) -> None:
+        self.profiler.stop()
+        sys.path.remove(self.modules_dir.name)
+        for name in [name for name in sys.modules if name.startswith("profiled_package")]:
+            del sys.modules[name]
+        self.modules_dir.cleanup()
+        super().tearDown()
+
+    def test_records_import_tree(self):
+        self.profiler.start()
+        self.assertTrue(self.profiler.is_running)
+        import profiled_package
+        self.profiler.stop()
+
+        self.assertFalse(self.profiler.is_running)
+        self.assertEqual(1, profiled_package.child_module.VALUE)
+        self.assertEqual(3, self.profiler.modules_count())
+        package_record = self.profiler.root.children[0]
+        self.assertEqual("profiled_package", package_record.name)
+        child_record = package_record.children[0]
+        self.assertEqual("profiled_package.child_module", child_record.name)
+        self.assertEqual(["profiled_package.leaf_module"], [record.name for record in child_record.children])
+        self.assertGreaterEqual(package_record.cumulative_time, child_record.cumulative_time)
+        self.assertGreaterEqual(package_record.self_time, 0)
+
+    def test_loaded_modules_keep_their_original_loader(self):
+        self.profiler.start()
+        import profiled_package.leaf_module  # noqa: F401
+        self.profiler.stop()
+
+        module = sys.modules["profiled_package.leaf_module"]
+        self.assertEqual("SourceFileLoader", type(module.__loader__).__name__)
+        self.assertIs(module.__loader__, module.__spec__.loader)
+
+    def test_modules_imported_when_stopped_are_not_recorded(self):
+        self.profiler.start()
+        self.profiler.stop()
+        import profiled_package  # noqa: F401
+
+        self.assertEqual(0, self.profiler.modules_count())
+
+    def test_report(self):
+        self.profiler.start()
+        import profiled_package  # noqa: F401
+        self.profiler.stop()
+
+        report = self.profiler.report(min_time_ms=0, slowest_count=2)
+
+        self.assertTrue(report.startswith("Startup took "))
+        self.assertIn("importing 3 modules", report)
+        self.assertIn("  profiled_package\n", report)
+        self.assertIn("    profiled_package.child_module\n", report)
+        self.assertIn("      profiled_package.leaf_module\n", report)
+        self.assertIn("Slowest 2 modules by self time:", report)
+        self.assertEqual(2, len(report.split("Slowest 2 modules by self time:")[1].strip().splitlines()) - 1)
+
+    def test_profiler_only_started_with_the_command_line_flag(self):
+        self.assertIsNone(start_startup_profiler_if_requested(["bin/hummingbot_quickstart.py", "-f", "conf.yml"]))
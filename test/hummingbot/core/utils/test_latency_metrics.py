@@ -0,0 +1,105 @@
+import asyncio
+import unittest
+from typing import Awaitable
+
+from hummingbot.core.api_throttler.async_throttler import AsyncThrottler
+from hummingbot.core.api_throttler.data_types import RateLimit
+from hummingbot.core.utils.latency_metrics import LatencyHistogram, LatencyMetric, LatencyMetricsRegistry
+
+
+class LatencyHistogramTest(unittest.TestCase):
+    def test_statistics(self):
+        histogram = LatencyHistogram()
+        for value in range(1, 101):
+            histogram.add(value / 1000)
+
+        self.assertEqual(100, histogram.count)
+        self.assertAlmostEqual(0.0505, histogram.mean)
+        self.assertAlmostEqual(0.05, histogram.percentile(50))
+        self.assertAlmostEqual(0.099, histogram.percentile(99))
+        self.assertAlmostEqual(0.1, histogram.max)
+
+    def test_percentiles_use_latest_samples_only(self):
+        histogram = LatencyHistogram(max_samples=10)
+        for _ in range(10):
+            histogram.add(1)
+        for _ in range(10):
+            histogram.add(2)
+
+        self.assertEqual(20, histogram.count)
+        self.assertEqual(2, histogram.percentile(50))
+        self.assertEqual(1.5, histogram.mean)
+
+    def test_empty_histogram(self):
+        histogram = LatencyHistogram()
+
+        self.assertEqual(0, histogram.count)
+        self.assertEqual(0, histogram.mean)
+        self.assertEqual(0, histogram.percentile(99))
+
+
+class LatencyMetricsRegistryTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        super().setUpClass()
+        cls.ev_loop = asyncio.get_event_loop()
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.registry = LatencyMetricsRegistry.get_instance()
+        self.registry.reset()
+
+    def tearDown(self) -> None:
+        self.registry.disable()
+        self.registry.reset()
+        super().tearDown()
+
+    def async_run_with_timeout(self, coroutine: Awaitable, timeout: int = 1):
+        ret = self.ev_loop.run_until_complete(asyncio.wait_for(coroutine, timeout))
+        return ret
+
+    def test_get_instance_returns_shared_instance(self):
+        self.assertIs(self.registry, LatencyMetricsRegistry.get_instance())
+
+    def test_nothing_recorded_when_disabled(self):
+        self.registry.record(LatencyMetric.REST_NETWORK, "key", 0.1)
+
+        self.assertIsNone(self.registry.histogram(LatencyMetric.REST_NETWORK, "key"))
+        self.assertEqual([], self.registry.snapshot())
+
+    def test_snapshot(self):
+        self.registry.enable()
+        self.registry.record(LatencyMetric.WS_DECODE, "stream.binance.com", 0.002)
+        self.registry.record(LatencyMetric.REST_NETWORK, "/api/v3/order", 0.1)
+        self.registry.record(LatencyMetric.REST_NETWORK, "/api/v3/order", 0.3)
+
+        snapshot = self.registry.snapshot()
+
+        self.assertEqual(2, len(snapshot))
+        self.assertEqual("rest_network", snapshot[0]["metric"])
+        self.assertEqual("/api/v3/order", snapshot[0]["key"])
+        self.assertEqual(2, snapshot[0]["count"])
+        self.assertAlmostEqual(200, snapshot[0]["mean_ms"])
+        self.assertAlmostEqual(100, snapshot[0]["p50_ms"])
+        self.assertAlmostEqual(300, snapshot[0]["p99_ms"])
+        self.assertAlmostEqual(300, snapshot[0]["max_ms"])
+        self.assertEqual("ws_decode", snapshot[1]["metric"])
+
+        self.registry.reset()
+
+        self.assertEqual([], self.registry.snapshot())
+
+    def test_throttler_records_wait_time(self):
+        throttler = AsyncThrottler(rate_limits=[RateLimit(limit_id="limit_id", limit=10, time_interval=1)])
+
+        async def execute_task():
+            async with throttler.execute_task(limit_id="limit_id"):
+                pass
+
+        self.async_run_with_timeout(execute_task())
+        self.assertIsNone(self.registry.histogram(LatencyMetric.THROTTLE_WAIT, "limit_id"))
+
+        self.registry.enable()
+        self.async_run_with_timeout(execute_task())
+
+        self.assertEqual(1, self.registry.histogram(LatencyMetric.THROTTLE_WAIT, "limit_id").count)
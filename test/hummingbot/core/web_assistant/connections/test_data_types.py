@@ -7,7 +7,7 @@ import aiohttp
 from aioresponses import aioresponses
 
 from hummingbot.core.web_assistant.connections.data_types import (
-    RESTMethod, RESTResponse, EndpointRESTRequest
+    RESTMethod, RESTRequest, RESTResponse, EndpointRESTRequest
 )
 
 
@@ -127,3 +127,40 @@ class EndpointRESTRequestTest(unittest.TestCase):
                 endpoint=endpoint,
                 data=data,
             )
+
+    def test_derive_copies_mutable_containers(self):
+        request = RESTRequest(
+            method=RESTMethod.POST,
+            url="https://some.url",
+            params={"one": 1},
+            data={"two": 2},
+            headers={"three": "3"},
+            is_auth_required=True,
+            throttler_limit_id="limit_id",
+        )
+
+        derived = request.derive()
+        derived.params["four"] = 4
+        derived.data["five"] = 5
+        derived.headers["six"] = "6"
+
+        self.assertEqual({"one": 1}, request.params)
+        self.assertEqual({"two": 2}, request.data)
+        self.assertEqual({"three": "3"}, request.headers)
+        self.assertEqual(request.url, derived.url)
+        self.assertTrue(derived.is_auth_required)
+        self.assertEqual("limit_id", derived.throttler_limit_id)
+
+    def test_derive_does_not_reprocess_endpoint_request_data(self):
+        data = {"one": 1}
+        request = EndpointRESTRequestDummy(
+            method=RESTMethod.POST,
+            endpoint="some/endpoint",
+            data=data,
+        )
+
+        derived = request.derive()
+
+        self.assertIsInstance(derived, EndpointRESTRequestDummy)
+        self.assertEqual(request.data, derived.data)
+        self.assertEqual(data, json.loads(derived.data))
@@ -0,0 +1,67 @@
+import json
+import unittest
+
+from hummingbot.core.web_assistant.connections import json_codec
+from hummingbot.core.web_assistant.connections.json_codec import OrjsonJSONCodec, StdlibJSONCodec, get_json_codec
+
+
+class JSONCodecTest(unittest.TestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        self.payload = {
+            "e": "depthUpdate",
+            "s": "BTCUSDT",
+            "U": 157,
+            "b": [["0.0024", "10"]],
+            "p": 0.1,
+        }
+
+    def test_stdlib_codec_loads_str_and_bytes(self):
+        codec = StdlibJSONCodec()
+        encoded = json.dumps(self.payload)
+
+        self.assertEqual(self.payload, codec.loads(encoded))
+        self.assertEqual(self.payload, codec.loads(encoded.encode()))
+
+    def test_stdlib_codec_raw_numbers(self):
+        codec = StdlibJSONCodec(raw_numbers=True)
+
+        decoded = codec.loads('{"price": 0.00012340, "qty": 12, "side": "buy"}')
+
+        self.assertTrue(codec.raw_numbers)
+        self.assertEqual({"price": "0.00012340", "qty": "12", "side": "buy"}, decoded)
+
+    def test_codecs_raise_value_error_for_invalid_payloads(self):
+        codecs = [StdlibJSONCodec(), get_json_codec()]
+
+        for codec in codecs:
+            with self.assertRaises(ValueError):
+                codec.loads("pong")
+
+    def test_dumps_is_compatible_with_stdlib(self):
+        for codec_name in json_codec.JSON_CODECS:
+            try:
+                codec = get_json_codec(codec_name)
+            except ImportError:
+                continue
+            self.assertEqual(json.dumps(self.payload), codec.dumps(self.payload))
+
+    @unittest.skipIf(json_codec.orjson is None, "orjson is not installed")
+    def test_orjson_codec_falls_back_to_stdlib_for_big_integers(self):
+        codec = OrjsonJSONCodec()
+        big_number = 2 ** 70
+
+        self.assertEqual({"n": big_number}, codec.loads(json.dumps({"n": big_number})))
+        self.assertEqual(self.payload, codec.loads(json.dumps(self.payload).encode()))
+
+    def test_get_json_codec(self):
+        self.assertIsInstance(get_json_codec("stdlib"), StdlibJSONCodec)
+        self.assertTrue(get_json_codec(raw_numbers=True).raw_numbers)
+
+        with self.assertRaises(ValueError):
+            get_json_codec("unknown")
+        with self.assertRaises(ValueError):
+            get_json_codec("orjson", raw_numbers=True)
+
+    def test_default_json_codec_is_shared(self):
+        self.assertIs(json_codec.default_json_codec(), json_codec.default_json_codec())
@@ -7,6 +7,7 @@ from unittest.mock import AsyncMock, patch
 import aiohttp
 
 from hummingbot.connector.test_support.network_mocking_assistant import NetworkMockingAssistant
+from hummingbot.core.utils.latency_metrics import LatencyMetric, LatencyMetricsRegistry
 from hummingbot.core.web_assistant.connections.data_types import WSJSONRequest, WSResponse
 from hummingbot.core.web_assistant.connections.ws_connection import WSConnection
 
@@ -121,6 +122,23 @@ class WSConnectionTest(unittest.TestCase):
         self.assertEqual(data, response.data)
         self.assertNotEqual(0, self.ws_connection.last_recv_time)
 
+    @patch("aiohttp.client.ClientSession.ws_connect", new_callable=AsyncMock)
+    def test_receive_records_decode_latency_when_metrics_enabled(self, ws_connect_mock):
+        registry = LatencyMetricsRegistry.get_instance()
+        registry.reset()
+        registry.enable()
+        self.addCleanup(registry.reset)
+        self.addCleanup(registry.disable)
+        ws_connect_mock.return_value = self.mocking_assistant.create_websocket_mock()
+        self.async_run_with_timeout(self.ws_connection.connect("ws://some.host/url"))
+        self.mocking_assistant.add_websocket_aiohttp_message(
+            ws_connect_mock.return_value, message=json.dumps({"one": 1})
+        )
+
+        self.async_run_with_timeout(self.ws_connection.receive())
+
+        self.assertEqual(1, registry.histogram(LatencyMetric.WS_DECODE, "some.host").count)
+
     @patch("aiohttp.client.ClientSession.ws_connect", new_callable=AsyncMock)
     def test_receive_disconnects_and_raises_on_aiohttp_closed(self, ws_connect_mock):
         ws_connect_mock.return_value = self.mocking_assistant.create_websocket_mock()
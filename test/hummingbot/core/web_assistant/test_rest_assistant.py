@@ -2,14 +2,22 @@ import asyncio
 import json
 import unittest
 from typing import Awaitable, Optional
-from unittest.mock import patch
+from unittest.mock import MagicMock, patch
 
 import aiohttp
 from aioresponses import aioresponses
 
 from hummingbot.core.api_throttler.async_throttler import AsyncThrottler
+from hummingbot.core.api_throttler.data_types import RateLimit
+from hummingbot.core.utils.latency_metrics import LatencyMetric, LatencyMetricsRegistry
 from hummingbot.core.web_assistant.auth import AuthBase
-from hummingbot.core.web_assistant.connections.data_types import RESTMethod, RESTRequest, RESTResponse, WSRequest
+from hummingbot.core.web_assistant.connections.data_types import (
+    RESTMethod,
+    RESTRequest,
+    RESTRequestTimings,
+    RESTResponse,
+    WSRequest,
+)
 from hummingbot.core.web_assistant.connections.rest_connection import RESTConnection
 from hummingbot.core.web_assistant.rest_assistant import RESTAssistant
 from hummingbot.core.web_assistant.rest_post_processors import RESTPostProcessorBase
@@ -100,3 +108,149 @@ class RESTAssistantTest(unittest.TestCase):
         self.assertIsNotNone(call_request)
         self.assertIsNotNone(call_request.headers)
         self.assertEqual(call_request.headers, auth_header)
+
+    @patch("hummingbot.core.web_assistant.connections.rest_connection.RESTConnection.call")
+    def test_rest_assistant_call_does_not_modify_original_request(self, mocked_call):
+        url = "https://www.test.com/url"
+        call_request: Optional[RESTRequest] = None
+
+        async def register_request_and_return(request: RESTRequest):
+            nonlocal call_request
+            call_request = request
+            return {}
+
+        mocked_call.side_effect = register_request_and_return
+
+        class AuthDummy(AuthBase):
+            async def rest_authenticate(self, request: RESTRequest) -> RESTRequest:
+                request.headers["authenticated"] = True
+                request.params["signature"] = "sig"
+                return request
+
+            async def ws_authenticate(self, request: WSRequest) -> WSRequest:
+                pass
+
+        connection = RESTConnection(aiohttp.ClientSession())
+        assistant = RESTAssistant(connection, throttler=AsyncThrottler(rate_limits=[]), auth=AuthDummy())
+        req = RESTRequest(method=RESTMethod.GET, url=url, params={"one": 1}, headers={}, is_auth_required=True)
+
+        self.async_run_with_timeout(assistant.call(req))
+
+        self.assertEqual({}, req.headers)
+        self.assertEqual({"one": 1}, req.params)
+        self.assertEqual({"authenticated": True}, call_request.headers)
+        self.assertEqual({"one": 1, "signature": "sig"}, call_request.params)
+
+    @patch("hummingbot.core.web_assistant.connections.rest_connection.RESTConnection.call")
+    def test_rest_assistant_execute_request_does_not_modify_the_params(self, mocked_call):
+        url = "https://www.test.com/url"
+        signed_params = []
+
+        async def register_request_and_return(request: RESTRequest):
+            signed_params.append(request.params)
+            return MagicMock(status=200)
+
+        mocked_call.side_effect = register_request_and_return
+
+        class AuthDummy(AuthBase):
+            async def rest_authenticate(self, request: RESTRequest) -> RESTRequest:
+                request.params["sign"] = f"sig-{len(request.params)}"
+                return request
+
+            async def ws_authenticate(self, request: WSRequest) -> WSRequest:
+                pass
+
+        connection = RESTConnection(aiohttp.ClientSession())
+        assistant = RESTAssistant(
+            connection=connection,
+            throttler=AsyncThrottler(rate_limits=[RateLimit(limit_id="limit_id", limit=10, time_interval=1)]),
+            auth=AuthDummy())
+        params = {"one": 1}
+
+        for _ in range(2):
+            self.async_run_with_timeout(assistant.execute_request_and_get_response(
+                url=url, throttler_limit_id="limit_id", params=params, is_auth_required=True))
+
+        self.assertEqual({"one": 1}, params)
+        self.assertEqual([{"one": 1, "sign": "sig-1"}, {"one": 1, "sign": "sig-1"}], signed_params)
+
+    @aioresponses()
+    def test_rest_assistant_execute_request_uses_default_headers(self, mocked_api):
+        url = "https://www.test.com/url"
+        mocked_api.post(url, body=json.dumps({"one": 1}).encode())
+
+        connection = RESTConnection(aiohttp.ClientSession())
+        assistant = RESTAssistant(
+            connection=connection,
+            throttler=AsyncThrottler(rate_limits=[RateLimit(limit_id="limit_id", limit=10, time_interval=1)]),
+            default_headers={"X-Client": "hummingbot"},
+        )
+
+        result = self.async_run_with_timeout(assistant.execute_request(
+            url=url,
+            throttler_limit_id="limit_id",
+            data={"two": 2},
+            method=RESTMethod.POST,
+            headers={"X-Extra": "extra"},
+        ))
+
+        self.assertEqual({"one": 1}, result)
+        sent_request = next(iter(mocked_api.requests.values()))[0]
+        self.assertEqual(
+            {"Content-Type": "application/json", "X-Client": "hummingbot", "X-Extra": "extra"},
+            sent_request.kwargs["headers"])
+        self.assertEqual({"two": 2}, json.loads(sent_request.kwargs["data"]))
+
+    @aioresponses()
+    def test_rest_assistant_reports_timings(self, mocked_api):
+        url = "https://www.test.com/url"
+        mocked_api.get(url, body=json.dumps({"one": 1}).encode())
+        mocked_api.get(url, body=json.dumps({"one": 1}).encode())
+        reported_timings = []
+
+        connection = RESTConnection(aiohttp.ClientSession())
+        assistant = RESTAssistant(
+            connection=connection,
+            throttler=AsyncThrottler(rate_limits=[
+                RateLimit(limit_id="limit_id", limit=10, time_interval=1),
+                RateLimit(limit_id="other_limit_id", limit=10, time_interval=1),
+            ]),
+            timings_hook=reported_timings.append,
+        )
+
+        self.async_run_with_timeout(assistant.execute_request(url=url, throttler_limit_id="limit_id"))
+        self.async_run_with_timeout(
+            assistant.execute_request_and_get_response(url=url, throttler_limit_id="other_limit_id"))
+
+        self.assertEqual(2, len(reported_timings))
+        timings: RESTRequestTimings = reported_timings[0]
+        self.assertEqual("limit_id", timings.throttler_limit_id)
+        self.assertGreater(timings.network, 0)
+        self.assertGreater(timings.parse, 0)
+        self.assertGreaterEqual(timings.total, timings.network + timings.parse)
+        self.assertEqual("other_limit_id", reported_timings[1].throttler_limit_id)
+        self.assertEqual(0, reported_timings[1].parse)
+
+    @aioresponses()
+    def test_rest_assistant_records_latency_metrics_when_enabled(self, mocked_api):
+        url = "https://www.test.com/url"
+        mocked_api.get(url, body=json.dumps({"one": 1}).encode())
+        registry = LatencyMetricsRegistry.get_instance()
+        registry.reset()
+        registry.enable()
+        self.addCleanup(registry.reset)
+        self.addCleanup(registry.disable)
+
+        connection = RESTConnection(aiohttp.ClientSession())
+        assistant = RESTAssistant(
+            connection=connection,
+            throttler=AsyncThrottler(rate_limits=[RateLimit(limit_id="limit_id", limit=10, time_interval=1)]),
+        )
+
+        self.async_run_with_timeout(assistant.execute_request(url=url, throttler_limit_id="limit_id"))
+
+        key = "www.test.com limit_id"
+        self.assertEqual(1, registry.histogram(LatencyMetric.REST_NETWORK, key).count)
+        self.assertEqual(1, registry.histogram(LatencyMetric.REST_SIGN, key).count)
+        self.assertEqual(1, registry.histogram(LatencyMetric.REST_PARSE, key).count)
+        self.assertEqual(1, registry.histogram(LatencyMetric.THROTTLE_WAIT, "limit_id").count)
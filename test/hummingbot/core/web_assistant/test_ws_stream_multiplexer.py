@@ -0,0 +1,197 @@
+import asyncio
+import json
+import unittest
+from typing import Any, Awaitable, Dict, List, Optional
+from unittest.mock import AsyncMock, patch
+
+from hummingbot.connector.test_support.network_mocking_assistant import NetworkMockingAssistant
+from hummingbot.core.web_assistant.connections.data_types import WSJSONRequest, WSRequest
+from hummingbot.core.web_assistant.ws_stream_multiplexer import WSStreamMultiplexer
+
+
+class DummyWSStreamMultiplexer(WSStreamMultiplexer):
+    def _build_subscribe_request(self, streams: List[str]) -> WSRequest:
+        return WSJSONRequest(payload={"op": "subscribe", "args": streams})
+
+    def _build_unsubscribe_request(self, streams: List[str]) -> WSRequest:
+        return WSJSONRequest(payload={"op": "unsubscribe", "args": streams})
+
+    def _stream_of_message(self, message: Dict[str, Any]) -> Optional[str]:
+        return message.get("stream")
+
+    def _payload_of_message(self, message: Dict[str, Any]) -> Any:
+        return message["data"]
+
+
+class WSStreamMultiplexerTests(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        super().setUpClass()
+        cls.ev_loop = asyncio.get_event_loop()
+        cls.ws_url = "wss://test.url/stream"
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.mocking_assistant = NetworkMockingAssistant()
+        self.multiplexer = DummyWSStreamMultiplexer(ws_url=self.ws_url, max_streams_per_connection=2)
+
+    def tearDown(self) -> None:
+        self.async_run_with_timeout(self.multiplexer.stop())
+        super().tearDown()
+
+    def async_run_with_timeout(self, coroutine: Awaitable, timeout: float = 1):
+        ret = self.ev_loop.run_until_complete(asyncio.wait_for(coroutine, timeout))
+        return ret
+
+    def sent_messages(self, ws_mock) -> List[Dict[str, Any]]:
+        return self.mocking_assistant.json_messages_sent_through_websocket(websocket_mock=ws_mock)
+
+    @patch("aiohttp.ClientSession.ws_connect", new_callable=AsyncMock)
+    def test_subscribe_connects_and_dispatches_messages_to_consumers(self, ws_connect_mock):
+        ws_connect_mock.return_value = self.mocking_assistant.create_websocket_mock()
+        first_queue = asyncio.Queue()
+        second_queue = asyncio.Queue()
+
+        self.async_run_with_timeout(self.multiplexer.subscribe(streams=["a", "b"], queue=first_queue))
+        self.async_run_with_timeout(self.multiplexer.subscribe(streams=["a"], queue=second_queue))
+
+        self.mocking_assistant.add_websocket_aiohttp_message(
+            websocket_mock=ws_connect_mock.return_value, message=json.dumps({"result": None}))
+        self.mocking_assistant.add_websocket_aiohttp_message(
+            websocket_mock=ws_connect_mock.return_value, message=json.dumps({"stream": "a", "data": {"v": 1}}))
+        self.mocking_assistant.add_websocket_aiohttp_message(
+            websocket_mock=ws_connect_mock.return_value, message=json.dumps({"stream": "b", "data": {"v": 2}}))
+        self.mocking_assistant.run_until_all_aiohttp_messages_delivered(ws_connect_mock.return_value)
+
+        self.assertEqual(1, ws_connect_mock.call_count)
+        self.assertEqual(1, self.multiplexer.connections_count)
+        self.assertEqual({"a", "b"}, self.multiplexer.streams)
+        self.assertEqual([{"op": "subscribe", "args": ["a", "b"]}], self.sent_messages(ws_connect_mock.return_value))
+        self.assertEqual({"v": 1}, first_queue.get_nowait())
+        self.assertEqual({"v": 2}, first_queue.get_nowait())
+        self.assertEqual({"v": 1}, second_queue.get_nowait())
+        self.assertTrue(second_queue.empty())
+
+    @patch("aiohttp.ClientSession.ws_connect", new_callable=AsyncMock)
+    def test_subscribe_and_unsubscribe_are_incremental_on_live_connection(self, ws_connect_mock):
+        ws_connect_mock.return_value = self.mocking_assistant.create_websocket_mock()
+        queue = asyncio.Queue()
+        other_queue = asyncio.Queue()
+
+        self.async_run_with_timeout(self.multiplexer.subscribe(streams=["a"], queue=queue))
+        self.mocking_assistant.add_websocket_aiohttp_message(
+            websocket_mock=ws_connect_mock.return_value, message=json.dumps({"result": None}))
+        self.mocking_assistant.run_until_all_aiohttp_messages_delivered(ws_connect_mock.return_value)
+
+        self.async_run_with_timeout(self.multiplexer.subscribe(streams=["b"], queue=queue))
+        self.async_run_with_timeout(self.multiplexer.subscribe(streams=["b"], queue=other_queue))
+        # The stream still has a consumer, so it is not unsubscribed from the exchange
+        self.async_run_with_timeout(self.multiplexer.unsubscribe(streams=["b"], queue=queue))
+        self.async_run_with_timeout(self.multiplexer.unsubscribe(streams=["b"], queue=other_queue))
+
+        self.assertEqual(1, ws_connect_mock.call_count)
+        self.assertEqual(
+            [
+                {"op": "subscribe", "args": ["a"]},
+                {"op": "subscribe", "args": ["b"]},
+                {"op": "unsubscribe", "args": ["b"]},
+            ],
+            self.sent_messages(ws_connect_mock.return_value))
+        self.assertEqual({"a"}, self.multiplexer.streams)
+
+    @patch("aiohttp.ClientSession.ws_connect", new_callable=AsyncMock)
+    def test_streams_added_together_on_live_connection_are_subscribed_with_one_request(self, ws_connect_mock):
+        ws_connect_mock.return_value = self.mocking_assistant.create_websocket_mock()
+        self.multiplexer = DummyWSStreamMultiplexer(ws_url=self.ws_url, max_streams_per_connection=10)
+        queues = [asyncio.Queue() for _ in range(3)]
+
+        self.async_run_with_timeout(self.multiplexer.subscribe(streams=["a"], queue=queues[0]))
+        self.mocking_assistant.add_websocket_aiohttp_message(
+            websocket_mock=ws_connect_mock.return_value, message=json.dumps({"result": None}))
+        self.mocking_assistant.run_until_all_aiohttp_messages_delivered(ws_connect_mock.return_value)
+
+        self.async_run_with_timeout(asyncio.gather(
+            self.multiplexer.subscribe(streams=["c"], queue=queues[1]),
+            self.multiplexer.subscribe(streams=["b"], queue=queues[2]),
+        ))
+        self.async_run_with_timeout(asyncio.sleep(0.1))
+
+        self.assertEqual(
+            [
+                {"op": "subscribe", "args": ["a"]},
+                {"op": "subscribe", "args": ["b", "c"]},
+            ],
+            self.sent_messages(ws_connect_mock.return_value))
+
+    @patch("aiohttp.ClientSession.ws_connect", new_callable=AsyncMock)
+    def test_streams_exceeding_connection_capacity_open_new_connection(self, ws_connect_mock):
+        ws_connect_mock.side_effect = [
+            self.mocking_assistant.create_websocket_mock(),
+            self.mocking_assistant.create_websocket_mock(),
+        ]
+        queue = asyncio.Queue()
+
+        self.async_run_with_timeout(self.multiplexer.subscribe(streams=["a", "b", "c"], queue=queue))
+        self.async_run_with_timeout(asyncio.sleep(0.1))
+
+        self.assertEqual(2, ws_connect_mock.call_count)
+        self.assertEqual(2, self.multiplexer.connections_count)
+
+    @patch("aiohttp.ClientSession.ws_connect", new_callable=AsyncMock)
+    def test_connection_without_streams_is_closed(self, ws_connect_mock):
+        ws_connect_mock.return_value = self.mocking_assistant.create_websocket_mock()
+        queue = asyncio.Queue()
+
+        self.async_run_with_timeout(self.multiplexer.subscribe(streams=["a"], queue=queue))
+        self.mocking_assistant.add_websocket_aiohttp_message(
+            websocket_mock=ws_connect_mock.return_value, message=json.dumps({"result": None}))
+        self.mocking_assistant.run_until_all_aiohttp_messages_delivered(ws_connect_mock.return_value)
+        self.async_run_with_timeout(self.multiplexer.unsubscribe(streams=["a"], queue=queue))
+
+        self.assertEqual(0, self.multiplexer.connections_count)
+        self.assertEqual(set(), self.multiplexer.streams)
+
+    @patch("aiohttp.ClientSession.ws_connect", new_callable=AsyncMock)
+    def test_all_streams_subscribed_again_after_reconnection(self, ws_connect_mock):
+        first_ws = self.mocking_assistant.create_websocket_mock()
+        second_ws = self.mocking_assistant.create_websocket_mock()
+        ws_connect_mock.side_effect = [first_ws, second_ws]
+        queue = asyncio.Queue()
+
+        self.async_run_with_timeout(self.multiplexer.subscribe(streams=["a", "b"], queue=queue))
+        self.mocking_assistant.add_websocket_aiohttp_exception(
+            websocket_mock=first_ws, exception=ConnectionError("Test disconnection"))
+        self.async_run_with_timeout(asyncio.sleep(0.1))
+
+        self.assertEqual(2, ws_connect_mock.call_count)
+        self.assertEqual([{"op": "subscribe", "args": ["a", "b"]}], self.sent_messages(second_ws))
+
+    @patch("aiohttp.ClientSession.ws_connect", new_callable=AsyncMock)
+    def test_consumers_notified_when_connection_is_interrupted(self, ws_connect_mock):
+        first_ws = self.mocking_assistant.create_websocket_mock()
+        second_ws = self.mocking_assistant.create_websocket_mock()
+        ws_connect_mock.side_effect = [first_ws, second_ws]
+        interruptions = []
+        queue = asyncio.Queue()
+        other_queue = asyncio.Queue()
+
+        self.async_run_with_timeout(self.multiplexer.subscribe(
+            streams=["a", "b"], queue=queue, on_interruption=lambda: interruptions.append("queue")))
+        self.async_run_with_timeout(self.multiplexer.subscribe(streams=["a"], queue=other_queue))
+        self.mocking_assistant.add_websocket_aiohttp_message(
+            websocket_mock=first_ws, message=json.dumps({"result": None}))
+        self.mocking_assistant.run_until_all_aiohttp_messages_delivered(first_ws)
+        self.assertEqual([], interruptions)
+
+        self.mocking_assistant.add_websocket_aiohttp_exception(
+            websocket_mock=first_ws, exception=ConnectionError("Test disconnection"))
+        self.async_run_with_timeout(asyncio.sleep(0.1))
+
+        self.assertEqual(["queue"], interruptions)
+        self.assertEqual(2, ws_connect_mock.call_count)
+
+    def test_shared_instance_is_unique_per_class_and_url(self):
+        instance = DummyWSStreamMultiplexer.shared_instance(ws_url=self.ws_url)
+
+        self.assertIs(instance, DummyWSStreamMultiplexer.shared_instance(ws_url=self.ws_url))
+        self.assertIsNot(instance, DummyWSStreamMultiplexer.shared_instance(ws_url="wss://other.url/stream"))
@@ -7,6 +7,7 @@ from unittest.mock import AsyncMock, MagicMock, patch
 
 from aioresponses import aioresponses
 
+from hummingbot.connector.exchange.binance.binance_ws_stream_multiplexer import BinanceWSStreamMultiplexer
 from hummingbot.connector.test_support.network_mocking_assistant import NetworkMockingAssistant
 from hummingbot.data_feed.candles_feed.binance_spot_candles import BinanceSpotCandles, constants as CONSTANTS
 
@@ -314,6 +315,68 @@ class TestBinanceSpotCandles(unittest.TestCase):
         self.assertEqual(self.data_feed.candles_df.shape[0], 2)
         self.assertEqual(self.data_feed.candles_df.shape[1], 10)
 
+    @patch("hummingbot.data_feed.candles_feed.binance_spot_candles.BinanceSpotCandles.fill_historical_candles")
+    @patch("aiohttp.ClientSession.ws_connect", new_callable=AsyncMock)
+    def test_process_multiplexed_kline_messages(self, ws_connect_mock, _):
+        ws_connect_mock.return_value = self.mocking_assistant.create_websocket_mock()
+        multiplexer = BinanceWSStreamMultiplexer(ws_url="wss://stream.binance.com:9443/stream")
+        data_feed = BinanceSpotCandles(
+            trading_pair=self.trading_pair, interval=self.interval, ws_multiplexer=multiplexer)
+        stream = f"{self.ex_trading_pair.lower()}@kline_{self.interval}"
+
+        for message in (self.get_candles_ws_data_mock_1(), self.get_candles_ws_data_mock_2()):
+            self.mocking_assistant.add_websocket_aiohttp_message(
+                websocket_mock=ws_connect_mock.return_value,
+                message=json.dumps({"stream": stream, "data": message}))
+
+        self.listening_task = self.ev_loop.create_task(data_feed.listen_for_subscriptions())
+        self.mocking_assistant.run_until_all_aiohttp_messages_delivered(ws_connect_mock.return_value)
+        self.async_run_with_timeout(asyncio.sleep(0.1))
+
+        sent_messages = self.mocking_assistant.json_messages_sent_through_websocket(
+            websocket_mock=ws_connect_mock.return_value)
+        self.assertEqual([stream], sent_messages[0]["params"])
+        self.assertEqual(data_feed.candles_df.shape[0], 2)
+
+        self.listening_task.cancel()
+        self.async_run_with_timeout(asyncio.sleep(0.1))
+        self.assertEqual(set(), multiplexer.streams)
+
+    @patch("hummingbot.data_feed.candles_feed.binance_spot_candles.BinanceSpotCandles.fill_historical_candles")
+    @patch("aiohttp.ClientSession.ws_connect", new_callable=AsyncMock)
+    def test_multiplexed_candles_filled_again_after_reconnection(self, ws_connect_mock, fill_historical_candles_mock):
+        first_ws = self.mocking_assistant.create_websocket_mock()
+        second_ws = self.mocking_assistant.create_websocket_mock()
+        ws_connect_mock.side_effect = [first_ws, second_ws]
+        multiplexer = BinanceWSStreamMultiplexer(ws_url="wss://stream.binance.com:9443/stream")
+        data_feed = BinanceSpotCandles(
+            trading_pair=self.trading_pair, interval=self.interval, ws_multiplexer=multiplexer)
+        stream = f"{self.ex_trading_pair.lower()}@kline_{self.interval}"
+
+        for message in (self.get_candles_ws_data_mock_1(), self.get_candles_ws_data_mock_2()):
+            self.mocking_assistant.add_websocket_aiohttp_message(
+                websocket_mock=first_ws, message=json.dumps({"stream": stream, "data": message}))
+        self.listening_task = self.ev_loop.create_task(data_feed.listen_for_subscriptions())
+        self.mocking_assistant.run_until_all_aiohttp_messages_delivered(first_ws)
+        self.async_run_with_timeout(asyncio.sleep(0.1))
+        self.assertEqual(2, data_feed.candles_df.shape[0])
+
+        self.mocking_assistant.add_websocket_aiohttp_exception(
+            websocket_mock=first_ws, exception=ConnectionError("Test disconnection"))
+        self.async_run_with_timeout(asyncio.sleep(0.1))
+        self.assertEqual(0, data_feed.candles_df.shape[0])
+
+        self.mocking_assistant.add_websocket_aiohttp_message(
+            websocket_mock=second_ws, message=json.dumps({"stream": stream, "data": self.get_candles_ws_data_mock_2()}))
+        self.mocking_assistant.run_until_all_aiohttp_messages_delivered(second_ws)
+        self.async_run_with_timeout(asyncio.sleep(0.1))
+
+        self.assertEqual(1, data_feed.candles_df.shape[0])
+        self.assertEqual(2, fill_historical_candles_mock.call_count)
+
+        self.listening_task.cancel()
+        self.async_run_with_timeout(asyncio.sleep(0.1))
+
     def _create_exception_and_unlock_test_with_event(self, exception):
         self.resume_test_event.set()
         raise exception
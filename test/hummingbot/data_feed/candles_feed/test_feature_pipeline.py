@@ -0,0 +1,113 @@
+import unittest
+from typing import List
+
+import numpy as np
+
+from hummingbot.data_feed.candles_feed.binance_spot_candles import BinanceSpotCandles
+from hummingbot.data_feed.candles_feed.feature_pipeline import CandlesFeaturePipeline
+from hummingbot.data_feed.candles_feed.incremental_indicators import SMA, BollingerBands
+
+
+class CandlesFeaturePipelineTest(unittest.TestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        self.candles_feed = BinanceSpotCandles(trading_pair="BTC-USDT", interval="1m", max_records=10)
+        self.pipeline = CandlesFeaturePipeline(self.candles_feed, [SMA(3)])
+        self.closed_pipelines: List[CandlesFeaturePipeline] = []
+        self.pipeline.add_candle_closed_listener(self.closed_pipelines.append)
+
+    def add_candle(self, timestamp: int, close: float):
+        # The websocket candles are arrays of strings
+        self.candles_feed._candles.append(np.array([timestamp, close, close, close, close, 1, 1, 1, 1, 1]).astype(str))
+
+    def update_open_candle(self, timestamp: int, close: float):
+        self.candles_feed._candles.pop()
+        self.add_candle(timestamp, close)
+
+    def fill_feed(self, count: int = 10):
+        for i in range(count):
+            self.add_candle(i * 60, 100 + i)
+
+    def test_no_update_until_the_feed_is_ready(self):
+        self.fill_feed(5)
+
+        self.assertFalse(self.pipeline.update())
+        self.assertEqual({}, self.pipeline.features)
+        self.assertEqual([], self.closed_pipelines)
+
+    def test_first_update_processes_all_candles(self):
+        self.fill_feed()
+
+        self.assertTrue(self.pipeline.update())
+
+        self.assertEqual([self.pipeline], self.closed_pipelines)
+        self.assertEqual(8 * 60, self.pipeline.last_closed_timestamp)
+        df = self.pipeline.features_df
+        self.assertEqual(10, len(df))
+        self.assertEqual(self.candles_feed.columns + ["SMA_3"], list(df.columns))
+        np.testing.assert_allclose(self.candles_feed.candles_df["close"].rolling(3).mean(), df["SMA_3"])
+        self.assertEqual(108, self.pipeline.features["SMA_3"])
+
+    def test_open_candle_is_recomputed_without_closing(self):
+        self.fill_feed()
+        self.pipeline.update()
+
+        self.update_open_candle(9 * 60, 120)
+
+        self.assertFalse(self.pipeline.update())
+        self.assertEqual(1, len(self.closed_pipelines))
+        self.assertEqual(120, self.pipeline.features["close"])
+        self.assertEqual((107 + 108 + 120) / 3, self.pipeline.features["SMA_3"])
+        self.assertEqual(10, len(self.pipeline.features_df))
+
+    def test_closed_candles_are_processed_once(self):
+        self.fill_feed()
+        self.pipeline.update()
+        self.update_open_candle(9 * 60, 120)
+        self.pipeline.update()
+
+        self.add_candle(10 * 60, 130)
+        self.add_candle(11 * 60, 140)
+
+        self.assertTrue(self.pipeline.update())
+        self.assertEqual(2, len(self.closed_pipelines))
+        self.assertEqual(10 * 60, self.pipeline.last_closed_timestamp)
+        df = self.pipeline.features_df
+        self.assertEqual(10, len(df))
+        np.testing.assert_allclose([(107 + 108 + 120) / 3, (108 + 120 + 130) / 3, 130], df["SMA_3"].iloc[-3:])
+        np.testing.assert_allclose(self.candles_feed.candles_df["close"].iloc[-3:].mean(), df["SMA_3"].iloc[-1])
+
+    def test_pipeline_restarts_after_a_gap_longer_than_the_feed(self):
+        self.fill_feed()
+        self.pipeline.update()
+
+        for i in range(10):
+            self.add_candle(1000 * 60 + i * 60, 200 + i)
+
+        self.assertTrue(self.pipeline.update())
+        df = self.pipeline.features_df
+        self.assertEqual(10, len(df))
+        self.assertTrue(np.isnan(df["SMA_3"].iloc[1]))
+        self.assertEqual(208, df["SMA_3"].iloc[-1])
+
+    def test_new_indicator_processes_the_candles_again(self):
+        self.fill_feed()
+        self.pipeline.update()
+
+        indicator = self.pipeline.add_indicator(BollingerBands(3, 2))
+        same_indicator = self.pipeline.add_indicator(BollingerBands(3, 2.0))
+        self.pipeline.update()
+
+        self.assertIs(indicator, same_indicator)
+        self.assertEqual(2, len(self.pipeline.indicators))
+        df = self.pipeline.features_df
+        self.assertEqual(10, len(df))
+        np.testing.assert_allclose(df["close"].rolling(3).mean(), df["BBM_3_2.0"])
+
+    def test_listener_errors_are_logged(self):
+        self.pipeline.remove_candle_closed_listener(self.closed_pipelines.append)
+        self.pipeline.add_candle_closed_listener(lambda pipeline: 1 / 0)
+        self.fill_feed()
+
+        with self.assertLogs(CandlesFeaturePipeline.logger(), level="ERROR"):
+            self.assertTrue(self.pipeline.update())
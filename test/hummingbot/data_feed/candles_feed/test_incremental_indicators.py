@@ -0,0 +1,123 @@
+import unittest
+
+import numpy as np
+import pandas as pd
+
+from hummingbot.data_feed.candles_feed.candles_base import CandlesBase
+from hummingbot.data_feed.candles_feed.incremental_indicators import (
+    EMA,
+    MACD,
+    RSI,
+    SMA,
+    BollingerBands,
+    IncrementalIndicator,
+)
+
+
+class IncrementalIndicatorsTest(unittest.TestCase):
+    """
+    The expected values are computed over the whole series with the formulas of pandas_ta.
+    """
+
+    def setUp(self) -> None:
+        super().setUp()
+        random = np.random.default_rng(42)
+        self.close = pd.Series(30000 + np.cumsum(random.normal(0, 50, 300)))
+
+    def candle(self, close: float):
+        candle = [0.0] * len(CandlesBase.columns)
+        candle[CandlesBase.columns.index("close")] = close
+        return candle
+
+    def compute(self, indicator: IncrementalIndicator) -> pd.DataFrame:
+        rows = [indicator.update(self.candle(close)) for close in self.close]
+        return pd.DataFrame(rows, columns=indicator.columns)
+
+    @staticmethod
+    def ema(series: pd.Series, length: int) -> pd.Series:
+        series = series.copy()
+        first_index = series.first_valid_index()
+        seed = series.loc[first_index:].iloc[:length].mean()
+        seed_index = series.loc[first_index:].index[length - 1]
+        series.loc[:seed_index] = np.nan
+        series.loc[seed_index] = seed
+        return series.ewm(span=length, adjust=False).mean()
+
+    def assert_series_equal(self, expected: pd.Series, actual: pd.Series):
+        np.testing.assert_allclose(expected.to_numpy(), actual.to_numpy(), rtol=1e-9, atol=1e-9)
+
+    def test_sma(self):
+        result = self.compute(SMA(20))
+
+        self.assertEqual(["SMA_20"], list(result.columns))
+        self.assert_series_equal(self.close.rolling(20).mean(), result["SMA_20"])
+
+    def test_ema(self):
+        result = self.compute(EMA(10))
+
+        self.assertEqual(["EMA_10"], list(result.columns))
+        self.assert_series_equal(self.ema(self.close, 10), result["EMA_10"])
+
+    def test_bollinger_bands(self):
+        result = self.compute(BollingerBands(20, 2))
+
+        mid = self.close.rolling(20).mean()
+        std = self.close.rolling(20).std(ddof=0)
+        lower, upper = mid - 2 * std, mid + 2 * std
+        self.assertEqual(["BBL_20_2.0", "BBM_20_2.0", "BBU_20_2.0", "BBB_20_2.0", "BBP_20_2.0"], list(result.columns))
+        self.assert_series_equal(lower, result["BBL_20_2.0"])
+        self.assert_series_equal(mid, result["BBM_20_2.0"])
+        self.assert_series_equal(upper, result["BBU_20_2.0"])
+        self.assert_series_equal(100 * (upper - lower) / mid, result["BBB_20_2.0"])
+        self.assert_series_equal((self.close - lower) / (upper - lower), result["BBP_20_2.0"])
+
+    def test_bollinger_bands_of_constant_prices(self):
+        indicator = BollingerBands(3, 2)
+        for _ in range(3):
+            lower, mid, upper, bandwidth, percent = indicator.update(self.candle(100))
+
+        self.assertEqual((100, 100, 100, 0), (lower, mid, upper, percent))
+        self.assertAlmostEqual(0, bandwidth)
+
+    def test_macd(self):
+        result = self.compute(MACD(12, 26, 9))
+
+        macd = self.ema(self.close, 12) - self.ema(self.close, 26)
+        signal = self.ema(macd, 9)
+        self.assertEqual(["MACD_12_26_9", "MACDh_12_26_9", "MACDs_12_26_9"], list(result.columns))
+        self.assert_series_equal(macd, result["MACD_12_26_9"])
+        self.assert_series_equal(signal, result["MACDs_12_26_9"])
+        self.assert_series_equal(macd - signal, result["MACDh_12_26_9"])
+
+    def test_rsi(self):
+        result = self.compute(RSI(14))
+
+        change = self.close.diff()
+        average_gain = change.clip(lower=0).ewm(alpha=1 / 14, min_periods=14).mean()
+        average_loss = (-change).clip(lower=0).ewm(alpha=1 / 14, min_periods=14).mean()
+        self.assertEqual(["RSI_14"], list(result.columns))
+        self.assert_series_equal(100 * average_gain / (average_gain + average_loss), result["RSI_14"])
+
+    def test_peek_does_not_change_the_state(self):
+        for indicator_factory in (lambda: SMA(5), lambda: EMA(5), lambda: BollingerBands(5, 2), lambda: MACD(3, 6, 4),
+                                  lambda: RSI(5)):
+            indicator = indicator_factory()
+            reference = indicator_factory()
+            for close in self.close[:20]:
+                indicator.update(self.candle(close))
+                reference.update(self.candle(close))
+
+            indicator.peek(self.candle(29000))
+            peeked = indicator.peek(self.candle(31000))
+
+            np.testing.assert_allclose(reference.update(self.candle(31000)), peeked)
+            indicator.update(self.candle(31000))
+            np.testing.assert_allclose(reference.update(self.candle(30500)), indicator.update(self.candle(30500)))
+
+    def test_reset(self):
+        indicator = MACD(3, 6, 4)
+        first_values = self.compute(indicator)
+
+        indicator.reset()
+
+        pd.testing.assert_frame_equal(first_values, self.compute(indicator))
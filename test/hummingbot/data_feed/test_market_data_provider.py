@@ -7,6 +7,7 @@ from hummingbot.core.data_type.common import PriceType
 from hummingbot.core.data_type.order_book_query_result import OrderBookQueryResult
 from hummingbot.data_feed.candles_feed.candles_base import CandlesBase
 from hummingbot.data_feed.candles_feed.candles_factory import CandlesConfig
+from hummingbot.data_feed.candles_feed.incremental_indicators import SMA
 from hummingbot.strategy.strategy_v2_base import MarketDataProvider
 
 
@@ -46,6 +47,23 @@ class TestMarketDataProvider(unittest.TestCase):
         result = self.provider.get_candles_df("binance", "BTC-USDT", "1m", 100)
         self.assertIsInstance(result, pd.DataFrame)
 
+    @patch.object(CandlesBase, "start", MagicMock())
+    def test_get_candles_feature_pipeline(self):
+        pipeline = self.provider.get_candles_feature_pipeline("binance", "BTC-USDT", "1m", 100, [SMA(10)])
+        same_pipeline = self.provider.get_candles_feature_pipeline("binance", "BTC-USDT", "1m", 100, [SMA(20)])
+
+        self.assertIs(pipeline, same_pipeline)
+        self.assertIs(self.provider.candles_feeds["binance_BTC-USDT_1m"], pipeline.candles_feed)
+        self.assertEqual(["SMA_10", "SMA_20"], [indicator.name for indicator in pipeline.indicators])
+
+        larger_pipeline = self.provider.get_candles_feature_pipeline("binance", "BTC-USDT", "1m", 200)
+        self.assertIsNot(pipeline, larger_pipeline)
+        self.assertEqual(200, larger_pipeline.candles_feed.max_records)
+        self.assertEqual(["SMA_10", "SMA_20"], [indicator.name for indicator in larger_pipeline.indicators])
+
+        self.provider.stop()
+        self.assertEqual({}, self.provider.feature_pipelines)
+
     def test_get_trading_pairs(self):
         self.mock_connector.trading_pairs = ["BTC-USDT"]
         trading_pairs = self.provider.get_trading_pairs("mock_connector")
@@ -66,6 +84,22 @@ class TestMarketDataProvider(unittest.TestCase):
         self.assertIsInstance(snapshot[0], pd.DataFrame)
         self.assertIsInstance(snapshot[1], pd.DataFrame)
 
+    def test_get_order_book_imbalance(self):
+        mock_order_book = MagicMock()
+        mock_order_book.get_depth_imbalance.return_value = 0.25
+        self.mock_connector.get_order_book.return_value = mock_order_book
+        result = self.provider.get_order_book_imbalance("mock_connector", "BTC-USDT", 10)
+        self.assertEqual(0.25, result)
+        mock_order_book.get_depth_imbalance.assert_called_once_with(10)
+
+    def test_get_cumulative_depth(self):
+        mock_order_book = MagicMock()
+        mock_order_book.get_cumulative_depth.return_value = 3.5
+        self.mock_connector.get_order_book.return_value = mock_order_book
+        result = self.provider.get_cumulative_depth("mock_connector", "BTC-USDT", 10, True)
+        self.assertEqual(3.5, result)
+        mock_order_book.get_cumulative_depth.assert_called_once_with(True, 10)
+
     def test_get_price_for_quote_volume(self):
         self.mock_connector.get_order_book.return_value = MagicMock(
             get_price_for_quote_volume=MagicMock(return_value=OrderBookQueryResult(100, 2, 100, 2)))
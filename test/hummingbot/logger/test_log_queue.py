@@ -0,0 +1,137 @@
+import logging
+import unittest
+from typing import List
+
+from hummingbot.logger.log_queue import LogQueue, LogQueueHandler, get_log_queue, start_log_queue, stop_log_queue
+
+
+class RecordsHandler(logging.Handler):
+    def __init__(self, level: int = logging.NOTSET):
+        super().__init__(level=level)
+        self.records: List[logging.LogRecord] = []
+
+    def emit(self, record: logging.LogRecord):
+        self.records.append(record)
+
+
+class LogQueueTest(unittest.TestCase):
+    level = 0
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.root_logger = logging.getLogger()
+        self.root_handlers = list(self.root_logger.handlers)
+        self.test_logger = logging.getLogger("hummingbot.test_log_queue")
+        self.test_logger.setLevel(logging.DEBUG)
+        self.test_logger.propagate = False
+        self.handler = RecordsHandler()
+        self.warning_handler = RecordsHandler(level=logging.WARNING)
+        self.test_logger.addHandler(self.handler)
+        self.test_logger.addHandler(self.warning_handler)
+        self.log_records = []
+        LogQueue.logger().setLevel(1)
+        LogQueue.logger().addHandler(self)
+
+    def tearDown(self) -> None:
+        stop_log_queue()
+        LogQueue.logger().removeHandler(self)
+        for handler in list(self.test_logger.handlers):
+            self.test_logger.removeHandler(handler)
+        for handler in list(self.root_logger.handlers):
+            self.root_logger.removeHandler(handler)
+        for handler in self.root_handlers:
+            self.root_logger.addHandler(handler)
+        super().tearDown()
+
+    def handle(self, record):
+        self.log_records.append(record)
+
+    def is_logged(self, log_level: str, message: str) -> bool:
+        return any(record.levelname == log_level and record.getMessage() == message for record in self.log_records)
+
+    def queued_handlers(self, queue_handler: LogQueueHandler) -> List[logging.Handler]:
+        # pytest adds its own capture handlers to the loggers that do not propagate
+        return [handler for handler in queue_handler.handlers if isinstance(handler, RecordsHandler)]
+
+    @staticmethod
+    def record(level: int, msg: str = "test") -> logging.LogRecord:
+        return logging.LogRecord("test", level, __file__, 0, msg, None, None)
+
+    def test_start_log_queue_moves_logger_handlers_to_the_queue(self):
+        log_queue = start_log_queue({"max_size": 100}, ["hummingbot.test_log_queue"])
+
+        self.assertIs(log_queue, get_log_queue())
+        self.assertTrue(log_queue.is_running)
+        self.assertEqual(1, len(self.test_logger.handlers))
+        queue_handler = self.test_logger.handlers[0]
+        self.assertIsInstance(queue_handler, LogQueueHandler)
+        self.assertEqual([self.handler, self.warning_handler], self.queued_handlers(queue_handler))
+
+        self.test_logger.debug("Debug %s", "message")
+        self.test_logger.warning("Warning message")
+        stop_log_queue()
+
+        self.assertIsNone(get_log_queue())
+        self.assertFalse(log_queue.is_running)
+        self.assertEqual(["Debug message", "Warning message"], [record.getMessage() for record in self.handler.records])
+        self.assertEqual(["Warning message"], [record.getMessage() for record in self.warning_handler.records])
+
+    def test_restarting_log_queue_keeps_the_original_handlers(self):
+        start_log_queue({}, ["hummingbot.test_log_queue"])
+        start_log_queue({}, ["hummingbot.test_log_queue"])
+
+        self.assertEqual(1, len(self.test_logger.handlers))
+        self.assertEqual([self.handler, self.warning_handler], self.queued_handlers(self.test_logger.handlers[0]))
+
+    def test_start_log_queue_rejects_invalid_sampling_level(self):
+        with self.assertRaises(ValueError):
+            start_log_queue({"sampling_level": "LOUD"}, [])
+
+    def test_queue_handler_merges_message_arguments(self):
+        log_queue = LogQueue()
+        handler = LogQueueHandler(log_queue, (self.handler,))
+        arguments = ["first"]
+        record = logging.LogRecord("test", logging.INFO, __file__, 0, "Message %s", (arguments,), None)
+
+        handler.emit(record)
+        arguments.append("second")
+
+        queued_record, handlers = log_queue._queue.get_nowait()
+        self.assertEqual("Message ['first']", queued_record.getMessage())
+        self.assertEqual((self.handler,), handlers)
+        self.assertEqual("Message ['first', 'second']", record.getMessage())
+
+    def test_low_level_records_are_sampled_when_queue_fills_up(self):
+        log_queue = LogQueue(max_size=10, sampling_threshold=0.5, sampling_rate=2)
+
+        queued = [log_queue.put(self.record(logging.DEBUG), (self.handler,)) for _ in range(9)]
+
+        self.assertEqual([True] * 5 + [False, True, False, True], queued)
+        self.assertEqual({"DEBUG": 2}, log_queue.dropped_records)
+        self.assertTrue(log_queue.put(self.record(logging.INFO), (self.handler,)))
+        self.assertEqual(8, log_queue.size)
+
+    def test_records_are_dropped_when_queue_is_full(self):
+        log_queue = LogQueue(max_size=2)
+
+        for _ in range(3):
+            log_queue.put(self.record(logging.ERROR), (self.handler,))
+        log_queue.put(self.record(logging.DEBUG), (self.handler,))
+
+        self.assertEqual(2, log_queue.size)
+        self.assertEqual({"ERROR": 1, "DEBUG": 1}, log_queue.dropped_records)
+        self.assertEqual(2, log_queue.dropped_count)
+
+    def test_dropped_records_are_reported(self):
+        log_queue = LogQueue(max_size=1, drop_report_interval=60)
+        log_queue.put(self.record(logging.INFO), (self.handler,))
+        log_queue.put(self.record(logging.INFO), (self.handler,))
+        log_queue.put(self.record(logging.DEBUG), (self.handler,))
+
+        log_queue._report_dropped_records()
+        log_queue.put(self.record(logging.INFO), (self.handler,))
+        log_queue._report_dropped_records()
+
+        self.assertTrue(self.is_logged(
+            "WARNING", "2 log records were dropped by the log queue (DEBUG: 1, INFO: 1 in total)."))
+        self.assertEqual(1, len(self.log_records))
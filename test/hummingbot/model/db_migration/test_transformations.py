@@ -1,7 +1,13 @@
 from unittest import TestCase
 from unittest.mock import MagicMock
 
-from hummingbot.model.db_migration.transformations import AddTradeFeeInQuote, ConvertPriceAndAmountColumnsToBigint
+from sqlalchemy import create_engine, inspect, text
+
+from hummingbot.model.db_migration.transformations import (
+    AddTradeFeeInQuote,
+    AddTradeFillConfigMarketSymbolTimestampIndex,
+    ConvertPriceAndAmountColumnsToBigint,
+)
 
 
 class ConvertPriceAndAmountColumnsToBigintTests(TestCase):
@@ -41,3 +47,25 @@ class AddTradeFeeInQuoteTests(TestCase):
 
     def test_to_version(self):
         self.assertEqual(20230516, AddTradeFeeInQuote(self).to_version)
+
+
+class AddTradeFillConfigMarketSymbolTimestampIndexTests(TestCase):
+    def test_name(self):
+        self.assertEqual("AddTradeFillConfigMarketSymbolTimestampIndex",
+                         AddTradeFillConfigMarketSymbolTimestampIndex(self).name)
+
+    def test_to_version(self):
+        self.assertEqual(20261019, AddTradeFillConfigMarketSymbolTimestampIndex(self).to_version)
+
+    def test_apply_creates_the_index(self):
+        engine = create_engine("sqlite://")
+        with engine.begin() as conn:
+            conn.execute(text("create table TradeFill (config_file_path TEXT, market TEXT, symbol TEXT, "
+                              "timestamp BIGINT)"))
+        db_handle = MagicMock()
+        db_handle.engine = engine
+
+        AddTradeFillConfigMarketSymbolTimestampIndex(migrator=self).apply(db_handle)
+
+        index_names = [index["name"] for index in inspect(engine).get_indexes("TradeFill")]
+        self.assertEqual(["tf_config_market_symbol_timestamp_index"], index_names)
@@ -0,0 +1,56 @@
+import os
+import tempfile
+from unittest import TestCase
+
+from sqlalchemy import text
+from sqlalchemy.pool import NullPool, QueuePool
+
+from hummingbot.client.config.client_config_map import ClientConfigMap, DBSqliteMode, DBSqlitePerformanceMode
+from hummingbot.client.config.config_helpers import ClientConfigAdapter
+from hummingbot.model.sql_connection_manager import SQLConnectionManager, SQLConnectionType
+
+
+class SQLConnectionManagerTests(TestCase):
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.db_dir = tempfile.TemporaryDirectory()
+        self.db_path = os.path.join(self.db_dir.name, "test_DB.sqlite")
+        self.client_config_map = ClientConfigAdapter(ClientConfigMap())
+
+    def tearDown(self) -> None:
+        self.db_dir.cleanup()
+        super().tearDown()
+
+    def pragma(self, manager: SQLConnectionManager, name: str):
+        with manager.engine.connect() as conn:
+            return conn.execute(text(f"PRAGMA {name}")).scalar()
+
+    def test_default_sqlite_mode_keeps_engine_defaults(self):
+        self.client_config_map.db_mode = DBSqliteMode()
+        manager = SQLConnectionManager(self.client_config_map, SQLConnectionType.TRADE_FILLS, db_path=self.db_path)
+
+        self.assertIsInstance(manager.engine.pool, NullPool)
+        self.assertEqual("delete", self.pragma(manager, "journal_mode"))
+        manager.engine.dispose()
+
+    def test_sqlite_performance_mode_sets_pragmas_and_reuses_connections(self):
+        self.client_config_map.db_mode = DBSqlitePerformanceMode(sqlite_synchronous="normal")
+        manager = SQLConnectionManager(self.client_config_map, SQLConnectionType.TRADE_FILLS, db_path=self.db_path)
+
+        self.assertIsInstance(manager.engine.pool, QueuePool)
+        self.assertEqual("wal", self.pragma(manager, "journal_mode"))
+        self.assertEqual(1, self.pragma(manager, "synchronous"))
+        self.assertEqual(-64000, self.pragma(manager, "cache_size"))
+        manager.engine.dispose()
+
+    def test_sqlite_performance_mode_with_in_memory_database(self):
+        self.client_config_map.db_mode = DBSqlitePerformanceMode()
+        manager = SQLConnectionManager(self.client_config_map, SQLConnectionType.TRADE_FILLS, db_path="")
+
+        self.assertNotIsInstance(manager.engine.pool, QueuePool)
+        self.assertIsNotNone(manager.get_local_db_version(manager.get_new_session()))
+
+    def test_sqlite_performance_mode_rejects_invalid_pragma_values(self):
+        with self.assertRaises(ValueError):
+            DBSqlitePerformanceMode(sqlite_synchronous="sometimes")
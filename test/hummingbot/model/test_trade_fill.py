@@ -1,5 +1,12 @@
+from decimal import Decimal
 from unittest import TestCase
 
+from hummingbot.client.config.client_config_map import ClientConfigMap
+from hummingbot.client.config.config_helpers import ClientConfigAdapter
+from hummingbot.core.data_type.common import PositionAction
+from hummingbot.model.order import Order  # noqa — Order needs to be defined for TradeFill
+from hummingbot.model.order_status import OrderStatus  # noqa — Order needs to be defined for TradeFill
+from hummingbot.model.sql_connection_manager import SQLConnectionManager, SQLConnectionType
 from hummingbot.model.trade_fill import TradeFill
 
 
@@ -37,3 +44,30 @@ class TradeFillTests(TestCase):
             "position", ]
 
         self.assertEqual(expected_attributes, TradeFill.attribute_names_for_file_export())
+
+    def test_stream_trades(self):
+        sql = SQLConnectionManager(ClientConfigAdapter(ClientConfigMap()), SQLConnectionType.TRADE_FILLS, db_path="")
+        with sql.get_new_session() as session:
+            with session.begin():
+                for i in range(5):
+                    session.add(TradeFill(
+                        config_file_path=self.config_file_path,
+                        strategy=self.strategy_name,
+                        market=self.display_name,
+                        symbol=self.trading_pair,
+                        base_asset=self.base,
+                        quote_asset=self.quote,
+                        timestamp=1000 - i,
+                        order_id=f"OID{i}",
+                        trade_type="BUY",
+                        order_type="LIMIT",
+                        price=Decimal("10"),
+                        amount=Decimal("1"),
+                        trade_fee={},
+                        exchange_trade_id=f"EOID{i}",
+                        position=PositionAction.NIL.value,
+                    ))
+
+            trades = list(TradeFill.stream_trades(session, market=self.display_name, batch_size=2))
+
+        self.assertEqual([f"OID{i}" for i in reversed(range(5))], [trade.order_id for trade in trades])
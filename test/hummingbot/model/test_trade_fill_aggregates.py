@@ -0,0 +1,149 @@
+import asyncio
+import unittest
+from decimal import Decimal
+from functools import partial
+from typing import Awaitable, List
+
+from hummingbot.client.config.client_config_map import ClientConfigMap
+from hummingbot.client.config.config_helpers import ClientConfigAdapter
+from hummingbot.client.performance import PerformanceMetrics
+from hummingbot.core.data_type.common import PositionAction
+from hummingbot.core.data_type.trade_fee import (
+    AddedToCostTradeFee,
+    DeductedFromReturnsTradeFee,
+    TokenAmount,
+    TradeFeeBase,
+)
+from hummingbot.core.rate_oracle.rate_oracle import RateOracle
+from hummingbot.model.order import Order  # noqa — Order needs to be defined for TradeFill
+from hummingbot.model.order_status import OrderStatus  # noqa — Order needs to be defined for TradeFill
+from hummingbot.model.sql_connection_manager import SQLConnectionManager, SQLConnectionType
+from hummingbot.model.trade_fill import TradeFill
+from hummingbot.model.trade_fill_aggregates import TradeFillAggregates
+
+
+class TradeFillAggregatesTest(unittest.TestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        self.sql = SQLConnectionManager(
+            ClientConfigAdapter(ClientConfigMap()), SQLConnectionType.TRADE_FILLS, db_path=""
+        )
+        self.config_file_path = "conf_pure_mm_1.yml"
+        rate_oracle = RateOracle()
+        rate_oracle._prices["COINALPHA-HBOT"] = Decimal("12")
+        RateOracle._shared_instance = rate_oracle
+
+    def tearDown(self) -> None:
+        RateOracle._shared_instance = None
+        super().tearDown()
+
+    def async_run_with_timeout(self, coroutine: Awaitable, timeout: float = 1):
+        ret = asyncio.get_event_loop().run_until_complete(asyncio.wait_for(coroutine, timeout))
+        return ret
+
+    def trade_fill(self,
+                   timestamp: int,
+                   order_id: str,
+                   trade_type: str,
+                   price: str,
+                   amount: str,
+                   trade_fee: TradeFeeBase,
+                   market: str = "binance",
+                   config_file_path: str = None,
+                   position: str = PositionAction.NIL.value) -> TradeFill:
+        return TradeFill(
+            config_file_path=config_file_path or self.config_file_path,
+            strategy="pure_market_making",
+            market=market,
+            symbol="COINALPHA-HBOT",
+            base_asset="COINALPHA",
+            quote_asset="HBOT",
+            timestamp=timestamp,
+            order_id=order_id,
+            trade_type=trade_type,
+            order_type="LIMIT",
+            price=Decimal(price),
+            amount=Decimal(amount),
+            trade_fee=trade_fee.to_json(),
+            exchange_trade_id=f"{order_id}-{timestamp}",
+            position=position,
+        )
+
+    def store(self, trades: List[TradeFill]):
+        with self.sql.get_new_session() as session:
+            with session.begin():
+                session.add_all(trades)
+
+    def test_market_summary_matches_metrics_calculated_from_fills(self):
+        trades = [
+            self.trade_fill(1000, "OID1", "BUY", "10.5", "2", AddedToCostTradeFee(percent=Decimal("0.001"))),
+            self.trade_fill(1001, "OID2", "SELL", "11.25", "1.5", DeductedFromReturnsTradeFee(percent=Decimal("0.002"))),
+            self.trade_fill(1002, "OID3", "BUY", "10.75", "0.25", AddedToCostTradeFee(
+                flat_fees=[TokenAmount("BNB", Decimal("0.01"))])),
+            self.trade_fill(1003, "OID4", "SELL", "11", "3", AddedToCostTradeFee(
+                percent=Decimal("0.001"), flat_fees=[TokenAmount("HBOT", Decimal("0.5"))])),
+            self.trade_fill(999, "OID0", "BUY", "9", "1", AddedToCostTradeFee(), market="kucoin"),
+            self.trade_fill(1004, "OID5", "BUY", "9", "1", AddedToCostTradeFee(), config_file_path="other.yml"),
+        ]
+        self.store(trades)
+        balances = {"COINALPHA": Decimal("100"), "HBOT": Decimal("1000")}
+
+        with self.sql.get_new_session() as session:
+            aggregates = TradeFillAggregates(session, 0, config_file_path=self.config_file_path)
+            summaries = {summary.market: summary for summary in aggregates.market_summaries()}
+            from_summary = self.async_run_with_timeout(
+                PerformanceMetrics.create_from_summary("COINALPHA-HBOT", summaries["binance"], balances))
+            fills = list(aggregates.stream_trades("binance", "COINALPHA-HBOT"))
+            from_fills = self.async_run_with_timeout(PerformanceMetrics.create("COINALPHA-HBOT", fills, balances))
+
+        self.assertEqual({"binance", "kucoin"}, set(summaries))
+        self.assertEqual(4, summaries["binance"].num_trades)
+        self.assertEqual(["OID1", "OID2", "OID3", "OID4"], [fill.order_id for fill in fills])
+        for attribute in ["num_buys", "num_sells", "b_vol_base", "s_vol_base", "b_vol_quote", "s_vol_quote",
+                          "start_price", "cur_price", "hold_value", "cur_value", "trade_pnl", "fee_in_quote",
+                          "total_pnl"]:
+            self.assertAlmostEqual(getattr(from_fills, attribute), getattr(from_summary, attribute), places=9,
+                                   msg=attribute)
+        self.assertEqual(set(from_fills.fees), set(from_summary.fees))
+
+    def test_quote_volumes_and_fees_summed_without_rounding(self):
+        fee = DeductedFromReturnsTradeFee(percent=Decimal("0.000075"))
+        self.store([self.trade_fill(1000 + i, f"OID{i}", "BUY", "29123.456789", "987654.123456", fee)
+                    for i in range(3)])
+
+        with self.sql.get_new_session() as session:
+            summary, = TradeFillAggregates(session, 0, config_file_path=self.config_file_path).market_summaries()
+
+        quote_volume = Decimal("29123.456789") * Decimal("987654.123456") * 3
+        self.assertEqual(quote_volume, summary.buys.quote_volume)
+        self.assertEqual(quote_volume * Decimal("0.000075"), summary.buys.percent_fee_volume)
+        self.assertEqual(quote_volume * Decimal("0.000075"), summary.buys.deducted_fee_volume)
+
+    def test_derivative_positions_paired_from_streamed_fills(self):
+        fee = AddedToCostTradeFee(percent=Decimal("0"))
+        self.store([
+            self.trade_fill(1000, "OID1", "BUY", "10", "1", fee, position=PositionAction.OPEN.value),
+            self.trade_fill(1001, "OID2", "SELL", "12", "1", fee, position=PositionAction.CLOSE.value),
+            self.trade_fill(1002, "OID3", "SELL", "15", "2", fee, position=PositionAction.OPEN.value),
+            self.trade_fill(1003, "OID4", "BUY", "14", "2", fee, position=PositionAction.CLOSE.value),
+        ])
+
+        with self.sql.get_new_session() as session:
+            aggregates = TradeFillAggregates(session, 0, config_file_path=self.config_file_path, batch_size=2)
+            summary = aggregates.market_summaries()[0]
+            metrics = self.async_run_with_timeout(PerformanceMetrics.create_from_summary(
+                "COINALPHA-HBOT",
+                summary,
+                {},
+                derivative_fills=partial(aggregates.stream_trades, summary.market, summary.symbol)))
+
+        self.assertTrue(summary.are_derivatives)
+        self.assertEqual(Decimal("4"), metrics.trade_pnl)
+
+    def test_has_trades(self):
+        self.store([self.trade_fill(1000, "OID1", "BUY", "10", "1", AddedToCostTradeFee())])
+
+        with self.sql.get_new_session() as session:
+            self.assertTrue(TradeFillAggregates(session, 0, config_file_path=self.config_file_path).has_trades())
+            self.assertFalse(TradeFillAggregates(session, 1001, config_file_path=self.config_file_path).has_trades())
+            self.assertFalse(TradeFillAggregates(session, 0, config_file_path="other.yml").has_trades())
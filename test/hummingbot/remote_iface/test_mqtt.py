@@ -15,6 +15,7 @@ from hummingbot.core.data_type.common import OrderType, TradeType
 from hummingbot.core.data_type.limit_order import LimitOrder
 from hummingbot.core.event.events import BuyOrderCreatedEvent, MarketEvent, OrderExpiredEvent, SellOrderCreatedEvent
 from hummingbot.core.mock_api.mock_mqtt_server import FakeMQTTBroker
+from hummingbot.core.utils.latency_metrics import LatencyMetricsRegistry
 from hummingbot.model.order import Order
 from hummingbot.model.trade_fill import TradeFill
 from hummingbot.remote_iface.mqtt import MQTTGateway, MQTTMarketEventForwarder
@@ -42,6 +43,7 @@ class RemoteIfaceMQTTTests(TestCase):
             'balance/limit',
             'balance/paper',
             'command_shortcuts',
+            'metrics',
         ]
         cls.START_URI = 'hbot/$instance_id/start'
         cls.STOP_URI = 'hbot/$instance_id/stop'
@@ -52,6 +54,7 @@ class RemoteIfaceMQTTTests(TestCase):
         cls.BALANCE_LIMIT_URI = 'hbot/$instance_id/balance/limit'
         cls.BALANCE_PAPER_URI = 'hbot/$instance_id/balance/paper'
         cls.COMMAND_SHORTCUT_URI = 'hbot/$instance_id/command_shortcuts'
+        cls.METRICS_URI = 'hbot/$instance_id/metrics'
         cls.fake_mqtt_broker = FakeMQTTBroker()
 
     def setUp(self) -> None:
@@ -426,6 +429,22 @@ class RemoteIfaceMQTTTests(TestCase):
         self.async_run_with_timeout(self.wait_for_rcv(topic, msg, msg_key='data'), timeout=10)
         self.assertTrue(self.is_msg_received(topic, msg, msg_key='data'))
 
+    def test_mqtt_command_metrics(self):
+        registry = LatencyMetricsRegistry.get_instance()
+        registry.reset()
+        self.addCleanup(registry.reset)
+        self.addCleanup(registry.disable)
+        self.start_mqtt()
+
+        topic = self.get_topic_for(self.METRICS_URI)
+        self.fake_mqtt_broker.publish_to_subscription(topic, {"enable": True})
+
+        reply_topic = f"test_reply/hbot/{self.instance_id}/metrics"
+        reply_data = {'status': 200, 'msg': '', 'enabled': True, 'metrics': []}
+        self.async_run_with_timeout(self.wait_for_rcv(reply_topic, reply_data, msg_key='data'), timeout=10)
+        self.assertTrue(self.is_msg_received(reply_topic, reply_data, msg_key='data'))
+        self.assertTrue(registry.enabled)
+
     def test_mqtt_command_config(self):
         self.start_mqtt()
 
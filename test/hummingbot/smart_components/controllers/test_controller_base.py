@@ -2,9 +2,12 @@ import asyncio
 from test.isolated_asyncio_wrapper_test_case import IsolatedAsyncioWrapperTestCase
 from unittest.mock import AsyncMock, MagicMock, PropertyMock
 
+import pandas as pd
+
 from hummingbot.data_feed.candles_feed.candles_factory import CandlesConfig
 from hummingbot.data_feed.market_data_provider import MarketDataProvider
 from hummingbot.smart_components.controllers.controller_base import ControllerBase, ControllerConfigBase
+from hummingbot.smart_components.controllers.controller_worker_pool import ControllerWorkerPool
 
 
 class TestControllerBase(IsolatedAsyncioWrapperTestCase):
@@ -84,6 +87,44 @@ class TestControllerBase(IsolatedAsyncioWrapperTestCase):
         # Check that no action is put in the queue
         self.mock_actions_queue.put.assert_not_called()
 
+    async def test_control_task_without_worker_pool_support(self):
+        type(self.controller.market_data_provider).ready = PropertyMock(return_value=True)
+        self.controller.executors_update_event.set()
+        self.controller.worker_pool = MagicMock(spec=ControllerWorkerPool)
+        self.controller.update_processed_data = AsyncMock()
+        self.controller.determine_executor_actions = MagicMock(return_value=[])
+
+        await self.controller.control_task()
+
+        self.assertFalse(self.controller.can_use_worker_pool)
+        self.controller.update_processed_data.assert_awaited_once()
+        self.controller.worker_pool.run.assert_not_called()
+
+    async def test_control_task_with_worker_pool(self):
+        class PoolController(ControllerBase):
+            @classmethod
+            def compute_processed_data(cls, config, market_data):
+                candles = market_data.get_candles_df("binance_perpetual", "ETH-USDT", "1m")
+                return {"last_close": candles["close"].iloc[-1], "controller_id": config.id}
+
+        worker_pool = ControllerWorkerPool(mode="thread", max_workers=1)
+        self.mock_market_data_provider.connectors = {}
+        self.mock_market_data_provider.get_candles_df.return_value = pd.DataFrame({"close": [1.0, 2.0]})
+        controller = PoolController(config=self.mock_controller_config,
+                                    market_data_provider=self.mock_market_data_provider,
+                                    actions_queue=self.mock_actions_queue,
+                                    worker_pool=worker_pool)
+        type(controller.market_data_provider).ready = PropertyMock(return_value=True)
+        controller.executors_update_event.set()
+        controller.determine_executor_actions = MagicMock(return_value=[])
+
+        await controller.control_task()
+        worker_pool.shutdown()
+
+        self.assertTrue(controller.can_use_worker_pool)
+        self.assertEqual({"last_close": 2.0, "controller_id": "test"}, controller.processed_data)
+        self.assertEqual(1, worker_pool.metrics["test"].runs_count)
+
     def test_to_format_status(self):
         # Test the to_format_status method
         status = self.controller.to_format_status()
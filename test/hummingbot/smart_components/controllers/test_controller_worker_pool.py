@@ -0,0 +1,111 @@
+import asyncio
+import time
+from decimal import Decimal
+from test.isolated_asyncio_wrapper_test_case import IsolatedAsyncioWrapperTestCase
+from unittest.mock import MagicMock
+
+import pandas as pd
+
+from hummingbot.core.data_type.common import PriceType
+from hummingbot.data_feed.candles_feed.candles_factory import CandlesConfig
+from hummingbot.data_feed.market_data_provider import MarketDataProvider
+from hummingbot.smart_components.controllers.controller_worker_pool import ControllerWorkerPool, MarketDataSnapshot
+
+
+def slow_sum(values, delay: float):
+    time.sleep(delay)
+    return sum(values)
+
+
+def failing_computation():
+    raise ValueError("Computation error")
+
+
+class ControllerWorkerPoolTest(IsolatedAsyncioWrapperTestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        self.pool = ControllerWorkerPool(mode="thread", max_workers=1, timeout=1.0)
+
+    def tearDown(self) -> None:
+        self.pool.shutdown()
+        super().tearDown()
+
+    def test_invalid_configuration_raises_error(self):
+        with self.assertRaises(ValueError):
+            ControllerWorkerPool(mode="cluster")
+        with self.assertRaises(ValueError):
+            ControllerWorkerPool(max_workers=0)
+
+    async def test_run_returns_result_and_records_metrics(self):
+        result = await self.pool.run("controller_1", slow_sum, [1, 2, 3], 0.01)
+
+        self.assertEqual(6, result)
+        metrics = self.pool.metrics["controller_1"]
+        self.assertEqual(1, metrics.runs_count)
+        self.assertGreaterEqual(metrics.last_compute_time, 0.01)
+        self.assertEqual(metrics.last_compute_time, metrics.max_compute_time)
+        self.assertIn("Worker pool: 1 updates", metrics.format_status())
+
+    async def test_concurrency_is_bounded(self):
+        results = await asyncio.gather(self.pool.run("controller_1", slow_sum, [1], 0.05),
+                                       self.pool.run("controller_2", slow_sum, [2], 0.05))
+
+        self.assertEqual([1, 2], results)
+        queue_waits = sorted(metrics.last_queue_wait for metrics in self.pool.metrics.values())
+        self.assertLess(queue_waits[0], 0.04)
+        self.assertGreaterEqual(queue_waits[1], 0.04)
+
+    async def test_timeout_is_counted(self):
+        pool = ControllerWorkerPool(mode="thread", max_workers=1, timeout=0.01)
+
+        with self.assertRaises(asyncio.TimeoutError):
+            await pool.run("controller_1", slow_sum, [1], 0.2)
+
+        self.assertEqual(1, pool.metrics["controller_1"].timeouts_count)
+        self.assertEqual(0, pool.metrics["controller_1"].runs_count)
+        pool.shutdown()
+
+    async def test_errors_are_counted(self):
+        with self.assertRaises(ValueError):
+            await self.pool.run("controller_1", failing_computation)
+
+        self.assertEqual(1, self.pool.metrics["controller_1"].errors_count)
+
+    async def test_process_pool(self):
+        pool = ControllerWorkerPool(mode="process", max_workers=1, timeout=60)
+
+        result = await pool.run("controller_1", slow_sum, [1, 2], 0)
+
+        self.assertEqual(3, result)
+        self.assertEqual(1, pool.metrics["controller_1"].runs_count)
+        pool.shutdown()
+
+
+class MarketDataSnapshotTest(IsolatedAsyncioWrapperTestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        self.candles_df = pd.DataFrame({"timestamp": [1, 2, 3], "close": [10.0, 11.0, 12.0]})
+        self.provider = MagicMock(spec=MarketDataProvider)
+        self.provider.connectors = {"binance": MagicMock()}
+        self.provider.get_candles_df.return_value = self.candles_df
+        self.provider.get_price_by_type.return_value = Decimal("11.5")
+        self.snapshot = MarketDataSnapshot.take(
+            self.provider,
+            [CandlesConfig(connector="binance", trading_pair="ETH-USDT", interval="1m", max_records=3)],
+            {"binance": {"ETH-USDT"}, "kucoin": {"ETH-USDT"}})
+
+    def test_candles_are_copied(self):
+        self.candles_df.loc[2, "close"] = 20.0
+
+        candles = self.snapshot.get_candles_df("binance", "ETH-USDT", "1m", max_records=2)
+
+        self.assertEqual([11.0, 12.0], list(candles["close"]))
+        with self.assertRaises(KeyError):
+            self.snapshot.get_candles_df("binance", "ETH-USDT", "5m")
+
+    def test_mid_prices_of_the_available_connectors(self):
+        self.assertEqual(Decimal("11.5"),
+                         self.snapshot.get_price_by_type("binance", "ETH-USDT", PriceType.MidPrice))
+        self.provider.get_price_by_type.assert_called_once_with("binance", "ETH-USDT", PriceType.MidPrice)
+        with self.assertRaises(KeyError):
+            self.snapshot.get_price_by_type("binance", "ETH-USDT", PriceType.BestBid)
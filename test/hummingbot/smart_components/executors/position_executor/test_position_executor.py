@@ -515,6 +515,41 @@ class TestPositionExecutor(IsolatedAsyncioWrapperTestCase):
         self.assertEqual(executor.close_type, CloseType.INSUFFICIENT_BALANCE)
         self.assertEqual(executor.status, SmartComponentStatus.TERMINATED)
 
+    @patch.object(PositionExecutor, "open_filled_amount", new_callable=PropertyMock, return_value=Decimal("0.5"))
+    @patch.object(PositionExecutor, "take_profit_price", new_callable=PropertyMock, return_value=Decimal("110"))
+    def test_renew_take_profit_order_amends_the_order(self, _, __):
+        position_config = self.get_position_config_market_long()
+        position_executor = self.get_position_executor_running_from_config(position_config)
+        position_executor._take_profit_limit_order = TrackedOrder(order_id="OID-SELL-1")
+        position_executor._strategy.amend.return_value = "OID-SELL-1"
+
+        position_executor.renew_take_profit_order()
+
+        position_executor._strategy.amend.assert_called_once_with(
+            connector_name="binance", trading_pair="ETH-USDT", order_id="OID-SELL-1", price=Decimal("110"),
+            amount=Decimal("0.5"), order_type=OrderType.LIMIT)
+        position_executor._strategy.cancel.assert_not_called()
+        position_executor._strategy.sell.assert_not_called()
+        self.assertEqual("OID-SELL-1", position_executor._take_profit_limit_order.order_id)
+
+        position_executor._strategy.amend.return_value = "OID-SELL-2"
+        position_executor.renew_take_profit_order()
+        self.assertEqual("OID-SELL-2", position_executor._take_profit_limit_order.order_id)
+
+    @patch.object(PositionExecutor, "open_filled_amount", new_callable=PropertyMock, return_value=Decimal("0.5"))
+    @patch.object(PositionExecutor, "take_profit_price", new_callable=PropertyMock, return_value=Decimal("110"))
+    def test_renew_take_profit_order_places_a_new_order_if_not_amended(self, _, __):
+        position_config = self.get_position_config_market_long()
+        position_executor = self.get_position_executor_running_from_config(position_config)
+        position_executor._take_profit_limit_order = TrackedOrder(order_id="OID-SELL-0")
+        position_executor._strategy.amend.return_value = None
+
+        position_executor.renew_take_profit_order()
+
+        position_executor._strategy.cancel.assert_called_once()
+        position_executor._strategy.sell.assert_called_once()
+        self.assertEqual("OID-SELL-1", position_executor._take_profit_limit_order.order_id)
+
     def test_get_custom_info(self):
         position_config = self.get_position_config_market_long()
         executor = PositionExecutor(self.strategy, position_config)
@@ -4,6 +4,7 @@ import unittest
 from copy import deepcopy
 from decimal import Decimal
 from typing import Dict, List, Tuple
+from unittest.mock import patch
 
 import numpy as np
 import pandas as pd
@@ -36,6 +37,7 @@ from hummingbot.strategy.avellaneda_market_making.avellaneda_market_making_confi
     MultiOrderLevelModel,
     TrackHangingOrdersModel,
 )
+from hummingbot.strategy.batch_proposal import BatchProposalEngine
 from hummingbot.strategy.data_types import PriceSize, Proposal
 from hummingbot.strategy.market_trading_pair_tuple import MarketTradingPairTuple
 from hummingbot.strategy.order_book_asset_price_delegate import OrderBookAssetPriceDelegate
@@ -897,6 +899,27 @@ class AvellanedaMarketMakingUnitTests(unittest.TestCase):
 
         self.assertEqual(str(expected_proposal), str(self.strategy.create_proposal_based_on_order_levels()))
 
+    def test_batch_proposal_based_on_order_levels_matches_the_level_by_level_proposal(self):
+        self.simulate_low_volatility(self.strategy)
+        self.simulate_high_liquidity(self.strategy)
+        self.strategy.measure_order_book_liquidity()
+        self.strategy.calculate_reservation_price_and_optimal_spread()
+        order_levels_mode = MultiOrderLevelModel()
+        order_levels_mode.order_levels = 20
+        order_levels_mode.level_distances = Decimal("0.7")
+        self.config_map.order_levels_mode = order_levels_mode
+
+        def batch_engine(market, trading_pair, price, size):
+            return BatchProposalEngine(market.get_order_price_quantum(trading_pair, price),
+                                       market.get_order_size_quantum(trading_pair, size))
+
+        expected_proposal = self.strategy.create_proposal_based_on_order_levels()
+        with patch.object(BatchProposalEngine, "for_market", side_effect=batch_engine):
+            proposal = self.strategy.create_proposal_based_on_order_levels()
+
+        self.assertEqual(20, len(proposal[0]))
+        self.assertEqual(str(expected_proposal), str(proposal))
+
     def test_create_basic_proposal(self):
         # Simulate low volatility
         self.simulate_low_volatility(self.strategy)
@@ -2,6 +2,7 @@ import unittest
 from decimal import Decimal
 from test.mock.mock_asset_price_delegate import MockAssetPriceDelegate
 from typing import List, Optional
+from unittest.mock import patch
 
 import pandas as pd
 
@@ -11,13 +12,14 @@ from hummingbot.client.config.config_helpers import ClientConfigAdapter
 from hummingbot.connector.exchange.paper_trade.paper_trade_exchange import QuantizationParams
 from hummingbot.connector.test_support.mock_paper_exchange import MockPaperExchange
 from hummingbot.core.clock import Clock, ClockMode
-from hummingbot.core.data_type.common import PriceType, TradeType
+from hummingbot.core.data_type.common import OrderType, PriceType, TradeType
 from hummingbot.core.data_type.limit_order import LimitOrder
 from hummingbot.core.data_type.order_book import OrderBook
 from hummingbot.core.data_type.order_book_row import OrderBookRow
 from hummingbot.core.event.event_logger import EventLogger
 from hummingbot.core.event.events import MarketEvent, OrderBookTradeEvent, OrderCancelledEvent
 from hummingbot.model.sql_connection_manager import SQLConnectionManager, SQLConnectionType
+from hummingbot.strategy.batch_proposal import BatchProposalEngine
 from hummingbot.strategy.market_trading_pair_tuple import MarketTradingPairTuple
 from hummingbot.strategy.order_book_asset_price_delegate import OrderBookAssetPriceDelegate
 from hummingbot.strategy.pure_market_making.inventory_cost_price_delegate import InventoryCostPriceDelegate
@@ -43,6 +45,43 @@ def simulate_order_book_widening(order_book: OrderBook, top_bid: float, top_ask:
     order_book.apply_diffs(bid_diffs, ask_diffs, update_id)
 
 
+class BatchCallsCountingExchange(MockPaperExchange):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.batch_order_create_calls = []
+        self.batch_order_cancel_calls = []
+
+    def batch_order_create(self, orders_to_create, limit_order_type=OrderType.LIMIT):
+        self.batch_order_create_calls.append((orders_to_create, limit_order_type))
+        return super().batch_order_create(orders_to_create, limit_order_type)
+
+    def batch_order_cancel(self, orders_to_cancel):
+        self.batch_order_cancel_calls.append(orders_to_cancel)
+        super().batch_order_cancel(orders_to_cancel)
+
+
+class OrderAmendingExchange(BatchCallsCountingExchange):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.amend_order_calls = []
+        self.amendments_fail = False
+        self.failed_amendments = {}
+
+    @property
+    def is_order_amendment_supported(self) -> bool:
+        return True
+
+    def amend_order(self, order, price, amount, limit_order_type=OrderType.LIMIT):
+        self.amend_order_calls.append((order.client_order_id, price, amount, limit_order_type))
+        if self.amendments_fail:
+            self.failed_amendments[order.client_order_id] = order
+        return order.client_order_id
+
+    def get_amended_order(self, client_order_id):
+        # The order keeps its previous price and amount when the amendment fails
+        return self.failed_amendments.pop(client_order_id, None)
+
+
 class PMMUnitTest(unittest.TestCase):
     start: pd.Timestamp = pd.Timestamp("2019-01-01", tz="UTC")
     end: pd.Timestamp = pd.Timestamp("2019-01-01 01:00:00", tz="UTC")
@@ -322,6 +361,36 @@ class PMMUnitTest(unittest.TestCase):
         sell_target = self.market_info.get_price_by_type(PriceType.BestAsk) * Decimal("1.01")
         self.assertEqual(sell_target, sell_ask.price)
 
+    def test_basic_one_level_price_type_microprice(self):
+        strategy = PureMarketMakingStrategy()
+        strategy.init_params(
+            self.market_info,
+            bid_spread=Decimal("0.01"),
+            ask_spread=Decimal("0.01"),
+            order_amount=Decimal("1"),
+            order_refresh_time=5.0,
+            order_refresh_tolerance_pct=-1,
+            minimum_spread=-1,
+            price_type="microprice",
+        )
+        self.clock.add_iterator(strategy)
+        # The top bid amount is 30 and the top ask amount 10
+        self.market.order_books[self.trading_pair].apply_diffs([OrderBookRow(99.5, 30, 2)], [], 2)
+
+        self.clock.backtest_til(self.start_timestamp + self.clock_tick_size)
+
+        microprice = Decimal("100.25")
+        self.assertEqual(microprice, self.market_info.get_price_by_type(PriceType.Microprice))
+        self.assertEqual(self.market.quantize_order_price(self.trading_pair, microprice * Decimal("0.99")),
+                         strategy.active_buys[0].price)
+        self.assertEqual(self.market.quantize_order_price(self.trading_pair, microprice * Decimal("1.01")),
+                         strategy.active_sells[0].price)
+
+        price_delegate = OrderBookAssetPriceDelegate(self.market, self.trading_pair)
+        self.assertEqual(microprice, price_delegate.get_price_by_type(PriceType.Microprice))
+        self.assertEqual(Decimal("0.5"), price_delegate.get_order_book_imbalance())
+        self.assertEqual(Decimal("50"), price_delegate.get_cumulative_depth(Decimal("200"), is_buy=False))
+
     def test_basic_multiple_levels(self):
         strategy = self.multi_levels_strategy
         self.clock.add_iterator(strategy)
@@ -360,6 +429,127 @@ class PMMUnitTest(unittest.TestCase):
         self.assertEqual(3, len(strategy.active_buys))
         self.assertEqual(3, len(strategy.active_sells))
 
+    def test_ladder_refresh_creates_and_cancels_the_orders_in_batch(self):
+        market = BatchCallsCountingExchange(client_config_map=ClientConfigAdapter(ClientConfigMap()))
+        market.set_balanced_order_book(self.trading_pair, mid_price=self.mid_price, min_price=1, max_price=200,
+                                       price_step_size=1, volume_step_size=10)
+        market.set_balance("HBOT", 500)
+        market.set_balance("ETH", 5000)
+        market.set_quantization_param(QuantizationParams(self.trading_pair, 6, 6, 6, 6))
+        self.clock.add_iterator(market)
+        strategy = PureMarketMakingStrategy()
+        strategy.init_params(
+            MarketTradingPairTuple(market, self.trading_pair, self.base_asset, self.quote_asset),
+            bid_spread=Decimal("0.01"),
+            ask_spread=Decimal("0.01"),
+            order_amount=Decimal("1"),
+            order_refresh_time=5.0,
+            order_refresh_tolerance_pct=-1,
+            order_levels=20,
+            order_level_spread=Decimal("0.001"),
+            minimum_spread=-1,
+        )
+        self.clock.add_iterator(strategy)
+
+        self.clock.backtest_til(self.start_timestamp + self.clock_tick_size)
+        self.assertEqual(1, len(market.batch_order_create_calls))
+        orders_to_create, limit_order_type = market.batch_order_create_calls[0]
+        self.assertEqual(40, len(orders_to_create))
+        self.assertEqual(market.get_maker_order_type(), limit_order_type)
+        self.assertEqual(20, len(strategy.active_buys))
+        self.assertEqual(20, len(strategy.active_sells))
+        first_order_ids = {order.client_order_id for order in strategy.active_orders}
+
+        # After order_refresh_time, the orders are cancelled and created again with a batch request each
+        self.clock.backtest_til(self.start_timestamp + 7)
+        self.assertEqual(1, len(market.batch_order_cancel_calls))
+        self.assertEqual(first_order_ids, {order.client_order_id for order in market.batch_order_cancel_calls[0]})
+        self.assertEqual(2, len(market.batch_order_create_calls))
+        self.assertEqual(40, len(strategy.active_orders))
+        self.assertTrue(first_order_ids.isdisjoint({order.client_order_id for order in strategy.active_orders}))
+
+    def test_ladder_refresh_amends_the_orders_if_the_market_supports_it(self):
+        market = OrderAmendingExchange(client_config_map=ClientConfigAdapter(ClientConfigMap()))
+        market.set_balanced_order_book(self.trading_pair, mid_price=self.mid_price, min_price=1, max_price=200,
+                                       price_step_size=1, volume_step_size=10)
+        market.set_balance("HBOT", 500)
+        market.set_balance("ETH", 5000)
+        market.set_quantization_param(QuantizationParams(self.trading_pair, 6, 6, 6, 6))
+        self.clock.add_iterator(market)
+        strategy = PureMarketMakingStrategy()
+        strategy.init_params(
+            MarketTradingPairTuple(market, self.trading_pair, self.base_asset, self.quote_asset),
+            bid_spread=Decimal("0.01"),
+            ask_spread=Decimal("0.01"),
+            order_amount=Decimal("1"),
+            order_refresh_time=5.0,
+            order_refresh_tolerance_pct=Decimal("0.01"),
+            order_levels=3,
+            order_level_spread=Decimal("0.001"),
+            minimum_spread=-1,
+        )
+        self.clock.add_iterator(strategy)
+
+        self.clock.backtest_til(self.start_timestamp + self.clock_tick_size)
+        order_ids = {order.client_order_id for order in strategy.active_orders}
+        self.assertEqual(6, len(order_ids))
+
+        # The mid price moves from 100 to 107.5, beyond the refresh tolerance
+        simulate_order_book_widening(market.order_books[self.trading_pair], self.mid_price, 115)
+        self.clock.backtest_til(self.start_timestamp + 7)
+
+        self.assertEqual(0, len(market.batch_order_cancel_calls))
+        self.assertEqual(1, len(market.batch_order_create_calls))
+        self.assertEqual(6, len(market.amend_order_calls))
+        self.assertEqual(order_ids, {order_id for order_id, _, _, _ in market.amend_order_calls})
+        self.assertEqual({market.get_maker_order_type()},
+                         {order_type for _, _, _, order_type in market.amend_order_calls})
+        self.assertEqual(order_ids, {order.client_order_id for order in strategy.active_orders})
+        self.assertEqual(Decimal("107.5") * Decimal("0.99"), max(order.price for order in strategy.active_buys))
+        self.assertEqual(Decimal("107.5") * Decimal("1.01"), min(order.price for order in strategy.active_sells))
+
+        # Orders within the refresh tolerance are not amended
+        self.clock.backtest_til(self.start_timestamp + 14)
+        self.assertEqual(6, len(market.amend_order_calls))
+        self.assertEqual(0, len(market.batch_order_cancel_calls))
+
+    def test_ladder_orders_keep_their_price_when_the_amendment_fails(self):
+        market = OrderAmendingExchange(client_config_map=ClientConfigAdapter(ClientConfigMap()))
+        market.set_balanced_order_book(self.trading_pair, mid_price=self.mid_price, min_price=1, max_price=200,
+                                       price_step_size=1, volume_step_size=10)
+        market.set_balance("HBOT", 500)
+        market.set_balance("ETH", 5000)
+        market.set_quantization_param(QuantizationParams(self.trading_pair, 6, 6, 6, 6))
+        market.amendments_fail = True
+        self.clock.add_iterator(market)
+        strategy = PureMarketMakingStrategy()
+        strategy.init_params(
+            MarketTradingPairTuple(market, self.trading_pair, self.base_asset, self.quote_asset),
+            bid_spread=Decimal("0.01"),
+            ask_spread=Decimal("0.01"),
+            order_amount=Decimal("1"),
+            order_refresh_time=5.0,
+            order_refresh_tolerance_pct=Decimal("0.01"),
+            order_levels=1,
+            minimum_spread=-1,
+        )
+        self.clock.add_iterator(strategy)
+        self.clock.backtest_til(self.start_timestamp + self.clock_tick_size)
+
+        simulate_order_book_widening(market.order_books[self.trading_pair], self.mid_price, 115)
+        self.clock.backtest_til(self.start_timestamp + 6)
+        self.assertEqual(2, len(market.amend_order_calls))
+        self.assertEqual(Decimal("107.5") * Decimal("0.99"), strategy.active_buys[0].price)
+
+        # The strategy tracks the orders with their previous prices once the amendments failed
+        self.clock.backtest_til(self.start_timestamp + 7)
+        self.assertEqual(Decimal("99"), strategy.active_buys[0].price)
+        self.assertEqual(Decimal("101"), strategy.active_sells[0].price)
+
+        # And amends them again at the next refresh
+        self.clock.backtest_til(self.start_timestamp + 14)
+        self.assertEqual(4, len(market.amend_order_calls))
+
     def test_apply_budget_constraint_to_proposal(self):
         strategy = self.multi_levels_strategy
         self.clock.add_iterator(strategy)
@@ -391,6 +581,37 @@ class PMMUnitTest(unittest.TestCase):
         self.assertEqual(Decimal("103"), strategy.active_sells[-1].price)
         self.assertEqual(Decimal("3"), strategy.active_sells[-1].quantity)
 
+    def test_batch_proposal_matches_the_level_by_level_proposal(self):
+        strategy = PureMarketMakingStrategy()
+        strategy.init_params(
+            self.market_info,
+            bid_spread=Decimal("0.0123"),
+            ask_spread=Decimal("0.0077"),
+            order_amount=Decimal("1.3"),
+            order_levels=20,
+            order_level_spread=Decimal("0.0031"),
+            order_level_amount=Decimal("0.7"),
+            minimum_spread=-1,
+        )
+
+        def batch_engine(market, trading_pair, price, size):
+            return BatchProposalEngine(market.get_order_price_quantum(trading_pair, price),
+                                       market.get_order_size_quantum(trading_pair, size))
+
+        for base_balance, quote_balance in [(Decimal("500"), Decimal("5000")), (Decimal("17.33"), Decimal("1234.5"))]:
+            self.market.set_balance("HBOT", base_balance)
+            self.market.set_balance("ETH", quote_balance)
+            proposal = strategy.create_base_proposal()
+            strategy.apply_budget_constraint(proposal)
+            with patch.object(BatchProposalEngine, "for_market", side_effect=batch_engine):
+                batch_proposal = strategy.create_base_proposal()
+                strategy.apply_budget_constraint(batch_proposal)
+
+            self.assertEqual([(buy.price, buy.size) for buy in proposal.buys],
+                             [(buy.price, buy.size) for buy in batch_proposal.buys])
+            self.assertEqual([(sell.price, sell.size) for sell in proposal.sells],
+                             [(sell.price, sell.size) for sell in batch_proposal.sells])
+
     def test_order_quantity_available_balance(self):
         """
         When balance is below the specified order amount, checks if orders created
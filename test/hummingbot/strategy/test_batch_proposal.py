@@ -0,0 +1,153 @@
+import random
+import unittest
+from decimal import Decimal
+from typing import List
+from unittest.mock import MagicMock
+
+import numpy as np
+
+from hummingbot.client.config.client_config_map import ClientConfigMap
+from hummingbot.client.config.config_helpers import ClientConfigAdapter
+from hummingbot.connector.exchange_py_base import ExchangePyBase
+from hummingbot.connector.test_support.mock_paper_exchange import MockPaperExchange
+from hummingbot.core.data_type.common import OrderType, TradeType
+from hummingbot.strategy.batch_proposal import BatchProposalEngine
+
+
+class BatchProposalEngineTest(unittest.TestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        self.random = random.Random(42)
+        self.engine = BatchProposalEngine(price_quantum=Decimal("0.01"), size_quantum=Decimal("0.001"))
+
+    @staticmethod
+    def quantize(value: Decimal, quantum: Decimal) -> Decimal:
+        # Quantization of the connectors
+        return (value // quantum) * quantum
+
+    def exact_fit_budget(self, prices: List[Decimal], sizes: List[Decimal], fee_percent: Decimal,
+                         quote_balance: Decimal) -> List[Decimal]:
+        # Budget constraint of the market making strategies
+        fitted_sizes = []
+        for price, size in zip(prices, sizes):
+            quote_size = size * price * (Decimal(1) + fee_percent)
+            if quote_balance < quote_size:
+                size = self.quantize(quote_balance / (price * (Decimal(1) + fee_percent)), self.engine.size_quantum)
+                quote_balance = Decimal(0)
+            elif quote_balance == Decimal(0):
+                size = Decimal(0)
+            else:
+                quote_balance -= quote_size
+            fitted_sizes.append(size)
+        return fitted_sizes
+
+    def test_for_market(self):
+        market = MagicMock(spec=ExchangePyBase)
+        market.get_order_price_quantum.return_value = Decimal("0.01")
+        market.get_order_size_quantum.return_value = Decimal("0.001")
+
+        engine = BatchProposalEngine.for_market(market, "COINALPHA-HBOT", Decimal("100"), Decimal("1"))
+
+        self.assertEqual(Decimal("0.01"), engine.price_quantum)
+        self.assertEqual(Decimal("0.001"), engine.size_quantum)
+        self.assertIsNone(BatchProposalEngine.for_market(market, "COINALPHA-HBOT", Decimal("NaN"), Decimal("1")))
+        paper_exchange = MockPaperExchange(client_config_map=ClientConfigAdapter(ClientConfigMap()))
+        self.assertIsNone(BatchProposalEngine.for_market(paper_exchange, "COINALPHA-HBOT", Decimal("100"), Decimal("1")))
+
+    def test_linear_levels_match_the_decimal_quantization(self):
+        for _ in range(200):
+            reference_price = Decimal(self.random.randint(1, 10 ** 7)) / Decimal(1000)
+            spread = Decimal(self.random.randint(0, 500)) / Decimal(10000)
+            level_spread = Decimal(self.random.randint(0, 500)) / Decimal(10000)
+            levels = self.random.randint(1, 60)
+
+            def exact_price(level: int) -> Decimal:
+                return reference_price * (Decimal("1") - spread - level * level_spread)
+
+            price_ticks = self.engine.linear_levels(reference_price * (Decimal("1") - spread),
+                                                    -reference_price * level_spread,
+                                                    levels,
+                                                    self.engine.price_quantum,
+                                                    exact_price)
+
+            expected = [self.quantize(exact_price(level), self.engine.price_quantum) for level in range(levels)]
+            self.assertEqual(expected, [Decimal(int(ticks)) * self.engine.price_quantum for ticks in price_ticks])
+
+    def test_linear_levels_on_the_tick_grid(self):
+        size_ticks = self.engine.linear_levels(Decimal("1"), Decimal("0.5"), 4, self.engine.size_quantum)
+
+        self.assertEqual([1000, 1500, 2000, 2500], list(size_ticks))
+
+    def test_prices_on_tick_boundaries_are_quantized_exactly(self):
+        # 0.1 * 3 = 0.30000000000000004 and 0.7 * 3 = 2.0999999999999996 in float
+        price_ticks = self.engine.quantize_prices(
+            np.array([0.1 * 3, 0.7 * 3, 2.0949]), lambda level: [Decimal("0.3"), Decimal("2.1"), Decimal("2.0949")][level])
+
+        self.assertEqual([30, 210, 209], list(price_ticks))
+
+    def test_tick_counts_too_large_for_float_are_exact(self):
+        engine = BatchProposalEngine(price_quantum=Decimal("1e-15"), size_quantum=Decimal("1e-15"))
+        first_price = Decimal("99.737209448031")
+
+        price_ticks = engine.linear_levels(first_price, Decimal("-0.0123456789"), 3, engine.price_quantum)
+        size_ticks = engine.linear_levels(Decimal("10"), Decimal("0"), 3, engine.size_quantum)
+
+        self.assertEqual([(first_price, Decimal("10")),
+                          (Decimal("99.724863769131"), Decimal("10")),
+                          (Decimal("99.712518090231"), Decimal("10"))],
+                         engine.to_decimal_levels(price_ticks, size_ticks))
+
+    def test_to_decimal_levels_skips_empty_sizes(self):
+        levels = self.engine.to_decimal_levels([9900, 9800, 9700], [1000, 0, 2500])
+
+        self.assertEqual([(Decimal("99.00"), Decimal("1.000")), (Decimal("97.00"), Decimal("2.500"))], levels)
+
+    def test_fit_buy_budget_matches_the_decimal_budget_constraint(self):
+        for _ in range(300):
+            levels = self.random.randint(1, 40)
+            prices = [Decimal(self.random.randint(1, 10 ** 6)) * self.engine.price_quantum for _ in range(levels)]
+            sizes = [Decimal(self.random.randint(0, 10 ** 4)) * self.engine.size_quantum for _ in range(levels)]
+            fee_percent = Decimal(self.random.randint(0, 30)) / Decimal(10000)
+            total_cost = sum(size * price * (Decimal(1) + fee_percent) for price, size in zip(prices, sizes))
+            quote_balance = (total_cost * Decimal(self.random.random())).quantize(Decimal("0.0001"))
+
+            self.assertEqual(self.exact_fit_budget(prices, sizes, fee_percent, quote_balance),
+                             self.engine.fit_buy_budget(prices, sizes, fee_percent, quote_balance))
+
+    def test_fit_buy_budget_with_balance_equal_to_the_cost_of_levels(self):
+        prices = [Decimal("99.99"), Decimal("98.87"), Decimal("97.01")]
+        sizes = [Decimal("0.3"), Decimal("0.7"), Decimal("1.1")]
+        fee_percent = Decimal("0.001")
+        quote_balance = sum(size * price * (Decimal(1) + fee_percent) for price, size in zip(prices[:2], sizes[:2]))
+
+        fitted_sizes = self.engine.fit_buy_budget(prices, sizes, fee_percent, quote_balance)
+
+        self.assertEqual([Decimal("0.3"), Decimal("0.7"), Decimal(0)], fitted_sizes)
+        self.assertEqual(self.exact_fit_budget(prices, sizes, fee_percent, quote_balance), fitted_sizes)
+
+    def test_fit_buy_budget_without_balance(self):
+        prices = [Decimal("99"), Decimal("98")]
+        sizes = [Decimal("1"), Decimal("2")]
+
+        self.assertEqual([0, 0], self.engine.fit_buy_budget(prices, sizes, Decimal(0), Decimal(0)))
+        self.assertEqual(sizes, self.engine.fit_buy_budget(prices, sizes, Decimal(0), Decimal(1000)))
+
+    def test_fit_sell_budget(self):
+        sizes = [Decimal("1"), Decimal("2"), Decimal("3")]
+
+        self.assertEqual([Decimal("1"), Decimal("2"), Decimal("0")],
+                         self.engine.fit_sell_budget(sizes, Decimal("3")))
+        self.assertEqual([Decimal("1"), Decimal("1.123"), Decimal("0")],
+                         self.engine.fit_sell_budget(sizes, Decimal("2.1234")))
+        self.assertEqual(sizes, self.engine.fit_sell_budget(sizes, Decimal("10")))
+        self.assertEqual([0, 0, 0], self.engine.fit_sell_budget(sizes, Decimal("0")))
+
+    def test_fee_percent_is_requested_once(self):
+        market = MagicMock()
+        market.get_fee.return_value.percent = Decimal("0.001")
+
+        fee_percent = self.engine.fee_percent(market, "COINALPHA", "HBOT", TradeType.BUY, Decimal("99"), Decimal("1"))
+
+        self.assertEqual(Decimal("0.001"), fee_percent)
+        market.get_fee.assert_called_once_with("COINALPHA", "HBOT", OrderType.LIMIT, TradeType.BUY, Decimal("1"),
+                                               Decimal("99"))
@@ -179,6 +179,24 @@ class TestStrategyV2Base(IsolatedAsyncioWrapperTestCase):
         for controller in self.strategy.controllers.values():
             controller.stop.assert_called_once()
 
+    def test_on_stop_shuts_down_worker_pool(self):
+        self.strategy.controllers_worker_pool = MagicMock()
+
+        self.strategy.on_stop()
+
+        self.strategy.controllers_worker_pool.shutdown.assert_called_once()
+
+    def test_controllers_worker_pool_config(self):
+        config = StrategyV2ConfigBase(markets={self.connector_name: {self.trading_pair}}, candles_config=[],
+                                      controllers_worker_pool="process", controllers_worker_pool_size=4)
+        self.assertEqual("process", config.controllers_worker_pool)
+        self.assertEqual("none", self.strategy_config.controllers_worker_pool)
+        self.assertIsNone(self.strategy.controllers_worker_pool)
+
+        with self.assertRaises(ValueError):
+            StrategyV2ConfigBase(markets={self.connector_name: {self.trading_pair}}, candles_config=[],
+                                 controllers_worker_pool="cluster")
+
     def test_parse_markets_str_valid(self):
         test_input = "binance.JASMY-USDT,RLC-USDT:kucoin.BTC-USDT"
         expected_output = {
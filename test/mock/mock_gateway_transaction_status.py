@@ -0,0 +1,58 @@
+from typing import Any, Dict, List, Optional, Tuple
+
+
+class MockGatewayTransactionStatusAPI:
+    """
+    Local stand-in for the transaction status routes of Gateway (`chain/poll` and `chain/poll-batch`).
+
+    Replace `GatewayHttpClient.api_request` with `api_request` and `GatewayHttpClient._request_poll_batch` with
+    `request_poll_batch` to serve the registered transaction statuses without a running Gateway. Set
+    `batch_route_supported` to False to emulate Gateway versions without the batched route, and
+    `batch_route_error_status` to make the batched route fail with that HTTP status.
+    """
+
+    def __init__(self, batch_route_supported: bool = True):
+        self.batch_route_supported = batch_route_supported
+        self.batch_route_error_status: Optional[int] = None
+        self.transactions: Dict[str, Dict[str, Any]] = {}
+        self.requests: List[Tuple[str, Dict[str, Any]]] = []
+
+    def set_transaction_status(self, tx_hash: str, tx_status: int, tx_receipt_status: int = 1, tx_block: int = 1):
+        self.transactions[tx_hash] = {
+            "txHash": tx_hash,
+            "txStatus": tx_status,
+            "txBlock": tx_block if tx_status == 1 else -1,
+            "txReceipt": {"status": tx_receipt_status, "gasUsed": 21000} if tx_status == 1 else None,
+        }
+
+    def requests_to(self, path_url: str) -> List[Dict[str, Any]]:
+        return [params for path, params in self.requests if path == path_url]
+
+    async def api_request(
+            self,
+            method: str,
+            path_url: str,
+            params: Dict[str, Any] = {},
+            fail_silently: bool = False,
+            use_body: bool = False,
+    ) -> Dict[str, Any]:
+        self.requests.append((path_url, params))
+        if path_url == "chain/poll":
+            return self._transaction_status(params["txHash"])
+        if fail_silently:
+            return {"error": f"Cannot {method.upper()} /{path_url}"}
+        raise ValueError(f"Error on {method.upper()} /{path_url} Error: not found")
+
+    async def request_poll_batch(self, request: Dict[str, Any]) -> Tuple[int, Any]:
+        self.requests.append(("chain/poll-batch", request))
+        if not self.batch_route_supported:
+            return 404, "<pre>Cannot POST /chain/poll-batch</pre>"
+        if self.batch_route_error_status is not None:
+            return self.batch_route_error_status, {"error": "Internal error", "httpErrorCode": self.batch_route_error_status}
+        return 200, {"transactions": [self._transaction_status(tx_hash) for tx_hash in request["txHashes"]]}
+
+    def _transaction_status(self, tx_hash: str) -> Dict[str, Any]:
+        return self.transactions.get(
+            tx_hash,
+            {"txHash": tx_hash, "txStatus": 0, "txBlock": -1, "txReceipt": None}
+        )